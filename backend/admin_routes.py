@@ -1,16 +1,22 @@
 import os
-import shutil
 import unicodedata
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Tuple
 from fastapi import APIRouter, Request, Form, UploadFile, File
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
-from backend.database import save_news, get_news_by_id, update_news
+from backend.config.settings import settings
+from backend.database import save_news, get_news_by_id, update_news, get_scrape_runs
+from backend.media_worker import media_worker, MediaJob
+from backend.scraping.runstats import STAGES, compare_runs
+from backend.templating import templates
+from backend.utils.uploads import save_image_upload, UploadRejected
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "askyerevan2026")
 UPLOAD_DIR = "static/img/important"
+UPLOAD_URL_PREFIX = "/static/img/important"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 def make_safe_filename(title: str, ext: str) -> str:
@@ -19,6 +25,18 @@ def make_safe_filename(title: str, ext: str) -> str:
     safe = ''.join(c if c.isalnum() else '-' for c in title[:30].strip().lower())
     return f"{safe}.{ext}"
 
+async def save_uploaded_image(image: UploadFile, title_en: str) -> Tuple[Path, str]:
+    """Upload-ը պահում է UPLOAD_DIR-ում → (path, public url). UploadRejected եթե մեծ է / նկար չէ"""
+    stem = make_safe_filename(title_en, "").strip(".-") or "news"
+    path = await save_image_upload(
+        image, UPLOAD_DIR, stem, max_bytes=settings.UPLOAD_MAX_MB * 1024 * 1024
+    )
+    return path, f"{UPLOAD_URL_PREFIX}/{path.name}"
+
+def queue_image_processing(news_id: Optional[int], path: Optional[Path], url: Optional[str]) -> None:
+    if news_id and path:
+        media_worker.enqueue(MediaJob(news_id=news_id, path=path, url=url, url_prefix=UPLOAD_URL_PREFIX))
+
 def is_logged_in(request: Request) -> bool:
     return request.cookies.get("admin_auth") == ADMIN_PASSWORD
 
@@ -73,14 +91,18 @@ async def admin_publish(
         return RedirectResponse("/admin")
 
     image_url = None
+    uploaded = None
 
     if image and image.filename:
-        ext = image.filename.rsplit(".", 1)[-1].lower()
-        filename = make_safe_filename(title_en, ext)
-        filepath = f"{UPLOAD_DIR}/{filename}"
-        with open(filepath, "wb") as f:
-            shutil.copyfileobj(image.file, f)
-        image_url = f"/static/img/important/{filename}"
+        try:
+            uploaded, image_url = await save_uploaded_image(image, title_en)
+        except UploadRejected as e:
+            return templates.TemplateResponse("admin_panel.html", {
+                "request": request,
+                "page": "panel",
+                "success": None,
+                "error": str(e)
+            }, status_code=400)
     elif image_url_manual.strip():
         image_url = image_url_manual.strip()
 
@@ -96,6 +118,7 @@ async def admin_publish(
             image_3=image_3.strip() or None,
             video_url=video_url.strip() or None,
         )
+        queue_image_processing(news_id, uploaded, image_url)
         return templates.TemplateResponse("admin_panel.html", {
             "request": request,
             "page": "panel",
@@ -149,14 +172,19 @@ async def admin_edit_submit(
 
     existing = get_news_by_id(news_id)
     image_url = existing["image_url"] if existing else None
+    uploaded = None
 
     if image and image.filename:
-        ext = image.filename.rsplit(".", 1)[-1].lower()
-        filename = make_safe_filename(title_en, ext)
-        filepath = f"{UPLOAD_DIR}/{filename}"
-        with open(filepath, "wb") as f:
-            shutil.copyfileobj(image.file, f)
-        image_url = f"/static/img/important/{filename}"
+        try:
+            uploaded, image_url = await save_uploaded_image(image, title_en)
+        except UploadRejected as e:
+            return templates.TemplateResponse("admin_panel.html", {
+                "request": request,
+                "page": "edit",
+                "news": dict(existing) if existing else {"id": news_id},
+                "success": None,
+                "error": str(e)
+            }, status_code=400)
     elif image_url_manual.strip():
         image_url = image_url_manual.strip()
 
@@ -176,6 +204,8 @@ async def admin_edit_submit(
         image_3=image_3.strip() or None,
         video_url=video_url.strip() or None,
     )
+    if updated:
+        queue_image_processing(news_id, uploaded, image_url)
 
     news = get_news_by_id(news_id)
     return templates.TemplateResponse("admin_panel.html", {
@@ -186,6 +216,25 @@ async def admin_edit_submit(
         "error": None if updated else "Թարմացումը չհաջողվեց"
     })
     
+@router.get("/admin/scrapes", response_class=HTMLResponse)
+async def admin_scrapes(request: Request, limit: int = 30):
+    """Scraper run history — stage timings, HTTP counters, per-type counts և breakage flags"""
+    if not is_logged_in(request):
+        return RedirectResponse("/admin")
+    runs = compare_runs(get_scrape_runs(limit=max(1, min(limit, 200))))
+    for run in runs:
+        run["started"] = datetime.fromtimestamp(run["started_at"]).strftime("%Y-%m-%d %H:%M")
+    latest: dict = {}
+    for run in runs:
+        latest.setdefault(run["source"], run)
+    return templates.TemplateResponse("admin_panel.html", {
+        "request": request,
+        "page": "scrapes",
+        "runs": runs,
+        "latest_runs": list(latest.values()),
+        "stages": STAGES,
+    })
+
 @router.get("/admin/logout")
 async def admin_logout():
     response = RedirectResponse("/admin")
@@ -1,9 +1,11 @@
+import asyncio
 import datetime
 from typing import Literal
 import random
 
 from backend.database import get_all_news
-from backend.armenia.events_sources import fetch_live_events_for_category
+from backend.armenia.live_prefetch import read_live_events
+from backend.scraping.dedupe import unique_events
 
 EventCategory = Literal[
     "premiere",  # պրեմիերա (այժմ չի օգտագործվում LIVE՝ մենյուի համար)
@@ -28,6 +30,16 @@ def _format_event_line(title: str, place: str, time_str: str, price: str) -> str
     )
 
 
+def _live_fields(ev: dict) -> dict:
+    """Live snapshot event → the news fields backend/scraping/dedupe.py compares."""
+    return {
+        "title_hy": ev.get("title"),
+        "eventdate": ev.get("date"),
+        "eventtime": ev.get("time"),
+        "venue_hy": ev.get("place"),
+    }
+
+
 CATEGORY_LABELS_HY: dict[EventCategory, str] = {
     "premiere": "Պրեմիերա",
     "film": "Ֆիլմ",
@@ -56,6 +68,7 @@ async def get_events_by_category(
         "more_url": ...,
         "source": "db" | "live",
       }
+    LIVE-ը երբեք ուղղակի չի scrape-վում այստեղ — միայն ֆոնային snapshot-ն է կարդացվում։
     """
     label_map = {
         "film": "Կինո",
@@ -101,10 +114,14 @@ async def get_events_by_category(
 
     cfg = _build_db_filter(category)
 
-    rows = []
-    for cat in cfg["categories"]:
-        rows_cat = get_all_news(limit=50, category=cat)
-        rows.extend(rows_cat)
+    def _load_rows() -> list:
+        rows = []
+        for cat in cfg["categories"]:
+            rows.extend(get_all_news(limit=50, category=cat))
+        return rows
+
+    # DB-ն thread-ում, որ bot-ի event loop-ը չկանգնի
+    rows = await asyncio.to_thread(_load_rows)
 
     def _row_is_future(row: dict) -> bool:
         d = row.get("eventdate")
@@ -138,6 +155,8 @@ async def get_events_by_category(
             return (d, t)
 
         filtered.sort(key=_sort_key)
+        # rows stored before ingest-time dedupe / not merged yet — նույն event-ը երկու անգամ չցույց տալ
+        filtered = unique_events(filtered)
 
         k = min(limit, len(filtered))
         chosen = random.sample(filtered, k=k)
@@ -175,7 +194,7 @@ async def get_events_by_category(
 
         return results
 
-    # ===== 2) LIVE FALLBACK =====
+    # ===== 2) LIVE FALLBACK (prefetched snapshot, backend/armenia/live_prefetch.py) =====
     live_category_map = {
         "film": "cinema",
         "theatre": "theatre",
@@ -187,7 +206,7 @@ async def get_events_by_category(
     if kind is None:
         return []
 
-    events = fetch_live_events_for_category(kind, limit=20)
+    events = await read_live_events(kind)
     if not events:
         return []
 
@@ -201,7 +220,7 @@ async def get_events_by_category(
         if d >= today_date:
             future_events.append(ev)
 
-    source_list = future_events or events
+    source_list = unique_events(future_events or events, _live_fields)
 
     k = min(limit, len(source_list))
     chosen = random.sample(source_list, k=k)
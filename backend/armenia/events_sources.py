@@ -1,33 +1,39 @@
+# backend/armenia/events_sources.py
+#
+# LIVE Tomsarkgh category pages (կինո, թատրոն, ...), առանց DB-ի։ Bot handler-ից
+# ուղղակի չի կանչվում — backend/armenia/live_prefetch.py-ն ֆոնում թարմացնում է
+# live_events աղյուսակը, /menu-ն միայն այն է կարդում։
+
+import asyncio
 from datetime import datetime
 from typing import List, Dict, Any
 
-import requests
 from bs4 import BeautifulSoup
 
+from backend.config.settings import settings
+from backend.scraping.extract import extract_links
+from backend.scraping.fetch import Fetcher
+from backend.scraping.sources import HtmlSource
+from backend.utils.logger import logger
+
 
 # ---------- Real fetchers from Tomsarkgh (LIVE) ----------
 
-CINEMA_CATEGORY_URL = "https://www.tomsarkgh.am/hy/category/%D4%BF%D5%AB%D5%B6%D5%B8"
-THEATRE_CATEGORY_URL = "https://www.tomsarkgh.am/hy/category/%D4%B9%D5%A1%D5%BF%D6%80%D5%B8%D5%B6"
-OPERA_CATEGORY_URL = "https://www.tomsarkgh.am/hy/category/%D5%95%D5%BA%D5%A5%D6%80%D5%A1-%D6%87-%D5%A2%D5%A1%D5%AC%D5%A5%D5%BF"
-PARTY_CATEGORY_URL = "https://www.tomsarkgh.am/hy/category/%D4%B1%D5%AF%D5%B8%D6%82%D5%B4%D5%A2-%D6%87-%D6%83%D5%A1%D5%A2"
-EVENTS_CATEGORY_URL = "https://www.tomsarkgh.am/hy/category/%D4%B1%D5%B5%D5%AC"
+BASE_URL = settings.TOMSARKGH_BASE_URL.rstrip("/")
+
+CINEMA_CATEGORY_URL = f"{BASE_URL}/hy/category/%D4%BF%D5%AB%D5%B6%D5%B8"
+THEATRE_CATEGORY_URL = f"{BASE_URL}/hy/category/%D4%B9%D5%A1%D5%BF%D6%80%D5%B8%D5%B6"
+OPERA_CATEGORY_URL = f"{BASE_URL}/hy/category/%D5%95%D5%BA%D5%A5%D6%80%D5%A1-%D6%87-%D5%A2%D5%A1%D5%AC%D5%A5%D5%BF"
+PARTY_CATEGORY_URL = f"{BASE_URL}/hy/category/%D4%B1%D5%AF%D5%B8%D6%82%D5%B4%D5%A2-%D6%87-%D6%83%D5%A1%D5%A2"
+EVENTS_CATEGORY_URL = f"{BASE_URL}/hy/category/%D4%B1%D5%B5%D5%AC"
 
 
-def _scrape_one_tomsarkgh_event(url: str) -> Dict[str, Any] | None:
+def parse_live_event(url: str, html: str) -> Dict[str, Any] | None:
     """
-    Քաշում է մեկ Tomsarkgh event էջը և վերադառնում է event dict:
-    Եթե status code != 200 կամ կառուցվածքը կոտրված է, վերադարձնում է None։
+    Tomsarkgh event էջի HTML → event dict (title/date/time/place/price/url)։
+    Եթե կառուցվածքը կոտրված է (չկա վերնագիր կամ ամսաթիվ), վերադարձնում է None։
     """
-    try:
-        resp = requests.get(url, timeout=15)
-    except Exception:
-        return None
-
-    if resp.status_code != 200:
-        return None
-
-    soup = BeautifulSoup(resp.text, "html.parser")
+    soup = BeautifulSoup(html, "html.parser")
 
     # Վերնագիր
     title_tag = soup.select_one("h1.event-name")
@@ -83,142 +89,78 @@ def _scrape_one_tomsarkgh_event(url: str) -> Dict[str, Any] | None:
         if not price_text:
             price_text = "գինը նշված չէ"
 
-        return {
-            "title": title,
-            "date": date_part,
-            "time": time_part,
-            "place": place,
-            "price": price_text,
-            "url": url,
-        }
-
-def _collect_event_links(category_url: str, limit: int) -> list[str]:
-    """
-    Բացում է տրված category_url-ը և վերադարձնում մինչև limit event URL-ների list։
-    Օգտագործվում է կինո/թատրոն/օպերա/փաբ և այլն fetch-երում։
-    """
-    links: list[str] = []
-
-    try:
-        resp = requests.get(category_url, timeout=15)
-    except Exception:
-        return links
-
-    if resp.status_code != 200:
-        return links
+    return {
+        "title": title,
+        "date": date_part,
+        "time": time_part,
+        "place": place,
+        "price": price_text,
+        "url": url,
+    }
 
-    soup = BeautifulSoup(resp.text, "html.parser")
-
-    for a in soup.select('a[href^="/hy/event/"]'):
-        href = a.get("href")
-        if not href:
-            continue
-        full_url = "https://www.tomsarkgh.am" + href
-        if full_url not in links:
-            links.append(full_url)
-        if len(links) >= limit:
-            break
 
-    return links
+def parse_category_links(html: str, limit: int) -> list[str]:
+    """Category էջի HTML → մինչև limit event URL։"""
+    return extract_links(html, BASE_URL, "/hy/event/", limit)
 
 
-def fetch_cinema_from_tomsarkgh(limit: int = 20) -> List[Dict[str, Any]]:
-    """Կինոների category էջից քաշում է մինչև `limit` ֆիլմերի event-ներ (LIVE)."""
-    events: List[Dict[str, Any]] = []
-    links = _collect_event_links(CINEMA_CATEGORY_URL, limit=limit)
-
-    for url in links:
-        ev = _scrape_one_tomsarkgh_event(url)
-        if ev is not None:
-            ev["category"] = "cinema"
-            events.append(ev)
-
-    return events
-
-
-def fetch_theatre_from_tomsarkgh(limit: int = 20) -> List[Dict[str, Any]]:
-    """Թատրոնի բաժնի event-ներ (LIVE)."""
-    events: List[Dict[str, Any]] = []
-    links = _collect_event_links(THEATRE_CATEGORY_URL, limit=limit)
+# ---------- Aggregated LIVE fetcher for menu buttons ----------
 
-    for url in links:
-        ev = _scrape_one_tomsarkgh_event(url)
-        if ev is not None:
-            ev["category"] = "theatre"
-            events.append(ev)
-    return events
+# kind → (category page, event "category")
+LIVE_SOURCES: Dict[str, tuple] = {
+    "cinema": (CINEMA_CATEGORY_URL, "cinema"),
+    "theatre": (THEATRE_CATEGORY_URL, "theatre"),
+    "opera": (OPERA_CATEGORY_URL, "opera"),
+    "party": (PARTY_CATEGORY_URL, "party"),
+    "festival": (EVENTS_CATEGORY_URL, "festival"),
+}
 
 
-def fetch_opera_from_tomsarkgh(limit: int = 10) -> List[Dict[str, Any]]:
-    """Օպերա / բալետ բաժնի event-ներ (LIVE)."""
-    events: List[Dict[str, Any]] = []
-    links = _collect_event_links(OPERA_CATEGORY_URL, limit=limit)
+def sort_live_events(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """sort by date/time asc, որ մոտակա օրերն առաջնահերթ գան"""
+    def _dt_key(ev: Dict[str, Any]):
+        d = ev.get("date") or ""
+        t = ev.get("time") or ""
+        try:
+            if t:
+                return datetime.fromisoformat(f"{d} {t}")
+            return datetime.fromisoformat(d)
+        except Exception:
+            return datetime.max
 
-    for url in links:
-        ev = _scrape_one_tomsarkgh_event(url)
-        if ev is not None:
-            ev["category"] = "opera"
-            events.append(ev)
+    events.sort(key=_dt_key)
     return events
 
 
-def fetch_party_from_tomsarkgh(limit: int = 20) -> List[Dict[str, Any]]:
-    """Ակումբ / փաբ / party բաժնի nightlife event-ներ (LIVE)."""
-    events: List[Dict[str, Any]] = []
-    links = _collect_event_links(PARTY_CATEGORY_URL, limit=limit)
+def live_source(kind: str, limit: int = 20) -> HtmlSource:
+    """kind-ի category էջը որպես HtmlSource (նույն Fetcher limits / crawl delay-ը, ինչ news scraper-ը)։"""
+    category_url, _ = LIVE_SOURCES[kind]
+    return HtmlSource(f"live:{kind}", category_url, parse_live_event, marker="/hy/event/", limit=limit)
 
-    for url in links:
-        ev = _scrape_one_tomsarkgh_event(url)
-        if ev is not None:
-            ev["category"] = "party"
-            events.append(ev)
-    return events
 
-
-def fetch_misc_events_from_tomsarkgh(limit: int = 20) -> List[Dict[str, Any]]:
-    """«Այլ» բաժնի stand‑up, ցուցահանդես և նման event-ներ (LIVE)."""
+async def fetch_live_events_async(fetcher: Fetcher, kind: str, limit: int = 20) -> List[Dict[str, Any]]:
+    """
+    Վերադարձնում է LIVE event-ների list տվյալ kind-ի համար՝ անմիջապես
+    Tomsarkgh-ից, առանց DB-ի (category էջ, հետո բոլոր event էջերը միասին):
+      kind: cinema / theatre / opera / party / festival
+    """
+    _, category = LIVE_SOURCES[kind]
     events: List[Dict[str, Any]] = []
-    links = _collect_event_links(EVENTS_CATEGORY_URL, limit=limit)
-
-    for url in links:
-        ev = _scrape_one_tomsarkgh_event(url)
+    async for url, page in live_source(kind, limit).pages(fetcher):
+        if isinstance(page, BaseException):
+            logger.debug(f"Live event unavailable: {url} — {page}")
+            continue
+        ev = await asyncio.to_thread(parse_live_event, url, page)
         if ev is not None:
-            ev["category"] = "festival"
+            ev["category"] = category
             events.append(ev)
-    return events
-
+    return sort_live_events(events)
 
-# ---------- Aggregated LIVE fetcher for menu buttons ----------
 
 def fetch_live_events_for_category(kind: str, limit: int = 20) -> List[Dict[str, Any]]:
-    """
-    Վերադարձնում է LIVE event-ների list տվյալ kind-ի համար՝
-    անմիջապես Tomsarkgh-ից, առանց DB-ի:
-      kind: cinema / theatre / opera / party / festival
-    """
-    if kind == "cinema":
-        events = fetch_cinema_from_tomsarkgh(limit=limit)
-    elif kind == "theatre":
-        events = fetch_theatre_from_tomsarkgh(limit=limit)
-    elif kind == "opera":
-        events = fetch_opera_from_tomsarkgh(limit=limit)
-    elif kind == "party":
-        events = fetch_party_from_tomsarkgh(limit=limit)
-    elif kind == "festival":
-        events = fetch_misc_events_from_tomsarkgh(limit=limit)
-    else:
-        events = []
+    """Նույնը՝ sync (debug-ի համար, bot handler-ից չի կանչվում)։"""
+    async def _fetch():
+        async with Fetcher() as fetcher:
+            return await fetch_live_events_async(fetcher, kind, limit)
 
-    # sort by date/time asc, որ մոտակա օրերն առաջնահերթ գան
-    def _dt_key(ev: Dict[str, Any]):
-        d = ev.get("date") or ""
-        t = ev.get("time") or ""
-        try:
-            if t:
-                return datetime.fromisoformat(f"{d} {t}")
-            return datetime.fromisoformat(d)
-        except Exception:
-            return datetime.max
-
-    events.sort(key=_dt_key)
-    return events
+    return asyncio.run(_fetch())
@@ -0,0 +1,94 @@
+# backend/armenia/live_prefetch.py
+#
+# Background prefetcher for the /menu LIVE fallback.
+# Every LIVE_EVENTS_REFRESH_MIN minutes the Tomsarkgh category pages used by
+# get_events_by_category() are fetched concurrently and stored in live_events;
+# the bot handler only reads that snapshot, within LIVE_EVENTS_BUDGET_MS.
+
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+from backend.armenia.events_sources import fetch_live_events_async
+from backend.config.settings import settings
+from backend.database import get_live_events, save_live_events
+from backend.scraping.fetch import Fetcher
+from backend.utils.logger import logger
+
+# kinds the /menu fallback maps to (see live_category_map in events.py)
+LIVE_KINDS = ("cinema", "theatre", "party", "festival")
+
+
+class LiveEventsPrefetcher:
+    def __init__(self, interval: float, kinds=LIVE_KINDS):
+        self.interval = interval
+        self.kinds = tuple(kinds)
+        self.last_refresh: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def refresh(self) -> Dict[str, int]:
+        """One pass over all kinds → {kind: events stored}. An empty result keeps the old snapshot."""
+        started = time.perf_counter()
+        async with Fetcher() as fetcher:
+            results = await asyncio.gather(
+                *(fetch_live_events_async(fetcher, kind) for kind in self.kinds),
+                return_exceptions=True,
+            )
+
+        stored: Dict[str, int] = {}
+        for kind, events in zip(self.kinds, results):
+            if isinstance(events, BaseException):
+                logger.error(f"❌ Live events ({kind}) failed: {events}")
+                continue
+            if not events:
+                logger.warning(f"⚠️ Live events ({kind}): nothing fetched, keeping previous snapshot")
+                continue
+            await asyncio.to_thread(save_live_events, kind, events)
+            stored[kind] = len(events)
+
+        self.last_refresh = time.time()
+        logger.info(f"🎟 Live events refreshed in {time.perf_counter() - started:.1f}s: {stored}")
+        return stored
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"❌ Live events prefetch failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+live_prefetcher = LiveEventsPrefetcher(interval=settings.LIVE_EVENTS_REFRESH_MIN * 60)
+
+
+async def read_live_events(kind: str, budget: Optional[float] = None) -> List[dict]:
+    """
+    Prefetched snapshot for `kind`, never a live scrape. [] if there is none yet,
+    it is too old, or the read doesn't finish within the budget.
+    """
+    budget = settings.LIVE_EVENTS_BUDGET_MS / 1000 if budget is None else budget
+    max_age = settings.LIVE_EVENTS_MAX_AGE_H * 3600
+    try:
+        events = await asyncio.wait_for(asyncio.to_thread(get_live_events, kind, max_age), budget)
+    except asyncio.TimeoutError:
+        logger.warning(f"⚠️ Live events ({kind}) read exceeded {budget * 1000:.0f} ms")
+        return []
+    except Exception as e:
+        logger.error(f"❌ Live events ({kind}) read failed: {e}")
+        return []
+    return events or []
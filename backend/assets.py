@@ -0,0 +1,205 @@
+# backend/assets.py
+#
+# Content-hashed static URLs.
+#
+#   asset_url("css/main.css") → "/static/css/main.3f2a9c1b7e.css"
+#
+# The manifest ({"css/main.css": "css/main.3f2a9c1b7e.css", ...}) covers the
+# bundled assets only — css/, js/, img/ without the directories written at
+# runtime (admin uploads, IMAGE_MIRROR_DIR). static/asset-manifest.json stores
+# it with a signature of those files' names / sizes / mtimes; the app's startup
+# hook checks the signature (stat only) and rebuilds the file when it doesn't
+# match (plain uvicorn, a deploy that kept an old file). backend.serve and
+# `python -m backend.tools.build_assets` write it up front so workers just read
+# it. Files are not copied: FingerprintedStaticFiles maps the hashed name back
+# to the real file and serves it with an immutable Cache-Control.
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, Iterator, Optional, Tuple
+
+from starlette.exceptions import HTTPException
+from starlette.staticfiles import StaticFiles
+
+from backend.config.settings import settings
+from backend.utils.logger import logger
+
+STATIC_DIR = "static"
+STATIC_URL = "/static"
+MANIFEST_NAME = "asset-manifest.json"
+HASH_LEN = 10
+ASSET_DIRS = ("css", "js", "img")
+UPLOADS_DIR = "img/important"   # backend/admin_routes.py UPLOAD_DIR
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+_HASHED_RE = re.compile(r"^(?P<stem>.+)\.[0-9a-f]{%d}(?P<ext>\.[^./]+)$" % HASH_LEN)
+
+
+def file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()[:HASH_LEN]
+
+
+def hashed_name(rel_path: str, digest: str) -> str:
+    stem, ext = os.path.splitext(rel_path)
+    return f"{stem}.{digest}{ext}"
+
+
+def _rel(path: str, static_dir: str) -> str:
+    return os.path.relpath(path, static_dir).replace(os.sep, "/")
+
+
+def runtime_dirs(static_dir: str = STATIC_DIR) -> set:
+    """Directories (relative to static_dir) the app writes to — never fingerprinted."""
+    return {UPLOADS_DIR, _rel(settings.IMAGE_MIRROR_DIR, static_dir)}
+
+
+def asset_files(static_dir: str = STATIC_DIR) -> Iterator[Tuple[str, str]]:
+    """(relative path, full path) of the bundled assets, sorted."""
+    skip = runtime_dirs(static_dir)
+    for top in ASSET_DIRS:
+        for root, dirs, files in os.walk(os.path.join(static_dir, top)):
+            dirs[:] = sorted(
+                d for d in dirs
+                if not d.startswith(".") and _rel(os.path.join(root, d), static_dir) not in skip
+            )
+            for name in sorted(files):
+                if not name.startswith("."):
+                    full = os.path.join(root, name)
+                    yield _rel(full, static_dir), full
+
+
+def tree_signature(static_dir: str = STATIC_DIR) -> str:
+    """Names, sizes and mtimes of the assets — changes whenever a file does (no reads)."""
+    h = hashlib.sha256()
+    for rel, full in asset_files(static_dir):
+        st = os.stat(full)
+        h.update(f"{rel}\0{st.st_size}\0{st.st_mtime_ns}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def build_manifest(static_dir: str = STATIC_DIR) -> Dict[str, str]:
+    """{relative path: hashed relative path} for every bundled asset."""
+    return {rel: hashed_name(rel, file_digest(full)) for rel, full in asset_files(static_dir)}
+
+
+def write_manifest(manifest: Dict[str, str], static_dir: str = STATIC_DIR,
+                   signature: Optional[str] = None) -> str:
+    path = os.path.join(static_dir, MANIFEST_NAME)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"signature": signature, "files": manifest}, f, indent=0, sort_keys=True)
+    os.replace(tmp, path)
+    return path
+
+
+def read_manifest(static_dir: str = STATIC_DIR) -> Tuple[Optional[str], Optional[Dict[str, str]]]:
+    """(signature, files) from the manifest file; (None, None) if missing or unreadable."""
+    try:
+        with open(os.path.join(static_dir, MANIFEST_NAME), encoding="utf-8") as f:
+            data = json.load(f)
+        return data["signature"], data["files"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None, None
+
+
+def refresh_manifest(static_dir: str = STATIC_DIR) -> Tuple[Dict[str, str], str]:
+    """
+    The manifest file if its signature matches the assets on disk, else a
+    rebuilt one (written back when static/ is writable) → (files, source).
+    """
+    signature = tree_signature(static_dir)
+    stored, files = read_manifest(static_dir)
+    if files is not None and stored == signature:
+        return files, "file"
+    files = build_manifest(static_dir)
+    try:
+        write_manifest(files, static_dir, signature)
+        return files, "rebuilt"
+    except OSError as e:
+        logger.warning(f"⚠️ Asset manifest not written: {e}")
+        return files, "built in memory"
+
+
+class AssetManifest:
+    def __init__(self, static_dir: str = STATIC_DIR):
+        self.static_dir = static_dir
+        self._files: Optional[Dict[str, str]] = None
+        self._originals: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _ensure(self) -> Dict[str, str]:
+        if self._files is None:
+            with self._lock:
+                if self._files is None:
+                    self._load()
+        return self._files
+
+    def _load(self) -> None:
+        started = time.perf_counter()
+        files, source = refresh_manifest(self.static_dir)
+        self._originals = {hashed: rel for rel, hashed in files.items()}
+        self._files = files
+        logger.info(
+            f"🔖 Asset manifest: {len(files)} files ({source}, "
+            f"{(time.perf_counter() - started) * 1000:.0f} ms)"
+        )
+
+    def load(self) -> int:
+        return len(self._ensure())
+
+    def hashed(self, rel_path: str) -> Optional[str]:
+        return self._ensure().get(rel_path)
+
+    def original(self, hashed_path: str) -> Optional[str]:
+        self._ensure()
+        return self._originals.get(hashed_path)
+
+
+manifest = AssetManifest()
+
+
+def asset_url(path: str) -> str:
+    """
+    "css/main.css" or "/static/css/main.css" → hashed /static URL.
+    Anything not in the manifest (uploads after start, external URLs) is returned as-is.
+    """
+    if not path or "://" in path:
+        return path
+    rel = path[len(STATIC_URL) + 1:] if path.startswith(STATIC_URL + "/") else path.lstrip("/")
+    hashed = manifest.hashed(rel) if settings.ASSET_FINGERPRINTS else None
+    if hashed is None:
+        return path if path.startswith("/") else f"{STATIC_URL}/{rel}"
+    return f"{STATIC_URL}/{hashed}"
+
+
+class FingerprintedStaticFiles(StaticFiles):
+    """StaticFiles that also answers hashed names (immutable) from the manifest."""
+
+    async def get_response(self, path: str, scope):
+        rel = path.replace(os.sep, "/")
+        original = manifest.original(rel) if settings.ASSET_FINGERPRINTS else None
+        if original is not None:
+            response = await super().get_response(original, scope)
+            response.headers["Cache-Control"] = IMMUTABLE
+            return response
+
+        try:
+            return await super().get_response(path, scope)
+        except HTTPException as e:
+            # a hash from an older deploy (cached HTML) → current file, but revalidate
+            match = _HASHED_RE.match(rel)
+            if e.status_code != 404 or match is None:
+                raise
+            response = await super().get_response(match["stem"] + match["ext"], scope)
+            response.headers["Cache-Control"] = REVALIDATE
+            return response
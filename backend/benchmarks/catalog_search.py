@@ -0,0 +1,67 @@
+# backend/benchmarks/catalog_search.py
+#
+# Catalog index build time and query latency.
+#
+#   python -m backend.benchmarks.catalog_search --builds 5 --rounds 200
+
+import argparse
+import statistics
+import time
+
+from backend.catalog.items import iter_items
+from backend.catalog.search import CatalogIndex, canonical
+
+# Armenian script, Latin-typed Armenian, English and unfinished (autocomplete) input
+QUERIES = [
+    "Գառնիի տաճար", "garni tachar", "Mayr tachar", "ekeghetsi", "khor virap",
+    "zvartnots", "sevan", "lake", "wine bar yerevan", "monastery unesco",
+    "etchm", "gegh", "kond hou", "noravan", "tat",
+]
+
+
+def _pct(samples: list, p: float) -> float:
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Catalog search build/query benchmark")
+    ap.add_argument("--builds", type=int, default=5)
+    ap.add_argument("--rounds", type=int, default=200)
+    args = ap.parse_args()
+
+    docs = list(iter_items())
+
+    cold, warm = [], []
+    for i in range(args.builds):
+        canonical.cache_clear()
+        started = time.perf_counter()
+        CatalogIndex(docs)
+        cold.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        index = CatalogIndex(docs)   # transliteration cache already filled
+        warm.append(time.perf_counter() - started)
+
+    print(f"docs: {len(docs)}  terms: {len(index.vocab)}  "
+          f"postings: {sum(len(p) for p in index.postings.values())}")
+    print(f"build cold  median {statistics.median(cold) * 1000:8.1f} ms")
+    print(f"build warm  median {statistics.median(warm) * 1000:8.1f} ms")
+
+    print(f"\n{'query':<20} {'p50 µs':>9} {'p95 µs':>9}  top hit")
+    all_samples = []
+    for q in QUERIES:
+        samples = []
+        for _ in range(args.rounds):
+            started = time.perf_counter()
+            hits = index.search(q, limit=10)
+            samples.append((time.perf_counter() - started) * 1e6)
+        all_samples += samples
+        top = f"{hits[0][0]}:{hits[0][1]['id']}" if hits else "-"
+        print(f"{q:<20} {_pct(samples, 0.5):9.0f} {_pct(samples, 0.95):9.0f}  {top}")
+
+    print(f"\nall queries  p50 {_pct(all_samples, 0.5):.0f} µs  "
+          f"p95 {_pct(all_samples, 0.95):.0f} µs  p99 {_pct(all_samples, 0.99):.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,366 @@
+# backend/benchmarks/http_load.py
+#
+# Load test for web_app: seeds a throwaway SQLite DB, drives every public page
+# and /api/* endpoint at fixed concurrency, reports req/s and latency
+# percentiles per route and writes JSON so runs can be diffed.
+#
+#   python -m backend.benchmarks.http_load                        # in-process ASGI
+#   python -m backend.benchmarks.http_load --uvicorn --workers 2  # real local server
+#   python -m backend.benchmarks.http_load --scale large --concurrency 32 --out after.json
+#   python -m backend.benchmarks.http_load --compare before.json --out after.json
+#   python -m backend.benchmarks.http_load --only /api/places
+#
+# Run from the repo root (templates/ and static/ are relative paths).
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+SCALES = {
+    #          news   likes  ratings comments
+    "small":  (200,   2_000,  1_000,  2_000),
+    "medium": (2_000, 20_000, 10_000, 20_000),
+    "large":  (20_000, 200_000, 100_000, 200_000),
+}
+
+NEWS_CATEGORIES = ["events", "city", "culture", "general", "important"]
+
+
+# ── seeding ──────────────────────────────────────────────────────────────────
+
+def seed(db_path: Path, news: int, likes: int, ratings: int, comments: int, rnd: random.Random) -> dict:
+    """Creates the schema via init_db() and bulk-inserts synthetic rows."""
+    os.environ["SQLITE_PATH"] = str(db_path)
+    from backend import database
+    from backend.places_data import PLACES
+
+    database.DB_PATH = db_path
+    with contextlib.redirect_stdout(io.StringIO()):
+        database.init_db()
+
+    place_ids = [p["id"] for p in PLACES]
+    now = datetime.utcnow()
+    conn = sqlite3.connect(db_path)
+
+    def ts(max_days: int) -> str:
+        return (now - timedelta(seconds=rnd.randint(0, max_days * 86400))).strftime("%Y-%m-%d %H:%M:%S")
+
+    conn.executemany(
+        """
+        INSERT INTO news (title_hy, title_en, content_hy, content_en, image_url,
+                          category, eventdate, source_url, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (
+                f"Նորություն {i}", f"News item {i}",
+                "<p>" + "Երևան " * rnd.randint(80, 600) + "</p>",
+                "<p>" + "Yerevan " * rnd.randint(80, 600) + "</p>",
+                "/static/img/important/bench.jpg" if rnd.random() < 0.7 else None,
+                rnd.choice(NEWS_CATEGORIES),
+                (now + timedelta(days=rnd.randint(-30, 60))).strftime("%Y-%m-%d"),
+                f"https://bench.local/news/{i}",
+                ts(150),
+            )
+            for i in range(news)
+        ],
+    )
+
+    def pairs(n: int) -> set:
+        out = set()
+        while len(out) < n:
+            out.add((rnd.choice(place_ids), f"sid-{rnd.randint(0, n * 2)}"))
+        return out
+
+    like_pairs = pairs(likes)
+    conn.executemany(
+        "INSERT INTO place_likes (place_id, session_id, created_at) VALUES (?, ?, ?)",
+        [(p, sid, ts(365)) for p, sid in like_pairs],
+    )
+    counts: Dict[str, int] = {}
+    for p, _ in like_pairs:
+        counts[p] = counts.get(p, 0) + 1
+    conn.executemany(
+        "INSERT INTO place_stats (place_id, like_count, updated_at) VALUES (?, ?, datetime('now'))",
+        list(counts.items()),
+    )
+    conn.executemany(
+        "INSERT INTO place_ratings (place_id, session_id, rating, created_at) VALUES (?, ?, ?, ?)",
+        [(p, sid, rnd.randint(1, 5), ts(365)) for p, sid in pairs(ratings)],
+    )
+    conn.executemany(
+        "INSERT INTO place_comments (place_id, session_id, text, rating, created_at) VALUES (?, ?, ?, ?, ?)",
+        [
+            (rnd.choice(place_ids), f"sid-{rnd.randint(0, comments)}",
+             "Լավ տեղ է " * rnd.randint(1, 20), rnd.randint(0, 5), ts(365))
+            for _ in range(comments)
+        ],
+    )
+    conn.commit()
+    news_ids = [r[0] for r in conn.execute("SELECT id FROM news ORDER BY RANDOM() LIMIT 50")]
+    conn.close()
+    return {"news_ids": news_ids, "place_ids": place_ids}
+
+
+# ── route table ──────────────────────────────────────────────────────────────
+
+def build_routes(ids: dict, rnd: random.Random) -> Dict[str, callable]:
+    """route label → fn() returning (method, url, json body or None)"""
+    from backend.churches_data import CHURCHES
+    from backend.sights_data import SIGHTS
+
+    church = lambda: rnd.choice(CHURCHES)["id"]
+    sight = lambda: rnd.choice(SIGHTS)["id"]
+    place = lambda: rnd.choice(ids["place_ids"])
+    news = lambda: rnd.choice(ids["news_ids"]) if ids["news_ids"] else 1
+    lang = lambda: rnd.choice(["hy", "en"])
+    words = ["garni", "tachar", "sevan", "wine", "etchm", "Գառնի", "monastery", "bar", "kond"]
+
+    get = lambda url: ("GET", url, None)
+    return {
+        "GET /": lambda: get("/"),
+        "GET /{lang}": lambda: get(f"/{lang()}"),
+        "GET /{lang}/churches": lambda: get(f"/{lang()}/churches"),
+        "GET /{lang}/churches/{id}": lambda: get(f"/{lang()}/churches/{church()}"),
+        "GET /{lang}/sights": lambda: get(f"/{lang()}/sights"),
+        "GET /{lang}/sights/{id}": lambda: get(f"/{lang()}/sights/{sight()}"),
+        "GET /{lang}/places": lambda: get(f"/{lang()}/places"),
+        "GET /{lang}/places/{id}": lambda: get(f"/{lang()}/places/{place()}"),
+        "GET /{lang}/news": lambda: get(f"/{lang()}/news"),
+        "GET /{lang}/news?category": lambda: get(f"/{lang()}/news?category={rnd.choice(NEWS_CATEGORIES)}"),
+        "GET /{lang}/news/{id}": lambda: get(f"/{lang()}/news/{news()}"),
+        "GET /{lang}/about": lambda: get(f"/{lang()}/about"),
+        "GET /sitemap.xml": lambda: get("/sitemap.xml"),
+        "GET /health": lambda: get("/health"),
+        "GET /api/catalog/search": lambda: get(f"/api/catalog/search?q={rnd.choice(words)}"),
+        "GET /api/nearby": lambda: get(
+            f"/api/nearby?lat={40.18 + rnd.gauss(0, 0.05):.4f}&lon={44.51 + rnd.gauss(0, 0.05):.4f}"
+        ),
+        "GET /api/places/{id}/likes": lambda: get(f"/api/places/{place()}/likes"),
+        "GET /api/places/{id}/rating": lambda: get(f"/api/places/{place()}/rating"),
+        "GET /api/places/{id}/comments": lambda: get(f"/api/places/{place()}/comments"),
+        "GET /api/places/{id}/summary": lambda: get(f"/api/places/{place()}/summary"),
+        "POST /api/places/{id}/like": lambda: ("POST", f"/api/places/{place()}/like", None),
+        "POST /api/places/{id}/rating": lambda: (
+            "POST", f"/api/places/{place()}/rating", {"rating": rnd.randint(1, 5)}
+        ),
+        "POST /api/places/{id}/comments": lambda: (
+            "POST", f"/api/places/{place()}/comments", {"text": "bench comment", "rating": 5}
+        ),
+    }
+
+
+# ── driver ───────────────────────────────────────────────────────────────────
+
+def _pct(sorted_ms: List[float], p: float) -> float:
+    if not sorted_ms:
+        return 0.0
+    return sorted_ms[min(len(sorted_ms) - 1, int(len(sorted_ms) * p))]
+
+
+async def drive_route(client: httpx.AsyncClient, make, requests: int, concurrency: int) -> dict:
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+    queue = list(range(requests))
+
+    async def worker():
+        # each virtual user keeps its own place_session, like a browser would
+        cookie = f"place_session=bench-{uuid.uuid4()}"
+        while queue:
+            queue.pop()
+            method, url, body = make()
+            started = time.perf_counter()
+            try:
+                resp = await client.request(method, url, json=body, headers={"cookie": cookie})
+                key = str(resp.status_code)
+            except Exception as e:
+                key = type(e).__name__
+            latencies.append((time.perf_counter() - started) * 1000)
+            statuses[key] = statuses.get(key, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    errors = sum(n for k, n in statuses.items() if not k.isdigit() or int(k) >= 500)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "statuses": statuses,
+        "rps": round(len(latencies) / wall, 1) if wall else 0.0,
+        "mean_ms": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+        "p50_ms": round(_pct(latencies, 0.50), 2),
+        "p90_ms": round(_pct(latencies, 0.90), 2),
+        "p95_ms": round(_pct(latencies, 0.95), 2),
+        "p99_ms": round(_pct(latencies, 0.99), 2),
+        "max_ms": round(latencies[-1], 2) if latencies else 0.0,
+    }
+
+
+async def run_all(client: httpx.AsyncClient, routes: dict, args) -> dict:
+    results = {}
+    for label, make in routes.items():
+        # warm-up: first-hit costs (template compile, index build) are not what we measure here
+        for _ in range(min(5, args.requests)):
+            method, url, body = make()
+            await client.request(method, url, json=body)
+        results[label] = await drive_route(client, make, args.requests, args.concurrency)
+        r = results[label]
+        print(f"{label:<34} {r['rps']:8.1f} {r['p50_ms']:8.2f} {r['p95_ms']:8.2f} "
+              f"{r['p99_ms']:8.2f} {r['max_ms']:8.2f} {r['errors']:6d}",
+              file=sys.__stdout__, flush=True)   # stdout itself is muted in-process
+    return results
+
+
+async def run_in_process(routes: dict, args) -> dict:
+    with contextlib.redirect_stdout(io.StringIO()):
+        from backend.web_app import app
+        await app.router.startup()
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            with contextlib.redirect_stdout(io.StringIO()):   # get_connection() prints per call
+                return await run_all(client, routes, args)
+    finally:
+        with contextlib.redirect_stdout(io.StringIO()):
+            await app.router.shutdown()
+
+
+async def run_uvicorn(routes: dict, args, env: dict) -> dict:
+    port = args.port
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "backend.web_app:app",
+         "--host", "127.0.0.1", "--port", str(port), "--workers", str(args.workers),
+         "--log-level", "warning", "--no-access-log"],
+        env=env, stdout=subprocess.DEVNULL,
+    )
+    base = f"http://127.0.0.1:{port}"
+    try:
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=base, limits=limits, timeout=30) as client:
+            for _ in range(200):
+                try:
+                    if (await client.get("/health")).status_code == 200:
+                        break
+                except httpx.TransportError:
+                    pass
+                await asyncio.sleep(0.1)
+            else:
+                raise SystemExit("uvicorn did not come up")
+            return await run_all(client, routes, args)
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def _git_rev() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def compare(old: dict, new: dict) -> None:
+    print(f"\n{'route':<34} {'p50 old':>9} {'p50 new':>9} {'Δ%':>7} {'rps old':>9} {'rps new':>9} {'Δ%':>7}")
+    for label, r in new["routes"].items():
+        o = old.get("routes", {}).get(label)
+        if not o:
+            continue
+        d50 = (r["p50_ms"] - o["p50_ms"]) / o["p50_ms"] * 100 if o["p50_ms"] else 0.0
+        drps = (r["rps"] - o["rps"]) / o["rps"] * 100 if o["rps"] else 0.0
+        print(f"{label:<34} {o['p50_ms']:9.2f} {r['p50_ms']:9.2f} {d50:+7.1f} "
+              f"{o['rps']:9.1f} {r['rps']:9.1f} {drps:+7.1f}")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="web_app load test")
+    ap.add_argument("--scale", choices=SCALES, default="small")
+    ap.add_argument("--news", type=int)
+    ap.add_argument("--likes", type=int)
+    ap.add_argument("--ratings", type=int)
+    ap.add_argument("--comments", type=int)
+    ap.add_argument("--requests", type=int, default=300, help="requests per route")
+    ap.add_argument("--concurrency", type=int, default=16)
+    ap.add_argument("--only", default="", help="substring filter on route labels")
+    ap.add_argument("--uvicorn", action="store_true", help="spawn a local uvicorn instead of in-process ASGI")
+    ap.add_argument("--workers", type=int, default=1)
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--seed", type=int, default=33)
+    ap.add_argument("--out", help="write JSON results here")
+    ap.add_argument("--compare", help="previous JSON results to diff against")
+    args = ap.parse_args()
+
+    if os.getenv("DATABASE_URL"):
+        raise SystemExit("Unset DATABASE_URL — the load test seeds its own SQLite file")
+
+    news, likes, ratings, comments = SCALES[args.scale]
+    news = args.news if args.news is not None else news
+    likes = args.likes if args.likes is not None else likes
+    ratings = args.ratings if args.ratings is not None else ratings
+    comments = args.comments if args.comments is not None else comments
+
+    rnd = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        started = time.perf_counter()
+        ids = seed(db_path, news, likes, ratings, comments, rnd)
+        seed_s = time.perf_counter() - started
+        print(f"seeded {db_path.name}: {news} news, {likes} likes, {ratings} ratings, "
+              f"{comments} comments in {seed_s:.1f} s")
+
+        # writes are part of the suite — keep the limiter from turning them into 429s
+        env = dict(os.environ, SQLITE_PATH=str(db_path), RATE_LIMIT_ENABLED="0", DATABASE_URL="")
+        os.environ.update(env)
+
+        routes = {k: v for k, v in build_routes(ids, rnd).items() if args.only in k}
+        mode = f"uvicorn x{args.workers}" if args.uvicorn else "in-process ASGI"
+        print(f"{mode}, concurrency {args.concurrency}, {args.requests} requests/route\n")
+        print(f"{'route':<34} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'err':>6}")
+
+        if args.uvicorn:
+            results = asyncio.run(run_uvicorn(routes, args, env))
+        else:
+            results = asyncio.run(run_in_process(routes, args))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "git": _git_rev(),
+            "python": platform.python_version(),
+            "mode": mode,
+            "concurrency": args.concurrency,
+            "requests_per_route": args.requests,
+            "seed": args.seed,
+            "data": {"news": news, "likes": likes, "ratings": ratings, "comments": comments},
+        },
+        "routes": results,
+    }
+
+    if args.out:
+        Path(args.out).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"\n📝 results → {args.out}")
+    if args.compare:
+        compare(json.loads(Path(args.compare).read_text(encoding="utf-8")), report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# backend/benchmarks/like_toggles.py
+#
+# Sustained like toggles/sec: direct toggle_place_like() vs LikeBuffer.
+#
+#   python -m backend.benchmarks.like_toggles --toggles 5000 --places 5 --sessions 200
+#
+# Runs on a throwaway SQLite file (DATABASE_URL must be empty) and checks that
+# both paths end with identical place_likes / place_stats counts.
+
+import argparse
+import contextlib
+import io
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from backend import database
+from backend.like_buffer import LikeBuffer
+
+
+def _workload(toggles: int, places: int, sessions: int, seed: int) -> list:
+    """Bursty traffic: most toggles hit one "shared in the group" place."""
+    rnd = random.Random(seed)
+    place_ids = [f"bench_place_{i}" for i in range(places)]
+    session_ids = [f"bench_sid_{i}" for i in range(sessions)]
+    hot = place_ids[0]
+    return [
+        (hot if rnd.random() < 0.8 else rnd.choice(place_ids), rnd.choice(session_ids))
+        for _ in range(toggles)
+    ]
+
+
+def _fresh_db(path: Path) -> None:
+    if path.exists():
+        path.unlink()
+    database.DB_PATH = path
+    database.init_db()
+
+
+def _final_counts(place_ids: set) -> dict:
+    conn = database.get_connection()
+    cur = database.get_cursor(conn)
+    out = {}
+    for p in sorted(place_ids):
+        cur.execute("SELECT COUNT(*) AS cnt FROM place_likes WHERE place_id = ?", (p,))
+        likes = cur.fetchone()["cnt"]
+        cur.execute("SELECT like_count FROM place_stats WHERE place_id = ?", (p,))
+        row = cur.fetchone()
+        out[p] = (int(likes), int(row["like_count"]) if row else 0)
+    conn.close()
+    return out
+
+
+def run_direct(ops: list) -> float:
+    started = time.perf_counter()
+    for place_id, session_id in ops:
+        database.toggle_place_like(place_id, session_id)
+    return time.perf_counter() - started
+
+
+def run_buffered(ops: list, flush_interval: float) -> float:
+    buf = LikeBuffer(flush_interval=flush_interval)
+    stop = threading.Event()
+
+    def flusher():
+        while not stop.wait(flush_interval):
+            buf.flush()
+
+    t = threading.Thread(target=flusher, daemon=True)
+    started = time.perf_counter()
+    t.start()
+    for place_id, session_id in ops:
+        buf.toggle(place_id, session_id)
+    stop.set()
+    t.join()
+    buf.flush()  # shutdown flush — part of the measured cost
+    elapsed = time.perf_counter() - started
+    assert buf.pending() == 0, "buffer not drained"
+    return elapsed
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Like toggles/sec: direct vs buffered")
+    ap.add_argument("--toggles", type=int, default=5000)
+    ap.add_argument("--places", type=int, default=5)
+    ap.add_argument("--sessions", type=int, default=200)
+    ap.add_argument("--flush-ms", type=int, default=250)
+    ap.add_argument("--seed", type=int, default=29)
+    args = ap.parse_args()
+
+    if database.DATABASE_URL:
+        raise SystemExit("Unset DATABASE_URL — the benchmark only runs on a temp SQLite file")
+
+    ops = _workload(args.toggles, args.places, args.sessions, args.seed)
+    place_ids = {p for p, _ in ops}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_file = Path(tmp) / "bench.db"
+        # get_connection() prints the SQLite path on every call
+        with contextlib.redirect_stdout(io.StringIO()):
+            _fresh_db(db_file)
+            direct = run_direct(ops)
+            direct_counts = _final_counts(place_ids)
+
+            _fresh_db(db_file)
+            buffered = run_buffered(ops, args.flush_ms / 1000)
+            buffered_counts = _final_counts(place_ids)
+
+    print(f"toggles: {len(ops)}  places: {len(place_ids)}  sessions: {args.sessions}  "
+          f"flush: {args.flush_ms} ms")
+    print(f"direct    {len(ops) / direct:10.0f} toggles/s   {direct:7.3f} s")
+    print(f"buffered  {len(ops) / buffered:10.0f} toggles/s   {buffered:7.3f} s")
+    print(f"speedup   {direct / buffered:10.1f}x")
+
+    if direct_counts != buffered_counts:
+        raise SystemExit(f"❌ counts differ: direct={direct_counts} buffered={buffered_counts}")
+    for p, (likes, stats) in buffered_counts.items():
+        if likes != stats:
+            raise SystemExit(f"❌ place_stats out of sync for {p}: {likes} vs {stats}")
+    print("✅ final counts match:", {p: c for p, (c, _) in buffered_counts.items()})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# backend/benchmarks/nearby.py
+#
+# k-d tree vs linear scan for k-nearest / radius queries.
+#
+#   python -m backend.benchmarks.nearby --points 5000 --queries 2000
+#
+# --points 0 uses the real catalog; otherwise random points across Armenia
+# (the catalog is small today — the synthetic run shows how it scales).
+
+import argparse
+import random
+import time
+
+from backend.catalog.geo import GeoIndex, haversine_km
+from backend.catalog.items import iter_items
+
+
+def _linear_knn(points, lat, lon, k):
+    return sorted((haversine_km(lat, lon, a, b), p) for a, b, p in points)[:k]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Nearby index benchmark")
+    ap.add_argument("--points", type=int, default=0)
+    ap.add_argument("--queries", type=int, default=2000)
+    ap.add_argument("--k", type=int, default=5)
+    ap.add_argument("--radius-km", type=float, default=5.0)
+    args = ap.parse_args()
+
+    rnd = random.Random(31)
+    if args.points:
+        points = [(rnd.uniform(38.9, 41.3), rnd.uniform(43.5, 46.6), i) for i in range(args.points)]
+    else:
+        points = [(item["lat"], item["lon"], item["id"]) for _, item in iter_items() if "lat" in item]
+    started = time.perf_counter()
+    index = GeoIndex(points)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    # queries cluster around Yerevan like real traffic does
+    queries = [(40.18 + rnd.gauss(0, 0.05), 44.51 + rnd.gauss(0, 0.05)) for _ in range(args.queries)]
+
+    def timed(fn) -> float:
+        started = time.perf_counter()
+        for lat, lon in queries:
+            fn(lat, lon)
+        return (time.perf_counter() - started) / len(queries) * 1e6
+
+    knn = timed(lambda la, lo: index.nearest(la, lo, k=args.k))
+    radius = timed(lambda la, lo: index.within(la, lo, args.radius_km))
+    linear = timed(lambda la, lo: _linear_knn(points, la, lo, args.k))
+
+    print(f"points: {len(index)}  queries: {len(queries)}  build: {build_ms:.1f} ms")
+    print(f"k-d tree  k={args.k:<3}        {knn:9.1f} µs/query")
+    print(f"k-d tree  r={args.radius_km:<5} km    {radius:9.1f} µs/query")
+    print(f"linear    k={args.k:<3}        {linear:9.1f} µs/query")
+
+
+if __name__ == "__main__":
+    main()
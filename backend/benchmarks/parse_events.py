@@ -0,0 +1,95 @@
+# backend/benchmarks/parse_events.py
+#
+# Event page extraction micro-benchmark: backend/scraping/extract.py per HTML backend.
+#
+#   python -m backend.benchmarks.parse_events                 # pages from the HTTP cache
+#   python -m backend.benchmarks.parse_events --pages DIR     # another cache dir
+#   python -m backend.benchmarks.parse_events --synthetic 200 # stand-in pages
+#
+# Saved pages are the scraper's on-disk HTTP cache (SCRAPER_CACHE_DIR); if it
+# has no event pages, synthetic stand-in pages are used. Every backend must
+# produce the same fields as the first one.
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from backend.config.settings import settings
+from backend.scraping import extract
+from backend.scraping.standin import SyntheticTomsarkgh
+
+BASE_URL = "https://www.tomsarkgh.am"
+
+
+def saved_pages(directory: str) -> Tuple[List[str], List[str]]:
+    """(HY event pages, EN event pages) from an HttpCache directory."""
+    hy, en = [], []
+    for meta_path in sorted(Path(directory).glob("*/*.json")):
+        try:
+            url = json.loads(meta_path.read_text(encoding="utf-8"))["url"]
+            body = meta_path.with_suffix(".html").read_text(encoding="utf-8")
+        except (OSError, ValueError, KeyError):
+            continue
+        if "/hy/event/" in url:
+            hy.append(body)
+        elif "/en/event/" in url:
+            en.append(body)
+    return hy, en
+
+
+def synthetic_pages(count: int) -> Tuple[List[str], List[str]]:
+    site = SyntheticTomsarkgh(per_type=max(1, count // 11 + 1))
+    ids = list(site.events)[:count]
+    return [site.event_page(i, "hy")[1] for i in ids], [site.event_page(i, "en")[1] for i in ids]
+
+
+def run_backend(backend: str, hy: List[str], en: List[str], repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        out = [extract.extract_event(html, BASE_URL, backend=backend) for html in hy]
+        out_en = [extract.extract_event_en(html, backend=backend) for html in en]
+        best = min(best, time.perf_counter() - started)
+    return best, (out, out_en)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Event page parser micro-benchmark")
+    ap.add_argument("--pages", default=settings.SCRAPER_CACHE_DIR, help="HttpCache directory")
+    ap.add_argument("--synthetic", type=int, default=0, help="use N stand-in pages instead")
+    ap.add_argument("--repeat", type=int, default=5, help="best of N")
+    args = ap.parse_args()
+
+    hy, en = synthetic_pages(args.synthetic) if args.synthetic else saved_pages(args.pages)
+    source = "synthetic" if args.synthetic else args.pages
+    if not hy and not en:
+        hy, en = synthetic_pages(200)
+        source = "synthetic (no saved event pages found)"
+
+    backends = [b for b in extract.BACKENDS
+                if not (b == "selectolax" and extract.LexborHTMLParser is None)
+                and not (b == "bs4-lxml" and not extract.HAS_LXML)]
+    pages = len(hy) + len(en)
+    kib = sum(len(p.encode("utf-8")) for p in hy + en) / 1024
+    print(f"{len(hy)} HY + {len(en)} EN pages ({kib:.0f} KiB) from {source}, best of {args.repeat}")
+    print(f"{'backend':<12}{'total ms':>10}{'ms/page':>10}{'pages/s':>10}{'vs bs4':>8}")
+
+    results = {b: run_backend(b, hy, en, args.repeat) for b in backends}
+    baseline = results["bs4"][0]
+    reference = results[backends[0]][1]
+    same = True
+    for backend, (elapsed, output) in results.items():
+        print(f"{backend:<12}{elapsed * 1000:>10.1f}{elapsed * 1000 / pages:>10.2f}"
+              f"{pages / elapsed:>10.0f}{baseline / elapsed:>7.1f}×")
+        if output != reference:
+            same = False
+            print(f"  ⚠️ {backend} output differs from {backends[0]}")
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
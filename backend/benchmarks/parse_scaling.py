@@ -0,0 +1,104 @@
+# backend/benchmarks/parse_scaling.py
+#
+# Parse stage throughput vs worker processes (backend/scraping/parse_pool.py).
+#
+#   python -m backend.benchmarks.parse_scaling                       # HTTP cache pages, 0..cores workers
+#   python -m backend.benchmarks.parse_scaling --backend bs4 --workers 0,1,2,4
+#   python -m backend.benchmarks.parse_scaling --synthetic 400 --repeat 3
+#
+# Event pages (the scraper's on-disk HTTP cache, or stand-in pages) go through
+# ParsePool + ordered_map exactly as in TomsarkghSource: parse_event() per HY +
+# EN page pair, 2 × workers pages in flight. 0 workers = the in-process thread
+# fallback. Pool start-up is timed separately (warm-up job per worker); every
+# worker count must produce the same rows.
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import List, Tuple
+
+from backend.benchmarks.parse_events import saved_pages, synthetic_pages
+from backend.config.settings import settings
+from backend.news_scraper import parse_event
+from backend.scraping import extract
+from backend.scraping.parse_pool import ParsePool, ordered_map
+
+Page = Tuple[str, str, str]   # (url, html_hy, html_en)
+
+
+def _pairs(hy: List[str], en: List[str]) -> List[Page]:
+    return [(f"/hy/event/{i}", html, en[i] if i < len(en) else "") for i, html in enumerate(hy)]
+
+
+def _warm(_: int) -> int:
+    return os.getpid()
+
+
+async def run_pool(workers: int, pages: List[Page], backend: str, repeat: int):
+    started = time.perf_counter()
+    with ParsePool(workers) as pool:
+        # one job per worker, so process start-up isn't counted as parse time
+        await asyncio.gather(*(pool.run(_warm, i) for i in range(max(1, workers))))
+        startup = time.perf_counter() - started
+
+        async def parse(page: Page):
+            url, html_hy, html_en = page
+            row, _ = await pool.run(parse_event, url, "events", html_hy, html_en or None, backend)
+            return row
+
+        best = float("inf")
+        rows: list = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            rows = [row async for _, row in ordered_map(parse, pages, pool.depth)]
+            best = min(best, time.perf_counter() - started)
+    errors = [r for r in rows if isinstance(r, BaseException)]
+    if errors:
+        raise errors[0]
+    return best, startup, rows
+
+
+def main() -> None:
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+    ap = argparse.ArgumentParser(description="Parse stage scaling over worker processes")
+    ap.add_argument("--pages", default=settings.SCRAPER_CACHE_DIR, help="HttpCache directory")
+    ap.add_argument("--synthetic", type=int, default=0, help="use N stand-in pages instead")
+    ap.add_argument("--backend", default=extract.DEFAULT_BACKEND, choices=extract.BACKENDS)
+    ap.add_argument("--workers", default=",".join(str(n) for n in range(cores + 1)),
+                    help="comma-separated worker counts (0 = thread in this process)")
+    ap.add_argument("--repeat", type=int, default=3, help="best of N")
+    args = ap.parse_args()
+
+    hy, en = synthetic_pages(args.synthetic) if args.synthetic else saved_pages(args.pages)
+    source = "synthetic" if args.synthetic else args.pages
+    if not hy:
+        hy, en = synthetic_pages(400)
+        source = "synthetic (no saved event pages found)"
+    pages = _pairs(hy, en)
+    kib = sum(len(h.encode("utf-8")) + len(e.encode("utf-8")) for _, h, e in pages) / 1024
+    counts = [int(n) for n in args.workers.split(",")]
+
+    print(f"{len(pages)} HY+EN event pages ({kib:.0f} KiB) from {source}, backend {args.backend}, "
+          f"{cores} core(s), best of {args.repeat}")
+    print(f"{'workers':<9}{'start s':>9}{'parse s':>9}{'pages/s':>10}{'vs 1':>7}")
+
+    reference = None
+    one = None
+    for n in counts:
+        elapsed, startup, rows = asyncio.run(run_pool(n, pages, args.backend, args.repeat))
+        reference = rows if reference is None else reference
+        rate = len(pages) / elapsed
+        one = rate if n == 1 else one
+        scale = f"{rate / one:>6.1f}×" if one else f"{'—':>7}"
+        print(f"{n if n else '0 (thr)':<9}{startup:>9.2f}{elapsed:>9.2f}{rate:>10.0f}{scale}")
+        if rows != reference:
+            print(f"  ⚠️ {n} workers: rows differ from {counts[0]} workers")
+            sys.exit(1)
+    if cores == 1:
+        print("single core: worker processes can't run in parallel here")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# backend/benchmarks/scrape_replay.py
+#
+# Full scraper run against recorded fixtures (backend/scraping/fixtures.py).
+#
+#   python -m backend.scraping.fixtures synth data/fixtures/synthetic   # or `record`
+#   python -m backend.benchmarks.scrape_replay data/fixtures/synthetic --latency-ms 50
+#
+# The fixtures are replayed by a local stand-in; the Tomsarkgh scraper and one
+# /menu live prefetch pass run in a fresh interpreter with an empty SQLite DB.
+# Reported: wall time and pages/sec of the full run, parse time per page (the
+# recorded event pages through parse_event / parse_live_event), and peak Python
+# memory of the run (tracemalloc, in a second run so it doesn't skew timings).
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from backend.scraping.fixtures import FixtureStore, scraper_env
+from backend.scraping.standin import StandinServer
+
+
+def _parse_timings(store: FixtureStore) -> dict:
+    from backend.armenia.events_sources import parse_live_event
+    from backend.news_scraper import event_url_en, parse_event
+
+    hy_pages = dict(store.pages("/hy/event/"))
+    en_pages = dict(store.pages("/en/event/"))
+
+    started = time.perf_counter()
+    for key, html in hy_pages.items():
+        parse_event(key, "events", html, en_pages.get(event_url_en(key)))
+    event_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for key, html in hy_pages.items():
+        parse_live_event(key, html)
+    live_s = time.perf_counter() - started
+
+    n = max(len(hy_pages), 1)
+    return {"events": len(hy_pages), "parse_ms": event_s * 1000 / n, "live_parse_ms": live_s * 1000 / n}
+
+
+def child(mode: str, directory: str) -> None:
+    import asyncio
+    import contextlib
+    import io
+    import tracemalloc
+
+    from backend import database
+    from backend.armenia.live_prefetch import live_prefetcher
+    from backend.news_scraper import scrape_tomsarkgh_events
+
+    result = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        database.init_db()
+        if mode == "memory":
+            tracemalloc.start()
+        started = time.perf_counter()
+        result["saved"] = scrape_tomsarkgh_events()
+        result["live"] = sum(asyncio.run(live_prefetcher.refresh()).values())
+        result["elapsed"] = time.perf_counter() - started
+        if mode == "memory":
+            result["peak_mib"] = tracemalloc.get_traced_memory()[1] / 2**20
+            tracemalloc.stop()
+        else:
+            result.update(_parse_timings(FixtureStore(directory)))
+        result["maxrss_mib"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    print(json.dumps(result))
+
+
+def run(mode: str, directory: str, base_url: str, db: str, extra: dict) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-m", "backend.benchmarks.scrape_replay", "--child", mode, directory],
+        env=scraper_env(base_url, db, **extra), capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Scraper benchmark on recorded fixtures")
+    ap.add_argument("directory", help="fixtures directory (backend/scraping/fixtures.py)")
+    ap.add_argument("--latency-ms", type=float, default=0.0, help="replay response delay")
+    ap.add_argument("--concurrency", type=int, default=8)
+    ap.add_argument("--per-host", type=int, default=4)
+    ap.add_argument("--parse-workers", type=int, default=None, help="SCRAPER_PARSE_WORKERS (default: setting)")
+    args = ap.parse_args()
+
+    store = FixtureStore(args.directory)
+    if not len(store):
+        sys.exit(f"no fixtures in {args.directory} — run `python -m backend.scraping.fixtures synth|record` first")
+
+    extra = {"SCRAPER_CONCURRENCY": str(args.concurrency), "SCRAPER_PER_HOST": str(args.per_host)}
+    if args.parse_workers is not None:
+        extra["SCRAPER_PARSE_WORKERS"] = str(args.parse_workers)
+    server = StandinServer(store, latency=args.latency_ms / 1000)
+    with tempfile.TemporaryDirectory() as tmp, server as base_url:
+        timed = run("timed", args.directory, base_url, os.path.join(tmp, "timed.db"), extra)
+        requests = server.requests
+        memory = run("memory", args.directory, base_url, os.path.join(tmp, "memory.db"), extra)
+
+    print(f"{len(store)} recorded pages in {args.directory}, replay latency {args.latency_ms:.0f} ms, "
+          f"concurrency {args.concurrency} (per host {args.per_host}), "
+          f"parse workers {extra.get('SCRAPER_PARSE_WORKERS', 'default')}")
+    print(f"full run        {timed['elapsed']:.2f} s, {requests} requests, "
+          f"{requests / timed['elapsed']:.0f} pages/s, {timed['saved']} events + {timed['live']} live saved")
+    print(f"parse per page  {timed['parse_ms']:.2f} ms (parse_event, HY+EN), "
+          f"{timed['live_parse_ms']:.2f} ms (parse_live_event) over {timed['events']} event pages")
+    print(f"peak memory     {memory['peak_mib']:.1f} MiB traced (tracemalloc), "
+          f"{timed['maxrss_mib']:.0f} MiB max RSS")
+
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        i = sys.argv.index("--child")
+        child(sys.argv[i + 1], sys.argv[i + 2])
+    else:
+        main()
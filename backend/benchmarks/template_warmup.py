@@ -0,0 +1,103 @@
+# backend/benchmarks/template_warmup.py
+#
+# First-request latency after a (simulated) deploy / worker restart.
+#
+#   python -m backend.benchmarks.template_warmup
+#
+# Every scenario runs in a fresh interpreter (nothing compiled in memory),
+# starts the app in-process, then times the first and second GET of a few pages:
+#   lazy, no cache        — the old Jinja2Templates(directory=...) behaviour
+#   lazy, bytecode cold   — cache dir empty (first boot after deploy)
+#   lazy, bytecode warm   — cache dir filled by a previous worker
+#   precompile + warm     — TEMPLATES_PRECOMPILE=1, compile cost moved to startup
+# Run from the repo root (templates/ and static/ are relative paths).
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROUTES = [
+    "/hy",
+    "/en/churches",
+    "/hy/churches/etchmiadzin",
+    "/en/sights/garni",
+    "/hy/places/kond-house",
+    "/en/news",
+    "/hy/about",
+    "/admin",
+]
+
+
+def child() -> None:
+    import contextlib
+    import io
+    from pathlib import Path
+
+    from backend import database
+    database.DB_PATH = Path(os.environ["BENCH_DB"])
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        from fastapi.testclient import TestClient
+        from backend.web_app import app
+        client = TestClient(app)
+        client.__enter__()  # runs startup hooks (precompile, etc.)
+        startup = time.perf_counter() - started
+
+        first, second = {}, {}
+        for route in ROUTES:
+            for bucket in (first, second):
+                t = time.perf_counter()
+                resp = client.get(route, follow_redirects=False)
+                bucket[route] = (time.perf_counter() - t) * 1000
+                assert resp.status_code < 500, (route, resp.status_code)
+        client.__exit__(None, None, None)
+
+    print(json.dumps({"startup": startup * 1000, "first": first, "second": second}))
+
+
+def run(label: str, cache_dir: str, precompile: bool, db: str) -> dict:
+    env = dict(
+        os.environ,
+        TEMPLATES_CACHE_DIR=cache_dir,
+        TEMPLATES_PRECOMPILE="1" if precompile else "0",
+        BENCH_DB=db,
+        DATABASE_URL="",
+    )
+    out = subprocess.run(
+        [sys.executable, "-m", "backend.benchmarks.template_warmup", "--child"],
+        env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    result = json.loads(out.strip().splitlines()[-1])
+    result["label"] = label
+    return result
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, "bench.db")
+        cache = os.path.join(tmp, "jinja")
+        results = [
+            run("lazy, no cache", "", False, db),
+            run("lazy, bytecode cold", cache, False, db),
+            run("lazy, bytecode warm", cache, False, db),
+            run("precompile + warm", cache, True, db),
+        ]
+
+    width = max(len(r) for r in ROUTES)
+    print(f"{'first request (ms)':<{width}}" + "".join(f"{r['label']:>22}" for r in results))
+    for route in ROUTES:
+        print(f"{route:<{width}}" + "".join(f"{r['first'][route]:22.1f}" for r in results))
+    print(f"{'sum first':<{width}}" + "".join(f"{sum(r['first'].values()):22.1f}" for r in results))
+    print(f"{'sum second (warm)':<{width}}" + "".join(f"{sum(r['second'].values()):22.1f}" for r in results))
+    print(f"{'startup':<{width}}" + "".join(f"{r['startup']:22.1f}" for r in results))
+
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        child()
+    else:
+        main()
@@ -0,0 +1,153 @@
+# backend/benchmarks/tomsarkgh_scrape.py
+#
+# Sequential (requests) vs concurrent (aiohttp) Tomsarkgh scraper.
+#
+#   python -m backend.benchmarks.tomsarkgh_scrape --latency-ms 80
+#
+# Both run against a local stand-in site (backend/scraping/standin.py) with a
+# fixed per-request latency, each into its own temporary SQLite DB, in a fresh
+# interpreter (BASE_TOMSARKGH_URL is read at import). The stored news rows
+# must be identical.
+#
+#   python -m backend.benchmarks.tomsarkgh_scrape --http-cache
+#
+# Three runs of the concurrent scraper sharing one DB and one on-disk HTTP cache:
+#   cold     empty DB and cache
+#   stale    SCRAPER_REFRESH_HOURS=0 — every known event is revalidated (304s, no parsing)
+#   fresh    default refresh policy — known events are not fetched at all
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from backend.scraping.standin import StandinServer, SyntheticTomsarkgh
+
+ROW_COLUMNS = (
+    "source_url", "title_hy", "title_en", "content_hy", "content_en", "image_url",
+    "category", "eventdate", "eventtime", "venue_hy", "price_hy",
+)
+
+
+def child(mode: str) -> None:
+    import contextlib
+    import io
+
+    from backend import database
+    from backend import news_scraper
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        database.init_db()
+        started = time.perf_counter()
+        fetch_stats = {}
+        if mode == "sequential":
+            saved = news_scraper.scrape_tomsarkgh_events_sequential()
+        elif mode == "cached":
+            saved, fetch_stats = asyncio.run(_scrape_cached())
+        else:
+            saved = news_scraper.scrape_tomsarkgh_events()
+        elapsed = time.perf_counter() - started
+
+        conn = database.get_connection()
+        cur = database.get_cursor(conn)
+        cur.execute(f"SELECT {', '.join(ROW_COLUMNS)} FROM news ORDER BY source_url")
+        rows = [list(r) for r in cur.fetchall()]
+        conn.close()
+
+    print(json.dumps({"elapsed": elapsed, "saved": saved, "rows": rows, "fetch": fetch_stats}))
+
+
+async def _scrape_cached():
+    from backend.scraping.fetch import Fetcher
+    from backend.scraping.tomsarkgh import default_cache, scrape_tomsarkgh_events_async
+
+    async with Fetcher(cache=default_cache()) as fetcher:
+        saved = await scrape_tomsarkgh_events_async(fetcher=fetcher)
+    st = fetcher.stats
+    return saved, {"bytes": st.bytes, "not_modified": st.not_modified, "bytes_saved": st.bytes_saved}
+
+
+def run(mode: str, base_url: str, db: str, extra_env: dict) -> dict:
+    env = dict(os.environ, TOMSARKGH_BASE_URL=base_url, SQLITE_PATH=db, DATABASE_URL="",
+               SCRAPER_CRAWL_DELAY_MS="0", **extra_env)
+    out = subprocess.run(
+        [sys.executable, "-m", "backend.benchmarks.tomsarkgh_scrape", "--child", mode],
+        env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Tomsarkgh scraper benchmark")
+    ap.add_argument("--latency-ms", type=float, default=80.0, help="stand-in response delay")
+    ap.add_argument("--per-type", type=int, default=20)
+    ap.add_argument("--concurrency", type=int, default=8)
+    ap.add_argument("--per-host", type=int, default=8)
+    ap.add_argument("--http-cache", action="store_true", help="cold / stale / fresh runs with the HTTP cache")
+    args = ap.parse_args()
+
+    site = SyntheticTomsarkgh(per_type=args.per_type)
+    extra = {"SCRAPER_CONCURRENCY": str(args.concurrency), "SCRAPER_PER_HOST": str(args.per_host)}
+    if args.http_cache:
+        return http_cache_main(args, site, extra)
+
+    extra["SCRAPER_CACHE_DIR"] = ""
+    results = {}
+    server = StandinServer(site, latency=args.latency_ms / 1000)
+    with tempfile.TemporaryDirectory() as tmp, server as base_url:
+        for mode in ("sequential", "concurrent"):
+            before = server.requests
+            results[mode] = run(mode, base_url, os.path.join(tmp, f"{mode}.db"), extra)
+            results[mode]["requests"] = server.requests - before
+
+    seq, conc = results["sequential"], results["concurrent"]
+    print(f"stand-in latency {args.latency_ms:.0f} ms, {len(site.events)} events, "
+          f"concurrency {args.concurrency} (per host {args.per_host})")
+    print(f"{'':<12}{'seconds':>10}{'requests':>10}{'saved':>8}{'rows':>7}")
+    for mode, r in (("sequential", seq), ("concurrent", conc)):
+        print(f"{mode:<12}{r['elapsed']:>10.2f}{r['requests']:>10}{r['saved']:>8}{len(r['rows']):>7}")
+    print(f"speed-up ×{seq['elapsed'] / conc['elapsed']:.1f}")
+    same = seq["rows"] == conc["rows"]
+    print("rows identical" if same else "ROWS DIFFER")
+    if not same:
+        sys.exit(1)
+
+
+def http_cache_main(args, site, extra: dict) -> None:
+    results = {}
+    server = StandinServer(site, latency=args.latency_ms / 1000)
+    with tempfile.TemporaryDirectory() as tmp, server as base_url:
+        extra = dict(extra, SCRAPER_CACHE_DIR=os.path.join(tmp, "http_cache"))
+        db = os.path.join(tmp, "cached.db")
+        for run_name, refresh_hours in (("cold", "24"), ("stale", "0"), ("fresh", "24")):
+            before, before_304 = server.requests, server.not_modified
+            results[run_name] = run("cached", base_url, db, dict(extra, SCRAPER_REFRESH_HOURS=refresh_hours))
+            results[run_name]["requests"] = server.requests - before
+            results[run_name]["304"] = server.not_modified - before_304
+
+    print(f"stand-in latency {args.latency_ms:.0f} ms, {len(site.events)} events, HTTP cache")
+    print(f"{'':<6}{'seconds':>10}{'requests':>10}{'304':>6}{'KiB in':>9}{'KiB saved':>11}{'saved':>7}")
+    for name, r in results.items():
+        f = r["fetch"]
+        print(f"{name:<6}{r['elapsed']:>10.2f}{r['requests']:>10}{r['304']:>6}"
+              f"{f['bytes'] / 1024:>9.0f}{f['bytes_saved'] / 1024:>11.0f}{r['saved']:>7}")
+    cold, stale, fresh = results["cold"], results["stale"], results["fresh"]
+    ok = (
+        cold["rows"] == stale["rows"] == fresh["rows"]
+        and stale["saved"] == fresh["saved"] == 0
+        and fresh["requests"] == len(site.lists)   # list pages only
+    )
+    print("known events revalidated / skipped, rows unchanged" if ok else "UNEXPECTED RESULT")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        child(sys.argv[sys.argv.index("--child") + 1])
+    else:
+        main()
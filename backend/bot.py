@@ -1,8 +1,10 @@
 # bot.py
 
 import asyncio
+import html
 import logging
 import random
+import re
 import os
 import datetime
 import signal
@@ -41,7 +43,11 @@ from backend.database import (
     init_db,
 )
 from backend.armenia.events import get_events_by_category, _format_event_line
+from backend.armenia.live_prefetch import live_prefetcher
+from backend.scraping.image_mirror import telegram_photo
 from backend.armenia.recommend import get_recommendations
+from backend.catalog.geo import get_geo_index
+from backend.catalog.items import card
 from transliterate import translit
 from backend.database import get_user
 from backend.languages import get_text
@@ -297,7 +303,7 @@ async def handle_menu_callback(callback: CallbackQuery):
         if image_url:
             try:
                 await callback.message.answer_photo(
-                    photo=image_url,
+                    photo=telegram_photo(image_url, BOT_SITE_URL),
                     caption=caption,
                 )
             except Exception:
@@ -385,6 +391,64 @@ async def on_chat_member_update(event: ChatMemberUpdated):
         text = get_text("goodbye_member", lang).format(name=user.full_name)
         await bot.send_message(chat_id, text)
         
+# ========== Location → մոտակա վայրեր մեր catalog-ից ==========
+
+# Ամբողջ բառեր/արտահայտություններ (ոչ substring՝ "mot" ≠ "remote", "near" ≠ "nearly",
+# "մոտ" ≠ "մոտավորապես"), so inflected forms are listed explicitly
+NEAR_ME_KEYWORDS = [
+    "մոտ", "մոտիկ", "մոտիկում", "մոտակա", "մոտակայք", "մոտակայքում", "մոտերքում",
+    "կողք", "կողքը", "կողքին", "կողքերում", "շրջակայք", "շրջակայքում", "շրջակայքի",
+    "near", "nearby", "near me", "close to me", "around me", "around here",
+    "рядом", "поблизости", "недалеко", "около меня",
+    "mot", "motik", "motaka", "koxq", "koxqin",
+]
+NEARBY_RADIUS_KM = 5
+
+_WORD_RE = re.compile(r"\w+")
+_NEAR_ME_PHRASES = {tuple(_WORD_RE.findall(k)) for k in NEAR_ME_KEYWORDS}
+_NEAR_ME_MAX_WORDS = max(len(p) for p in _NEAR_ME_PHRASES)
+
+
+def is_near_me_question(text: str) -> bool:
+    words = _WORD_RE.findall(text.lower())
+    return any(
+        tuple(words[i:i + n]) in _NEAR_ME_PHRASES
+        for n in range(1, _NEAR_ME_MAX_WORDS + 1)
+        for i in range(len(words) - n + 1)
+    )
+
+
+def catalog_nearby_lines(user_location: str, lang: str, limit: int = 3) -> list[str]:
+    """"lat,lon" → մեր եկեղեցիներ/տեսարժան վայրեր/places-ից ամենամոտերը (Google-ից առաջ)"""
+    lat, lon = (float(x) for x in user_location.split(","))
+    hits = get_geo_index().nearest(lat, lon, k=limit, max_km=NEARBY_RADIUS_KM)
+    site_lang = "hy" if lang == "hy" else "en"
+    lines = []
+    for km, (kind, item) in hits:
+        c = card(kind, item, site_lang)
+        dist = f"{km * 1000:.0f} m" if km < 1 else f"{km:.1f} km"
+        lines.append(f"📍 <b>{html.escape(c['title'])}</b> — {dist}\n{BOT_SITE_URL}{c['url']}")
+    return lines
+
+
+@dp.message(F.location, F.chat.type == "private")
+async def handle_location(message: Message):
+    loc = message.location
+    USER_LOCATIONS[message.from_user.id] = f"{loc.latitude},{loc.longitude}"
+
+    user_row = get_user(message.from_user.id)
+    lang = user_row["language"] if user_row and user_row.get("language") else "hy"
+    lines = catalog_nearby_lines(USER_LOCATIONS[message.from_user.id], lang)
+
+    if lang == "ru":
+        head = "📌 Рядом с вами:" if lines else f"📌 В радиусе {NEARBY_RADIUS_KM} км из нашего каталога ничего нет."
+    elif lang == "en":
+        head = "📌 Near you:" if lines else f"📌 Nothing from our catalog within {NEARBY_RADIUS_KM} km."
+    else:
+        head = "📌 Քո մոտակայքում․" if lines else f"📌 {NEARBY_RADIUS_KM} կմ շառավղում մեր ցանկից վայր չկա։"
+
+    await message.answer("\n\n".join([head] + lines), disable_web_page_preview=True)
+
 # ========== /start-ից հետո AI հարց ==========
 
 from transliterate import translit  # մի անգամ ավելացնել imports-ում
@@ -419,19 +483,27 @@ async def handle_user_question(message: Message, state: FSMContext):
     user_id = message.from_user.id
     user_location = USER_LOCATIONS.get(user_id)
 
-    # 1) Maps-ի recommendation-ներ
+    # 1) "մոտս ի՞նչ կա" → նախ մեր catalog-ից, Google-ը միայն եթե մոտակայքում բան չկա
     rec_parts: list[str] = []
-    try:
-        recs = await get_recommendations(raw, user_location=user_location)
-        if recs and not recs[0].startswith("🤔 "):
-            rec_parts.extend(recs)
-    except Exception:
-        pass
-
-    # 2) Groq AI պատասխան
+    if user_location and is_near_me_question(raw):
+        try:
+            rec_parts.extend(catalog_nearby_lines(user_location, lang))
+        except Exception as e:
+            logger.warning(f"Catalog nearby failed: {e}")
+
+    # 2) Maps-ի recommendation-ներ
+    if not rec_parts:
+        try:
+            recs = await get_recommendations(raw, user_location=user_location)
+            if recs and not recs[0].startswith("🤔 "):
+                rec_parts.extend(recs)
+        except Exception:
+            pass
+
+    # 3) Groq AI պատասխան
     reply = await generate_reply(raw, lang=lang)
 
-    # 3) Կոմբինացված պատասխան
+    # 4) Կոմբինացված պատասխան
     if rec_parts:
         if lang == "ru":
             separator = "➕ Помимо этих вариантов, также:"
@@ -1132,6 +1204,7 @@ async def main():
     logger.info("Webhook deleted for clean start")
 
     polling_task = asyncio.create_task(dp.start_polling(bot))
+    live_prefetcher.start()   # /menu LIVE fallback snapshot
 
     try:
         await stop_event.wait()
@@ -1139,6 +1212,7 @@ async def main():
         logger.info("Keyboard interrupt received.")
     finally:
         logger.info("Shutting down bot...")
+        await live_prefetcher.stop()
         await dp.stop_polling()
         await bot.session.close()
         logger.info("Bot stopped successfully.")
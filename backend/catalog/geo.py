@@ -0,0 +1,158 @@
+# backend/catalog/geo.py
+#
+# Static k-d tree over catalog coordinates.
+#
+# Points are stored as 3-D unit vectors, so straight-line (chord) distance is
+# monotonic in great-circle distance: k-nearest and radius queries are exact
+# haversine answers without any lat/lon wrap-around special cases.
+
+import heapq
+import math
+import threading
+from typing import Any, List, Optional, Tuple
+
+from backend.catalog.items import iter_items
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def _unit(lat: float, lon: float) -> Tuple[float, float, float]:
+    la, lo = math.radians(lat), math.radians(lon)
+    return (math.cos(la) * math.cos(lo), math.cos(la) * math.sin(lo), math.sin(la))
+
+
+def _chord2(a, b) -> float:
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+
+def _chord_to_km(chord2: float) -> float:
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(chord2) / 2))
+
+
+def _km_to_chord2(km: float) -> float:
+    return (2 * math.sin(min(math.pi, km / EARTH_RADIUS_KM) / 2)) ** 2
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    return _chord_to_km(_chord2(_unit(lat1, lon1), _unit(lat2, lon2)))
+
+
+class GeoIndex:
+    """
+    Balanced k-d tree kept in flat lists (point / axis / left / right per node).
+    payload is whatever the caller wants back — here (kind, item).
+    """
+
+    def __init__(self, points: List[Tuple[float, float, Any]]):
+        self._xyz: List[Tuple[float, float, float]] = []
+        self._payload: List[Any] = []
+        self._axis: List[int] = []
+        self._left: List[int] = []
+        self._right: List[int] = []
+        order = []
+        for lat, lon, payload in points:
+            self._xyz.append(_unit(lat, lon))
+            self._payload.append(payload)
+            order.append(len(order))
+        self._node_point: List[int] = []
+        self._root = self._build(order)
+
+    def __len__(self) -> int:
+        return len(self._payload)
+
+    def _build(self, idx: List[int]) -> int:
+        if not idx:
+            return -1
+        # split on the axis with the widest spread
+        spreads = [
+            max(self._xyz[i][a] for i in idx) - min(self._xyz[i][a] for i in idx)
+            for a in range(3)
+        ]
+        axis = spreads.index(max(spreads))
+        idx.sort(key=lambda i: self._xyz[i][axis])
+        mid = len(idx) // 2
+
+        node = len(self._node_point)
+        self._node_point.append(idx[mid])
+        self._axis.append(axis)
+        self._left.append(-1)
+        self._right.append(-1)
+        self._left[node] = self._build(idx[:mid])
+        self._right[node] = self._build(idx[mid + 1:])
+        return node
+
+    def nearest(self, lat: float, lon: float, k: int = 5,
+                max_km: Optional[float] = None) -> List[Tuple[float, Any]]:
+        """k closest points → [(distance_km, payload), ...] nearest first."""
+        if k <= 0 or self._root < 0:
+            return []
+        q = _unit(lat, lon)
+        bound = _km_to_chord2(max_km) if max_km is not None else math.inf
+        heap: List[Tuple[float, int]] = []   # max-heap via negated distance
+
+        def visit(node: int) -> None:
+            if node < 0:
+                return
+            p = self._node_point[node]
+            d2 = _chord2(q, self._xyz[p])
+            if d2 <= bound:
+                if len(heap) < k:
+                    heapq.heappush(heap, (-d2, p))
+                elif d2 < -heap[0][0]:
+                    heapq.heapreplace(heap, (-d2, p))
+            axis = self._axis[node]
+            diff = q[axis] - self._xyz[p][axis]
+            near, far = (self._left[node], self._right[node]) if diff < 0 else (self._right[node], self._left[node])
+            visit(near)
+            worst = -heap[0][0] if len(heap) == k else bound
+            if diff * diff <= worst:
+                visit(far)
+
+        visit(self._root)
+        return [
+            (round(_chord_to_km(-nd2), 3), self._payload[p])
+            for nd2, p in sorted(heap, key=lambda t: -t[0])
+        ]
+
+    def within(self, lat: float, lon: float, radius_km: float) -> List[Tuple[float, Any]]:
+        """All points inside radius_km → [(distance_km, payload), ...] nearest first."""
+        if self._root < 0:
+            return []
+        q = _unit(lat, lon)
+        bound = _km_to_chord2(radius_km)
+        found: List[Tuple[float, int]] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node < 0:
+                continue
+            p = self._node_point[node]
+            d2 = _chord2(q, self._xyz[p])
+            if d2 <= bound:
+                found.append((d2, p))
+            axis = self._axis[node]
+            diff = q[axis] - self._xyz[p][axis]
+            if diff < 0 or diff * diff <= bound:
+                stack.append(self._left[node])
+            if diff >= 0 or diff * diff <= bound:
+                stack.append(self._right[node])
+        found.sort()
+        return [(round(_chord_to_km(d2), 3), self._payload[p]) for d2, p in found]
+
+
+_index: Optional[GeoIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_geo_index() -> GeoIndex:
+    """Process-wide index over every catalog item that has lat/lon."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = GeoIndex([
+                    (item["lat"], item["lon"], (kind, item))
+                    for kind, item in iter_items()
+                    if "lat" in item and "lon" in item
+                ])
+    return _index
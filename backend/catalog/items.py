@@ -0,0 +1,47 @@
+# backend/catalog/items.py
+#
+# One flat view over CHURCHES / SIGHTS / PLACES for search and geo lookups.
+
+from typing import Iterator
+
+from backend.churches_data import CHURCHES
+from backend.sights_data import SIGHTS
+from backend.places_data import PLACES
+
+# kind → (data list, URL section)
+CATALOGS = {
+    "church": (CHURCHES, "churches"),
+    "sight": (SIGHTS, "sights"),
+    "place": (PLACES, "places"),
+}
+
+
+def title(item: dict, lang: str) -> str:
+    """Churches use name_*, sights/places use title_*."""
+    return item.get(f"name_{lang}") or item.get(f"title_{lang}") or item["id"]
+
+
+def item_url(kind: str, item_id: str, lang: str) -> str:
+    return f"/{lang}/{CATALOGS[kind][1]}/{item_id}"
+
+
+def iter_items() -> Iterator[tuple]:
+    """Yields (kind, item) for every catalog entry."""
+    for kind, (items, _) in CATALOGS.items():
+        for item in items:
+            yield kind, item
+
+
+def card(kind: str, item: dict, lang: str) -> dict:
+    """Short JSON-able card used by /api/catalog/* responses."""
+    thumb = item.get("thumb") or item.get("image_main") or ""
+    if thumb and not thumb.startswith(("/", "http")):
+        thumb = "/" + thumb
+    return {
+        "kind": kind,
+        "id": item["id"],
+        "title": title(item, lang),
+        "location": item.get(f"location_{lang}", ""),
+        "url": item_url(kind, item["id"], lang),
+        "thumb": thumb,
+    }
@@ -0,0 +1,182 @@
+# backend/catalog/search.py
+#
+# In-memory BM25 search over churches / sights / places (hy + en fields).
+#
+# Every token is reduced to a "canonical" Latin key: Armenian script goes through
+# transliterate (hy → Latin), then spelling variants people actually type
+# (tch/ch, ts/c/dz, kh/x, q/k, ye/e …) are folded together. So "Garni tachar",
+# "garnii tatchar" and "Գառնիի տաճար" all hit the same postings.
+
+import html
+import math
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from transliterate import translit
+
+from backend.catalog.items import iter_items, title
+from backend.utils.logger import logger
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_ARMENIAN_RE = re.compile("[Ա-և]")
+_KEEP_RE = re.compile("[^a-z0-9Ѐ-ӿ]")
+_REPEAT_RE = re.compile(r"(.)\1+")
+
+# Order matters: trigraphs before the digraphs they contain.
+_FOLDS = (
+    ("tch", "ch"), ("dj", "j"), ("jh", "j"), ("zh", "j"),
+    ("kh", "x"), ("gh", "g"), ("th", "t"), ("ph", "p"),
+    ("tz", "c"), ("ts", "c"), ("dz", "c"),
+    ("ye", "e"), ("vo", "o"), ("q", "k"), ("w", "v"), ("y", "j"),
+)
+
+FIELD_WEIGHTS = {"title": 3.0, "location": 1.5, "short": 1.5, "description": 1.0}
+
+
+@lru_cache(maxsize=50_000)
+def canonical(token: str) -> str:
+    """Script- and spelling-independent key for one token."""
+    t = token.lower()
+    if _ARMENIAN_RE.search(t):
+        t = translit(t, "hy", reversed=True).lower()
+    t = t.replace("&", "ev").replace("'", "")
+    for src, dst in _FOLDS:
+        t = t.replace(src, dst)
+    t = _KEEP_RE.sub("", t)
+    return _REPEAT_RE.sub(r"\1", t)
+
+
+def tokenize(text: str) -> List[str]:
+    text = html.unescape(_TAG_RE.sub(" ", text or ""))
+    out = []
+    for raw in _TOKEN_RE.findall(text):
+        key = canonical(raw)
+        if len(key) > 1 or key.isdigit():
+            out.append(key)
+    return out
+
+
+def _doc_fields(item: dict) -> Dict[str, str]:
+    return {
+        "title": f"{title(item, 'hy')} {title(item, 'en')}",
+        "location": f"{item.get('location_hy', '')} {item.get('location_en', '')}",
+        "short": f"{item.get('short_hy', '')} {item.get('short_en', '')}",
+        "description": f"{item.get('description_hy', '')} {item.get('description_en', '')}",
+    }
+
+
+class CatalogIndex:
+    """
+    Inverted index with field-weighted BM25.
+    postings: term → [(doc_no, weighted tf), ...]
+    """
+
+    K1 = 1.2
+    B = 0.75
+    PREFIX_WEIGHT = 0.7      # completions of the last term score a bit lower
+    MAX_EXPANSIONS = 30
+
+    def __init__(self, docs: List[Tuple[str, dict]]):
+        self.docs = docs
+        self.postings: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+        lengths = []
+
+        for doc_no, (_, item) in enumerate(docs):
+            tf: Counter = Counter()
+            length = 0.0
+            for field, text in _doc_fields(item).items():
+                weight = FIELD_WEIGHTS[field]
+                for term in tokenize(text):
+                    tf[term] += weight
+                    length += weight
+            for term, freq in tf.items():
+                self.postings[term].append((doc_no, freq))
+            lengths.append(length)
+
+        self.postings = dict(self.postings)
+        self.vocab = sorted(self.postings)
+        avg = (sum(lengths) / len(lengths)) if lengths else 1.0
+        self._norm = [self.K1 * (1 - self.B + self.B * n / avg) for n in lengths]
+        n_docs = len(docs)
+        self._idf = {
+            term: math.log(1 + (n_docs - len(p) + 0.5) / (len(p) + 0.5))
+            for term, p in self.postings.items()
+        }
+
+    def complete(self, prefix: str) -> List[str]:
+        """Vocabulary terms starting with a canonical prefix, most common first."""
+        if not prefix:
+            return []
+        matches = []
+        i = bisect_left(self.vocab, prefix)
+        while i < len(self.vocab) and self.vocab[i].startswith(prefix):
+            matches.append(self.vocab[i])
+            i += 1
+        matches.sort(key=lambda t: -len(self.postings[t]))
+        return matches[: self.MAX_EXPANSIONS]
+
+    def search(self, query: str, limit: int = 10, prefix: bool = True) -> List[Tuple[str, dict, float]]:
+        """
+        Returns [(kind, item, score), ...] best first.
+        prefix=True treats the last query word as unfinished (autocomplete).
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        # Each query word is one BM25 clause. The unfinished last word
+        # scores by its best completion, so "zvartnots" isn't outranked by a
+        # page that merely mentions several inflected forms of it.
+        clauses = [{term: 1.0} for term in dict.fromkeys(terms)]
+        if prefix and not query[-1:].isspace():
+            last = next(c for c in clauses if terms[-1] in c)
+            for term in self.complete(terms[-1]):
+                last.setdefault(term, self.PREFIX_WEIGHT)
+
+        scores: Dict[int, float] = defaultdict(float)
+        for clause in clauses:
+            best_in_clause: Dict[int, float] = {}
+            for term, qweight in clause.items():
+                postings = self.postings.get(term)
+                if not postings:
+                    continue
+                idf = self._idf[term]
+                for doc_no, tf in postings:
+                    s = qweight * idf * tf * (self.K1 + 1) / (tf + self._norm[doc_no])
+                    if s > best_in_clause.get(doc_no, 0.0):
+                        best_in_clause[doc_no] = s
+            for doc_no, s in best_in_clause.items():
+                scores[doc_no] += s
+
+        best = sorted(scores.items(), key=lambda kv: -kv[1])[:limit]
+        return [(self.docs[d][0], self.docs[d][1], round(s, 4)) for d, s in best]
+
+
+_index: Optional[CatalogIndex] = None
+_index_lock = threading.Lock()
+
+
+def build_index() -> CatalogIndex:
+    started = time.perf_counter()
+    index = CatalogIndex(list(iter_items()))
+    logger.info(
+        f"🔎 Catalog index: {len(index.docs)} docs, {len(index.vocab)} terms "
+        f"in {(time.perf_counter() - started) * 1000:.1f} ms"
+    )
+    return index
+
+
+def get_index() -> CatalogIndex:
+    """Process-wide index, built on first use (catalog data is static)."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = build_index()
+    return _index
@@ -14,6 +14,8 @@ CHURCHES = [
         "address_en": "Araratyan 1, Vagharshapat 1101",
         "unesco": True,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=40.1596,44.2919",
+        "lat": 40.1596,
+        "lon": 44.2919,
         "image_main": "/static/img/churches/etchmiadzin-old-1.jpg",
         "image_old": "/static/img/churches/etchmiadzin-old-1.jpg",
         "image_new": "/static/img/churches/etchmiadzin-old-2.jpg",
@@ -127,6 +129,8 @@ history, and the present meet each other.
         "address_en": "Ancient Artashat, Ararat Province",
         "unesco": False,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=39.9010,44.5720",
+        "lat": 39.9010,
+        "lon": 44.5720,
         "image_main": "/static/img/churches/artashat-octagon-1.jpg",
         "image_old": "/static/img/churches/artashat-octagon-1.jpg",
         "image_new": "/static/img/churches/artashat-octagon-2.jpg",
@@ -214,6 +218,8 @@ Armenia to the church traditions of the Eastern Mediterranean.
         "address_en": "Hripsime 85, Vagharshapat",
         "unesco": True,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=40.1611,44.2919",
+        "lat": 40.1611,
+        "lon": 44.2919,
         "image_main": "/static/img/churches/hripsime-old.jpg",
         "image_old": "/static/img/churches/hripsime-old.jpg",
         "image_new": "/static/img/churches/hripsime-new.jpg",
@@ -274,6 +280,8 @@ Saint Hripsime is included in the UNESCO World Heritage List together with the o
         "address_en": "Vagharshapat, Armavir Province",
         "unesco": True,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=40.1578,44.2911",
+        "lat": 40.1578,
+        "lon": 44.2911,
         "image_main": "/static/img/churches/gayane-old.jpg",
         "image_old": "/static/img/churches/gayane-old.jpg",
         "image_new": "/static/img/churches/gayane-new.jpg",
@@ -332,6 +340,8 @@ The church is included in the UNESCO World Heritage complex “Etchmiadzin Cathe
         "address_en": "Khor Virap, Ararat Province",
         "unesco": False,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=39.8284,44.5619",
+        "lat": 39.8284,
+        "lon": 44.5619,
         "image_main": "/static/img/churches/khor-virap-new.jpg",
         "image_old": "/static/img/churches/khor-virap-old.jpg",
         "image_new": "/static/img/churches/khor-virap-new.jpg",
@@ -383,6 +393,8 @@ sites in Armenia, renowned for its view of Mount Ararat.
         "address_en": "Sevan, Gegharkunik Province",
         "unesco": False,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=40.5614,44.9494",
+        "lat": 40.5614,
+        "lon": 44.9494,
         "image_main": "/static/img/churches/sevanavank.jpg",
         "image_old": "/static/img/churches/sevanavank_old.png",
         "image_new": "/static/img/churches/sevanavank_new.jpg",
@@ -436,6 +448,8 @@ restored in the 20th century and now functions as a spiritual center and a belov
         "address_en": "Geghard Monastery, Kotayk Province",
         "unesco": True,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=40.1415,44.8143",
+        "lat": 40.1415,
+        "lon": 44.8143,
         "image_main": "/static/img/churches/geghard-outside-main.jpg",
         "image_old": "/static/img/churches/geghard-khachkars.jpg",
         "image_new": "/static/img/churches/geghard-outside-main.jpg",
@@ -514,6 +528,8 @@ At that time a strongly fortified monastic complex with walls, gates, and courty
         "address_en": "Noravank, Vayots Dzor",
         "unesco": False,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=39.6836,45.2311",
+        "lat": 39.6836,
+        "lon": 45.2311,
         "image_main": "/static/img/churches/noravank-new.jpg",
         "image_old": "/static/img/churches/noravank-old.jpg",
         "image_new": "/static/img/churches/noravank-new.jpg",
@@ -625,6 +641,8 @@ an excellent stop on the way to Syunik or Artsakh.
         "address_en": "Tatev 3218, Syunik Province",
         "unesco": False,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=39.3797,46.2442",
+        "lat": 39.3797,
+        "lon": 46.2442,
         "image_main": "/static/img/churches/tatev.jpg",
         "image_old": "/static/img/churches/tatev-old.jpg",
         "image_new": "/static/img/churches/tatev.jpg",
@@ -739,6 +757,8 @@ and a modern cableway.
         "address_en": "Haghpat, Lori Province",
         "unesco": True,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=41.0965,44.7048",
+        "lat": 41.0965,
+        "lon": 44.7048,
         "image_main": "/static/img/churches/haghpat.jpg",
         "image_old": "/static/img/churches/haghpat-old.jpg",
         "image_new": "/static/img/churches/haghpat-new.jpg",
@@ -851,6 +871,8 @@ is a very good “concentrate” of that feeling.
         "address_en": "Sanahin 1705, Lori Province",
         "unesco": True,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=41.1009,44.6997",
+        "lat": 41.1009,
+        "lon": 44.6997,
         "image_main": "/static/img/churches/sanahin-new.jpg",
         "image_old": "/static/img/churches/sanahin-old.jpg",
         "image_new": "/static/img/churches/sanahin-new.jpg",
@@ -964,6 +986,8 @@ and enjoy the green views of the Debed gorge.
         "address_en": "Haghartsin 3902, Tavush Province",
         "unesco": False,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=40.8012,44.9623",
+        "lat": 40.8012,
+        "lon": 44.9623,
         "image_main": "/static/img/churches/haghartin.jpg",
         "image_old": "/static/img/churches/aghartin.jpg",
         "image_new": "/static/img/churches/haghartin.jpg",
@@ -1056,6 +1080,8 @@ stop for travelers along the North–South route.
         "address_en": "Gosh 3907, Tavush Province",
         "unesco": False,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=40.8178,44.8756",
+        "lat": 40.8178,
+        "lon": 44.8756,
         "image_main": "/static/img/churches/goshavank.jpg",
         "image_old": "/static/img/churches/goshavank-old.jpg",
         "image_new": "/static/img/churches/goshavank-new.webp",
@@ -1133,6 +1159,8 @@ in the early morning when the surrounding village is still asleep.
         "address_en": "Marmashen, Shirak Province",
         "unesco": False,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=40.8523,43.7841",
+        "lat": 40.8523,
+        "lon": 43.7841,
         "image_main": "/static/img/churches/Marmashen.jpg",
         "image_old": "/static/img/churches/Marmashen1.jpg",
         "image_new": "/static/img/churches/Marmashen.jpg",
@@ -1206,6 +1234,8 @@ of Shirak. The view of the Akhuryan gorge, especially during harvest season, is
         "address_en": "Vagharshapat, Armavir Province",
         "unesco": True,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=40.1567,44.2889",
+        "lat": 40.1567,
+        "lon": 44.2889,
         "image_main": "/static/img/churches/shoghakat.jpg",
         "image_old": "/static/img/churches/shoghakat-old.jpg",
         "image_new": "/static/img/churches/shoghakat-new.jpg",
@@ -1277,6 +1307,8 @@ personal atmosphere of pilgrimage compared to the crowded courtyard of the Mothe
         "address_en": "Aruch 0210, Aragatsotn Province",
         "unesco": False,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=40.2856,44.0231",
+        "lat": 40.2856,
+        "lon": 44.0231,
         "image_main": "/static/img/churches/aruchavank-old.jpg",
         "image_old": "/static/img/churches/aruchavank-old.jpg",
         "image_new": "/static/img/churches/aruchavank-inside.webp",
@@ -1373,6 +1405,8 @@ seldom‑touristed place where you can feel a direct connection with 7th‑centu
         "address_en": "Saghmosavan 0211, Aragatsotn Province",
         "unesco": False,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=40.3803,44.3956",
+        "lat": 40.3803,
+        "lon": 44.3956,
         "image_main": "/static/img/churches/saghmosavank-new.jpg",
         "image_old": "/static/img/churches/saghmosavank-old.jpg",
         "image_new": "/static/img/churches/saghmosavank-new.jpg",
@@ -1467,6 +1501,8 @@ by photographers and nature lovers.
         "address_en": "Ohanavan 0225, Aragatsotn Province",
         "unesco": False,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=40.3396,44.3888",
+        "lat": 40.3396,
+        "lon": 44.3888,
         "image_main": "/static/img/churches/hovanavank_hervic.jpg",
         "image_old": "/static/img/churches/hovanavanq_old.jpg",
         "image_new": "/static/img/churches/hovanavank_hervic.jpg",
@@ -1565,6 +1601,8 @@ towards Mount Aragats or Amberd Fortress.
         "address_en": "Odzun 1731, Lori Province",
         "unesco": False,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=41.0506,44.6158",
+        "lat": 41.0506,
+        "lon": 44.6158,
         "image_main": "/static/img/churches/Odzun-new.jpg",
         "image_old": "/static/img/churches/odzun_old.jpg",
         "image_new": "/static/img/churches/Odzun-new.jpg",
@@ -1633,6 +1671,8 @@ travel itinerary.
         "address_en": "Gndevaz 3704, Vayots Dzor",
         "unesco": False,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=39.7588,45.6111",
+        "lat": 39.7588,
+        "lon": 45.6111,
         "image_main": "/static/img/churches/Gndevank.jpg",
         "image_old": "/static/img/churches/Gndevank1.jpg",
         "image_new": "/static/img/churches/Gndevank.jpg",
@@ -1701,6 +1741,8 @@ a wonderful “hidden gem” along the Noravank–Tatev route.
         "address_en": "Yervand Kochar Street, Yerevan",
         "unesco": False,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=40.1719,44.5169",
+        "lat": 40.1719,
+        "lon": 44.5169,
         "image_main": "/static/img/churches/Saint-Gregory_1.jpg",
         "image_old": "/static/img/churches/Saint-Gregory_1.jpg",
         "image_new": "/static/img/churches/Saint_Gregory_2.webp",
@@ -1771,6 +1813,8 @@ ceremonies and national celebrations are held.
         "address_en": "Abovyan and Sayat-Nova intersection",
         "unesco": False,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=40.1844,44.5191",
+        "lat": 40.1844,
+        "lon": 44.5191,
         "image_main": "/static/img/churches/saint-anna-1.jpg",
         "image_old": "/static/img/churches/saint-anna-1.jpg",
         "image_new": "/static/img/churches/saint-anna-2.jpg",
@@ -1830,6 +1874,8 @@ it is frequently visited by residents of the city.
         "address_en": "Masis, Ararat Province",
         "unesco": False,
         "maps_url": "https://www.google.com/maps/search/?api=1&query=39.9995,44.4372",
+        "lat": 39.9995,
+        "lon": 44.4372,
         "image_main": "/static/img/churches/Saint_Tadeos.jpg",
         "image_old": "/static/img/churches/Saint_Tadeos11.jpg",
         "image_new": "/static/img/churches/Saint_Tadeos_Glxavor.jpg",
@@ -1,6 +1,7 @@
 # config/settings.py
 
 import os
+import tempfile
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
@@ -20,6 +21,85 @@ class Settings:
     TIMEZONE: str = os.getenv("TIMEZONE", "Asia/Yerevan")
     GROUP_CHAT_ID: int = int(os.getenv("GROUP_CHAT_ID", "-1003340745236"))
 
+    # Places detail page — comments per page (first render + "load more")
+    PLACE_COMMENTS_PAGE_SIZE: int = int(os.getenv("PLACE_COMMENTS_PAGE_SIZE", "20"))
+
+    # Places API write throttling: "db" (shared across workers) or "memory"
+    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "1") == "1"
+    RATE_LIMIT_STORE: str = os.getenv("RATE_LIMIT_STORE", "db")
+    # Proxies in front of the app that append to X-Forwarded-For: 0 = none, the
+    # header is ignored (set 1 on Render); uvicorn rewrites the client address
+    # only for requests from FORWARDED_ALLOW_IPS
+    TRUSTED_PROXY_HOPS: int = int(os.getenv("TRUSTED_PROXY_HOPS", "0"))
+    FORWARDED_ALLOW_IPS: str = os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1")
+
+    # Like toggles: "1" → write-behind buffer flushed every PLACE_LIKES_FLUSH_MS
+    PLACE_LIKES_BUFFERED: bool = os.getenv("PLACE_LIKES_BUFFERED", "0") == "1"
+    PLACE_LIKES_FLUSH_MS: int = int(os.getenv("PLACE_LIKES_FLUSH_MS", "250"))
+
+    # Jinja2: bytecode cache dir ("" → off), compile everything at startup,
+    # re-check template mtimes on every render (turn off in production)
+    TEMPLATES_CACHE_DIR: str = os.getenv(
+        "TEMPLATES_CACHE_DIR", os.path.join(tempfile.gettempdir(), "askyerevan-jinja")
+    )
+    TEMPLATES_PRECOMPILE: bool = os.getenv("TEMPLATES_PRECOMPILE", "1") == "1"
+    TEMPLATES_AUTO_RELOAD: bool = os.getenv("TEMPLATES_AUTO_RELOAD", "1") == "1"
+
+    # Static files: content-hashed URLs via asset_url() + immutable caching
+    ASSET_FINGERPRINTS: bool = os.getenv("ASSET_FINGERPRINTS", "1") == "1"
+
+    # Admin image uploads: max size per file (the request body may be ~1 MB more)
+    UPLOAD_MAX_MB: int = int(os.getenv("UPLOAD_MAX_MB", "10"))
+
+    # Web serving: uvicorn worker processes (python -m backend.serve)
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+    # Cross-worker cache invalidation: SQLite poll interval (PostgreSQL uses LISTEN/NOTIFY)
+    INVALIDATION_POLL_MS: int = int(os.getenv("INVALIDATION_POLL_MS", "500"))
+    # Home page hero images: per-worker pool, refreshed on news writes or after TTL
+    HERO_POOL_TTL: int = int(os.getenv("HERO_POOL_TTL", "300"))
+    # /news/{id} rows cached per worker; edits/re-scrapes invalidate by id
+    NEWS_ITEM_TTL: int = int(os.getenv("NEWS_ITEM_TTL", "300"))
+
+    # Event scrapers: site root (point at a local stand-in for benchmarks),
+    # total / per-host concurrent requests, retries per request
+    TOMSARKGH_BASE_URL: str = os.getenv("TOMSARKGH_BASE_URL", "https://www.tomsarkgh.am")
+    SCRAPER_CONCURRENCY: int = int(os.getenv("SCRAPER_CONCURRENCY", "8"))
+    SCRAPER_PER_HOST: int = int(os.getenv("SCRAPER_PER_HOST", "4"))
+    SCRAPER_RETRIES: int = int(os.getenv("SCRAPER_RETRIES", "3"))
+    # Politeness: min. gap between request starts to one host (a source may set its own)
+    SCRAPER_CRAWL_DELAY_MS: int = int(os.getenv("SCRAPER_CRAWL_DELAY_MS", "250"))
+    # Extra RSS/Atom sources for run_all_scrapers(): "name=url|category,name2=url2|category2"
+    SCRAPER_FEEDS: str = os.getenv("SCRAPER_FEEDS", "")
+    # Rows per bulk write transaction (backend/scraping/ingest.py)
+    SCRAPER_BATCH_SIZE: int = int(os.getenv("SCRAPER_BATCH_SIZE", "50"))
+    # Parse worker processes (backend/scraping/parse_pool.py): 0 = in-process thread,
+    # -1 = auto (processes only for the BeautifulSoup backend, selectolax is faster in-thread)
+    SCRAPER_PARSE_WORKERS: int = int(os.getenv("SCRAPER_PARSE_WORKERS", "0"))
+    # Pages / rows buffered between the fetch → parse → save stages
+    SCRAPER_QUEUE_SIZE: int = int(os.getenv("SCRAPER_QUEUE_SIZE", "64"))
+    # On-disk HTTP cache for conditional revalidation ("" = off), entry max age
+    SCRAPER_CACHE_DIR: str = os.getenv("SCRAPER_CACHE_DIR", "data/http_cache")
+    SCRAPER_CACHE_MAX_AGE_DAYS: int = int(os.getenv("SCRAPER_CACHE_MAX_AGE_DAYS", "30"))
+    # Known events are re-fetched only when scraped longer ago than this (0 = always)
+    SCRAPER_REFRESH_HOURS: float = float(os.getenv("SCRAPER_REFRESH_HOURS", "24"))
+
+    # Remote event images → resized local copies (backend/scraping/image_mirror.py):
+    # directory under static/, images per pass, pass interval, max download size,
+    # failed images retried after RETRY_MIN, 2×RETRY_MIN, ... up to MAX_ATTEMPTS times
+    IMAGE_MIRROR_DIR: str = os.getenv("IMAGE_MIRROR_DIR", "static/img/events")
+    IMAGE_MIRROR_BATCH: int = int(os.getenv("IMAGE_MIRROR_BATCH", "100"))
+    IMAGE_MIRROR_INTERVAL_MIN: int = int(os.getenv("IMAGE_MIRROR_INTERVAL_MIN", "10"))
+    IMAGE_MIRROR_MAX_MB: int = int(os.getenv("IMAGE_MIRROR_MAX_MB", "15"))
+    IMAGE_MIRROR_RETRY_MIN: int = int(os.getenv("IMAGE_MIRROR_RETRY_MIN", "15"))
+    IMAGE_MIRROR_MAX_ATTEMPTS: int = int(os.getenv("IMAGE_MIRROR_MAX_ATTEMPTS", "6"))
+
+    # /menu LIVE fallback: background refresh period, max snapshot age served,
+    # and how long the bot handler may wait for the snapshot read
+    LIVE_EVENTS_REFRESH_MIN: int = int(os.getenv("LIVE_EVENTS_REFRESH_MIN", "30"))
+    LIVE_EVENTS_MAX_AGE_H: float = float(os.getenv("LIVE_EVENTS_MAX_AGE_H", "12"))
+    LIVE_EVENTS_BUDGET_MS: int = int(os.getenv("LIVE_EVENTS_BUDGET_MS", "300"))
+
     # Thread IDs for topics (fixed կոնստանտներ)
     SELL_THREAD_ID: int = 255
     RENT_THREAD_ID: int = 261
@@ -1,12 +1,19 @@
 # backend/database.py
 
 import os
+import json
+import base64
+import hashlib
+import time
 import datetime
 from pathlib import Path
 from datetime import date, datetime, timedelta
 from typing import Optional, Dict, Any, List
 from typing import Iterable
 
+from backend.scraping.dedupe import TITLE_MATCH, dedupe_key, find_match
+from backend.utils import metrics
+from backend.utils.helpers import make_excerpt, reading_time_minutes
 from backend.utils.logger import logger
 
 # ============================================================================
@@ -15,32 +22,130 @@ from backend.utils.logger import logger
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+
+def _record_query(started: float) -> None:
+    elapsed = time.perf_counter() - started
+    metrics.add_timing("db", elapsed)
+    metrics.DB_QUERIES.inc()
+
+
+def _opened() -> None:
+    metrics.DB_CONNECTIONS.inc()
+    metrics.DB_CONNECTIONS_OPEN.inc()
+
+
 if DATABASE_URL:
     # PostgreSQL mode
     import psycopg2
+    import psycopg2.extensions
     from psycopg2.extras import RealDictCursor
 
+    class _TimedCursor(RealDictCursor):
+        """RealDictCursor that reports statement time to backend.utils.metrics."""
+
+        def execute(self, query, vars=None):
+            started = time.perf_counter()
+            try:
+                return super().execute(query, vars)
+            finally:
+                _record_query(started)
+
+        def executemany(self, query, vars_list):
+            started = time.perf_counter()
+            try:
+                return super().executemany(query, vars_list)
+            finally:
+                _record_query(started)
+
+    class _TimedConnection(psycopg2.extensions.connection):
+        def commit(self):
+            started = time.perf_counter()
+            try:
+                return super().commit()
+            finally:
+                metrics.add_timing("db", time.perf_counter() - started)
+
+        def close(self):
+            if not self.closed:
+                metrics.DB_CONNECTIONS_OPEN.dec()
+            return super().close()
+
     def get_connection():
         """Return a PostgreSQL connection."""
         print(f"🐘 Using PostgreSQL: {DATABASE_URL[:30]}...")
-        return psycopg2.connect(DATABASE_URL)
+        started = time.perf_counter()
+        conn = psycopg2.connect(DATABASE_URL, connection_factory=_TimedConnection)
+        metrics.add_timing("db", time.perf_counter() - started)
+        _opened()
+        return conn
 
     def get_cursor(conn):
         """Return a dict cursor for PostgreSQL."""
-        return conn.cursor(cursor_factory=RealDictCursor)
+        return conn.cursor(cursor_factory=_TimedCursor)
 
 else:
     # SQLite fallback (local dev)
     import sqlite3
 
-    DB_PATH = Path("data/bot.db")
+    DB_PATH = Path(os.getenv("SQLITE_PATH", "data/bot.db"))
+
+    class _TimedCursor(sqlite3.Cursor):
+        """sqlite3 does the real work lazily, so fetches are timed too."""
+
+        def execute(self, *args):
+            started = time.perf_counter()
+            try:
+                return super().execute(*args)
+            finally:
+                _record_query(started)
+
+        def executemany(self, *args):
+            started = time.perf_counter()
+            try:
+                return super().executemany(*args)
+            finally:
+                _record_query(started)
+
+        def fetchone(self):
+            started = time.perf_counter()
+            try:
+                return super().fetchone()
+            finally:
+                metrics.add_timing("db", time.perf_counter() - started)
+
+        def fetchall(self):
+            started = time.perf_counter()
+            try:
+                return super().fetchall()
+            finally:
+                metrics.add_timing("db", time.perf_counter() - started)
+
+    class _TimedConnection(sqlite3.Connection):
+        _open = True
+
+        def cursor(self, factory=_TimedCursor):
+            return super().cursor(factory)
+
+        def commit(self):
+            started = time.perf_counter()
+            try:
+                return super().commit()
+            finally:
+                metrics.add_timing("db", time.perf_counter() - started)
+
+        def close(self):
+            if self._open:
+                self._open = False
+                metrics.DB_CONNECTIONS_OPEN.dec()
+            return super().close()
 
     def get_connection():
         """Return a SQLite connection, auto-creates DB if missing."""
         DB_PATH.parent.mkdir(parents=True, exist_ok=True)
         print(f"📂 Using SQLite: {DB_PATH.absolute()}")
-        conn = sqlite3.connect(DB_PATH)
+        conn = sqlite3.connect(DB_PATH, factory=_TimedConnection)
         conn.row_factory = sqlite3.Row
+        _opened()
         return conn
 
     def get_cursor(conn):
@@ -48,6 +153,60 @@ else:
         return conn.cursor()
 
 
+def _q(query: str) -> str:
+    """Adapt a %s-style query to the active driver's placeholder."""
+    return query if DATABASE_URL else query.replace("%s", "?")
+
+
+# ============================================================================
+# CACHE INVALIDATION  (cross-worker, see backend/invalidation.py)
+# ============================================================================
+
+INVALIDATION_CHANNEL = "askyerevan_invalidate"
+
+
+def _publish_invalidation(cur, topic: str, key: Optional[str] = None) -> None:
+    """
+    Call inside the write transaction: delivered to every web worker only if it commits.
+    PostgreSQL → pg_notify, SQLite → row in cache_invalidations (workers poll it).
+    """
+    if DATABASE_URL:
+        payload = json.dumps({"topic": topic, "key": key})
+        cur.execute("SELECT pg_notify(%s, %s)", (INVALIDATION_CHANNEL, payload))
+    else:
+        cur.execute(
+            "INSERT INTO cache_invalidations (topic, key, created_at) VALUES (?, ?, ?)",
+            (topic, key, time.time()),
+        )
+
+
+def get_invalidations_since(conn, last_id: int, limit: int = 500) -> list:
+    """
+    SQLite stand-in only: [{"id", "topic", "key"}, ...] newer than last_id.
+    Takes the listener's long-lived connection (it polls a few times a second).
+    """
+    cur = get_cursor(conn)
+    cur.execute(
+        "SELECT id, topic, key FROM cache_invalidations WHERE id > ? ORDER BY id LIMIT ?",
+        (last_id, limit),
+    )
+    return [dict(r) for r in cur.fetchall()]
+
+
+def get_last_invalidation_id(conn) -> int:
+    cur = get_cursor(conn)
+    cur.execute("SELECT COALESCE(MAX(id), 0) AS last_id FROM cache_invalidations")
+    return int(cur.fetchone()["last_id"])
+
+
+def cleanup_invalidations(conn, older_than: float) -> int:
+    cur = get_cursor(conn)
+    cur.execute("DELETE FROM cache_invalidations WHERE created_at < ?", (older_than,))
+    deleted = cur.rowcount
+    conn.commit()
+    return deleted
+
+
 # ============================================================================
 # INIT DB — CREATE TABLES
 # ============================================================================
@@ -62,10 +221,12 @@ def init_db():
         autoincrement = "SERIAL PRIMARY KEY"
         datetime_now = "CURRENT_TIMESTAMP"
         bool_type = "BOOLEAN"
+        float_type = "DOUBLE PRECISION"
     else:
         autoincrement = "INTEGER PRIMARY KEY AUTOINCREMENT"
-        datetime_now = "datetime('now')"
+        datetime_now = "(datetime('now'))"
         bool_type = "INTEGER"
+        float_type = "REAL"
 
     # EVENTS table (for Telegram schedule, Madrid, etc.)
     cur.execute(f"""
@@ -128,6 +289,53 @@ def init_db():
         )
     """)
 
+    # news-ի ավելի ուշ ավելացված սյուները (հին DB-ների համար)
+    _ensure_columns(cur, "news", {
+        "image_2": "TEXT",
+        "image_3": "TEXT",
+        "video_url": "TEXT",
+        "image_srcset": "TEXT",   # "url 480w, url 960w, ..." from backend/media_worker.py
+        # list-card fields, computed by save_news / update_news (_news_card_fields)
+        "excerpt_hy": "TEXT",
+        "excerpt_en": "TEXT",
+        "reading_time": "INTEGER",
+        "has_image": f"{bool_type} DEFAULT {'FALSE' if DATABASE_URL else 0}",
+        # unix time of the last scrape (NULL = admin-created / scraped before the column)
+        "scraped_at": float_type,
+        # hash of the last *scraped* field values (news_content_hash), not of the row
+        "content_hash": "TEXT",
+        # normalized title|date|time|venue (backend/scraping/dedupe.py), '' = no date, never merged
+        "dedupe_key": "TEXT",
+        # remote image_url the local image_url was mirrored from (backend/scraping/image_mirror.py)
+        "image_origin": "TEXT",
+    })
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_news_dedupe_key ON news (dedupe_key)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_news_eventdate ON news (eventdate)")
+
+    # What re-scrapes changed in news rows: {"field": [old, new], ...}
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS news_changes (
+            id         {autoincrement},
+            news_id    INTEGER NOT NULL,
+            changes    TEXT NOT NULL,
+            changed_at TIMESTAMP DEFAULT {datetime_now}
+        )
+    """)
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_news_changes_news ON news_changes (news_id)")
+
+    # URLs of scraped duplicates merged into an existing event (backend/scraping/dedupe.py)
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS news_aliases (
+            source_url TEXT PRIMARY KEY,
+            news_id    INTEGER NOT NULL,
+            scraped_at {float_type},
+            merged_at  TIMESTAMP DEFAULT {datetime_now}
+        )
+    """)
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_news_aliases_news ON news_aliases (news_id)")
+    _backfill_news_card_fields(cur)
+    _backfill_dedupe_keys(cur)
+
     # MEMORY table
     cur.execute(f"""
         CREATE TABLE IF NOT EXISTS memory (
@@ -153,11 +361,246 @@ def init_db():
         )
     """)
 
+    # PLACE LIKES / RATINGS / COMMENTS (anonymous, keyed by place_session cookie)
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS place_likes (
+            id         {autoincrement},
+            place_id   TEXT NOT NULL,
+            session_id TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT {datetime_now}
+        )
+    """)
+    # Մեկ like՝ մեկ session-ին (ON CONFLICT DO NOTHING-ի համար)։ Հին աղյուսակներում
+    # (select-then-insert-ի ժամանակներից) կարող են կրկնօրինակներ լինել → ամեն start-ին
+    # նախ հանում ենք դրանք (ամենահինը մնում ա), հետո unique index
+    cur.execute("""
+        DELETE FROM place_likes WHERE id NOT IN (
+            SELECT MIN(id) FROM place_likes GROUP BY place_id, session_id
+        )
+    """)
+    cur.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_place_likes_session "
+        "ON place_likes (place_id, session_id)"
+    )
+    cur.execute("DROP INDEX IF EXISTS idx_place_likes_place")
+
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS place_ratings (
+            id         {autoincrement},
+            place_id   TEXT NOT NULL,
+            session_id TEXT NOT NULL,
+            rating     INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT {datetime_now},
+            UNIQUE (place_id, session_id)
+        )
+    """)
+
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS place_comments (
+            id         {autoincrement},
+            place_id   TEXT NOT NULL,
+            session_id TEXT NOT NULL,
+            text       TEXT NOT NULL,
+            rating     INTEGER,
+            created_at TIMESTAMP DEFAULT {datetime_now}
+        )
+    """)
+    # Denormalized per-place counters: like counts are read from here (not COUNT(*)),
+    # like writes keep them in sync; rebuilt from place_likes on every start
+    # (new table, likes written before it existed, the duplicate cleanup above)
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS place_stats (
+            place_id   TEXT PRIMARY KEY,
+            like_count INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT {datetime_now}
+        )
+    """)
+    cur.execute(f"""
+        INSERT INTO place_stats (place_id, like_count, updated_at)
+        SELECT place_id, COUNT(*), {datetime_now} FROM place_likes GROUP BY place_id
+        ON CONFLICT (place_id) DO UPDATE SET like_count = excluded.like_count
+    """)
+    cur.execute("""
+        UPDATE place_stats SET like_count = 0
+        WHERE like_count <> 0 AND place_id NOT IN (SELECT place_id FROM place_likes)
+    """)
+
+    # Cursor pagination: WHERE place_id = ? AND (created_at, id) < (?, ?)
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_place_comments_page "
+        "ON place_comments (place_id, created_at DESC, id DESC)"
+    )
+
+    # RATE LIMIT buckets (shared token buckets for all web workers)
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+            bucket_key   TEXT PRIMARY KEY,
+            tokens       {float_type} NOT NULL,
+            updated_at   {float_type} NOT NULL,
+            last_allowed {bool_type} NOT NULL
+        )
+    """)
+    if DATABASE_URL:
+        # tables created with REAL (float4 on PostgreSQL: ~128 s steps for a unix time)
+        cur.execute(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_name = 'rate_limit_buckets' AND data_type = 'real'"
+        )
+        for row in cur.fetchall():
+            cur.execute(
+                f"ALTER TABLE rate_limit_buckets ALTER COLUMN {row['column_name']} TYPE DOUBLE PRECISION"
+            )
+
+    # Scraper run history (backend/scraping/runstats.py, /admin/scrapes)
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS scrape_runs (
+            id         {autoincrement},
+            source     TEXT NOT NULL,
+            started_at {float_type} NOT NULL,
+            duration   {float_type} NOT NULL,
+            stages     TEXT NOT NULL,
+            http       TEXT NOT NULL,
+            types      TEXT NOT NULL,
+            found      INTEGER NOT NULL DEFAULT 0,
+            new        INTEGER NOT NULL DEFAULT 0,
+            updated    INTEGER NOT NULL DEFAULT 0,
+            unchanged  INTEGER NOT NULL DEFAULT 0,
+            merged     INTEGER NOT NULL DEFAULT 0,
+            skipped    INTEGER NOT NULL DEFAULT 0,
+            failed     INTEGER NOT NULL DEFAULT 0,
+            error      TEXT
+        )
+    """)
+    _ensure_columns(cur, "scrape_runs", {"merged": "INTEGER NOT NULL DEFAULT 0"})
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_scrape_runs_source ON scrape_runs (source, started_at)")
+
+    # LIVE events snapshot per /menu kind (backend/armenia/live_prefetch.py)
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS live_events (
+            kind       TEXT PRIMARY KEY,
+            events     TEXT NOT NULL,
+            fetched_at {float_type} NOT NULL
+        )
+    """)
+
+    # Remote event images → local resized copies (backend/scraping/image_mirror.py)
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS image_mirror (
+            source_url   TEXT PRIMARY KEY,
+            image_url    TEXT,
+            image_srcset TEXT,
+            content_hash TEXT,
+            attempts     INTEGER NOT NULL DEFAULT 0,
+            next_attempt {float_type} NOT NULL DEFAULT 0,
+            error        TEXT,
+            updated_at   {float_type}
+        )
+    """)
+
+    # Cache invalidations — SQLite stand-in for LISTEN/NOTIFY (PostgreSQL uses pg_notify)
+    if not DATABASE_URL:
+        cur.execute(f"""
+            CREATE TABLE IF NOT EXISTS cache_invalidations (
+                id         {autoincrement},
+                topic      TEXT NOT NULL,
+                key        TEXT,
+                created_at REAL NOT NULL
+            )
+        """)
+
     conn.commit()
     conn.close()
     print("✅ Database initialized")
 
 
+def _news_card_fields(content_hy: Optional[str], content_en: Optional[str],
+                      image_url: Optional[str]) -> tuple:
+    """(excerpt_hy, excerpt_en, reading_time, has_image) — list-ը content չի կարդում"""
+    return (
+        make_excerpt(content_hy or ""),
+        make_excerpt(content_en or ""),
+        reading_time_minutes(content_hy or content_en or ""),
+        bool(image_url),
+    )
+
+
+def _backfill_news_card_fields(cur, batch: int = 500) -> int:
+    """Fills list-card fields for rows written before they existed."""
+    total = 0
+    while True:
+        cur.execute(
+            _q("""
+            SELECT id, content_hy, content_en, image_url FROM news
+            WHERE excerpt_hy IS NULL
+            LIMIT %s
+            """),
+            (batch,),
+        )
+        rows = cur.fetchall()
+        if not rows:
+            break
+        cur.executemany(
+            _q("""
+            UPDATE news SET excerpt_hy = %s, excerpt_en = %s, reading_time = %s, has_image = %s
+            WHERE id = %s
+            """),
+            [
+                (*_news_card_fields(r["content_hy"], r["content_en"], r["image_url"]), r["id"])
+                for r in rows
+            ],
+        )
+        total += len(rows)
+    if total:
+        print(f"🗂 Backfilled list-card fields for {total} news rows")
+    return total
+
+
+def _news_dedupe_key(title_hy, title_en, eventdate, eventtime, venue_hy) -> str:
+    return dedupe_key({
+        "title_hy": title_hy, "title_en": title_en,
+        "eventdate": eventdate, "eventtime": eventtime, "venue_hy": venue_hy,
+    }) or ""
+
+
+def _backfill_dedupe_keys(cur, batch: int = 500) -> int:
+    """dedupe_key for rows written before the column (merging them: backend/tools/merge_duplicate_events.py)."""
+    total = 0
+    while True:
+        cur.execute(
+            _q("""
+            SELECT id, title_hy, title_en, eventdate, eventtime, venue_hy FROM news
+            WHERE dedupe_key IS NULL
+            LIMIT %s
+            """),
+            (batch,),
+        )
+        rows = cur.fetchall()
+        if not rows:
+            break
+        cur.executemany(
+            _q("UPDATE news SET dedupe_key = %s WHERE id = %s"),
+            [(dedupe_key(dict(r)) or "", r["id"]) for r in rows],
+        )
+        total += len(rows)
+    if total:
+        print(f"🗂 Backfilled dedupe keys for {total} news rows")
+    return total
+
+
+def _ensure_columns(cur, table: str, columns: Dict[str, str]) -> None:
+    """Adds missing columns: {name: SQL type}. Existing ones are left alone."""
+    if DATABASE_URL:
+        for name, sql_type in columns.items():
+            cur.execute(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {name} {sql_type}")
+        return
+
+    cur.execute(f"PRAGMA table_info({table})")
+    existing = {row["name"] for row in cur.fetchall()}
+    for name, sql_type in columns.items():
+        if name not in existing:
+            cur.execute(f"ALTER TABLE {table} ADD COLUMN {name} {sql_type}")
+
+
 # ============================================================================
 # USER HELPERS
 # ============================================================================
@@ -472,7 +915,11 @@ def save_news(
     image_2: Optional[str] = None,
     image_3: Optional[str] = None,
     video_url: Optional[str] = None,
+    scraped_at: Optional[float] = None,
+    content_hash: Optional[str] = None,
 ) -> Optional[int]:
+    card_fields = _news_card_fields(content_hy, content_en, image_url)
+    key = _news_dedupe_key(title_hy, title_en, eventdate, eventtime, venue_hy)
     conn = get_connection()
     cur = get_cursor(conn)
 
@@ -486,10 +933,13 @@ def save_news(
                 category,
                 eventdate, eventtime,
                 venue_hy, price_hy,
-                source_url
+                source_url,
+                excerpt_hy, excerpt_en, reading_time, has_image,
+                scraped_at, content_hash, dedupe_key
             )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             ON CONFLICT (source_url) DO NOTHING
+            RETURNING id
             """,
             (
                 title_hy, title_en,
@@ -499,6 +949,8 @@ def save_news(
                 eventdate, eventtime,
                 venue_hy, price_hy,
                 source_url,
+                *card_fields,
+                scraped_at, content_hash, key,
             ),
         )
     else:
@@ -511,9 +963,11 @@ def save_news(
                 category,
                 eventdate, eventtime,
                 venue_hy, price_hy,
-                source_url
+                source_url,
+                excerpt_hy, excerpt_en, reading_time, has_image,
+                scraped_at, content_hash, dedupe_key
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 title_hy, title_en,
@@ -523,16 +977,20 @@ def save_news(
                 eventdate, eventtime,
                 venue_hy, price_hy,
                 source_url,
+                *card_fields,
+                scraped_at, content_hash, key,
             ),
         )
 
-    conn.commit()
     if DATABASE_URL:
-        cur.execute("SELECT lastval()")
+        # RealDictCursor → row["id"]; no row when ON CONFLICT skipped the insert
         row = cur.fetchone()
-        news_id = row[0] if row else None
+        news_id = row["id"] if row else None
     else:
-        news_id = cur.lastrowid
+        news_id = cur.lastrowid if cur.rowcount > 0 else None
+    if news_id is not None:
+        _publish_invalidation(cur, "news")
+    conn.commit()
     conn.close()
     return news_id
 
@@ -580,6 +1038,38 @@ def get_all_news(limit: int = 10,
     return rows
 
 
+NEWS_CARD_COLUMNS = (
+    "id, title_hy, title_en, excerpt_hy, excerpt_en, reading_time, has_image, "
+    "image_url, image_srcset, category, eventdate, eventtime, venue_hy, price_hy, created_at"
+)
+
+
+def get_news_cards(limit: int = 10, category: Optional[str] = None):
+    """get_all_news()-ի նման, բայց միայն list card-ի սյուները (առանց content_*)"""
+    conn = get_connection()
+    cur = get_cursor(conn)
+
+    if DATABASE_URL:
+        published = "TRUE"
+        recent = "created_at >= NOW() - INTERVAL '6 months'"
+    else:
+        published = "1"
+        recent = "created_at >= datetime('now', '-6 months')"
+
+    query = f"SELECT {NEWS_CARD_COLUMNS} FROM news WHERE published = {published} AND {recent}"
+    params: List[Any] = []
+    if category:
+        query += " AND category = %s"
+        params.append(category)
+    query += " ORDER BY created_at DESC LIMIT %s"
+    params.append(limit)
+
+    cur.execute(_q(query), tuple(params))
+    rows = cur.fetchall()
+    conn.close()
+    return rows
+
+
 def get_news_by_id(news_id: int):
     conn = get_connection()
     cur = get_cursor(conn)
@@ -599,6 +1089,296 @@ def get_news_by_id(news_id: int):
     conn.close()
     return row
 
+def get_news_scraped_at(urls: List[str], chunk: int = 500) -> Dict[str, float]:
+    """{source_url: scraped_at} for the `urls` already stored (0.0 = never recorded)."""
+    found: Dict[str, float] = {}
+    if not urls:
+        return found
+    conn = get_connection()
+    cur = get_cursor(conn)
+    for i in range(0, len(urls), chunk):
+        part = list(urls[i:i + chunk])
+        placeholders = ", ".join(["%s"] * len(part))
+        cur.execute(
+            _q(f"""
+            SELECT source_url, scraped_at FROM news WHERE source_url IN ({placeholders})
+            UNION ALL
+            SELECT source_url, scraped_at FROM news_aliases WHERE source_url IN ({placeholders})
+            """),
+            part + part,
+        )
+        for row in cur.fetchall():
+            found[row["source_url"]] = row["scraped_at"] or 0.0
+    conn.close()
+    return found
+
+def touch_news_scraped(urls: List[str], scraped_at: float, chunk: int = 500) -> None:
+    """Re-scraped, nothing changed — only moves scraped_at forward."""
+    if not urls:
+        return
+    conn = get_connection()
+    cur = get_cursor(conn)
+    for i in range(0, len(urls), chunk):
+        part = list(urls[i:i + chunk])
+        placeholders = ", ".join(["%s"] * len(part))
+        for table in ("news", "news_aliases"):
+            cur.execute(
+                _q(f"UPDATE {table} SET scraped_at = %s WHERE source_url IN ({placeholders})"),
+                [scraped_at, *part],
+            )
+    conn.commit()
+    conn.close()
+
+SCRAPED_NEWS_FIELDS = (
+    "title_hy", "title_en", "content_hy", "content_en", "image_url",
+    "eventdate", "eventtime", "venue_hy", "price_hy",
+)
+
+
+def news_content_hash(row: Dict[str, Any]) -> str:
+    """Hash of the fields a scraper fills (category excluded — the first EventType owns it)."""
+    payload = json.dumps([row.get(f) for f in SCRAPED_NEWS_FIELDS], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _clip_change(value, limit: int = 200):
+    """news_changes keeps the log small — long texts are cut."""
+    if isinstance(value, str) and len(value) > limit:
+        return value[:limit] + "…"
+    return value
+
+
+def upsert_scraped_news(row: Dict[str, Any], scraped_at: float) -> tuple:
+    """
+    Scraped event (parse_event() output) → news. Returns (news_id, status),
+    status = "new" | "updated" | "unchanged" | "merged".
+
+    An existing row is rewritten only when the scraped fields' hash differs from
+    the one stored at the last scrape; the diff goes to news_changes and the
+    row's pages are invalidated. category / published / admin-only fields are
+    kept, image_srcset is dropped if the image changed.
+    """
+    return bulk_upsert_scraped_news([row], scraped_at)[0]
+
+_INSERT_SCRAPED_COLUMNS = (
+    "title_hy", "title_en", "content_hy", "content_en", "image_url", "category",
+    "eventdate", "eventtime", "venue_hy", "price_hy", "source_url",
+    "excerpt_hy", "excerpt_en", "reading_time", "has_image", "scraped_at", "content_hash",
+    "dedupe_key",
+)
+
+def _insert_scraped(cur, row: Dict[str, Any], scraped_at: float, digest: str) -> Optional[int]:
+    card_fields = _news_card_fields(row.get("content_hy"), row.get("content_en"), row.get("image_url"))
+    values = (
+        row["title_hy"], row["title_en"], row["content_hy"], row["content_en"], row.get("image_url"),
+        row.get("category") or "general", row.get("eventdate"), row.get("eventtime"),
+        row.get("venue_hy"), row.get("price_hy"), row["source_url"],
+        *card_fields, scraped_at, digest, dedupe_key(row) or "",
+    )
+    columns = ", ".join(_INSERT_SCRAPED_COLUMNS)
+    placeholders = ", ".join(["%s"] * len(_INSERT_SCRAPED_COLUMNS))
+    if DATABASE_URL:
+        cur.execute(
+            f"INSERT INTO news ({columns}) VALUES ({placeholders}) "
+            "ON CONFLICT (source_url) DO NOTHING RETURNING id",
+            values,
+        )
+        inserted = cur.fetchone()
+        return inserted["id"] if inserted else None
+    cur.execute(_q(f"INSERT OR IGNORE INTO news ({columns}) VALUES ({placeholders})"), values)
+    return cur.lastrowid if cur.rowcount > 0 else None
+
+def _update_scraped(cur, news_id: int, row: Dict[str, Any], scraped_at: float, digest: str) -> None:
+    card_fields = _news_card_fields(row.get("content_hy"), row.get("content_en"), row.get("image_url"))
+    same_image = "image_url IS NOT DISTINCT FROM %s" if DATABASE_URL else "image_url IS %s"
+    cur.execute(
+        _q(f"""
+        UPDATE news SET
+            image_srcset = CASE WHEN {same_image} THEN image_srcset END,
+            image_origin = CASE WHEN {same_image} THEN image_origin END,
+            {", ".join(f"{f} = %s" for f in SCRAPED_NEWS_FIELDS)},
+            excerpt_hy = %s,
+            excerpt_en = %s,
+            reading_time = %s,
+            has_image  = %s,
+            scraped_at = %s,
+            content_hash = %s,
+            dedupe_key = %s
+        WHERE id = %s
+        """),
+        (
+            row.get("image_url"),
+            row.get("image_url"),
+            *(row.get(f) for f in SCRAPED_NEWS_FIELDS),
+            *card_fields,
+            scraped_at,
+            digest,
+            dedupe_key(row) or "",
+            news_id,
+        ),
+    )
+
+def bulk_upsert_scraped_news(rows: List[Dict[str, Any]], scraped_at: float,
+                             unchanged_urls: Iterable[str] = (), chunk: int = 500) -> List[tuple]:
+    """
+    upsert_scraped_news() for a batch in one connection / transaction (one
+    SELECT per `chunk` URLs for the stored hashes, one commit). `rows` must
+    have distinct source_urls. `unchanged_urls` — known URLs whose pages did
+    not change — only get scraped_at moved. Returns [(news_id, status)] in
+    `rows` order.
+
+    A new URL whose row is an event already stored under another URL (another
+    EventType, site or language — backend/scraping/dedupe.py) is not inserted:
+    the URL becomes a news_aliases entry of that row, status "merged". Alias
+    URLs stay "merged" on later scrapes; their content never overwrites the
+    row they were merged into.
+    """
+    unchanged_urls = list(unchanged_urls)
+    if not rows and not unchanged_urls:
+        return []
+    conn = get_connection()
+    cur = get_cursor(conn)
+
+    existing: Dict[str, Any] = {}
+    urls = [row["source_url"] for row in rows]
+    for i in range(0, len(urls), chunk):
+        part = urls[i:i + chunk]
+        cur.execute(
+            _q(f"""
+            SELECT id, source_url, content_hash, image_origin, {', '.join(SCRAPED_NEWS_FIELDS)}
+            FROM news WHERE source_url IN ({", ".join(["%s"] * len(part))})
+            """),
+            part,
+        )
+        for old in cur.fetchall():
+            existing[old["source_url"]] = old
+    aliases = _alias_targets(cur, [url for url in urls if url not in existing], chunk)
+
+    results: List[tuple] = []
+    same: List[tuple] = []
+    merged: List[tuple] = []
+    by_date: Dict[str, list] = {}
+    inserted = False
+    for row in rows:
+        digest = news_content_hash(row)
+        old = existing.get(row["source_url"])
+        if old is None:
+            news_id = aliases.get(row["source_url"])
+            if news_id is None:
+                match = _find_duplicate(cur, row, by_date)
+                news_id = match["id"] if match else None
+            if news_id is not None:
+                merged.append((row["source_url"], news_id, scraped_at))
+                results.append((news_id, "merged"))
+                continue
+            news_id = _insert_scraped(cur, row, scraped_at, digest)
+            inserted = inserted or news_id is not None
+            if news_id is not None and (row.get("eventdate") or "").strip():
+                # later rows of this batch can merge into it too
+                by_date.setdefault(row["eventdate"].strip(), []).append({**row, "id": news_id})
+            results.append((news_id, "new"))
+            continue
+
+        news_id = old["id"]
+        # a mirrored image is compared by the remote URL it came from, and kept if that didn't change
+        scraped = {**dict(old), "image_url": old["image_origin"]} if old["image_origin"] else old
+        mirrored = old["image_origin"] is not None and old["image_origin"] == row.get("image_url")
+        changes = {
+            f: [_clip_change(scraped[f]), _clip_change(row.get(f))]
+            for f in SCRAPED_NEWS_FIELDS if scraped[f] != row.get(f)
+        }
+        if old["content_hash"] == digest or not changes:
+            # same as last scrape (or a pre-hash row that already matches)
+            same.append((scraped_at, digest, news_id))
+            results.append((news_id, "unchanged"))
+            continue
+
+        stored = {**row, "image_url": old["image_url"]} if mirrored else row
+        _update_scraped(cur, news_id, stored, scraped_at, digest)
+        cur.execute(
+            _q("INSERT INTO news_changes (news_id, changes) VALUES (%s, %s)"),
+            (news_id, json.dumps(changes, ensure_ascii=False)),
+        )
+        _publish_invalidation(cur, "news", str(news_id))
+        results.append((news_id, "updated"))
+
+    if same:
+        cur.executemany(_q("UPDATE news SET scraped_at = %s, content_hash = %s WHERE id = %s"), same)
+    if merged:
+        _save_aliases(cur, merged)
+    for i in range(0, len(unchanged_urls), chunk):
+        part = unchanged_urls[i:i + chunk]
+        for table in ("news", "news_aliases"):
+            cur.execute(
+                _q(f"UPDATE {table} SET scraped_at = %s WHERE source_url IN ({', '.join(['%s'] * len(part))})"),
+                [scraped_at, *part],
+            )
+    if inserted:
+        _publish_invalidation(cur, "news")
+    conn.commit()
+    conn.close()
+    return results
+
+def _alias_targets(cur, urls: List[str], chunk: int = 500) -> Dict[str, int]:
+    """{source_url: news_id} for the `urls` merged into another row earlier."""
+    found: Dict[str, int] = {}
+    for i in range(0, len(urls), chunk):
+        part = urls[i:i + chunk]
+        cur.execute(
+            _q(f"SELECT source_url, news_id FROM news_aliases WHERE source_url IN ({', '.join(['%s'] * len(part))})"),
+            part,
+        )
+        for r in cur.fetchall():
+            found[r["source_url"]] = r["news_id"]
+    return found
+
+def _find_duplicate(cur, row: Dict[str, Any], by_date: Dict[str, list]) -> Optional[Dict[str, Any]]:
+    """Stored row that is the same event as `row` (one indexed query per eventdate and batch)."""
+    date = (row.get("eventdate") or "").strip()
+    if not date:
+        return None
+    if date not in by_date:
+        cur.execute(
+            _q("""
+            SELECT id, title_hy, title_en, eventdate, eventtime, venue_hy, dedupe_key
+            FROM news WHERE eventdate = %s ORDER BY id
+            """),
+            (date,),
+        )
+        by_date[date] = [dict(r) for r in cur.fetchall()]
+    return find_match(row, by_date[date], strict=True)
+
+def _save_aliases(cur, aliases: List[tuple]) -> None:
+    """[(source_url, news_id, scraped_at)] → news_aliases (an existing alias is repointed)."""
+    if DATABASE_URL:
+        cur.executemany(
+            """
+            INSERT INTO news_aliases (source_url, news_id, scraped_at) VALUES (%s, %s, %s)
+            ON CONFLICT (source_url) DO UPDATE SET news_id = EXCLUDED.news_id, scraped_at = EXCLUDED.scraped_at
+            """,
+            aliases,
+        )
+    else:
+        cur.executemany(
+            "INSERT OR REPLACE INTO news_aliases (source_url, news_id, scraped_at) VALUES (?, ?, ?)",
+            aliases,
+        )
+
+def get_news_changes(news_id: int, limit: int = 20) -> list:
+    """Latest re-scrape diffs of one row: [{"changes": {...}, "changed_at": ...}, ...]"""
+    conn = get_connection()
+    cur = get_cursor(conn)
+    cur.execute(
+        _q("""
+        SELECT changes, changed_at FROM news_changes
+        WHERE news_id = %s ORDER BY id DESC LIMIT %s
+        """),
+        (news_id, limit),
+    )
+    rows = [{"changes": json.loads(r["changes"]), "changed_at": r["changed_at"]} for r in cur.fetchall()]
+    conn.close()
+    return rows
+
 def get_random_news_with_image(category: str):
     conn = get_connection()
     cur = get_cursor(conn)
@@ -634,6 +1414,27 @@ def get_random_news_with_image(category: str):
     conn.close()
     return row
 
+def get_news_image_pool(category: str, limit: int = 50) -> list:
+    """Վերջին նկարով news-երը [{"id", "image_url"}, ...] — hero-ն ընտրվում է սրանցից"""
+    conn = get_connection()
+    cur = get_cursor(conn)
+    published = "TRUE" if DATABASE_URL else "1"
+    cur.execute(
+        _q(f"""
+        SELECT id, image_url
+        FROM news
+        WHERE published = {published}
+          AND category = %s
+          AND has_image = {published}
+        ORDER BY created_at DESC, id DESC
+        LIMIT %s
+        """),
+        (category, limit),
+    )
+    rows = [dict(r) for r in cur.fetchall()]
+    conn.close()
+    return rows
+
 def update_news(
     news_id: int,
     title_hy: str,
@@ -651,6 +1452,8 @@ def update_news(
     video_url: Optional[str] = None,
 ) -> bool:
     """Update existing news item by ID. Returns True if updated."""
+    card_fields = _news_card_fields(content_hy, content_en, image_url)
+    key = _news_dedupe_key(title_hy, title_en, eventdate, eventtime, venue_hy)
     conn = get_connection()
     cur = get_cursor(conn)
 
@@ -658,6 +1461,10 @@ def update_news(
         cur.execute(
             """
             UPDATE news SET
+                image_srcset = CASE WHEN image_url IS NOT DISTINCT FROM %s
+                                    THEN image_srcset END,
+                image_origin = CASE WHEN image_url IS NOT DISTINCT FROM %s
+                                    THEN image_origin END,
                 title_hy   = %s,
                 title_en   = %s,
                 content_hy = %s,
@@ -670,16 +1477,25 @@ def update_news(
                 eventdate  = %s,
                 eventtime  = %s,
                 venue_hy   = %s,
-                price_hy   = %s
+                price_hy   = %s,
+                excerpt_hy = %s,
+                excerpt_en = %s,
+                reading_time = %s,
+                has_image  = %s,
+                dedupe_key = %s
             WHERE id = %s
             """,
             (
+                image_url,
+                image_url,
                 title_hy, title_en,
                 content_hy, content_en,
                 image_url, image_2, image_3, video_url,
                 category,
                 eventdate, eventtime,
                 venue_hy, price_hy,
+                *card_fields,
+                key,
                 news_id,
             ),
         )
@@ -687,6 +1503,8 @@ def update_news(
         cur.execute(
             """
             UPDATE news SET
+                image_srcset = CASE WHEN image_url IS ? THEN image_srcset END,
+                image_origin = CASE WHEN image_url IS ? THEN image_origin END,
                 title_hy   = ?,
                 title_en   = ?,
                 content_hy = ?,
@@ -699,26 +1517,56 @@ def update_news(
                 eventdate  = ?,
                 eventtime  = ?,
                 venue_hy   = ?,
-                price_hy   = ?
+                price_hy   = ?,
+                excerpt_hy = ?,
+                excerpt_en = ?,
+                reading_time = ?,
+                has_image  = ?,
+                dedupe_key = ?
             WHERE id = ?
             """,
             (
+                image_url,
+                image_url,
                 title_hy, title_en,
                 content_hy, content_en,
                 image_url, image_2, image_3, video_url,
                 category,
                 eventdate, eventtime,
                 venue_hy, price_hy,
+                *card_fields,
+                key,
                 news_id,
             ),
         )
 
     updated = cur.rowcount > 0
+    if updated:
+        _publish_invalidation(cur, "news", str(news_id))
     conn.commit()
     conn.close()
     return updated
     
 
+def set_news_image(news_id: int, expected_url: str, image_url: str, image_srcset: Optional[str]) -> bool:
+    """
+    Optimized նկարը գրում է news-ի մեջ, եթե image_url-ը դեռ expected_url է
+    (admin-ը մշակման ընթացքում կարող էր նկարը փոխել)։
+    """
+    conn = get_connection()
+    cur = get_cursor(conn)
+    cur.execute(
+        _q("UPDATE news SET image_url = %s, image_srcset = %s WHERE id = %s AND image_url = %s"),
+        (image_url, image_srcset, news_id, expected_url),
+    )
+    updated = cur.rowcount > 0
+    if updated:
+        _publish_invalidation(cur, "news", str(news_id))
+    conn.commit()
+    conn.close()
+    return updated
+
+
 def get_upcoming_holiday_events(days_ahead: int = 14, limit: int = 10):
     """
     Վերադարձնում է մոտակա holiday_events կատեգորիայի իրադարձությունները
@@ -840,6 +1688,10 @@ def delete_old_news(days: int = 90) -> int:
             )
 
         deleted_count = cur.rowcount
+        if deleted_count:
+            cur.execute("DELETE FROM news_changes WHERE news_id NOT IN (SELECT id FROM news)")
+            cur.execute("DELETE FROM news_aliases WHERE news_id NOT IN (SELECT id FROM news)")
+            _publish_invalidation(cur, "news")
         conn.commit()
         logger.info(f"🧹 Deleted {deleted_count} news older than {days} days")
         return deleted_count
@@ -852,6 +1704,263 @@ def delete_old_news(days: int = 90) -> int:
         cur.close()
         conn.close()
 
+def merge_duplicate_news(dry_run: bool = False, threshold: float = TITLE_MATCH) -> List[Dict[str, Any]]:
+    """
+    One-off merge of the duplicate events stored before ingest-time dedupe
+    (backend/tools/merge_duplicate_events.py). Per eventdate, rows are matched
+    like bulk_upsert_scraped_news() does (strict: the time or venue must match
+    too); each group keeps one row — admin-created before scraped, published
+    before hidden, then the oldest — and the others' source_urls become its
+    news_aliases, their news_changes / aliases move to it and they are deleted.
+    Only scraped rows are ever merged away: an admin-created row (no
+    source_url) is always kept. Returns [{"keep": row, "merged": [row, ...]}];
+    dry_run rolls everything back.
+    """
+    conn = get_connection()
+    cur = get_cursor(conn)
+    groups: List[Dict[str, Any]] = []
+    try:
+        _backfill_dedupe_keys(cur)
+        cur.execute(
+            """
+            SELECT id, title_hy, title_en, eventdate, eventtime, venue_hy, dedupe_key,
+                   source_url, scraped_at, published
+            FROM news WHERE eventdate IS NOT NULL AND eventdate <> ''
+            ORDER BY eventdate, id
+            """
+        )
+        by_date: Dict[str, list] = {}
+        for r in cur.fetchall():
+            by_date.setdefault(r["eventdate"].strip(), []).append(dict(r))
+
+        for rows in by_date.values():
+            rows.sort(key=lambda r: (r["source_url"] is not None, not r["published"], r["id"]))
+            kept: List[Dict[str, Any]] = []
+            merged: Dict[int, list] = {}
+            for row in rows:
+                match = find_match(row, kept, threshold, strict=True) if row["source_url"] else None
+                if match is None:
+                    kept.append(row)
+                else:
+                    merged.setdefault(match["id"], []).append(row)
+            groups.extend(
+                {"keep": keep, "merged": merged[keep["id"]]} for keep in kept if keep["id"] in merged
+            )
+
+        for group in groups:
+            keep_id = group["keep"]["id"]
+            dup_ids = [r["id"] for r in group["merged"]]
+            placeholders = ", ".join(["%s"] * len(dup_ids))
+            _save_aliases(cur, [
+                (r["source_url"], keep_id, r["scraped_at"]) for r in group["merged"]
+            ])
+            for table in ("news_aliases", "news_changes"):
+                cur.execute(
+                    _q(f"UPDATE {table} SET news_id = %s WHERE news_id IN ({placeholders})"),
+                    [keep_id, *dup_ids],
+                )
+            cur.execute(_q(f"DELETE FROM news WHERE id IN ({placeholders})"), dup_ids)
+            for news_id in dup_ids:
+                _publish_invalidation(cur, "news", str(news_id))
+        if groups:
+            _publish_invalidation(cur, "news")
+
+        if dry_run:
+            conn.rollback()
+        else:
+            conn.commit()
+        return groups
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cur.close()
+        conn.close()
+
+# ============================================================================
+# SCRAPE RUNS  (per-run scraper stats, see backend/scraping/runstats.py)
+# ============================================================================
+
+_SCRAPE_RUN_JSON = ("stages", "http", "types")
+_SCRAPE_RUN_COLUMNS = (
+    "source", "started_at", "duration", "stages", "http", "types",
+    "found", "new", "updated", "unchanged", "merged", "skipped", "failed", "error",
+)
+
+def save_scrape_run(row: Dict[str, Any]) -> None:
+    """row = RunStats.to_row()"""
+    values = [json.dumps(row[c]) if c in _SCRAPE_RUN_JSON else row[c] for c in _SCRAPE_RUN_COLUMNS]
+    conn = get_connection()
+    cur = get_cursor(conn)
+    cur.execute(
+        _q(f"""
+        INSERT INTO scrape_runs ({", ".join(_SCRAPE_RUN_COLUMNS)})
+        VALUES ({", ".join(["%s"] * len(_SCRAPE_RUN_COLUMNS))})
+        """),
+        values,
+    )
+    conn.commit()
+    conn.close()
+
+def get_scrape_runs(limit: int = 30, source: Optional[str] = None) -> list:
+    """Newest first, JSON columns decoded."""
+    conn = get_connection()
+    cur = get_cursor(conn)
+    query = f"SELECT id, {', '.join(_SCRAPE_RUN_COLUMNS)} FROM scrape_runs"
+    params: List[Any] = []
+    if source:
+        query += " WHERE source = %s"
+        params.append(source)
+    query += " ORDER BY started_at DESC LIMIT %s"
+    params.append(limit)
+    cur.execute(_q(query), params)
+    runs = []
+    for r in cur.fetchall():
+        run = dict(r)
+        for c in _SCRAPE_RUN_JSON:
+            run[c] = json.loads(run[c])
+        runs.append(run)
+    conn.close()
+    return runs
+
+# ============================================================================
+# LIVE EVENTS  (prefetched Tomsarkgh category pages for the /menu fallback)
+# ============================================================================
+
+def save_live_events(kind: str, events: list, fetched_at: Optional[float] = None) -> None:
+    conn = get_connection()
+    cur = get_cursor(conn)
+    cur.execute(
+        _q("""
+        INSERT INTO live_events (kind, events, fetched_at) VALUES (%s, %s, %s)
+        ON CONFLICT (kind) DO UPDATE SET events = excluded.events, fetched_at = excluded.fetched_at
+        """),
+        (kind, json.dumps(events, ensure_ascii=False), fetched_at or time.time()),
+    )
+    conn.commit()
+    conn.close()
+
+def get_live_events(kind: str, max_age: Optional[float] = None) -> Optional[list]:
+    """Snapshot list, or None if there is none (or it is older than max_age seconds)."""
+    conn = get_connection()
+    cur = get_cursor(conn)
+    cur.execute(_q("SELECT events, fetched_at FROM live_events WHERE kind = %s"), (kind,))
+    row = cur.fetchone()
+    conn.close()
+    if row is None:
+        return None
+    if max_age is not None and time.time() - row["fetched_at"] > max_age:
+        return None
+    return json.loads(row["events"])
+
+# ============================================================================
+# IMAGE MIRROR  (local copies of remote event images, backend/scraping/image_mirror.py)
+# ============================================================================
+
+def get_images_to_mirror(limit: int, max_attempts: int, now: Optional[float] = None) -> list:
+    """
+    Remote news.image_url values still to do: never tried, due for a retry, or
+    mirrored already (a row scraped since then still points at the remote URL).
+    [{"source_url", "image_url" (local copy or None), "image_srcset", "attempts"}]
+    """
+    conn = get_connection()
+    cur = get_cursor(conn)
+    cur.execute(
+        _q("""
+        SELECT DISTINCT n.image_url AS source_url, m.image_url, m.image_srcset, m.attempts
+        FROM news n LEFT JOIN image_mirror m ON m.source_url = n.image_url
+        WHERE substr(n.image_url, 1, 4) = 'http'
+          AND (m.source_url IS NULL
+               OR m.image_url IS NOT NULL
+               OR (m.next_attempt <= %s AND m.attempts < %s))
+        LIMIT %s
+        """),
+        (now or time.time(), max_attempts, limit),
+    )
+    rows = [dict(r) for r in cur.fetchall()]
+    conn.close()
+    return rows
+
+def save_image_mirror(source_url: str, image_url: str, image_srcset: Optional[str],
+                      content_hash: Optional[str] = None) -> int:
+    """
+    Records the local copy of `source_url` and points every news row still
+    using the remote URL at it (image_origin keeps the remote one). Returns
+    the number of rows switched.
+    """
+    conn = get_connection()
+    cur = get_cursor(conn)
+    cur.execute(
+        _q("""
+        INSERT INTO image_mirror (source_url, image_url, image_srcset, content_hash, error, updated_at)
+        VALUES (%s, %s, %s, %s, NULL, %s)
+        ON CONFLICT (source_url) DO UPDATE SET
+            image_url = excluded.image_url,
+            image_srcset = excluded.image_srcset,
+            content_hash = COALESCE(excluded.content_hash, image_mirror.content_hash),
+            error = NULL,
+            updated_at = excluded.updated_at
+        """),
+        (source_url, image_url, image_srcset, content_hash, time.time()),
+    )
+    cur.execute(_q("SELECT id FROM news WHERE image_url = %s"), (source_url,))
+    ids = [r["id"] for r in cur.fetchall()]
+    if ids:
+        cur.execute(
+            _q("""
+            UPDATE news SET image_url = %s, image_srcset = %s, image_origin = %s
+            WHERE image_url = %s
+            """),
+            (image_url, image_srcset, source_url, source_url),
+        )
+        for news_id in ids:
+            _publish_invalidation(cur, "news", str(news_id))
+    conn.commit()
+    conn.close()
+    return len(ids)
+
+def image_mirror_failed(source_url: str, error: str, next_attempt: float) -> None:
+    """One more failed attempt; the next one not before `next_attempt` (unix time)."""
+    conn = get_connection()
+    cur = get_cursor(conn)
+    cur.execute(
+        _q("""
+        INSERT INTO image_mirror (source_url, attempts, next_attempt, error, updated_at)
+        VALUES (%s, 1, %s, %s, %s)
+        ON CONFLICT (source_url) DO UPDATE SET
+            attempts = image_mirror.attempts + 1,
+            next_attempt = excluded.next_attempt,
+            error = excluded.error,
+            updated_at = excluded.updated_at
+        """),
+        (source_url, next_attempt, error[:500], time.time()),
+    )
+    conn.commit()
+    conn.close()
+
+def prune_image_mirror() -> set:
+    """
+    Drops image_mirror entries no news row uses any more (remote or mirrored),
+    returns the local URLs (image_url + srcset) of the ones left.
+    """
+    conn = get_connection()
+    cur = get_cursor(conn)
+    cur.execute(
+        """
+        DELETE FROM image_mirror
+        WHERE source_url NOT IN (SELECT image_origin FROM news WHERE image_origin IS NOT NULL)
+          AND source_url NOT IN (SELECT image_url FROM news WHERE image_url IS NOT NULL)
+        """
+    )
+    cur.execute("SELECT image_url, image_srcset FROM image_mirror WHERE image_url IS NOT NULL")
+    used = set()
+    for r in cur.fetchall():
+        used.add(r["image_url"])
+        used.update(part.split()[0] for part in (r["image_srcset"] or "").split(",") if part.strip())
+    conn.commit()
+    conn.close()
+    return used
+
 # ============================================================================
 # QUESTIONS HELPERS  (unanswered group questions)
 # ============================================================================
@@ -1117,50 +2226,131 @@ def toggle_place_like(place_id: str, session_id: str) -> dict:
     conn = get_connection()
     cur = get_cursor(conn)
 
-    # ստուգում ա կա՞ արդեն
+    # կար → DELETE-ը ջնջում ա; չկար → INSERT (միաժամանակ toggle-ը UNIQUE-ից կրկնօրինակ չի գրի)
     cur.execute(
-        "SELECT id FROM place_likes WHERE place_id = %s AND session_id = %s",
+        _q("DELETE FROM place_likes WHERE place_id = %s AND session_id = %s"),
         (place_id, session_id),
     )
-    existing = cur.fetchone()
-
-    if existing:
-        cur.execute(
-            "DELETE FROM place_likes WHERE place_id = %s AND session_id = %s",
-            (place_id, session_id),
-        )
-        liked = False
-    else:
+    liked = cur.rowcount == 0
+    delta = -1
+    if liked:
         cur.execute(
-            "INSERT INTO place_likes (place_id, session_id) VALUES (%s, %s)",
+            _q("""
+            INSERT INTO place_likes (place_id, session_id) VALUES (%s, %s)
+            ON CONFLICT (place_id, session_id) DO NOTHING
+            """),
             (place_id, session_id),
         )
-        liked = True
+        delta = 1 if cur.rowcount == 1 else 0
 
+    # count-ը place_stats-ից (+1/-1), ոչ թե COUNT(*)
+    now = "CURRENT_TIMESTAMP" if DATABASE_URL else "datetime('now')"
+    greatest = "GREATEST" if DATABASE_URL else "MAX"
     cur.execute(
-        "SELECT COUNT(*) AS cnt FROM place_likes WHERE place_id = %s",
-        (place_id,),
+        _q(f"""
+        INSERT INTO place_stats (place_id, like_count, updated_at)
+        VALUES (%s, %s, {now})
+        ON CONFLICT (place_id) DO UPDATE SET
+            like_count = {greatest}(0, place_stats.like_count + %s),
+            updated_at = EXCLUDED.updated_at
+        RETURNING like_count
+        """),
+        (place_id, max(delta, 0), delta),
     )
-    count = cur.fetchone()["cnt"]
+    count = cur.fetchone()["like_count"]
+    _publish_invalidation(cur, "place", place_id)
 
     conn.commit()
     conn.close()
     return {"liked": liked, "count": int(count)}
 
 
+def _upsert_place_stats(cur, counts: list) -> None:
+    """place_stats-ում գրում է [(place_id, like_count), ...]"""
+    now = "CURRENT_TIMESTAMP" if DATABASE_URL else "datetime('now')"
+    cur.executemany(
+        _q(f"""
+        INSERT INTO place_stats (place_id, like_count, updated_at)
+        VALUES (%s, %s, {now})
+        ON CONFLICT (place_id) DO UPDATE SET
+            like_count = EXCLUDED.like_count,
+            updated_at = EXCLUDED.updated_at
+        """),
+        counts,
+    )
+
+
+def apply_place_like_changes(changes: list) -> dict:
+    """
+    Buffered like-երի batch flush — մեկ transaction։
+    changes: [(place_id, session_id, liked), ...] — session-ի վերջնական վիճակը։
+    Վերադարձնում է {place_id: like_count} թարմ count-երը (place_stats-ում էլ)։
+    """
+    if not changes:
+        return {}
+
+    adds = [(p, sid) for p, sid, liked in changes if liked]
+    removes = [(p, sid) for p, sid, liked in changes if not liked]
+    place_ids = sorted({p for p, _, _ in changes})
+
+    conn = get_connection()
+    cur = get_cursor(conn)
+
+    try:
+        if adds:
+            cur.executemany(
+                _q("""
+                INSERT INTO place_likes (place_id, session_id) VALUES (%s, %s)
+                ON CONFLICT (place_id, session_id) DO NOTHING
+                """),
+                adds,
+            )
+        if removes:
+            cur.executemany(
+                _q("DELETE FROM place_likes WHERE place_id = %s AND session_id = %s"),
+                removes,
+            )
+
+        marks = ", ".join(["%s"] * len(place_ids))
+        cur.execute(
+            _q(f"""
+            SELECT place_id, COUNT(*) AS cnt
+            FROM place_likes
+            WHERE place_id IN ({marks})
+            GROUP BY place_id
+            """),
+            place_ids,
+        )
+        counts = {p: 0 for p in place_ids}
+        counts.update({r["place_id"]: int(r["cnt"]) for r in cur.fetchall()})
+        _upsert_place_stats(cur, list(counts.items()))
+        for place_id in place_ids:
+            _publish_invalidation(cur, "place", place_id)
+
+        conn.commit()
+        return counts
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cur.close()
+        conn.close()
+
+
 def get_place_likes(place_id: str, session_id: str) -> dict:
-    """Վերադարձնում է like-ի count + արդյոք session-ը like ա արել"""
+    """Վերադարձնում է like-ի count (place_stats) + արդյոք session-ը like ա արել"""
     conn = get_connection()
     cur = get_cursor(conn)
 
     cur.execute(
-        "SELECT COUNT(*) AS cnt FROM place_likes WHERE place_id = %s",
+        _q("SELECT like_count FROM place_stats WHERE place_id = %s"),
         (place_id,),
     )
-    count = cur.fetchone()["cnt"]
+    row = cur.fetchone()
+    count = row["like_count"] if row else 0
 
     cur.execute(
-        "SELECT id FROM place_likes WHERE place_id = %s AND session_id = %s",
+        _q("SELECT id FROM place_likes WHERE place_id = %s AND session_id = %s"),
         (place_id, session_id),
     )
     liked = cur.fetchone() is not None
@@ -1180,23 +2370,24 @@ def set_place_rating(place_id: str, session_id: str, rating: int) -> dict:
     cur = get_cursor(conn)
 
     cur.execute(
-        """
+        _q("""
         INSERT INTO place_ratings (place_id, session_id, rating)
         VALUES (%s, %s, %s)
         ON CONFLICT (place_id, session_id)
         DO UPDATE SET rating = EXCLUDED.rating
-        """,
+        """),
         (place_id, session_id, rating),
     )
 
     cur.execute(
-        """
+        _q("""
         SELECT COUNT(*) AS cnt, AVG(rating) AS avg
         FROM place_ratings WHERE place_id = %s
-        """,
+        """),
         (place_id,),
     )
     row = cur.fetchone()
+    _publish_invalidation(cur, "place", place_id)
 
     conn.commit()
     conn.close()
@@ -1213,16 +2404,16 @@ def get_place_rating(place_id: str, session_id: str) -> dict:
     cur = get_cursor(conn)
 
     cur.execute(
-        """
+        _q("""
         SELECT COUNT(*) AS cnt, AVG(rating) AS avg
         FROM place_ratings WHERE place_id = %s
-        """,
+        """),
         (place_id,),
     )
     row = cur.fetchone()
 
     cur.execute(
-        "SELECT rating FROM place_ratings WHERE place_id = %s AND session_id = %s",
+        _q("SELECT rating FROM place_ratings WHERE place_id = %s AND session_id = %s"),
         (place_id, session_id),
     )
     my = cur.fetchone()
@@ -1243,37 +2434,97 @@ def add_place_comment(place_id: str, session_id: str, text: str, rating: int = 0
     cur = get_cursor(conn)
 
     cur.execute(
-        """
+        _q("""
         INSERT INTO place_comments (place_id, session_id, text, rating)
         VALUES (%s, %s, %s, %s)
         RETURNING id, created_at
-        """,
+        """),
         (place_id, session_id, text[:500], rating or None),
     )
     row = cur.fetchone()
+    _publish_invalidation(cur, "place", place_id)
 
     conn.commit()
     conn.close()
     return {"id": row["id"], "created_at": str(row["created_at"])}
 
 
-def get_place_comments(place_id: str) -> list:
-    """Վերադարձնում է place-ի բոլոր comment-ները՝ նորից հին"""
+def _encode_comment_cursor(comment: dict) -> str:
+    """(created_at, id) → opaque URL-safe cursor"""
+    raw = json.dumps([comment["created_at"], comment["id"]])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_comment_cursor(cursor: str) -> tuple:
+    """
+    Cursor → (created_at, id)։ Սխալ cursor-ի դեպքում ValueError — նաև եթե
+    decode լինում ա, բայց created_at-ը timestamp չի կամ id-ն integer չի
+    (PostgreSQL-ը SQL-ում կընկներ → 500)
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, comment_id = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(created_at, str) or type(comment_id) is not int:
+            raise TypeError("cursor fields have the wrong types")
+        datetime.fromisoformat(created_at)
+        if not 0 < comment_id < 2 ** 31:
+            raise ValueError("comment id out of range")
+        return created_at, comment_id
+    except Exception as e:
+        raise ValueError(f"Invalid comment cursor: {cursor!r}") from e
+
+
+def _fetch_comment_page(cur, place_id: str, limit: int, cursor: Optional[str] = None) -> dict:
+    """
+    Մեկ էջ comment՝ նորից հին, (created_at, id) keyset-ով։
+    Վերադարձնում է {"comments": [...], "next_cursor": str | None}
+    """
+    if cursor:
+        created_at, comment_id = _decode_comment_cursor(cursor)
+        cur.execute(
+            _q("""
+            SELECT id, text, rating, created_at
+            FROM place_comments
+            WHERE place_id = %s
+              AND (created_at, id) < (%s, %s)
+            ORDER BY created_at DESC, id DESC
+            LIMIT %s
+            """),
+            (place_id, created_at, comment_id, limit + 1),
+        )
+    else:
+        cur.execute(
+            _q("""
+            SELECT id, text, rating, created_at
+            FROM place_comments
+            WHERE place_id = %s
+            ORDER BY created_at DESC, id DESC
+            LIMIT %s
+            """),
+            (place_id, limit + 1),
+        )
+
+    comments = [_comment_to_dict(r) for r in cur.fetchall()]
+    next_cursor = None
+    if len(comments) > limit:
+        comments = comments[:limit]
+        next_cursor = _encode_comment_cursor(comments[-1])
+    return {"comments": comments, "next_cursor": next_cursor}
+
+
+def get_place_comments(place_id: str, limit: int = 20, cursor: Optional[str] = None) -> dict:
+    """
+    Վերադարձնում է place-ի comment-ների մեկ էջը՝ նորից հին։
+    cursor-ը նախորդ էջի next_cursor-ն է (None → առաջին էջ)։
+    """
     conn = get_connection()
     cur = get_cursor(conn)
 
-    cur.execute(
-        """
-        SELECT id, text, rating, created_at
-        FROM place_comments
-        WHERE place_id = %s
-        ORDER BY created_at DESC
-        """,
-        (place_id,),
-    )
-    rows = cur.fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    try:
+        return _fetch_comment_page(cur, place_id, limit, cursor)
+    finally:
+        cur.close()
+        conn.close()
 
 
 def get_place_comment_count(place_id: str) -> int:
@@ -1282,10 +2533,172 @@ def get_place_comment_count(place_id: str) -> int:
     cur = get_cursor(conn)
 
     cur.execute(
-        "SELECT COUNT(*) AS cnt FROM place_comments WHERE place_id = %s",
+        _q("SELECT COUNT(*) AS cnt FROM place_comments WHERE place_id = %s"),
         (place_id,),
     )
     row = cur.fetchone()
     conn.close()
     return int(row["cnt"]) if row else 0
 
+
+
+# ── SUMMARY (detail page) ─────────────────────────────────────────────────────
+
+def _comment_to_dict(row) -> dict:
+    """Comment row → JSON-friendly dict (created_at-ը string)"""
+    c = dict(row)
+    if hasattr(c.get("created_at"), "isoformat"):
+        c["created_at"] = c["created_at"].isoformat()
+    elif c.get("created_at") is not None:
+        c["created_at"] = str(c["created_at"])
+    return c
+
+
+def get_place_summary(place_id: str, session_id: str, comments_limit: int = 20) -> dict:
+    """
+    Detail էջի համար մեկ connection-ով բերում է like-երը, rating-ը,
+    comment-ների քանակը, առաջին էջի comment-ները և session-ի վիճակը։
+    Վերադարձնում է {"likes": {...}, "rating": {...}, "comment_count": int,
+                    "comments": [...], "next_cursor": str | None}
+    """
+    conn = get_connection()
+    cur = get_cursor(conn)
+
+    try:
+        cur.execute(
+            _q("""
+            SELECT
+                (SELECT like_count FROM place_stats
+                  WHERE place_id = %s) AS like_count,
+                (SELECT COUNT(*) FROM place_likes
+                  WHERE place_id = %s AND session_id = %s) AS liked,
+                (SELECT COUNT(*) FROM place_ratings
+                  WHERE place_id = %s) AS rating_count,
+                (SELECT AVG(rating) FROM place_ratings
+                  WHERE place_id = %s) AS rating_avg,
+                (SELECT MAX(rating) FROM place_ratings
+                  WHERE place_id = %s AND session_id = %s) AS my_rating,
+                (SELECT COUNT(*) FROM place_comments
+                  WHERE place_id = %s) AS comment_count
+            """),
+            (
+                place_id,
+                place_id, session_id,
+                place_id,
+                place_id,
+                place_id, session_id,
+                place_id,
+            ),
+        )
+        row = cur.fetchone()
+
+        page = _fetch_comment_page(cur, place_id, comments_limit)
+    finally:
+        cur.close()
+        conn.close()
+
+    return {
+        "likes": {
+            "liked": bool(row["liked"]),
+            "count": int(row["like_count"] or 0),
+        },
+        "rating": {
+            "my_rating": int(row["my_rating"]) if row["my_rating"] else 0,
+            "avg": round(float(row["rating_avg"]), 1) if row["rating_avg"] else 0.0,
+            "count": int(row["rating_count"]),
+        },
+        "comment_count": int(row["comment_count"]),
+        "comments": page["comments"],
+        "next_cursor": page["next_cursor"],
+    }
+
+
+# ============================================================================
+# RATE LIMIT BUCKETS
+# ============================================================================
+
+def take_rate_limit_token(
+    bucket_key: str,
+    capacity: float,
+    refill_per_sec: float,
+    now: float,
+) -> tuple:
+    """
+    Atomically refills the bucket and takes one token if available.
+    Returns (allowed, tokens_left). One UPSERT per call, so concurrent
+    workers never read-modify-write the same row.
+    """
+    least = "LEAST" if DATABASE_URL else "MIN"
+    greatest = "GREATEST" if DATABASE_URL else "MAX"
+    refilled = (
+        f"{least}(%s, rate_limit_buckets.tokens + "
+        f"{greatest}(0, %s - rate_limit_buckets.updated_at) * %s)"
+    )
+
+    conn = get_connection()
+    cur = get_cursor(conn)
+
+    try:
+        cur.execute(
+            _q(f"""
+            INSERT INTO rate_limit_buckets (bucket_key, tokens, updated_at, last_allowed)
+            VALUES (%s, %s, %s, {'TRUE' if DATABASE_URL else 1})
+            ON CONFLICT (bucket_key) DO UPDATE SET
+                tokens = CASE WHEN {refilled} >= 1
+                              THEN {refilled} - 1
+                              ELSE {refilled} END,
+                last_allowed = ({refilled} >= 1),
+                updated_at = %s
+            RETURNING tokens, last_allowed
+            """),
+            (
+                bucket_key, capacity - 1, now,
+                capacity, now, refill_per_sec,
+                capacity, now, refill_per_sec,
+                capacity, now, refill_per_sec,
+                capacity, now, refill_per_sec,
+                now,
+            ),
+        )
+        row = cur.fetchone()
+        conn.commit()
+    finally:
+        cur.close()
+        conn.close()
+
+    return bool(row["last_allowed"]), float(row["tokens"])
+
+
+def refund_rate_limit_token(bucket_key: str, capacity: float) -> None:
+    """Gives back a token taken for a request another bucket then rejected."""
+    least = "LEAST" if DATABASE_URL else "MIN"
+    conn = get_connection()
+    cur = get_cursor(conn)
+
+    try:
+        cur.execute(
+            _q(f"UPDATE rate_limit_buckets SET tokens = {least}(%s, tokens + 1) WHERE bucket_key = %s"),
+            (capacity, bucket_key),
+        )
+        conn.commit()
+    finally:
+        cur.close()
+        conn.close()
+
+
+def cleanup_rate_limit_buckets(older_than: float) -> int:
+    """Deletes buckets untouched since `older_than` (unix time)."""
+    conn = get_connection()
+    cur = get_cursor(conn)
+
+    try:
+        cur.execute(
+            _q("DELETE FROM rate_limit_buckets WHERE updated_at < %s"),
+            (older_than,),
+        )
+        deleted = cur.rowcount
+        conn.commit()
+        return deleted
+    finally:
+        cur.close()
+        conn.close()
@@ -0,0 +1,143 @@
+# backend/invalidation.py
+#
+# Cross-worker cache invalidation.
+#
+# Writes call database._publish_invalidation(cur, topic, key) inside their
+# transaction. Every web worker runs one InvalidationListener thread:
+#   PostgreSQL → LISTEN askyerevan_invalidate (pg_notify payload = {"topic", "key"})
+#   SQLite     → polls the cache_invalidations table every INVALIDATION_POLL_MS
+# and calls the handlers registered for the topic. key=None means "everything".
+#
+# Topics: "news" (save/update/delete news), "place" (key = place_id: likes,
+# ratings, comments).
+
+import json
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+
+from backend import database
+from backend.utils.logger import logger
+
+Handler = Callable[[Optional[str]], None]
+
+_handlers: Dict[str, List[Handler]] = defaultdict(list)
+
+
+def on_invalidate(topic: str, handler: Handler) -> None:
+    _handlers[topic].append(handler)
+
+
+def dispatch(topic: str, key: Optional[str] = None) -> None:
+    for handler in _handlers.get(topic, ()):
+        try:
+            handler(key)
+        except Exception as e:
+            logger.error(f"❌ Invalidation handler failed ({topic}/{key}): {e}")
+
+
+def dispatch_all() -> None:
+    """After a listener (re)connect — notifications may have been missed."""
+    for topic in list(_handlers):
+        dispatch(topic, None)
+
+
+class InvalidationListener:
+    RETENTION_SEC = 600      # SQLite: rows older than this are pruned
+    CLEANUP_EVERY_SEC = 60
+    RECONNECT_SEC = 2.0
+
+    def __init__(self, poll_interval: float = 0.5):
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        target = self._listen_postgres if database.DATABASE_URL else self._poll_sqlite
+        self._thread = threading.Thread(target=target, name="cache-invalidation", daemon=True)
+        self._thread.start()
+        mode = "LISTEN/NOTIFY" if database.DATABASE_URL else f"polling every {self.poll_interval * 1000:.0f} ms"
+        logger.info(f"📡 Cache invalidation listener started ({mode})")
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    # ── PostgreSQL ───────────────────────────────────────────────────────────
+
+    def _listen_postgres(self) -> None:
+        import select
+
+        import psycopg2
+        import psycopg2.extensions
+
+        first = True
+        while not self._stop.is_set():
+            conn = None
+            try:
+                # own connection: LISTEN needs a long-lived autocommit session
+                conn = psycopg2.connect(database.DATABASE_URL)
+                conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                conn.cursor().execute(f"LISTEN {database.INVALIDATION_CHANNEL}")
+                if not first:
+                    dispatch_all()
+                first = False
+
+                while not self._stop.is_set():
+                    if not select.select([conn], [], [], 1.0)[0]:
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        note = conn.notifies.pop(0)
+                        try:
+                            payload = json.loads(note.payload)
+                        except ValueError:
+                            payload = {"topic": note.payload, "key": None}
+                        dispatch(payload.get("topic", ""), payload.get("key"))
+            except Exception as e:
+                logger.error(f"❌ Invalidation LISTEN failed, reconnecting: {e}")
+                self._stop.wait(self.RECONNECT_SEC)
+            finally:
+                if conn is not None:
+                    conn.close()
+
+    # ── SQLite stand-in ──────────────────────────────────────────────────────
+
+    def _poll_sqlite(self) -> None:
+        conn = None
+        last_id = None
+        next_cleanup = 0.0
+        while not self._stop.is_set():
+            try:
+                if conn is None:
+                    conn = database.get_connection()
+                    if last_id is None:
+                        last_id = database.get_last_invalidation_id(conn)
+                    else:
+                        dispatch_all()
+
+                for row in database.get_invalidations_since(conn, last_id):
+                    last_id = row["id"]
+                    dispatch(row["topic"], row["key"])
+
+                now = time.time()
+                if now >= next_cleanup:
+                    next_cleanup = now + self.CLEANUP_EVERY_SEC
+                    database.cleanup_invalidations(conn, now - self.RETENTION_SEC)
+            except Exception as e:
+                logger.error(f"❌ Invalidation poll failed: {e}")
+                if conn is not None:
+                    conn.close()
+                    conn = None
+                self._stop.wait(self.RECONNECT_SEC)
+                continue
+            self._stop.wait(self.poll_interval)
+
+        if conn is not None:
+            conn.close()
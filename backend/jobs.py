@@ -11,6 +11,7 @@ from backend.armenia.traffic import get_traffic_status
 from backend.armenia.weather import get_yerevan_weather
 from backend.armenia.recommend import get_recommendations
 from backend.database import get_unanswered_questions_older_than, mark_question_answered
+from backend.scraping.image_mirror import telegram_photo
 from backend.ai.response import generate_reply
 
 BASE_URL = "https://askyerevan.am"
@@ -88,7 +89,7 @@ async def send_holiday_events():
 
             image_url = item.get("image_url")
             if image_url:
-                await bot.send_photo(chat_id, photo=image_url, caption=caption)
+                await bot.send_photo(chat_id, photo=telegram_photo(image_url, BASE_URL), caption=caption)
             else:
                 await bot.send_message(chat_id, caption)
 
@@ -147,7 +148,7 @@ async def send_next_day_events():
 
             image_url = item.get("image_url")
             if image_url:
-                await bot.send_photo(chat_id, photo=image_url, caption=caption)
+                await bot.send_photo(chat_id, photo=telegram_photo(image_url, BASE_URL), caption=caption)
             else:
                 await bot.send_message(chat_id, caption)
 
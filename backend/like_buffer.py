@@ -0,0 +1,204 @@
+# backend/like_buffer.py
+#
+# Write-behind buffer for place like toggles.
+# Toggles are applied to in-memory per-place state and answered right away;
+# net changes are flushed to place_likes / place_stats in one transaction
+# every PLACE_LIKES_FLUSH_MS.
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from backend.database import apply_place_like_changes, get_place_likes
+from backend.utils.logger import logger
+
+
+@dataclass
+class _PlaceState:
+    count: int                                                 # current count incl. pending toggles
+    liked: Dict[str, bool] = field(default_factory=dict)       # session → current state
+    persisted: Dict[str, bool] = field(default_factory=dict)   # session → state in DB
+    touched_at: float = field(default_factory=time.monotonic)
+
+
+class LikeBuffer:
+    """
+    toggle() never opens a transaction for a known (place, session); the first
+    toggle of an unseen pair reads its state once. flush() writes only pairs whose
+    state differs from the DB, so a like + unlike burst costs nothing.
+    """
+
+    IDLE_EVICT_SEC = 30  # drop clean place state (other workers' writes also arrive via invalidate())
+
+    def __init__(self, flush_interval: float = 0.25):
+        self.flush_interval = flush_interval
+        self._places: Dict[str, _PlaceState] = {}
+        self._dirty: Dict[tuple, bool] = {}   # (place_id, session_id) → desired state
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    # ── reads / toggles ──────────────────────────────────────────────────────
+
+    def _ensure_state(self, place_id: str, session_id: str) -> None:
+        with self._lock:
+            st = self._places.get(place_id)
+            if st is not None and session_id in st.liked:
+                return
+
+        db = get_place_likes(place_id, session_id)
+
+        with self._lock:
+            st = self._places.get(place_id)
+            if st is None:
+                pending = sum(
+                    (1 if v else -1)
+                    for (p, sid), v in self._dirty.items()
+                    if p == place_id
+                )
+                st = self._places[place_id] = _PlaceState(count=db["count"] + pending)
+            if session_id not in st.liked:
+                st.liked[session_id] = db["liked"]
+                st.persisted[session_id] = db["liked"]
+
+    def toggle(self, place_id: str, session_id: str) -> dict:
+        """Same contract as database.toggle_place_like → {"liked", "count"}"""
+        self._ensure_state(place_id, session_id)
+
+        with self._lock:
+            st = self._places[place_id]
+            liked = not st.liked[session_id]
+            st.liked[session_id] = liked
+            st.count += 1 if liked else -1
+            st.touched_at = time.monotonic()
+
+            key = (place_id, session_id)
+            if liked == st.persisted[session_id]:
+                self._dirty.pop(key, None)
+            else:
+                self._dirty[key] = liked
+
+            return {"liked": liked, "count": max(st.count, 0)}
+
+    def overlay(self, place_id: str, session_id: str, likes: dict) -> dict:
+        """Patches a DB-read {"liked", "count"} with not-yet-flushed toggles."""
+        with self._lock:
+            st = self._places.get(place_id)
+            if st is None:
+                return likes
+            return {
+                "liked": st.liked.get(session_id, likes["liked"]),
+                "count": max(st.count, 0),
+            }
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._dirty)
+
+    # ── flushing ─────────────────────────────────────────────────────────────
+
+    def flush(self) -> int:
+        """Writes net changes in one batch. Returns the number of rows changed."""
+        with self._flush_lock:
+            with self._lock:
+                batch = self._dirty
+                self._dirty = {}
+            if not batch:
+                self._evict_idle()
+                return 0
+
+            try:
+                counts = apply_place_like_changes(
+                    [(p, sid, liked) for (p, sid), liked in batch.items()]
+                )
+            except Exception as e:
+                logger.error(f"❌ Like buffer flush failed ({len(batch)} changes): {e}")
+                with self._lock:
+                    for key, liked in batch.items():
+                        self._requeue(key, liked)
+                return 0
+
+            with self._lock:
+                for (place_id, session_id), liked in batch.items():
+                    st = self._places.get(place_id)
+                    if st is not None:
+                        st.persisted[session_id] = liked
+                        self._requeue((place_id, session_id), liked)
+                for place_id, db_count in counts.items():
+                    st = self._places.get(place_id)
+                    if st is None:
+                        continue
+                    pending = sum(
+                        (1 if v else -1)
+                        for (p, sid), v in self._dirty.items()
+                        if p == place_id
+                    )
+                    st.count = db_count + pending
+
+            self._evict_idle()
+            return len(batch)
+
+    def _requeue(self, key: tuple, fallback: bool) -> None:
+        """Re-marks a pair dirty if its in-memory state drifted from the DB
+        while a flush was in flight (caller holds self._lock)."""
+        if key in self._dirty:
+            return
+        place_id, session_id = key
+        st = self._places.get(place_id)
+        if st is None:
+            self._dirty[key] = fallback
+        elif st.liked[session_id] != st.persisted[session_id]:
+            self._dirty[key] = st.liked[session_id]
+
+    def _evict_idle(self) -> None:
+        cutoff = time.monotonic() - self.IDLE_EVICT_SEC
+        with self._lock:
+            dirty_places = {p for p, _ in self._dirty}
+            for place_id in [
+                p for p, st in self._places.items()
+                if st.touched_at < cutoff and p not in dirty_places
+            ]:
+                del self._places[place_id]
+
+    def invalidate(self, place_id: Optional[str] = None) -> None:
+        """Drops cached state for a place, or every place (pending toggles stay queued)."""
+        with self._lock:
+            dirty_places = {p for p, _ in self._dirty}
+            targets = list(self._places) if place_id is None else [place_id]
+            for p in targets:
+                if p not in dirty_places:
+                    self._places.pop(p, None)
+
+    # ── lifecycle ────────────────────────────────────────────────────────────
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception as e:
+                logger.error(f"❌ Like buffer loop error: {e}")
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(f"💾 Like buffer started (flush every {self.flush_interval * 1000:.0f} ms)")
+
+    async def stop(self) -> None:
+        """Stops the loop and flushes everything that is still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await asyncio.to_thread(self.flush)
+        left = self.pending()
+        if left:
+            logger.error(f"❌ Like buffer stopped with {left} unflushed changes")
+        else:
+            logger.info("💾 Like buffer flushed on shutdown")
@@ -0,0 +1,93 @@
+# backend/media_worker.py
+#
+# Background image processing for admin uploads.
+# The upload is saved as-is and the news row points at it right away; the
+# worker then builds resized JPEG variants (backend/utils/images.py) and
+# swaps the row to the optimized image + srcset.
+
+import asyncio
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from backend.database import set_news_image
+from backend.utils.images import make_variants
+from backend.utils.logger import logger
+
+
+@dataclass
+class MediaJob:
+    news_id: int
+    path: Path        # uploaded original on disk
+    url: str          # its public URL (what news.image_url holds now)
+    url_prefix: str   # public URL of path.parent, e.g. "/static/img/important"
+
+
+class MediaWorker:
+    def __init__(self, maxsize: int = 100):
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._task: Optional[asyncio.Task] = None
+
+    def enqueue(self, job: MediaJob) -> bool:
+        """False if the queue is full — the original image then simply stays."""
+        try:
+            self._queue.put_nowait(job)
+            return True
+        except asyncio.QueueFull:
+            logger.warning(f"⚠️ Media queue full, news {job.news_id} keeps the original image")
+            return False
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    async def _run(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await asyncio.to_thread(self.process, job)
+            except Exception as e:
+                logger.error(f"❌ Media job for news {job.news_id} failed: {e}")
+            finally:
+                self._queue.task_done()
+
+    @staticmethod
+    def process(job: MediaJob) -> bool:
+        variants = make_variants(job.path)
+        if not variants:
+            return False
+
+        urls = {w: f"{job.url_prefix}/{p.name}" for w, p in variants.items()}
+        largest = max(urls)
+        srcset = ", ".join(f"{urls[w]} {w}w" for w in sorted(urls))
+
+        if set_news_image(job.news_id, job.url, urls[largest], srcset):
+            job.path.unlink(missing_ok=True)
+            logger.info(f"🖼 News {job.news_id}: {len(variants)} image variants ready")
+            return True
+
+        # image was replaced while we worked — drop what we made
+        for p in variants.values():
+            p.unlink(missing_ok=True)
+        return False
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        """Finishes queued jobs (up to `timeout`), then stops."""
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"⚠️ Media worker stopped with {self.pending()} jobs left")
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+media_worker = MediaWorker()
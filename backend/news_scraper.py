@@ -2,14 +2,17 @@
 # backend/news_scraper.py
 # =============================================================================
 
-import re
+import asyncio
+import time
 from datetime import date, timedelta
 from typing import List, Optional
 
 import requests
-from bs4 import BeautifulSoup
 
-from backend.database import save_news
+from backend.config.settings import settings
+from backend.database import save_scrape_run, upsert_scraped_news
+from backend.scraping.extract import extract_event, extract_event_en, extract_links
+from backend.scraping.runstats import RunStats
 from backend.utils.logger import logger
 
 
@@ -103,7 +106,7 @@ def final_category_from_source(
 # CONSTANTS
 # =============================================================================
 
-BASE_TOMSARKGH_URL = "https://www.tomsarkgh.am"
+BASE_TOMSARKGH_URL = settings.TOMSARKGH_BASE_URL.rstrip("/")
 HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -131,40 +134,33 @@ TOMSARKGH_CATEGORIES = {
 
 
 # =============================================================================
-# HELPERS
+# LIST PAGE → EVENT URLS
 # =============================================================================
 
-def _safe_text(el) -> str:
-    """Extract clean text from BeautifulSoup element."""
-    return el.get_text(strip=True) if el else ""
-
+def tomsarkgh_list_params(event_type: int, days_ahead: int = 7) -> dict:
+    """Query for /list?EventType[]=...&startFrom=..&startTo=..."""
+    today = date.today()
+    return {
+        "EventType[]": str(event_type),
+        "startFrom": today.strftime("%m/%d/%Y"),
+        "startTo": (today + timedelta(days=days_ahead)).strftime("%m/%d/%Y"),
+    }
 
-def _full_text(soup: BeautifulSoup) -> str:
-    """Full visible text of the page (for regex fallbacks)."""
-    return soup.get_text(separator="\n", strip=True)
 
+def parse_event_links(html: str, limit: int = 20) -> List[str]:
+    """List page HTML → first `limit` unique /hy/event/ URLs."""
+    return extract_links(html, BASE_TOMSARKGH_URL, "/hy/event/", limit)
 
-# =============================================================================
-# LIST PAGE → EVENT URLS
-# =============================================================================
 
 def fetch_tomsarkgh_events(event_type: int, days_ahead: int = 7) -> List[str]:
     """
     Fetch event URLs from Tomsarkgh list endpoint by EventType and date range.
     Uses /list?EventType[]=...&startFrom=..&startTo=...
     """
-    today = date.today()
-    start = today.strftime("%m/%d/%Y")
-    end = (today + timedelta(days=days_ahead)).strftime("%m/%d/%Y")
-
-    params = {
-        "EventType[]": str(event_type),
-        "startFrom": start,
-        "startTo": end,
-    }
+    params = tomsarkgh_list_params(event_type, days_ahead)
 
     try:
-        logger.info(f"📋 Tomsarkgh list: type={event_type}, {start}→{end}")
+        logger.info(f"📋 Tomsarkgh list: type={event_type}, {params['startFrom']}→{params['startTo']}")
         resp = requests.get(
             f"{BASE_TOMSARKGH_URL}/list",
             params=params,
@@ -176,104 +172,77 @@ def fetch_tomsarkgh_events(event_type: int, days_ahead: int = 7) -> List[str]:
         logger.error(f"❌ Tomsarkgh list error (type={event_type}): {e}")
         return []
 
-    soup = BeautifulSoup(resp.text, "html.parser")
-    links: List[str] = []
-
-    for a in soup.select("a[href*='/hy/event/']"):
-        href = a.get("href", "").strip()
-        if not href or "/hy/event/" not in href:
-            continue
-        full_url = href if href.startswith("http") else BASE_TOMSARKGH_URL + href
-        if full_url not in links:
-            links.append(full_url)
-
+    links = parse_event_links(resp.text)
     logger.info(f"✅ Found {len(links)} events for type={event_type}")
-    return links[:20]
+    return links
 
 
 # =============================================================================
-# EVENT PAGE PARSER
+# EVENT PAGE PARSER  (field extraction: backend/scraping/extract.py)
 # =============================================================================
 
-def _parse_event_datetime(soup: BeautifulSoup) -> (str, str):
-    """
-    Return (eventdate, eventtime) strings.
-    """
-    meta = soup.select_one("meta[itemprop='startDate']")
-    eventdate = ""
-    eventtime = ""
-
-    if meta and meta.get("content"):
-        raw = meta["content"].strip()  # "2025-12-30 14:00"
-        parts = raw.split()
-        if len(parts) >= 1:
-            eventdate = parts[0]
-        if len(parts) >= 2:
-            eventtime = parts[1]
-
-    txt = _full_text(soup)
-    if not eventdate:
-        m = re.search(r"(\d{4}-\d{2}-\d{2})", txt)
-        if m:
-            eventdate = m.group(1)
-    if not eventtime:
-        m = re.search(r"(\d{1,2}[:․]\d{2})", txt)
-        if m:
-            eventtime = m.group(1).replace("․", ":")
-
-    return eventdate[:32], eventtime[:32]
-
-
-def _parse_event_venue(soup: BeautifulSoup) -> str:
-    el = soup.select_one(".occurrence_venue span[itemprop='name']")
-    if el:
-        return _safe_text(el)[:100]
-
-    txt = _full_text(soup)
-    m = re.search(
-        r"(թատրոն|ակումբ|ջազ ակումբ|համերգասրահ|cinema|hall)[^\n]{0,80}",
-        txt,
-        re.IGNORECASE,
-    )
-    return m.group(0).strip()[:100] if m else ""
-
-
-def _parse_event_price(soup: BeautifulSoup) -> str:
-    meta_price = soup.select_one(
-        "span[itemprop='offers'] meta[itemprop='price'], meta[itemprop='price']"
-    )
-    if meta_price and meta_price.get("content"):
-        raw = meta_price["content"].strip()
-        m = re.match(r"(\d+)", raw)
-        if m:
-            return m.group(1)
+def event_url_en(url: str) -> str:
+    if "/hy/event" in url:
+        return url.replace("/hy/event", "/en/event")
+    if "/en/event" in url:
+        return url
+    return url.replace("/hy/", "/en/")
 
-    txt = _full_text(soup)
-    m = re.search(r"(\d{3,}(?:[-–]\d{3,})?)\s*(?:դր\.?|դրամ|AMD)", txt)
-    return m.group(1).replace("–", "-") if m else ""
 
+def parse_event(url: str, base_category: str, html_hy: str, html_en: Optional[str] = None,
+                backend: Optional[str] = None) -> dict:
+    """
+    HY (+ optional EN) event page HTML → save_news() keyword arguments.
+    Pure — the sync and the async (backend/scraping/tomsarkgh.py) scrapers share it.
+    `backend` — HTML parser (extract.BACKENDS), default the fastest installed.
+    """
+    page = extract_event(html_hy, BASE_TOMSARKGH_URL, backend)
 
-def _parse_event_image(soup: BeautifulSoup) -> Optional[str]:
-    og = soup.select_one("meta[property='og:image']")
-    if og and og.get("content"):
-        return og["content"].strip()
+    # ---------- HY VERSION ----------
+    title_hy = page.title[:200] or "Միջոցառում"
+    content_hy = page.description[:4000]
+    eventdate, eventtime = page.eventdate, page.eventtime
+    venue_hy = page.venue
+    price_hy = page.price
+    image_url = page.image_url
 
-    img = soup.select_one(".event_photo img")
-    if img and img.get("src"):
-        src = img["src"].strip()
-        return src if src.startswith("http") else BASE_TOMSARKGH_URL + src
+    # ---------- EN VERSION (optional) ----------
+    title_en = title_hy
+    content_en = content_hy
 
-    return None
+    if html_en:
+        try:
+            en_title, text_en = extract_event_en(html_en, backend)
+            if en_title:
+                title_en = en_title[:200]
+            if text_en:
+                content_en = text_en[:4000]
+        except Exception:
+            logger.debug(f"EN version unparsable for {url}")
+
+    # ---------- CATEGORY FINAL ----------
+    final_category = final_category_from_source(base_category, title_hy, content_hy)
+
+    return dict(
+        title_hy=title_hy,
+        title_en=title_en,
+        content_hy=content_hy,
+        content_en=content_en,
+        image_url=image_url,
+        category=final_category,
+        source_url=url,
+        eventdate=eventdate,
+        eventtime=eventtime,
+        venue_hy=venue_hy,
+        price_hy=price_hy,
+    )
 
 
-def _parse_event_description(soup: BeautifulSoup) -> str:
-    desc = soup.select_one(".description #eventDesc, .description span#eventDesc")
-    if not desc:
-        desc = soup.select_one(".description")
-    text = desc.decode_contents() if desc else ""
-    if text:
-        text = BeautifulSoup(text, "html.parser").get_text("\n", strip=True)
-    return text[:4000]
+def log_saved_event(row: dict) -> None:
+    logger.info(
+        f"SAVED [{row['category']}] {row['title_hy'][:40]} | 📅{row['eventdate']} ⏰{row['eventtime']} "
+        f"📍{row['venue_hy'][:20]} 💰{row['price_hy']}"
+    )
 
 
 def scrape_tomsarkgh_event(
@@ -286,71 +255,18 @@ def scrape_tomsarkgh_event(
         logger.info(f"🎫 Scraping event: {url}")
         resp = requests.get(url, headers=HEADERS, timeout=15)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-
-        # ---------- HY VERSION ----------
-        title_el = soup.select_one("h1.event-name") or soup.select_one("h1")
-        title_hy = _safe_text(title_el)[:200] or "Միջոցառում"
-
-        content_hy = _parse_event_description(soup)
-        eventdate, eventtime = _parse_event_datetime(soup)
-        venue_hy = _parse_event_venue(soup)
-        price_hy = _parse_event_price(soup)
-        image_url = _parse_event_image(soup)
-
-        # ---------- EN VERSION (optional) ----------
-        title_en = title_hy
-        content_en = content_hy
 
+        html_en = None
         try:
-            if "/hy/event" in url:
-                url_en = url.replace("/hy/event", "/en/event")
-            elif "/en/event" in url:
-                url_en = url
-            else:
-                url_en = url.replace("/hy/", "/en/")
-
-            resp_en = requests.get(url_en, headers=HEADERS, timeout=10)
+            resp_en = requests.get(event_url_en(url), headers=HEADERS, timeout=10)
             resp_en.raise_for_status()
-            soup_en = BeautifulSoup(resp_en.text, "html.parser")
-
-            title_en_el = soup_en.select_one("h1.event-name") or soup_en.select_one("h1")
-            en_title = _safe_text(title_en_el)
-            if en_title:
-                title_en = en_title[:200]
-
-            desc_en = soup_en.select_one(".description #eventDesc, .description, article, .content")
-            if desc_en:
-                text_en = BeautifulSoup(
-                    desc_en.decode_contents(), "html.parser"
-                ).get_text("\n", strip=True)
-                if text_en:
-                    content_en = text_en[:4000]
+            html_en = resp_en.text
         except Exception:
             logger.debug(f"EN version unavailable for {url}")
 
-        # ---------- CATEGORY FINAL ----------
-        final_category = final_category_from_source(base_category, title_hy, content_hy)
-
-        # ---------- SAVE ----------
-        save_news(
-            title_hy=title_hy,
-            title_en=title_en,
-            content_hy=content_hy,
-            content_en=content_en,
-            image_url=image_url,
-            category=final_category,
-            source_url=url,
-            eventdate=eventdate,
-            eventtime=eventtime,
-            venue_hy=venue_hy,
-            price_hy=price_hy,
-        )
-
-        logger.info(
-            f"SAVED [{final_category}] {title_hy[:40]} | 📅{eventdate} ⏰{eventtime} "
-            f"📍{venue_hy[:20]} 💰{price_hy}"
-        )
+        row = parse_event(url, base_category, resp.text, html_en)
+        upsert_scraped_news(row, time.time())
+        log_saved_event(row)
         return True
 
     except Exception as e:
@@ -362,9 +278,9 @@ def scrape_tomsarkgh_event(
 # MAIN TOMSARKGH SCRAPER — FULL FLOW
 # =============================================================================
 
-def scrape_tomsarkgh_events() -> int:
-    """Scrape all mapped Tomsarkgh categories."""
-    logger.info("▶️ Starting Tomsarkgh scraper (event pages)")
+def scrape_tomsarkgh_events_sequential() -> int:
+    """Old one-request-at-a-time flow (kept for comparison/debugging)."""
+    logger.info("▶️ Starting Tomsarkgh scraper (event pages, sequential)")
     total_saved = 0
 
     for event_type, base_category in TOMSARKGH_CATEGORIES.items():
@@ -389,22 +305,54 @@ def scrape_tomsarkgh_events() -> int:
     return total_saved
 
 
+def scrape_tomsarkgh_events(run: Optional[RunStats] = None) -> int:
+    """
+    Scrape all mapped Tomsarkgh categories (concurrent, see backend/scraping/tomsarkgh.py).
+    Stage timings / counts go to `run` if given.
+    """
+    from backend.scraping.tomsarkgh import scrape_tomsarkgh_events_async
+
+    # scheduler runs this sync job in a worker thread → own event loop here
+    return asyncio.run(scrape_tomsarkgh_events_async(run=run))
+
+
 # =============================================================================
-# MAIN RUNNER
+# MAIN RUNNER  (all sources concurrently, see backend/scraping/ingest.py)
 # =============================================================================
 
+def configured_sources() -> list:
+    """Tomsarkgh + the RSS/Atom feeds listed in SCRAPER_FEEDS."""
+    from backend.scraping.sources import feed_sources
+    from backend.scraping.tomsarkgh import TomsarkghSource
+
+    return [TomsarkghSource(), *feed_sources(settings.SCRAPER_FEEDS)]
+
+
 def run_all_scrapers() -> int:
-    """Run complete news scraping cycle (Tomsarkgh + PanARMENIAN)."""
-    logger.info("🚀 === NEWS SCRAPER START ===")
+    """Run complete news scraping cycle (Tomsarkgh + SCRAPER_FEEDS), one scrape_runs row per source."""
+    from backend.scraping.ingest import run_sources
 
-    total = 0
+    logger.info("🚀 === NEWS SCRAPER START ===")
 
-    # 1) Tomsarkgh
+    sources = configured_sources()
+    runs = {source.name: RunStats(source.name) for source in sources}
     try:
-        total_hy = scrape_tomsarkgh_events()
-        total += total_hy
+        # scheduler runs this sync job in a worker thread → own event loop here
+        asyncio.run(run_sources(sources, runs=runs))
     except Exception as e:
-        logger.error(f"Tomsarkgh scraper failed: {e}")
+        logger.error(f"News scrapers failed: {e}")
+        for run in runs.values():
+            run.error = run.error or f"{type(e).__name__}: {e}"
+
+    total = 0
+    for run in runs.values():
+        totals = run.totals()
+        total += totals["new"] + totals["updated"]
+        run.finish()
+        try:
+            save_scrape_run(run.to_row())
+        except Exception as e:
+            logger.error(f"Could not store scrape run ({run.source}): {e}")
 
     logger.info(f"🏁 === NEWS SCRAPER DONE: {total} items ===")
     return total
@@ -16,6 +16,8 @@ PLACES = [
         "location_hy": "Երևան, Լեո 46",
         "location_en": "46 Leo St, Yerevan",
         "maps_url": "https://maps.app.goo.gl/bzqxdPX6TcJt4qPA6",
+        "lat": 40.1800,
+        "lon": 44.5030,
         "rating": 4.7,
         "thumb": "/static/img/places/kond-house-bbq.jpg",
         "images": [
@@ -74,6 +76,8 @@ PLACES = [
         "location_hy": "Երևան, Սայաթ-Նովա պողոտա 7",
         "location_en": "7 Sayat-Nova Ave, Yerevan",
         "maps_url": "https://maps.app.goo.gl/KRvsZWdKTFRCGB7M9",
+        "lat": 40.1830,
+        "lon": 44.5150,
         "rating": 4.8,
         "thumb": "/static/img/places/ulikhanyan-stage.jpg",
         "images": [
@@ -133,6 +137,8 @@ PLACES = [
             "location_hy": "Երևան, Հյուսիսային պողոտա 5",
             "location_en": "5 Northern Ave, Yerevan",
     "maps_url": "https://maps.app.goo.gl/chk3jk6zxJAZqBM36",
+    "lat": 40.1840,
+    "lon": 44.5170,
     "rating": 4.6,
     "thumb": "/static/img/places/corpous-interior.jpg",
     "images": [
@@ -196,6 +202,8 @@ PLACES = [
     "location_hy": "Հայաստան, Ծաղկաձոր, Տանձաղբյուր փողոց",
     "location_en": "Tandzaghbyur St, Tsaghkadzor",
     "maps_url": "https://maps.app.goo.gl/MJ9o9aAWFEVp82t8A",
+    "lat": 40.5330,
+    "lon": 44.7070,
     "rating": 4.5,
     "thumb": "/static/img/places/tsaghkadzor-summit-view.webp",
     "images": [
@@ -262,6 +270,8 @@ PLACES = [
     "location_hy": "Հայաստան, Սևան",
     "location_en": "Sevan, Armenia",
     "maps_url": "https://maps.app.goo.gl/ySyoBNGzfBtdFSdM9",
+    "lat": 40.5600,
+    "lon": 44.9600,
     "rating": 4.9,
     "thumb": "/static/img/places/sevan-sunset-lakeview.jpg",
     "images": [
@@ -327,6 +337,8 @@ PLACES = [
     "location_hy": "Հայաստան, Ոսկեհատ գյուղ, Արարատի մարզ",
     "location_en": "Voskehat village, Armavir region, Armenia",
     "maps_url": "https://maps.app.goo.gl/dvdSD8S6KaHfHTJE7",
+    "lat": 40.1390,
+    "lon": 44.3260,
     "rating": 4.7,
     "thumb": "/static/img/places/van-ardi-wine-tasting.jpg",
     "images": [
@@ -391,6 +403,8 @@ PLACES = [
     "location_hy": "Հայաստան, Գյումրի, Վարդանանց հրապարակ 1",
     "location_en": "1 Vardananc Square, Gyumri, Armenia",
     "maps_url": "https://maps.app.goo.gl/bmZTmogSTztRqxTM9",
+    "lat": 40.7857,
+    "lon": 43.8417,
     "rating": 4.8,
     "thumb": "/static/img/places/poloz-mukuch-food-table.jpg",
     "images": [
@@ -462,6 +476,8 @@ PLACES = [
     "location_hy": "Հայաստան, Դիլիջան, Մյասնիկյան 5, շ. 28",
     "location_en": "28, 5 Myasnikyan St, Dilijan, Armenia",
     "maps_url": "https://maps.app.goo.gl/D7Dy1DB5hEBpouCh7",
+    "lat": 40.7410,
+    "lon": 44.8640,
     "rating": 4.4,
     "thumb": "/static/img/places/dilijan-forest-cafe-table.jpg",
     "images": [
@@ -526,6 +542,8 @@ PLACES = [
     "location_hy": "Հայաստան, Ջերմուկ, Մյասնիկյան 27",
     "location_en": "27 Myasnikyan Street, Jermuk, Armenia",
     "maps_url": "https://maps.app.goo.gl/PaLF2jsqfafAZXFq5",
+    "lat": 39.8390,
+    "lon": 45.6700,
     "rating": 4.2,
     "thumb": "/static/img/places/jermuk-spa-lounge-evening.jpg",
     "images": [
@@ -599,6 +617,8 @@ PLACES = [
     "location_hy": "Երևան, Պուշկին փողոց",
     "location_en": "Pushkin St, Yerevan",
     "maps_url": "https://maps.app.goo.gl/ScP9M8a1Zukxx2vVA",
+    "lat": 40.1830,
+    "lon": 44.5110,
     "rating": 4.8,
     "thumb": "/static/img/places/calumet-live-music.jpg",
     "images": [
@@ -662,6 +682,8 @@ PLACES = [
     "location_hy": "Երևան, Արամ փողոց 72",
     "location_en": "72 Aram Street, Yerevan",
     "maps_url": "https://maps.app.goo.gl/iKPmd8JVE2kLYQGx8",
+    "lat": 40.1828,
+    "lon": 44.5088,
     "rating": 4.7,
     "thumb": "/static/img/places/dargett-beer-flight.jpeg",
     "images": [
@@ -736,6 +758,8 @@ PLACES = [
     "location_hy": "Երևան, Արամ փողոց 80",
     "location_en": "80 Aram Street, Yerevan",
     "maps_url": "https://maps.app.goo.gl/dTjYCtmmiFmUorN99",
+    "lat": 40.1832,
+    "lon": 44.5087,
     "rating": 4.5,
     "thumb": "/static/img/places/simona-bar-interior.jpg",
     "images": [
@@ -808,6 +832,8 @@ PLACES = [
     "location_hy": "Երևան, Մոսկովյան փողոց 37",
     "location_en": "37 Moskovyan Street, Yerevan",
     "maps_url": "https://maps.app.goo.gl/XXLtWWqqAmmcQdVHA",
+    "lat": 40.1879,
+    "lon": 44.5162,
     "rating": 4.4,
     "thumb": "/static/img/places/stop-club-bar.jpg",
     "images": [
@@ -885,6 +911,8 @@ PLACES = [
     "location_hy": "Հայաստան, Գյումրի, Գյումրիի կոմերցիոն կենտրոն",
     "location_en": "Gyumri Commercial Center, Gyumri, Armenia",
     "maps_url": "https://maps.app.goo.gl/eab9pbeteAvP5kpY6",
+    "lat": 40.7900,
+    "lon": 43.8460,
     "rating": 4.3,
     "thumb": "/static/img/places/garage-club-crowd.jpg",
     "images": [
@@ -965,6 +993,8 @@ PLACES = [
     "location_hy": "Երևան, Աբովյան փողոց 18",
     "location_en": "18 Abovyan St, Yerevan",
     "maps_url": "https://maps.app.goo.gl/4CdqKKUQBV1Bk1Pf9",
+    "lat": 40.1840,
+    "lon": 44.5190,
     "rating": 4.6,
     "thumb": "/static/img/places/kami-club-stage.jpeg",
     "images": [
@@ -1053,6 +1083,8 @@ PLACES = [
     "location_hy": "Երևան, Աբովյան փողոց",
     "location_en": "Abovyan St, Yerevan",
     "maps_url": "https://maps.app.goo.gl/Uufwxize46Poojnb6",
+    "lat": 40.1845,
+    "lon": 44.5195,
     "rating": 4.4,
     "thumb": "/static/img/places/diamond-restaurant-table.jpg",
     "images": [
@@ -1149,6 +1181,8 @@ PLACES = [
     "location_hy": "Երևան, Արինջ, Բաբաջանյան 3-րդ թաղ. 1, M15",
     "location_en": "Babajanyan block 3, 1, M15, Arinj, Yerevan",
     "maps_url": "https://maps.app.goo.gl/LyFVpj3CJVdcfDpT6",
+    "lat": 40.2350,
+    "lon": 44.5700,
     "rating": 4.5,
     "thumb": "/static/img/places/tsirani-garden-overview.jpg",
     "images": [
@@ -1244,6 +1278,8 @@ PLACES = [
     "location_hy": "Երևան, Պուշկին փողոց 10",
     "location_en": "10 Pushkin St, Yerevan",
     "maps_url": "https://maps.app.goo.gl/hMxFvk7mh6SpFrJ98",
+    "lat": 40.1820,
+    "lon": 44.5120,
     "rating": 4.8,
     "thumb": "/static/img/places/dolmama-dolma.jpg",
     "images": [
@@ -1342,6 +1378,8 @@ PLACES = [
     "location_hy": "Հայաստան, Գեղարքունիքի մարզ, Ծովագյուղ, Սևանա լիճ",
     "location_en": "Tsovagyugh, Lake Sevan, Gegharkunik region, Armenia",
     "maps_url": "https://maps.app.goo.gl/xucG6Wwj8L6joWsg8",
+    "lat": 40.6300,
+    "lon": 44.9600,
     "rating": 4.5,
     "thumb": "/static/img/places/yasaman-sevan-fish.webp",
     "images": [
@@ -1440,6 +1478,8 @@ PLACES = [
     "location_hy": "Երևան, Ամիրյան փողոց 1",
     "location_en": "1 Amiryan St, Yerevan",
     "maps_url": "https://maps.app.goo.gl/7RfRRwqRzJECcWJdA",
+    "lat": 40.1779,
+    "lon": 44.5126,
     "rating": 4.6,
     "thumb": "/static/img/places/sherep-restaurant-table.webp",
     "images": [
@@ -7,10 +7,12 @@ from zoneinfo import ZoneInfo
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
 
 from backend.news_scraper import run_all_scrapers
 from backend.database import delete_old_news
+from backend.scraping.image_mirror import mirror_images, prune_files
 
 from .jobs import (
     send_morning_broadcast,
@@ -77,6 +79,14 @@ def create_scheduler() -> AsyncIOScheduler:
         replace_existing=True,
     )
 
+    # Event նկարների local mirror (նոր scrape-ված + backoff-ով retry)
+    scheduler.add_job(
+        mirror_images,
+        IntervalTrigger(minutes=settings.IMAGE_MIRROR_INTERVAL_MIN, timezone=TIMEZONE),
+        id="mirror_event_images",
+        replace_existing=True,
+    )
+
     # 03:30 — 30 օրից հինը ջնջել (արդեն կա, փոխել days=30)
     scheduler.add_job(
         lambda: delete_old_news(days=30),  # 1 տարի → 30 օր
@@ -85,6 +95,14 @@ def create_scheduler() -> AsyncIOScheduler:
         replace_existing=True,
     )
 
+    # 03:45 — ջնջված event-ների mirror նկարները
+    scheduler.add_job(
+        prune_files,
+        CronTrigger(hour=3, minute=45, timezone=TIMEZONE),
+        id="prune_mirrored_images",
+        replace_existing=True,
+    )
+
     logger.info("✅ Scheduler configured with all jobs")
     logger.info("📅 Active jobs:")
     for job in scheduler.get_jobs():
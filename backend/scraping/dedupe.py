@@ -0,0 +1,140 @@
+# backend/scraping/dedupe.py
+#
+# One event, many rows: the same show is listed under several Tomsarkgh
+# EventTypes, on other sites, in Armenian on one page and in English on another.
+# source_url can't see that, so events are matched by what they are:
+#
+#   dedupe_key()  title + start date/time + venue, normalized → exact match (indexed)
+#   same_event()  same date, compatible time / venue, similar title in either
+#                 language → fuzzy match against that date's rows
+#
+# bulk_upsert_scraped_news() merges a new row into the event it matches (its URL
+# becomes a news_aliases entry); backend/tools/merge_duplicate_events.py does the
+# same for rows stored before. Pure — no DB, no settings.
+
+import hashlib
+import re
+import unicodedata
+from difflib import SequenceMatcher
+from typing import Any, Callable, Iterable, List, Mapping, Optional
+
+TITLE_MATCH = 0.85          # SequenceMatcher ratio of normalized titles
+MIN_CONTAINED = 8           # "X" inside "X — premiere" counts as the same title if X is this long
+
+_PUNCT_RE = re.compile(r"[^\w\s]|_", re.UNICODE)
+_SPACE_RE = re.compile(r"\s+")
+_TIME_RE = re.compile(r"(\d{1,2})\s*[:.․]\s*(\d{2})")
+_NUMBER_RE = re.compile(r"\d+")
+
+
+def normalize_text(value: Optional[str]) -> str:
+    """NFKC (և → եւ, full-width → ASCII), casefold, punctuation / quotes «» → space, single spaces."""
+    if not value:
+        return ""
+    value = unicodedata.normalize("NFKC", value).casefold()
+    value = _PUNCT_RE.sub(" ", value)
+    return _SPACE_RE.sub(" ", value).strip()
+
+
+def normalize_time(value: Optional[str]) -> str:
+    """"19:00" / "19.00" / "7:00 PM"-ish → "HH:MM"; "" if there is no time."""
+    m = _TIME_RE.search(value or "")
+    if not m:
+        return ""
+    hour, minute = int(m.group(1)), m.group(2)
+    if "pm" in (value or "").casefold() and hour < 12:
+        hour += 12
+    return f"{hour:02d}:{minute}"
+
+
+def dedupe_key(row: Mapping[str, Any]) -> Optional[str]:
+    """news.dedupe_key — None for rows without a date (news, feed items): they are never merged."""
+    title = normalize_text(row.get("title_hy")) or normalize_text(row.get("title_en"))
+    date = (row.get("eventdate") or "").strip()
+    if not title or not date:
+        return None
+    parts = [title, date, normalize_time(row.get("eventtime")), normalize_text(row.get("venue_hy"))]
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def title_similarity(a: str, b: str) -> float:
+    """
+    Normalized titles → 0..1; one title containing the other (subtitle,
+    "premiere") counts as 0.9. Different numbers ("Part 1" / "Part 2",
+    "Symphony No. 5" / "No. 9") are different events → 0.
+    """
+    if not a or not b:
+        return 0.0
+    if a == b:
+        return 1.0
+    if set(_NUMBER_RE.findall(a)) != set(_NUMBER_RE.findall(b)):
+        return 0.0
+    short, long = sorted((a, b), key=len)
+    if len(short) >= MIN_CONTAINED and short in long:
+        return 0.9
+    return SequenceMatcher(None, a, b, autojunk=False).ratio()
+
+
+def _compatible(a: str, b: str) -> bool:
+    """Equal, or one side unknown / a shorter form of the other ("Opera" vs "Opera and Ballet Theatre")."""
+    return not a or not b or a in b or b in a
+
+
+def corroborated(a: Mapping[str, Any], b: Mapping[str, Any]) -> bool:
+    """Both rows have the time and it is the same, or both have the venue and it matches."""
+    time_a, time_b = normalize_time(a.get("eventtime")), normalize_time(b.get("eventtime"))
+    venue_a, venue_b = normalize_text(a.get("venue_hy")), normalize_text(b.get("venue_hy"))
+    return bool(time_a and time_a == time_b) or bool(venue_a and venue_b and _compatible(venue_a, venue_b))
+
+
+def same_event(a: Mapping[str, Any], b: Mapping[str, Any], threshold: float = TITLE_MATCH,
+               strict: bool = False) -> bool:
+    """
+    Rows (news / scraped row fields) describe the same event: same non-empty
+    eventdate, compatible time and venue, and some pair of their HY / EN titles
+    at least `threshold` similar — an EN-only listing matches a Tomsarkgh row
+    through its title_en. `strict` (merges) also wants corroborated(): a
+    missing time / venue alone is not enough.
+    """
+    date = (a.get("eventdate") or "").strip()
+    if not date or date != (b.get("eventdate") or "").strip():
+        return False
+    if not _compatible(normalize_time(a.get("eventtime")), normalize_time(b.get("eventtime"))):
+        return False
+    if not _compatible(normalize_text(a.get("venue_hy")), normalize_text(b.get("venue_hy"))):
+        return False
+    if strict and not corroborated(a, b):
+        return False
+    titles_a = {normalize_text(a.get("title_hy")), normalize_text(a.get("title_en"))} - {""}
+    titles_b = {normalize_text(b.get("title_hy")), normalize_text(b.get("title_en"))} - {""}
+    return any(title_similarity(x, y) >= threshold for x in titles_a for y in titles_b)
+
+
+def find_match(row: Mapping[str, Any], candidates: Iterable[Mapping[str, Any]],
+               threshold: float = TITLE_MATCH, strict: bool = False) -> Optional[Mapping[str, Any]]:
+    """
+    First candidate with the same dedupe_key (a stored news.dedupe_key is used
+    as is), else the first same_event() one. With `strict` a key match counts
+    only if the row has a time or venue (the key is then more than title + date).
+    """
+    candidates = list(candidates)
+    key = dedupe_key(row)
+    if key is not None and (not strict or normalize_time(row.get("eventtime")) or normalize_text(row.get("venue_hy"))):
+        for candidate in candidates:
+            if (candidate.get("dedupe_key") or dedupe_key(candidate)) == key:
+                return candidate
+    return next((c for c in candidates if same_event(row, c, threshold, strict)), None)
+
+
+def unique_events(items: Iterable[Any], fields: Callable[[Any], Mapping[str, Any]] = lambda x: x,
+                  threshold: float = TITLE_MATCH) -> List[Any]:
+    """Drops later items that are the same event as an earlier one (order kept)."""
+    kept: List[Any] = []
+    seen: List[Mapping[str, Any]] = []
+    for item in items:
+        row = fields(item)
+        if (row.get("eventdate") or "").strip() and find_match(row, seen, threshold) is not None:
+            continue
+        kept.append(item)
+        seen.append(row)
+    return kept
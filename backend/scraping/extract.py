@@ -0,0 +1,248 @@
+# backend/scraping/extract.py
+#
+# Single-pass field extraction for Tomsarkgh event pages, plus the link / text
+# helpers the source adapters share (backend/scraping/sources.py).
+#
+# The page is parsed once (selectolax/lexbor when installed, else BeautifulSoup
+# with lxml, else html.parser), all <meta> microdata / OpenGraph values are read
+# in one loop over the meta tags, and the full page text — only needed by the
+# regex fallbacks — is built lazily, at most once. Output matches the old
+# multi-pass BeautifulSoup helpers in backend/news_scraper.py.
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:   # selectolax < 0.3 or not installed
+    LexborHTMLParser = None
+
+try:
+    import lxml  # noqa: F401  — BeautifulSoup's "lxml" tree builder
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+BACKENDS = ("selectolax", "bs4-lxml", "bs4")
+DEFAULT_BACKEND = "selectolax" if LexborHTMLParser else ("bs4-lxml" if HAS_LXML else "bs4")
+
+# Regex fallbacks (same as the old helpers)
+DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+TIME_RE = re.compile(r"(\d{1,2}[:․]\d{2})")
+VENUE_RE = re.compile(r"(թատրոն|ակումբ|ջազ ակումբ|համերգասրահ|cinema|hall)[^\n]{0,80}", re.IGNORECASE)
+PRICE_RE = re.compile(r"(\d{3,}(?:[-–]\d{3,})?)\s*(?:դր\.?|դրամ|AMD)")
+LEADING_DIGITS_RE = re.compile(r"(\d+)")
+
+TITLE_CSS = "h1.event-name"
+DESC_CSS = ".description #eventDesc, .description span#eventDesc"
+DESC_EN_CSS = ".description #eventDesc, .description, article, .content"
+VENUE_CSS = ".occurrence_venue span[itemprop='name']"
+
+
+@dataclass
+class EventPage:
+    title: str
+    description: str
+    eventdate: str
+    eventtime: str
+    venue: str
+    price: str
+    image_url: Optional[str]
+
+
+class _LexborPage:
+    _SEP = "\x00"   # the HTML parser turns NUL into U+FFFD, so it never occurs in text
+
+    def __init__(self, html: str):
+        self.tree = LexborHTMLParser(html)
+        # BeautifulSoup's get_text() skips script/style strings too
+        self.tree.strip_tags(["script", "style"])
+        self._full_text: Optional[str] = None
+
+    def first(self, css: str):
+        return self.tree.css_first(css)
+
+    def select(self, css: str):
+        return self.tree.css(css)
+
+    @property
+    def root(self):
+        return self.tree.root
+
+    def attr(self, node, name: str) -> Optional[str]:
+        return node.attributes.get(name)
+
+    def text(self, node, sep: str = "") -> str:
+        # = BeautifulSoup get_text(sep, strip=True): strip every string, drop empty ones
+        parts = node.text(deep=True, separator=self._SEP, strip=False).split(self._SEP)
+        return sep.join(p for p in (s.strip() for s in parts) if p)
+
+    def metas(self):
+        for node in self.tree.css("meta"):
+            yield node.attributes
+
+    @property
+    def full_text(self) -> str:
+        if self._full_text is None:
+            root = self.root
+            self._full_text = self.text(root, "\n") if root is not None else ""
+        return self._full_text
+
+
+class _SoupPage:
+    def __init__(self, html: str, features: str):
+        self.soup = BeautifulSoup(html, features)
+        self._full_text: Optional[str] = None
+
+    def first(self, css: str):
+        return self.soup.select_one(css)
+
+    def select(self, css: str):
+        return self.soup.select(css)
+
+    @property
+    def root(self):
+        return self.soup
+
+    def attr(self, node, name: str) -> Optional[str]:
+        return node.get(name)
+
+    def text(self, node, sep: str = "") -> str:
+        return node.get_text(sep, strip=True)
+
+    def metas(self):
+        for node in self.soup.find_all("meta"):
+            yield node.attrs
+
+    @property
+    def full_text(self) -> str:
+        if self._full_text is None:
+            self._full_text = self.soup.get_text(separator="\n", strip=True)
+        return self._full_text
+
+
+def _page(html: str, backend: Optional[str]):
+    backend = backend or DEFAULT_BACKEND
+    if backend == "selectolax":
+        if LexborHTMLParser is None:
+            raise RuntimeError("selectolax (lexbor backend) is not installed")
+        return _LexborPage(html)
+    if backend == "bs4-lxml":
+        return _SoupPage(html, "lxml")
+    if backend == "bs4":
+        return _SoupPage(html, "html.parser")
+    raise ValueError(f"unknown HTML backend: {backend}")
+
+
+def _read_metas(page) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """One pass over <meta>: ({itemprop: content}, {og property: content}), first wins."""
+    itemprops: Dict[str, str] = {}
+    og: Dict[str, str] = {}
+    for attrs in page.metas():
+        content = attrs.get("content") or ""
+        name = attrs.get("itemprop")
+        if name and name not in itemprops:
+            itemprops[name] = content
+        prop = attrs.get("property")
+        if prop and prop.startswith("og:") and prop not in og:
+            og[prop] = content
+    return itemprops, og
+
+
+def _title(page) -> str:
+    el = page.first(TITLE_CSS) or page.first("h1")
+    return page.text(el) if el is not None else ""
+
+
+def extract_event(html: str, base_url: str, backend: Optional[str] = None) -> EventPage:
+    """HY event page → fields (untruncated, no defaults — parse_event() applies those)."""
+    page = _page(html, backend)
+    itemprops, og = _read_metas(page)
+
+    # date / time: microdata "2025-12-30 14:00", then the page text
+    eventdate = eventtime = ""
+    start = itemprops.get("startDate", "").strip()
+    if start:
+        parts = start.split()
+        eventdate = parts[0]
+        if len(parts) >= 2:
+            eventtime = parts[1]
+    if not eventdate:
+        m = DATE_RE.search(page.full_text)
+        if m:
+            eventdate = m.group(1)
+    if not eventtime:
+        m = TIME_RE.search(page.full_text)
+        if m:
+            eventtime = m.group(1).replace("․", ":")
+
+    el = page.first(VENUE_CSS)
+    if el is not None:
+        venue = page.text(el)
+    else:
+        m = VENUE_RE.search(page.full_text)
+        venue = m.group(0).strip() if m else ""
+
+    price = ""
+    m = LEADING_DIGITS_RE.match(itemprops.get("price", "").strip())
+    if m:
+        price = m.group(1)
+    else:
+        m = PRICE_RE.search(page.full_text)
+        if m:
+            price = m.group(1).replace("–", "-")
+
+    image_url = og.get("og:image", "").strip() or None
+    if image_url is None:
+        img = page.first(".event_photo img")
+        src = (page.attr(img, "src") or "").strip() if img is not None else ""
+        if src:
+            image_url = src if src.startswith("http") else base_url + src
+
+    desc = page.first(DESC_CSS) or page.first(".description")
+    return EventPage(
+        title=_title(page),
+        description=page.text(desc, "\n") if desc is not None else "",
+        eventdate=eventdate[:32],
+        eventtime=eventtime[:32],
+        venue=venue[:100],
+        price=price,
+        image_url=image_url,
+    )
+
+
+def extract_event_en(html: str, backend: Optional[str] = None) -> Tuple[str, str]:
+    """EN event page → (title, description); only these two differ from HY."""
+    page = _page(html, backend)
+    desc = page.first(DESC_EN_CSS)
+    return _title(page), page.text(desc, "\n") if desc is not None else ""
+
+
+def extract_links(html: str, base_url: str, marker: str, limit: Optional[int] = None,
+                  backend: Optional[str] = None) -> List[str]:
+    """<a href> containing `marker` → unique absolute URLs in page order, at most `limit`."""
+    page = _page(html, backend)
+    links: List[str] = []
+    seen = set()
+    for a in page.select(f"a[href*='{marker}']"):
+        href = (page.attr(a, "href") or "").strip()
+        if not href:
+            continue
+        url = href if href.startswith("http") else base_url + href
+        if url not in seen:
+            seen.add(url)
+            links.append(url)
+            if limit is not None and len(links) >= limit:
+                break
+    return links
+
+
+def html_to_text(fragment: str, backend: Optional[str] = None) -> str:
+    """HTML snippet (feed description, ...) → plain text, strings joined by spaces."""
+    if "<" not in fragment:
+        return fragment.strip()
+    page = _page(fragment, backend)
+    return page.text(page.root, " ") if page.root is not None else ""
@@ -0,0 +1,278 @@
+# backend/scraping/fetch.py
+#
+# Shared aiohttp fetcher for the scrapers: one keep-alive session, a global and
+# a per-host concurrency limit, a per-host crawl delay (min. gap between request
+# starts, SCRAPER_CRAWL_DELAY_MS or per host), jittered exponential backoff on
+# transient errors. With an HttpCache, requests are conditional and unchanged
+# pages are flagged; get(defer_cache=True) leaves writing the new entry to the
+# caller (FetchResult.pending). stream() hands out the body in chunks (feeds).
+
+import asyncio
+import random
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from backend.config.settings import settings
+from backend.scraping.http_cache import CacheEntry, HttpCache, PendingEntry, body_hash, cache_key
+from backend.utils.logger import logger
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/122.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class FetchError(Exception):
+    def __init__(self, url: str, message: str, status: Optional[int] = None):
+        super().__init__(f"{url}: {message}")
+        self.url = url
+        self.status = status
+
+
+@dataclass
+class FetchStats:
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    bytes: int = 0
+    statuses: Counter = field(default_factory=Counter)
+    not_modified: int = 0    # 304 answered from the cache
+    same_body: int = 0       # 200, but body hash equal to the cached one
+    bytes_saved: int = 0     # cached bytes not downloaded thanks to 304
+    crawl_wait: float = 0.0  # seconds spent waiting for a host's crawl delay
+
+
+@dataclass
+class FetchResult:
+    text: str
+    status: int
+    unchanged: bool = False  # same content as the cached copy from the last run
+    pending: List[PendingEntry] = field(default_factory=list)   # defer_cache: entry to commit after saving
+
+
+class Fetcher:
+    """
+    async with Fetcher() as f:
+        html = await f.get_text(url, params={...})
+    """
+
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        per_host: Optional[int] = None,
+        retries: Optional[int] = None,
+        timeout: float = 15.0,
+        backoff: float = 0.5,
+        headers: Optional[Dict[str, str]] = None,
+        cache: Optional[HttpCache] = None,
+        crawl_delay: Optional[float] = None,
+        host_delays: Optional[Dict[str, float]] = None,
+    ):
+        self.concurrency = concurrency or settings.SCRAPER_CONCURRENCY
+        self.per_host = per_host or settings.SCRAPER_PER_HOST
+        self.retries = settings.SCRAPER_RETRIES if retries is None else retries
+        self.timeout = timeout
+        self.backoff = backoff
+        self.headers = headers or DEFAULT_HEADERS
+        self.cache = cache
+        self.crawl_delay = settings.SCRAPER_CRAWL_DELAY_MS / 1000 if crawl_delay is None else crawl_delay
+        self.host_delays: Dict[str, float] = dict(host_delays or {})   # netloc → seconds
+        self.stats = FetchStats()
+        self._global = asyncio.Semaphore(self.concurrency)
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+        self._next_start: Dict[str, float] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "Fetcher":
+        connector = aiohttp.TCPConnector(
+            limit=self.concurrency,
+            limit_per_host=self.per_host,
+            ttl_dns_cache=300,
+        )
+        self._session = aiohttp.ClientSession(connector=connector, headers=self.headers)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        sem = self._hosts.get(host)
+        if sem is None:
+            sem = self._hosts[host] = asyncio.Semaphore(self.per_host)
+        return sem
+
+    async def _crawl_wait(self, host: str) -> None:
+        """Reserves the host's next start time; requests to one host start >= delay apart."""
+        delay = self.host_delays.get(host, self.crawl_delay)
+        if delay <= 0:
+            return
+        now = time.monotonic()
+        start = max(now, self._next_start.get(host, 0.0))
+        self._next_start[host] = start + delay
+        if start > now:
+            self.stats.crawl_wait += start - now
+            await asyncio.sleep(start - now)
+
+    @asynccontextmanager
+    async def _slot(self, url: str):
+        # host slot → crawl delay → global slot: waiting on one host never holds a global slot
+        async with self._host_limit(url):
+            await self._crawl_wait(urlsplit(url).netloc)
+            async with self._global:
+                self.stats.requests += 1
+                yield
+
+    def _delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), 30.0)
+        # full jitter around the exponential step
+        return self.backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+    async def _backoff(self, attempt: int, error: FetchError, retry_after: Optional[str]) -> None:
+        """Sleeps before retry `attempt + 1`, or raises `error` after the last one."""
+        if attempt >= self.retries:
+            self.stats.failures += 1
+            raise error
+        delay = self._delay(attempt, retry_after)
+        self.stats.retries += 1
+        logger.debug(f"↻ retry {attempt + 1}/{self.retries} in {delay:.2f}s — {error}")
+        await asyncio.sleep(delay)
+
+    async def get_text(self, url: str, params: Optional[dict] = None,
+                       timeout: Optional[float] = None) -> str:
+        """GET → decoded body. Raises FetchError after the last retry."""
+        return (await self.get(url, params, timeout)).text
+
+    async def get(self, url: str, params: Optional[dict] = None,
+                  timeout: Optional[float] = None, defer_cache: bool = False) -> FetchResult:
+        """
+        Like get_text(), plus whether the page changed since the cached copy.
+        With `defer_cache` a new / changed response is not written to the
+        cache: it comes back in FetchResult.pending for self.cache.commit()
+        once its content is saved.
+        """
+        if self.cache is None:
+            return await self._request(url, params, timeout, None, None, defer_cache)
+
+        key = cache_key(url, params)
+        entry = await asyncio.to_thread(self.cache.get, key)
+        return await self._request(url, params, timeout, key, entry, defer_cache)
+
+    async def _request(self, url: str, params: Optional[dict], timeout: Optional[float],
+                       key: Optional[str], entry: Optional[CacheEntry],
+                       defer_cache: bool = False) -> FetchResult:
+        if self._session is None:
+            raise RuntimeError("Fetcher used outside `async with`")
+
+        client_timeout = aiohttp.ClientTimeout(total=timeout or self.timeout)
+        headers = entry.validators() if entry else None
+        attempt = 0
+        while True:
+            retry_after = None
+            async with self._slot(url):
+                try:
+                    async with self._session.get(url, params=params, timeout=client_timeout,
+                                                 headers=headers) as resp:
+                        self.stats.statuses[resp.status] += 1
+                        if resp.status == 304 and entry is not None:
+                            cached = await asyncio.to_thread(self.cache.body, key)
+                            if cached is not None:
+                                self.stats.not_modified += 1
+                                self.stats.bytes_saved += entry.size
+                                await asyncio.to_thread(self.cache.touch, key, entry)
+                                return FetchResult(cached, 304, unchanged=True)
+                            # body file lost — ask again without validators
+                            headers, entry = None, None
+                            continue
+                        elif resp.status < 400:
+                            body = await resp.read()
+                            self.stats.bytes += len(body)
+                            text = body.decode(resp.charset or "utf-8", errors="replace")
+                            if key is None:
+                                return FetchResult(text, resp.status)
+                            return await self._store(key, entry, url, resp, text, len(body), defer_cache)
+                        elif resp.status not in RETRY_STATUSES:
+                            self.stats.failures += 1
+                            raise FetchError(url, f"HTTP {resp.status}", resp.status)
+                        else:
+                            error = FetchError(url, f"HTTP {resp.status}", resp.status)
+                            retry_after = resp.headers.get("Retry-After")
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    error = FetchError(url, f"{type(e).__name__}: {e}")
+
+            # sleep outside the semaphores so waiting doesn't hold a slot
+            await self._backoff(attempt, error, retry_after)
+            attempt += 1
+
+    async def stream(self, url: str, params: Optional[dict] = None,
+                     timeout: Optional[float] = None, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+        """
+        GET → body chunks as they arrive (no cache). Retried like get() until the
+        first chunk is handed out; a later error raises FetchError.
+        """
+        if self._session is None:
+            raise RuntimeError("Fetcher used outside `async with`")
+
+        client_timeout = aiohttp.ClientTimeout(total=timeout or self.timeout)
+        attempt = 0
+        while True:
+            retry_after = None
+            started = False
+            async with self._slot(url):
+                try:
+                    async with self._session.get(url, params=params, timeout=client_timeout) as resp:
+                        self.stats.statuses[resp.status] += 1
+                        if resp.status < 400:
+                            async for chunk in resp.content.iter_chunked(chunk_size):
+                                self.stats.bytes += len(chunk)
+                                started = True
+                                yield chunk
+                            return
+                        error = FetchError(url, f"HTTP {resp.status}", resp.status)
+                        if resp.status not in RETRY_STATUSES:
+                            self.stats.failures += 1
+                            raise error
+                        retry_after = resp.headers.get("Retry-After")
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    error = FetchError(url, f"{type(e).__name__}: {e}")
+                    if started:
+                        self.stats.failures += 1
+                        raise error from e
+
+            await self._backoff(attempt, error, retry_after)
+            attempt += 1
+
+    async def _store(self, key: str, old: Optional[CacheEntry], url: str,
+                     resp: aiohttp.ClientResponse, text: str, size: int,
+                     defer: bool = False) -> FetchResult:
+        digest = body_hash(text)
+        unchanged = old is not None and old.body_hash == digest
+        if unchanged:
+            self.stats.same_body += 1
+        entry = CacheEntry(
+            url=url,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+            body_hash=digest,
+            size=size,
+            fetched_at=time.time(),
+        )
+        if defer:
+            return FetchResult(text, resp.status, unchanged=unchanged, pending=[PendingEntry(key, entry, text)])
+        await asyncio.to_thread(self.cache.put, key, entry, text)
+        return FetchResult(text, resp.status, unchanged=unchanged)
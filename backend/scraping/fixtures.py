@@ -0,0 +1,196 @@
+# backend/scraping/fixtures.py
+#
+# Record / replay of scraped pages, so the scrapers can be tested and profiled
+# offline.
+#
+#   python -m backend.scraping.fixtures record data/fixtures/tomsarkgh
+#   python -m backend.scraping.fixtures synth  data/fixtures/synthetic --per-type 20
+#   python -m backend.scraping.fixtures serve  data/fixtures/tomsarkgh --latency-ms 50
+#
+# record: a recording proxy (StandinServer + RecordingSite) is put in front of
+#   the upstream site, and the Tomsarkgh scraper plus the /menu live prefetch
+#   run through it in a child process (TOMSARKGH_BASE_URL → proxy). Every
+#   list, category and event page ends up in the fixtures directory.
+# synth: the same recording, with the SyntheticTomsarkgh stand-in upstream.
+# serve: FixtureStore replays the directory (backend/benchmarks/scrape_replay.py).
+#
+#   <dir>/index.json          {"<path>?<query>": {"status": 200, "file": "pages/<sha1>.html"}}
+#   <dir>/pages/<sha1>.html
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+import aiohttp
+
+from backend.scraping.fetch import DEFAULT_HEADERS
+from backend.scraping.standin import StandinServer, SyntheticTomsarkgh
+
+Page = Tuple[int, str]
+
+# list queries carry today's date range — ignored, so fixtures replay on any day
+VOLATILE_PARAMS = {"startFrom", "startTo"}
+
+# absolute event links would bypass the proxy / stand-in
+_ABSOLUTE_EVENT_HREF = re.compile(r'href="https?://(?:www\.)?tomsarkgh\.am(/(?:hy|en)/event/)')
+
+
+def fixture_key(path: str, query: dict) -> str:
+    stable = sorted((k, v) for k, v in query.items() if k not in VOLATILE_PARAMS)
+    return path + ("?" + urlencode(stable) if stable else "")
+
+
+class FixtureStore:
+    """A fixtures directory; `.get(path, query)` makes it a StandinServer site."""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        index_path = self.directory / "index.json"
+        self.index: Dict[str, dict] = (
+            json.loads(index_path.read_text(encoding="utf-8")) if index_path.exists() else {}
+        )
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def save(self, path: str, query: dict, status: int, body: str) -> None:
+        name = hashlib.sha1(fixture_key(path, query).encode("utf-8")).hexdigest()
+        rel = f"pages/{name}.html"
+        (self.directory / "pages").mkdir(parents=True, exist_ok=True)
+        (self.directory / rel).write_text(body, encoding="utf-8")
+        self.index[fixture_key(path, query)] = {"status": status, "file": rel}
+
+    def flush(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self.directory / "index.json.tmp"
+        tmp.write_text(json.dumps(self.index, ensure_ascii=False, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.directory / "index.json")
+
+    def get(self, path: str, query: dict) -> Page:
+        entry = self.index.get(fixture_key(path, query))
+        if entry is None:
+            return 404, "<html><body>Not recorded</body></html>"
+        return entry["status"], (self.directory / entry["file"]).read_text(encoding="utf-8")
+
+    def pages(self, marker: str):
+        """(key, html) of recorded 200 pages whose key contains `marker`, e.g. "/hy/event/"."""
+        for key, entry in sorted(self.index.items()):
+            if marker in key and entry["status"] == 200:
+                yield key, (self.directory / entry["file"]).read_text(encoding="utf-8")
+
+
+class RecordingSite:
+    """Proxies to `upstream` and saves every answer into `store`."""
+
+    def __init__(self, upstream: str, store: FixtureStore, timeout: float = 20.0):
+        self.upstream = upstream.rstrip("/")
+        self.store = store
+        self.timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def get(self, path: str, query: dict) -> Page:
+        if self._session is None:
+            self._session = aiohttp.ClientSession(headers=DEFAULT_HEADERS)
+        try:
+            async with self._session.get(self.upstream + path, params=query,
+                                         timeout=aiohttp.ClientTimeout(total=self.timeout)) as resp:
+                body = await resp.text(errors="replace")
+                status = resp.status
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return 502, f"upstream error: {e}"
+        body = _ABSOLUTE_EVENT_HREF.sub(r'href="\1', body)
+        if status < 500:
+            self.store.save(path, query, status, body)
+        return status, body
+
+    async def aclose(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+
+
+def _run_scrapers() -> None:
+    """Child process: the full Tomsarkgh scrape + one live prefetch pass."""
+    import contextlib
+    import io
+
+    from backend import database
+    from backend.armenia.live_prefetch import live_prefetcher
+    from backend.news_scraper import scrape_tomsarkgh_events
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        database.init_db()
+        saved = scrape_tomsarkgh_events()
+        live = asyncio.run(live_prefetcher.refresh())
+    print(json.dumps({"saved": saved, "live": live}))
+
+
+def scraper_env(base_url: str, db_path: str, **extra) -> dict:
+    """Environment for a scraper child pointed at a stand-in: own SQLite DB, no HTTP cache, no crawl delay."""
+    return dict(os.environ, TOMSARKGH_BASE_URL=base_url, SQLITE_PATH=db_path, DATABASE_URL="",
+                SCRAPER_CACHE_DIR="", SCRAPER_CRAWL_DELAY_MS="0", SCRAPER_FEEDS="", **extra)
+
+
+def record(directory: str, upstream: str) -> FixtureStore:
+    store = FixtureStore(directory)
+    site = RecordingSite(upstream, store)
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp, StandinServer(site) as base_url:
+        out = subprocess.run(
+            [sys.executable, "-m", "backend.scraping.fixtures", "_run-scrapers"],
+            env=scraper_env(base_url, os.path.join(tmp, "record.db")),
+            capture_output=True, text=True, check=True,
+        ).stdout
+    store.flush()
+    result = json.loads(out.strip().splitlines()[-1])
+    print(f"📼 Recorded {len(store)} pages from {upstream} into {directory} "
+          f"in {time.perf_counter() - started:.1f}s (saved {result['saved']}, live {result['live']})")
+    return store
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Scraper fixtures: record / synth / serve")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    rec = sub.add_parser("record", help="record the live site through a proxy")
+    rec.add_argument("directory")
+    rec.add_argument("--upstream", default="https://www.tomsarkgh.am")
+    syn = sub.add_parser("synth", help="record the synthetic stand-in site")
+    syn.add_argument("directory")
+    syn.add_argument("--per-type", type=int, default=20)
+    srv = sub.add_parser("serve", help="replay a fixtures directory on 127.0.0.1")
+    srv.add_argument("directory")
+    srv.add_argument("--port", type=int, default=None)
+    srv.add_argument("--latency-ms", type=float, default=0.0)
+    sub.add_parser("_run-scrapers")
+    args = ap.parse_args()
+
+    if args.cmd == "_run-scrapers":
+        _run_scrapers()
+    elif args.cmd == "record":
+        record(args.directory, args.upstream)
+    elif args.cmd == "synth":
+        with StandinServer(SyntheticTomsarkgh(per_type=args.per_type)) as upstream:
+            record(args.directory, upstream)
+    else:
+        store = FixtureStore(args.directory)
+        server = StandinServer(store, latency=args.latency_ms / 1000, port=args.port)
+        with server as base_url:
+            print(f"▶️ Serving {len(store)} recorded pages on {base_url} — TOMSARKGH_BASE_URL={base_url}")
+            try:
+                while True:
+                    time.sleep(3600)
+            except KeyboardInterrupt:
+                pass
+
+
+if __name__ == "__main__":
+    main()
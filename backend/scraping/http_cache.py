@@ -0,0 +1,123 @@
+# backend/scraping/http_cache.py
+#
+# Persistent HTTP response cache for the scrapers, keyed by URL (+ query).
+# Each entry keeps the body plus ETag / Last-Modified / body hash, so the next
+# run can revalidate with If-None-Match / If-Modified-Since and learn that a
+# page is unchanged without downloading or parsing it again.
+#
+#   <dir>/<key[:2]>/<key>.json   metadata
+#   <dir>/<key[:2]>/<key>.html   body (utf-8)
+#
+# A page whose content still has to be saved is fetched with defer_cache: its
+# new entry comes back as a PendingEntry and is written only after the row is
+# in the DB — otherwise a failed save would leave a validator that makes the
+# next run see the page as "not modified" and lose the update.
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlencode
+
+from backend.utils.logger import logger
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body_hash: str
+    size: int
+    fetched_at: float
+
+    def validators(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def body_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def cache_key(url: str, params: Optional[dict] = None) -> str:
+    full = url + ("?" + urlencode(sorted(params.items())) if params else "")
+    return hashlib.sha256(full.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class PendingEntry:
+    """A response not yet written to the cache (HttpCache.commit() after the save)."""
+    key: str
+    entry: CacheEntry
+    text: str
+
+
+class HttpCache:
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+
+    def _paths(self, key: str):
+        base = self.directory / key[:2] / key
+        return base.with_suffix(".json"), base.with_suffix(".html")
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        meta_path, body_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not body_path.exists():
+            return None
+        return CacheEntry(**meta)
+
+    def body(self, key: str) -> Optional[str]:
+        try:
+            return self._paths(key)[1].read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def put(self, key: str, entry: CacheEntry, text: str) -> None:
+        meta_path, body_path = self._paths(key)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        # body first, metadata last — a half-written entry has no .json and is ignored
+        tmp = body_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, body_path)
+        tmp = meta_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(asdict(entry)), encoding="utf-8")
+        os.replace(tmp, meta_path)
+
+    def touch(self, key: str, entry: CacheEntry) -> None:
+        """After a 304: same body, new fetched_at (keeps it from being pruned)."""
+        meta_path, _ = self._paths(key)
+        entry.fetched_at = time.time()
+        meta_path.write_text(json.dumps(asdict(entry)), encoding="utf-8")
+
+    def commit(self, pending: Iterable["PendingEntry"]) -> None:
+        for p in pending:
+            self.put(p.key, p.entry, p.text)
+
+    def prune(self, max_age_days: float = 30) -> int:
+        """Drops entries not fetched for `max_age_days`."""
+        cutoff = time.time() - max_age_days * 86400
+        removed = 0
+        for meta_path in self.directory.glob("*/*.json"):
+            try:
+                fetched_at = json.loads(meta_path.read_text(encoding="utf-8"))["fetched_at"]
+            except (OSError, ValueError, KeyError):
+                fetched_at = 0
+            if fetched_at < cutoff:
+                meta_path.unlink(missing_ok=True)
+                meta_path.with_suffix(".html").unlink(missing_ok=True)
+                removed += 1
+        if removed:
+            logger.info(f"🧹 HTTP cache: pruned {removed} entries older than {max_age_days:g} days")
+        return removed
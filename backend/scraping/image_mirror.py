@@ -0,0 +1,185 @@
+# backend/scraping/image_mirror.py
+#
+# Local copies of remote event images. Scraped rows store the source's og:image
+# URL: the site hotlinks it, and every bot.send_photo(photo=url) makes Telegram
+# fetch the full-size original again — a slow host stalls the whole broadcast.
+#
+# mirror_pending() — one pass (scheduler job every IMAGE_MIRROR_INTERVAL_MIN):
+#
+#   remote news.image_url values (get_images_to_mirror)
+#     → downloaded once through the scrapers' Fetcher (per-host limit, crawl delay, retries)
+#     → type sniffed by magic bytes, size capped at IMAGE_MIRROR_MAX_MB
+#     → JPEG variants (backend/utils/images.py): 480 / 960 for the site, 1280 for Telegram,
+#       named by content hash under IMAGE_MIRROR_DIR (the same picture behind two URLs is stored once)
+#     → save_image_mirror(): image_url = largest variant, image_srcset = all,
+#       image_origin = the remote URL (re-scrapes compare against it and keep the copy)
+#
+# A failed image keeps its remote URL and is tried again on a later pass after
+# IMAGE_MIRROR_RETRY_MIN, 2×, 4×, ... minutes, at most IMAGE_MIRROR_MAX_ATTEMPTS times.
+# prune_files() (daily, after delete_old_news) removes copies no event uses;
+# telegram_photo() is what the jobs / bot hand to send_photo.
+
+import asyncio
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from aiogram.types import FSInputFile
+
+from backend.config.settings import settings
+from backend.database import get_images_to_mirror, image_mirror_failed, prune_image_mirror, save_image_mirror
+from backend.scraping.fetch import DEFAULT_HEADERS, Fetcher
+from backend.utils.images import make_variants
+from backend.utils.logger import logger
+from backend.utils.uploads import sniff_image_type
+
+MIRROR_WIDTHS = (480, 960, 1280)   # list card, detail page, Telegram photo (its largest side)
+IMAGE_HEADERS = {**DEFAULT_HEADERS, "Accept": "image/webp,image/png,image/jpeg,image/*;q=0.8,*/*;q=0.5"}
+
+
+class MirrorError(Exception):
+    """The remote image can't be mirrored (too large, not an image)."""
+
+
+def url_prefix(directory: str) -> str:
+    """IMAGE_MIRROR_DIR "static/img/events" → public "/static/img/events"."""
+    return "/" + directory.strip("/")
+
+
+def retry_delay(attempts: int) -> float:
+    """Seconds before the next try after `attempts` failures."""
+    return settings.IMAGE_MIRROR_RETRY_MIN * 60 * 2 ** max(0, attempts - 1)
+
+
+async def download(fetcher: Fetcher, url: str, max_bytes: int) -> bytes:
+    chunks = []
+    size = 0
+    stream = fetcher.stream(url)
+    try:
+        async for chunk in stream:
+            size += len(chunk)
+            if size > max_bytes:
+                raise MirrorError(f"larger than {max_bytes // (1024 * 1024)} MB")
+            chunks.append(chunk)
+    finally:
+        await stream.aclose()
+    return b"".join(chunks)
+
+
+def store(body: bytes, directory: Path, prefix: str) -> Tuple[str, Optional[str], str]:
+    """
+    Image bytes → resized copies in `directory` → (image_url, image_srcset,
+    content hash). Animated GIFs are kept as they are (no srcset). Blocking —
+    run it in a thread.
+    """
+    kind = sniff_image_type(body[:16])
+    if kind is None:
+        raise MirrorError("not a JPEG/PNG/WebP/GIF image")
+    digest = hashlib.sha256(body).hexdigest()
+    directory.mkdir(parents=True, exist_ok=True)
+    original = directory / f"{digest[:16]}.{kind[0]}"
+    tmp = original.with_name(f".{original.name}.{os.getpid()}.part")
+    tmp.write_bytes(body)
+    os.replace(tmp, original)
+
+    variants = make_variants(original, MIRROR_WIDTHS)
+    if not variants:
+        return f"{prefix}/{original.name}", None, digest
+    original.unlink(missing_ok=True)
+    urls = {w: f"{prefix}/{p.name}" for w, p in variants.items()}
+    srcset = ", ".join(f"{urls[w]} {w}w" for w in sorted(urls))
+    return urls[max(urls)], srcset, digest
+
+
+async def mirror_one(fetcher: Fetcher, item: dict, directory: Path, prefix: str) -> int:
+    """One get_images_to_mirror() entry → news rows switched to the local copy."""
+    source_url = item["source_url"]
+    if item["image_url"]:
+        # mirrored before — rows scraped since then still point at the remote URL
+        return await asyncio.to_thread(save_image_mirror, source_url, item["image_url"], item["image_srcset"])
+    body = await download(fetcher, source_url, settings.IMAGE_MIRROR_MAX_MB * 1024 * 1024)
+    image_url, srcset, digest = await asyncio.to_thread(store, body, directory, prefix)
+    return await asyncio.to_thread(save_image_mirror, source_url, image_url, srcset, digest)
+
+
+async def mirror_pending(limit: Optional[int] = None, fetcher: Optional[Fetcher] = None,
+                         directory: Optional[str] = None) -> Dict[str, int]:
+    """One pass over the images due → {"images", "mirrored", "failed", "rows"}."""
+    directory = directory or settings.IMAGE_MIRROR_DIR
+    items = await asyncio.to_thread(
+        get_images_to_mirror, limit or settings.IMAGE_MIRROR_BATCH, settings.IMAGE_MIRROR_MAX_ATTEMPTS
+    )
+    counts = {"images": len(items), "mirrored": 0, "failed": 0, "rows": 0}
+    if not items:
+        return counts
+
+    own_fetcher = fetcher is None
+    if own_fetcher:
+        fetcher = Fetcher(headers=IMAGE_HEADERS, timeout=30.0)
+        await fetcher.__aenter__()
+    try:
+        results = await asyncio.gather(
+            *(mirror_one(fetcher, item, Path(directory), url_prefix(directory)) for item in items),
+            return_exceptions=True,
+        )
+    finally:
+        if own_fetcher:
+            await fetcher.__aexit__(None, None, None)
+
+    for item, result in zip(items, results):
+        if isinstance(result, BaseException):
+            attempts = (item["attempts"] or 0) + 1
+            counts["failed"] += 1
+            logger.warning(f"⚠️ Image mirror failed ({attempts}/{settings.IMAGE_MIRROR_MAX_ATTEMPTS}): "
+                           f"{item['source_url']} — {result}")
+            await asyncio.to_thread(
+                image_mirror_failed, item["source_url"], f"{type(result).__name__}: {result}",
+                time.time() + retry_delay(attempts),
+            )
+            continue
+        counts["mirrored"] += 1
+        counts["rows"] += result
+
+    logger.info(f"🖼 Image mirror: {counts['mirrored']}/{counts['images']} images, "
+                f"{counts['rows']} news rows switched, {counts['failed']} failed")
+    return counts
+
+
+def prune_files(directory: Optional[str] = None, min_age: float = 3600) -> int:
+    """
+    Deletes mirrored files no image_mirror entry uses (their events were
+    deleted). Files younger than `min_age` seconds are left alone — a running
+    pass may not have recorded them yet. Returns the number deleted.
+    """
+    directory = directory or settings.IMAGE_MIRROR_DIR
+    used = prune_image_mirror()
+    prefix = url_prefix(directory)
+    cutoff = time.time() - min_age
+    removed = 0
+    for path in Path(directory).glob("*"):
+        if path.is_file() and f"{prefix}/{path.name}" not in used and path.stat().st_mtime < cutoff:
+            path.unlink(missing_ok=True)
+            removed += 1
+    if removed:
+        logger.info(f"🧹 Image mirror: {removed} unused files deleted")
+    return removed
+
+
+def mirror_images() -> Dict[str, int]:
+    """Scheduler job (sync, runs in a worker thread → own event loop)."""
+    return asyncio.run(mirror_pending())
+
+
+def telegram_photo(image_url: str, site_url: str) -> Union[str, FSInputFile]:
+    """
+    send_photo(photo=...) value: an image under static/ is uploaded from disk
+    (Telegram never fetches the remote original), anything else goes as a URL.
+    """
+    if image_url.startswith("/static/"):
+        path = Path(image_url.lstrip("/"))
+        if path.is_file():
+            return FSInputFile(path)
+        return site_url.rstrip("/") + image_url
+    return image_url
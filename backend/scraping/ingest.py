@@ -0,0 +1,248 @@
+# backend/scraping/ingest.py
+#
+# Runs Source plugins (backend/scraping/sources.py) concurrently through one
+# shared pipeline:
+#
+#   source.items() ─┐
+#   source.items() ─┼─▶ bounded queue ─▶ normalize ─▶ dedupe ─▶ batch ─▶ bulk write
+#   source.items() ─┘
+#
+# All sources share one Fetcher, so the per-host concurrency limit and crawl
+# delay hold across sources (a source may set its own delay for its hosts);
+# each source still gets its own FetchStats. They also share one ParsePool
+# (SCRAPER_PARSE_WORKERS processes, backend/scraping/parse_pool.py). The queue
+# holds SCRAPER_QUEUE_SIZE items, so sources slow down instead of piling rows
+# up when the writer falls behind. Rows are written SCRAPER_BATCH_SIZE at a
+# time, one transaction per batch (bulk_upsert_scraped_news); the HTTP cache
+# entries of a batch's pages are written after it commits. Every source gets
+# a RunStats (→ scrape_runs).
+
+import asyncio
+import copy
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from backend.config.settings import settings
+from backend.database import bulk_upsert_scraped_news
+from backend.scraping.fetch import Fetcher, FetchStats
+from backend.scraping.http_cache import HttpCache
+from backend.scraping.parse_pool import ParsePool
+from backend.scraping.runstats import RunStats
+from backend.scraping.sources import Item, Source
+from backend.utils.logger import logger
+
+# upsert_scraped_news() fields and their max length
+ROW_LIMITS = {
+    "title_hy": 200, "title_en": 200, "content_hy": 4000, "content_en": 4000,
+    "eventdate": 32, "eventtime": 32, "venue_hy": 100, "price_hy": 100,
+}
+ROW_FIELDS = (*ROW_LIMITS, "image_url", "category", "source_url")
+
+
+def default_cache() -> Optional[HttpCache]:
+    return HttpCache(settings.SCRAPER_CACHE_DIR) if settings.SCRAPER_CACHE_DIR else None
+
+
+def normalize_row(row: dict) -> Optional[dict]:
+    """
+    Shared cleanup for every source's rows: known fields only, strings
+    stripped and clipped, missing HY/EN title or content taken from the other
+    language. None if there is no title or source_url.
+    """
+    out = {}
+    for field in ROW_FIELDS:
+        value = row.get(field)
+        if isinstance(value, str):
+            value = value.strip()
+            if field in ROW_LIMITS:
+                value = value[: ROW_LIMITS[field]]
+        out[field] = value
+    out["title_hy"] = out["title_hy"] or out["title_en"]
+    out["title_en"] = out["title_en"] or out["title_hy"]
+    out["content_hy"] = out["content_hy"] or out["content_en"] or ""
+    out["content_en"] = out["content_en"] or out["content_hy"]
+    out["image_url"] = out["image_url"] or None
+    out["category"] = out["category"] or "general"
+    if not out["title_hy"] or not out["source_url"]:
+        return None
+    return out
+
+
+class Dedupe:
+    """First Item per source_url wins within a run (feeds and list pages overlap)."""
+
+    def __init__(self):
+        self.seen: Dict[str, str] = {}   # source_url → source name
+
+    def admit(self, source: str, item: Item) -> bool:
+        if item.url in self.seen:
+            return False
+        self.seen[item.url] = source
+        return True
+
+
+class BulkWriter:
+    """
+    Collects normalized rows / unchanged URLs and writes them batch_size at a
+    time. Items' pending HTTP cache entries go to `cache` only after their
+    batch is saved: a failed batch is fetched and parsed again next run.
+    """
+
+    def __init__(self, runs: Dict[str, RunStats], scraped_at: float, batch_size: int,
+                 cache: Optional[HttpCache] = None):
+        self.runs = runs
+        self.scraped_at = scraped_at
+        self.batch_size = max(1, batch_size)
+        self.cache = cache
+        self.pending: List[Tuple[str, Item]] = []
+
+    async def add(self, source: str, item: Item) -> None:
+        self.pending.append((source, item))
+        if len(self.pending) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        batch, self.pending = self.pending, []
+        if not batch:
+            return
+        written = [(source, item) for source, item in batch if item.row is not None]
+        unchanged = [(source, item) for source, item in batch if item.row is None]
+        started = time.perf_counter()
+        try:
+            results = await asyncio.to_thread(
+                bulk_upsert_scraped_news,
+                [item.row for _, item in written],
+                self.scraped_at,
+                [item.url for _, item in unchanged],
+            )
+        except Exception as e:
+            logger.error(f"❌ Bulk write of {len(batch)} rows failed: {e}")
+            for source, item in batch:
+                self.runs[source].type_counts(item.key)["failed"] += 1
+            return
+        elapsed = time.perf_counter() - started
+        pending = [entry for _, item in batch for entry in item.cache]
+        if self.cache is not None and pending:
+            try:
+                await asyncio.to_thread(self.cache.commit, pending)
+            except OSError as e:
+                logger.warning(f"⚠️ HTTP cache write failed: {e}")
+
+        # write time split between the sources by their share of the batch
+        for source, n in Counter(source for source, _ in batch).items():
+            self.runs[source].stages["save"] += elapsed * n / len(batch)
+        for (source, item), (news_id, status) in zip(written, results):
+            self.runs[source].type_counts(item.key)[status] += 1
+            if status == "updated":
+                logger.info(f"✏️ UPDATED #{news_id} {item.row['title_hy'][:40]}")
+            elif status == "new":
+                logger.debug(f"SAVED #{news_id} [{item.row['category']}] {item.row['title_hy'][:40]}")
+            elif status == "merged":
+                logger.debug(f"MERGED {item.url} → #{news_id}")
+        for source, item in unchanged:
+            self.runs[source].type_counts(item.key)["unchanged"] += 1
+
+
+def _merge_stats(into: FetchStats, stats: FetchStats) -> None:
+    for name in ("requests", "retries", "failures", "bytes", "not_modified",
+                 "same_body", "bytes_saved", "crawl_wait"):
+        setattr(into, name, getattr(into, name) + getattr(stats, name))
+    into.statuses.update(stats.statuses)
+
+
+def _scoped(fetcher: Fetcher) -> Fetcher:
+    """Same session, limits and crawl-delay clock; separate stats (one per source)."""
+    scoped = copy.copy(fetcher)
+    scoped.stats = FetchStats()
+    return scoped
+
+
+async def run_sources(
+    sources: Iterable[Source],
+    fetcher: Optional[Fetcher] = None,
+    runs: Optional[Dict[str, RunStats]] = None,
+    batch_size: Optional[int] = None,
+    parse_workers: Optional[int] = None,
+) -> Dict[str, RunStats]:
+    """
+    Runs every source concurrently into the shared pipeline → {source name: RunStats}.
+    A failing source is logged and recorded in its RunStats.error; the others go on.
+    """
+    sources = list(sources)
+    runs = runs if runs is not None else {}
+    for source in sources:
+        runs.setdefault(source.name, RunStats(source.name))
+    batch_size = batch_size or settings.SCRAPER_BATCH_SIZE
+
+    host_delays = {
+        host: source.crawl_delay
+        for source in sources if source.crawl_delay is not None
+        for host in source.hosts()
+    }
+    own_fetcher = fetcher is None
+    if own_fetcher:
+        fetcher = Fetcher(cache=default_cache(), host_delays=host_delays)
+        await fetcher.__aenter__()
+    else:
+        for host, delay in host_delays.items():
+            fetcher.host_delays.setdefault(host, delay)
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=settings.SCRAPER_QUEUE_SIZE)
+    parser = ParsePool(parse_workers)
+    writer = BulkWriter(runs, time.time(), batch_size, fetcher.cache)
+    dedupe = Dedupe()
+    scoped = {source.name: _scoped(fetcher) for source in sources}
+
+    async def produce(source: Source) -> None:
+        run = runs[source.name]
+        try:
+            async for item in source.items(scoped[source.name], run, parser):
+                await queue.put((source.name, item))
+        except Exception as e:
+            logger.error(f"❌ Source {source.name} failed: {e}")
+            run.error = f"{type(e).__name__}: {e}"
+
+    async def consume() -> None:
+        while True:
+            got = await queue.get()
+            if got is None:
+                break
+            name, item = got
+            counts = runs[name].type_counts(item.key)
+            if item.row is not None:
+                item.row = normalize_row(item.row)
+                if item.row is None:
+                    counts["failed"] += 1
+                    continue
+            if not dedupe.admit(name, item):
+                counts["skipped"] += 1
+                continue
+            await writer.add(name, item)
+        await writer.flush()
+
+    consumer = asyncio.ensure_future(consume())
+    try:
+        await asyncio.gather(*(produce(source) for source in sources))
+        await queue.put(None)
+        await consumer
+    finally:
+        consumer.cancel()
+        await asyncio.to_thread(parser.close)
+        if own_fetcher:
+            await fetcher.__aexit__(None, None, None)
+            if fetcher.cache is not None:
+                await asyncio.to_thread(fetcher.cache.prune, settings.SCRAPER_CACHE_MAX_AGE_DAYS)
+
+    for source in sources:
+        stats = scoped[source.name].stats
+        runs[source.name].absorb_fetch(stats)
+        if not own_fetcher:
+            _merge_stats(fetcher.stats, stats)
+        for key, counts in runs[source.name].types.items():
+            logger.info(
+                f"✅ {source.name} [{key}]: {counts['new']} new, {counts['updated']} updated, "
+                f"{counts['unchanged']} unchanged, {counts['merged']} merged, {counts['skipped']} skipped, "
+                f"{counts['failed']} failed / {counts['found']}"
+            )
+    return runs
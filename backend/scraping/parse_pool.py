@@ -0,0 +1,119 @@
+# backend/scraping/parse_pool.py
+#
+# Parse stage of the scraper pipeline (backend/scraping/ingest.py).
+#
+# HTML parsing is CPU-bound and holds the GIL, so with SCRAPER_PARSE_WORKERS > 0
+# pages go to a pool of worker processes (forkserver: the workers don't inherit
+# the scheduler's threads / DB connections, and backend.news_scraper is imported
+# once in the server, not per worker). 0 (default) = parse in a thread of this
+# process; -1 = auto: with the BeautifulSoup backend one worker per spare core,
+# at most 4, else 0. selectolax parses a HY+EN pair in ~0.4 ms, about what the
+# round trip to a worker costs, so processes only slow it down
+# (backend.benchmarks.parse_scaling, 400 pages: 2543 pages/s in-thread vs
+# 1295 with 1 worker / 1717 with 2; bs4: 587 in-thread, ~1.7 ms per page).
+#
+# Stages are joined by ordered_map() windows — bounded FIFOs: a stage stops
+# pulling input while `limit` of its results wait for the next stage.
+#
+#   fetch (SCRAPER_QUEUE_SIZE pages) ─▶ parse (2 × workers pages) ─▶ ingest queue ─▶ bulk write
+
+import asyncio
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Optional, Tuple, Union
+
+from backend.config.settings import settings
+from backend.scraping.extract import DEFAULT_BACKEND
+
+PRELOAD = ["backend.news_scraper", "backend.armenia.events_sources"]
+
+
+def parse_workers(configured: Optional[int] = None) -> int:
+    workers = settings.SCRAPER_PARSE_WORKERS if configured is None else configured
+    if workers >= 0:
+        return workers
+    if DEFAULT_BACKEND == "selectolax":
+        return 0
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+    return min(4, cores - 1)
+
+
+def _timed(fn: Callable, *args) -> Tuple[Any, float]:
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+class ParsePool:
+    """
+    with ParsePool() as pool:
+        row, seconds = await pool.run(parse_event, url, category, html_hy, html_en)
+
+    `fn` must be a module-level function (it is pickled by name for the workers).
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = parse_workers(workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        if self.workers > 0:
+            ctx = multiprocessing.get_context("forkserver")
+            ctx.set_forkserver_preload(PRELOAD)
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=ctx)
+
+    @property
+    def depth(self) -> int:
+        """Pages handed to the parse stage at once."""
+        return max(2, self.workers * 2)
+
+    async def run(self, fn: Callable, *args) -> Tuple[Any, float]:
+        """(fn(*args), seconds spent parsing)."""
+        if self._executor is None:
+            return await asyncio.to_thread(_timed, fn, *args)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, _timed, fn, *args)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> "ParsePool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+async def _settle(item: Any, task: asyncio.Future) -> Tuple[Any, Any]:
+    try:
+        return item, await task
+    except Exception as e:
+        return item, e
+
+
+async def ordered_map(fn: Callable[[Any], Awaitable[Any]],
+                      items: Union[Iterable, AsyncIterator], limit: int) -> AsyncIterator[Tuple[Any, Any]]:
+    """
+    (item, await fn(item) or the exception it raised) for every item, in input
+    order, with at most `limit` calls started but not yet consumed. Pending
+    calls are cancelled if the consumer stops early.
+    """
+    pending: deque = deque()
+    try:
+        if hasattr(items, "__aiter__"):
+            async for item in items:
+                pending.append((item, asyncio.ensure_future(fn(item))))
+                if len(pending) >= limit:
+                    yield await _settle(*pending.popleft())
+        else:
+            for item in items:
+                pending.append((item, asyncio.ensure_future(fn(item))))
+                if len(pending) >= limit:
+                    yield await _settle(*pending.popleft())
+        while pending:
+            yield await _settle(*pending.popleft())
+    finally:
+        for _, task in pending:
+            task.cancel()
@@ -0,0 +1,127 @@
+# backend/scraping/runstats.py
+#
+# Per-run scraper statistics: time per stage (list fetch, detail fetch, parse,
+# save), HTTP counters from the Fetcher, and per-EventType counts (found / new /
+# updated / unchanged / merged into another source's event / skipped /
+# failed). The stages overlap: fetch is the time
+# the pipeline waited for pages, parse the summed parse time of all pages (in
+# the worker processes), save the bulk writes. run_all_scrapers() stores one
+# row per source and run in scrape_runs; /admin/scrapes shows the history.
+
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from backend.scraping.fetch import FetchStats
+
+STAGES = ("list_fetch", "detail_fetch", "parse", "save")
+COUNTS = ("found", "new", "updated", "unchanged", "merged", "skipped", "failed")
+
+
+@dataclass
+class RunStats:
+    source: str
+    started_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    stages: Dict[str, float] = field(default_factory=lambda: defaultdict(float))   # seconds
+    types: Dict[str, Counter] = field(default_factory=dict)   # "16 events" → Counter
+    http: Dict[str, object] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @contextmanager
+    def stage(self, name: str):
+        """Adds the block's wall time to `name` (called repeatedly for parse / save)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] += time.perf_counter() - started
+
+    def type_counts(self, key: str) -> Counter:
+        return self.types.setdefault(key, Counter())
+
+    def absorb_fetch(self, stats: FetchStats) -> None:
+        self.http = {
+            "requests": stats.requests,
+            "retries": stats.retries,
+            "failures": stats.failures,
+            "bytes": stats.bytes,
+            "not_modified": stats.not_modified,
+            "bytes_saved": stats.bytes_saved,
+            "crawl_wait": round(stats.crawl_wait, 3),
+            "statuses": {str(k): v for k, v in sorted(stats.statuses.items())},
+        }
+
+    def totals(self) -> Counter:
+        total: Counter = Counter()
+        for counts in self.types.values():
+            total.update(counts)
+        return total
+
+    def finish(self, error: Optional[str] = None) -> "RunStats":
+        self.finished_at = time.time()
+        if error:
+            self.error = error
+        return self
+
+    def to_row(self) -> dict:
+        """Column values for database.save_scrape_run()."""
+        totals = self.totals()
+        finished = self.finished_at or time.time()
+        return {
+            "source": self.source,
+            "started_at": self.started_at,
+            "duration": finished - self.started_at,
+            "stages": {name: round(self.stages.get(name, 0.0), 3) for name in STAGES},
+            "http": self.http,
+            "types": {key: {c: counts.get(c, 0) for c in COUNTS} for key, counts in self.types.items()},
+            **{c: totals.get(c, 0) for c in COUNTS},
+            "error": self.error,
+        }
+
+
+# ---- run-over-run comparison (/admin/scrapes) ----
+
+FOUND_DROP_RATIO = 0.5      # found < 50% of the previous run
+FAILED_RATIO = 0.2          # more than 20% of the fetched detail pages failed
+
+
+def breakage_flags(run: dict, previous: Optional[dict]) -> list:
+    """Warnings for a scrape_runs row (get_scrape_runs()) compared with the run before it."""
+    flags = []
+    if run.get("error"):
+        flags.append(f"error: {run['error']}")
+    attempted = run["found"] - run["skipped"]
+    if run["found"] == 0 and run["failed"]:
+        flags.append("nothing found, list / feed fetch failed")
+    elif attempted > 0 and run["failed"] / attempted > FAILED_RATIO:
+        flags.append(f"{run['failed']}/{attempted} detail pages failed")
+    if previous is None:
+        return flags
+    if previous["found"] and run["found"] < previous["found"] * FOUND_DROP_RATIO:
+        flags.append(f"found dropped {previous['found']} → {run['found']}")
+    for key, counts in previous["types"].items():
+        if counts.get("found") and not run["types"].get(key, {}).get("found"):
+            flags.append(f"{key}: 0 found (was {counts['found']})")
+    return flags
+
+
+def compare_runs(runs: list) -> list:
+    """
+    runs — newest first, any sources. Adds to each row: `delta` (found/new/
+    updated/failed vs the previous run of the same source, None for its
+    oldest), `flags` and per-type rows for the template.
+    """
+    for i, run in enumerate(runs):
+        previous = next((r for r in runs[i + 1:] if r["source"] == run["source"]), None)
+        run["delta"] = {c: run[c] - previous[c] for c in ("found", "new", "updated", "failed")} if previous else None
+        run["flags"] = breakage_flags(run, previous)
+        prev_types = previous["types"] if previous else {}
+        run["type_rows"] = [
+            {"key": key, **{c: counts.get(c, 0) for c in COUNTS},
+             "prev_found": prev_types.get(key, {}).get("found")}
+            for key, counts in sorted({**{k: {} for k in prev_types}, **run["types"]}.items())
+        ]
+    return runs
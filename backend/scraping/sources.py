@@ -0,0 +1,252 @@
+# backend/scraping/sources.py
+#
+# Source plugins for backend/scraping/ingest.py. A Source yields Items — a
+# scraped row (upsert_scraped_news() fields, not yet normalized) or an
+# "unchanged" marker for a known URL — and counts found / skipped / failed
+# into the run's RunStats. Page parsing goes through the run's ParsePool;
+# normalizing, dedupe and the bulk write are shared.
+#
+#   FeedSource       RSS 2.0 / Atom, entries parsed while the body streams in
+#   HtmlSource       list page → links containing a marker → pages → parse(url, html)
+#   TomsarkghSource  backend/scraping/tomsarkgh.py (EventType lists, HY + EN pages,
+#                    known events skipped / revalidated)
+#
+# Extra feeds come from SCRAPER_FEEDS ("name=url|category,..."), see feed_sources().
+
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from backend.config.settings import settings
+from backend.scraping.extract import extract_links, html_to_text
+from backend.scraping.fetch import Fetcher, FetchError
+from backend.scraping.http_cache import PendingEntry
+from backend.scraping.parse_pool import ParsePool, ordered_map
+from backend.scraping.runstats import RunStats
+from backend.utils.logger import logger
+
+
+@dataclass
+class Item:
+    key: str                     # RunStats.types key ("16 events", feed name, ...)
+    url: str                     # source_url — dedupe / upsert key
+    row: Optional[dict] = None   # None → page unchanged since the last scrape, only scraped_at moves
+    cache: List[PendingEntry] = field(default_factory=list)   # HTTP cache entries written after the save
+
+
+class Source:
+    name: str = "source"
+    base_url: str = ""
+    crawl_delay: Optional[float] = None   # seconds between requests to its host, None → SCRAPER_CRAWL_DELAY_MS
+
+    def hosts(self) -> List[str]:
+        return [urlsplit(self.base_url).netloc] if self.base_url else []
+
+    def items(self, fetcher: Fetcher, run: RunStats, parser: ParsePool) -> AsyncIterator[Item]:
+        raise NotImplementedError
+
+
+# ---------- RSS / Atom ----------
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child_text(elem: ET.Element, *names: str) -> str:
+    for child in elem:
+        if _local(child.tag) in names and (child.text or "").strip():
+            return child.text.strip()
+    return ""
+
+
+def _entry(elem: ET.Element) -> Dict[str, str]:
+    """<item> / <entry> → {title, link, summary, published, image}."""
+    link = ""
+    image = ""
+    for child in elem:
+        name = _local(child.tag)
+        if name == "link":
+            href = child.get("href")
+            if href is None:
+                link = link or (child.text or "").strip()          # RSS
+            elif child.get("rel", "alternate") == "alternate":
+                link = link or href.strip()                        # Atom
+            elif child.get("rel") == "enclosure" and (child.get("type") or "").startswith("image/"):
+                image = image or href.strip()
+        elif name == "enclosure" and (child.get("type") or "").startswith("image/"):
+            image = image or (child.get("url") or "").strip()
+        elif name in ("content", "thumbnail") and child.get("url") and child.get("medium", "image") == "image":
+            image = image or child.get("url").strip()              # media:content / media:thumbnail
+    return {
+        "title": _child_text(elem, "title"),
+        "link": link or _child_text(elem, "guid", "id"),
+        "summary": _child_text(elem, "encoded", "content", "description", "summary"),
+        "published": _child_text(elem, "pubDate", "published", "updated", "date"),
+        "image": image,
+    }
+
+
+class FeedParser:
+    """Incremental RSS 2.0 / Atom parser: feed() bytes as they arrive, get the entries completed so far."""
+
+    def __init__(self):
+        self._parser = ET.XMLPullParser(events=("end",))
+
+    def feed(self, data: bytes) -> List[Dict[str, str]]:
+        self._parser.feed(data)
+        return self._entries()
+
+    def close(self) -> List[Dict[str, str]]:
+        self._parser.close()
+        return self._entries()
+
+    def _entries(self) -> List[Dict[str, str]]:
+        entries = []
+        for _, elem in self._parser.read_events():
+            if _local(elem.tag) in ("item", "entry"):
+                entries.append(_entry(elem))
+                elem.clear()   # a parsed entry isn't needed in the tree any more
+        return entries
+
+
+class FeedSource(Source):
+    def __init__(self, name: str, url: str, category: str = "general", limit: int = 50,
+                 crawl_delay: Optional[float] = None):
+        self.name = name
+        self.url = url
+        self.base_url = url
+        self.category = category
+        self.limit = limit
+        self.crawl_delay = crawl_delay
+
+    def entry_row(self, entry: Dict[str, str]) -> Optional[dict]:
+        """Feed entry → row; feeds have one language, so HY and EN get the same text."""
+        if not entry["title"] or not entry["link"]:
+            return None
+        text = html_to_text(entry["summary"]) if entry["summary"] else ""
+        url = urljoin(self.url, entry["link"])
+        return dict(
+            title_hy=entry["title"],
+            title_en=entry["title"],
+            content_hy=text,
+            content_en=text,
+            image_url=urljoin(url, entry["image"]) if entry["image"] else None,
+            category=self.category,
+            source_url=url,
+        )
+
+    async def items(self, fetcher: Fetcher, run: RunStats, parser: ParsePool) -> AsyncIterator[Item]:
+        # feeds are small and parsed as they stream in — no parse pool round trip
+        counts = run.type_counts(self.name)
+        feed = FeedParser()
+        chunks = fetcher.stream(self.url)
+        try:
+            while counts["found"] < self.limit:
+                with run.stage("list_fetch"):
+                    chunk = await anext(chunks, None)
+                with run.stage("parse"):
+                    entries = feed.feed(chunk) if chunk is not None else feed.close()
+                for entry in entries[: self.limit - counts["found"]]:
+                    counts["found"] += 1
+                    row = self.entry_row(entry)
+                    if row is None:
+                        counts["failed"] += 1
+                        continue
+                    yield Item(self.name, row["source_url"], row)
+                if chunk is None:
+                    break
+        except FetchError as e:
+            logger.error(f"❌ Feed error ({self.name}): {e}")
+            counts["failed"] += 1
+        except ET.ParseError as e:
+            logger.error(f"❌ Feed {self.name} is not valid RSS/Atom: {e}")
+            counts["failed"] += 1
+        finally:
+            await chunks.aclose()
+
+
+def feed_sources(value: str) -> List[FeedSource]:
+    """SCRAPER_FEEDS "name=url|category,name2=url2" → FeedSources (category defaults to general)."""
+    sources = []
+    for spec in filter(None, (part.strip() for part in value.split(","))):
+        name, sep, rest = spec.partition("=")
+        url, _, category = rest.partition("|")
+        if not sep or not url.strip().startswith(("http://", "https://")):
+            logger.warning(f"⚠️ SCRAPER_FEEDS: ignoring {spec!r} (expected name=url|category)")
+            continue
+        sources.append(FeedSource(name.strip(), url.strip(), category.strip() or "general"))
+    return sources
+
+
+# ---------- HTML list → detail pages ----------
+
+class HtmlSource(Source):
+    """
+    One list page → links containing `marker` → detail pages, fetched together
+    and parsed in list order by parse(url, html) → row dict or None. `parse`
+    runs in the parse pool, so it must be a module-level function.
+    """
+
+    def __init__(self, name: str, list_url: str, parse: Callable[[str, str], Optional[dict]],
+                 marker: str = "/event/", limit: int = 20, params: Optional[dict] = None,
+                 crawl_delay: Optional[float] = None):
+        self.name = name
+        self.list_url = list_url
+        self.parse = parse
+        self.marker = marker
+        self.limit = limit
+        self.params = params
+        parts = urlsplit(list_url)
+        self.base_url = f"{parts.scheme}://{parts.netloc}"
+        self.crawl_delay = crawl_delay
+
+    async def pages(self, fetcher: Fetcher, run: Optional[RunStats] = None) -> AsyncIterator[Tuple[str, Any]]:
+        """(url, html or exception) in list order; nothing if the list page failed."""
+        run = run or RunStats(self.name)
+        counts = run.type_counts(self.name)
+        try:
+            with run.stage("list_fetch"):
+                html = await fetcher.get_text(self.list_url, params=self.params)
+        except FetchError as e:
+            logger.error(f"❌ List page error ({self.name}): {e}")
+            return
+        links = extract_links(html, self.base_url, self.marker, self.limit)
+        counts["found"] = len(links)
+
+        pages = ordered_map(fetcher.get_text, links, settings.SCRAPER_QUEUE_SIZE)
+        try:
+            while True:
+                with run.stage("detail_fetch"):
+                    got = await anext(pages, None)
+                if got is None:
+                    break
+                yield got
+        finally:
+            await pages.aclose()
+
+    async def items(self, fetcher: Fetcher, run: RunStats, parser: ParsePool) -> AsyncIterator[Item]:
+        counts = run.type_counts(self.name)
+
+        async def parse(got: Tuple[str, Any]) -> Optional[dict]:
+            url, page = got
+            if isinstance(page, BaseException):
+                logger.debug(f"Page unavailable: {url} — {page}")
+                return None
+            row, seconds = await parser.run(self.parse, url, page)
+            run.stages["parse"] += seconds
+            return row
+
+        parsed = ordered_map(parse, self.pages(fetcher, run), parser.depth)
+        try:
+            async for (url, _), row in parsed:
+                if isinstance(row, BaseException):
+                    logger.error(f"❌ Parse error: {url} — {row}")
+                    row = None
+                if row is None:
+                    counts["failed"] += 1
+                    continue
+                row.setdefault("source_url", url)
+                yield Item(self.name, url, row)
+        finally:
+            await parsed.aclose()
@@ -0,0 +1,178 @@
+# backend/scraping/standin.py
+#
+# Local stand-in for tomsarkgh.am (benchmarks / offline runs).
+#
+#   with StandinServer(SyntheticTomsarkgh(), latency=0.08) as base_url:
+#       os.environ["TOMSARKGH_BASE_URL"] = base_url
+#
+# SyntheticTomsarkgh generates list + HY/EN event pages with the markup the
+# parser reads (microdata, og:image, .description #eventDesc). Some events
+# appear under two EventTypes, like concerts under 2 and 10 on the real site.
+# /hy/category/<name> pages (backend/armenia/events_sources.py) reuse the lists.
+
+import asyncio
+import hashlib
+import inspect
+import random
+import socket
+import threading
+import zlib
+from datetime import date, timedelta
+from html import escape
+from typing import Dict, Optional, Tuple
+
+from aiohttp import web
+
+Page = Tuple[int, str]   # (status, html)
+
+
+class SyntheticTomsarkgh:
+    VENUES = ["Կամերային երաժշտության տուն", "Ստանիսլավսկու անվ. թատրոն", "Mezzo Classic House",
+              "Օպերայի և բալետի ազգային թատրոն", "Moscow Cinema", "Calumet Jazz Club"]
+
+    def __init__(self, event_types=(16, 54, 31, 10, 2, 41, 1, 6, 12, 21, 7), per_type: int = 20,
+                 shared_every: int = 4, seed: int = 39):
+        rnd = random.Random(seed)
+        self.lists: Dict[int, list] = {}
+        self.events: Dict[int, dict] = {}
+        next_id = 10_000
+        for event_type in event_types:
+            ids = []
+            for _ in range(per_type):
+                ids.append(next_id)
+                self.events[next_id] = self._event(next_id, rnd)
+                next_id += 1
+            self.lists[event_type] = ids
+        # concerts (2) also list every Nth pop (10) event
+        if 2 in self.lists and 10 in self.lists:
+            self.lists[2] = self.lists[10][::shared_every] + self.lists[2]
+
+    def _event(self, event_id: int, rnd: random.Random) -> dict:
+        day = date.today() + timedelta(days=rnd.randint(0, 7))
+        words = " ".join(rnd.choice(["համերգ", "ներկայացում", "երեկո", "փառատոն", "պրեմիերա"])
+                         for _ in range(rnd.randint(60, 400)))
+        return {
+            "id": event_id,
+            "title_hy": f"Միջոցառում {event_id}",
+            "title_en": f"Event {event_id}",
+            "start": f"{day.isoformat()} {rnd.choice(['12:00', '19:00', '20:30'])}",
+            "venue": rnd.choice(self.VENUES),
+            "price": str(rnd.choice([2000, 3500, 5000, 8000, 15000])),
+            "desc_hy": words,
+            "desc_en": "Concert evening " * rnd.randint(20, 120),
+        }
+
+    def list_page(self, event_type: int) -> Page:
+        ids = self.lists.get(event_type, [])
+        items = "\n".join(
+            f'<div class="event-item"><a href="/hy/event/{i}">{escape(self.events[i]["title_hy"])}</a></div>'
+            for i in ids
+        )
+        return 200, f"<html><body><div class='events'>{items}</div></body></html>"
+
+    def event_page(self, event_id: int, lang: str) -> Page:
+        ev = self.events.get(event_id)
+        if ev is None:
+            return 404, "<html><body>Not found</body></html>"
+        title = ev["title_hy"] if lang == "hy" else ev["title_en"]
+        desc = ev["desc_hy"] if lang == "hy" else ev["desc_en"]
+        return 200, f"""<html><head>
+<meta property="og:image" content="https://www.tomsarkgh.am/thumbnails/Event/{event_id}.jpg">
+</head><body>
+<h1 class="event-name">{escape(title)}</h1>
+<div class="occurrence" itemscope itemtype="http://schema.org/Event">
+  <meta itemprop="startDate" content="{ev['start']}">
+  <div class="occurrence_venue"><span itemprop="name">{escape(ev['venue'])}</span></div>
+  <span itemprop="offers"><meta itemprop="price" content="{ev['price']}"></span>
+</div>
+<div class="description"><span id="eventDesc"><p>{escape(desc)}</p><p>{ev['price']} դր.</p></span></div>
+</body></html>"""
+
+    def get(self, path: str, query: dict) -> Page:
+        if path == "/list":
+            try:
+                return self.list_page(int(query.get("EventType[]", "0")))
+            except ValueError:
+                return 400, ""
+        if path.startswith("/hy/category/"):
+            types = list(self.lists)
+            return self.list_page(types[zlib.crc32(path.encode("utf-8")) % len(types)])
+        for lang in ("hy", "en"):
+            prefix = f"/{lang}/event/"
+            if path.startswith(prefix) and path[len(prefix):].isdigit():
+                return self.event_page(int(path[len(prefix):]), lang)
+        return 404, "<html><body>Not found</body></html>"
+
+
+class StandinServer:
+    """Serves `site.get(path, query)` on 127.0.0.1 from a background thread.
+
+    `site.get` may be a coroutine (backend/scraping/fixtures.py records through it).
+    Pages carry an ETag (body hash); a matching If-None-Match gets a 304.
+    """
+
+    def __init__(self, site, latency: float = 0.0, port: Optional[int] = None):
+        self.site = site
+        self.latency = latency
+        self.port = port or _free_port()
+        self.requests = 0
+        self.not_modified = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        result = self.site.get(request.path, dict(request.query))
+        if inspect.isawaitable(result):
+            result = await result
+        status, body = result
+        if status != 200:
+            return web.Response(status=status, text=body, content_type="text/html", charset="utf-8")
+        etag = '"' + hashlib.sha1(body.encode("utf-8")).hexdigest() + '"'
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(status=status, text=body, content_type="text/html", charset="utf-8",
+                            headers={"ETag": etag})
+
+    async def _start(self) -> None:
+        app = web.Application()
+        app.router.add_route("GET", "/{tail:.*}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, "127.0.0.1", self.port).start()
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._loop.run_until_complete(self._start())
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.run_until_complete(self._runner.cleanup())
+        aclose = getattr(self.site, "aclose", None)
+        if aclose is not None:
+            self._loop.run_until_complete(aclose())
+        self._loop.close()
+
+    def __enter__(self) -> str:
+        self._thread = threading.Thread(target=self._run, name="scrape-standin", daemon=True)
+        self._thread.start()
+        self._ready.wait(10)
+        return self.base_url
+
+    def __exit__(self, *exc) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=10)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
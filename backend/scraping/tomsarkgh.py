@@ -0,0 +1,177 @@
+# backend/scraping/tomsarkgh.py
+#
+# Concurrent Tomsarkgh scraper — a Source for backend/scraping/ingest.py. Same
+# pages and parser as the sequential flow in backend/news_scraper.py, but:
+#   - all list pages and event pages are fetched concurrently (Fetcher limits),
+#   - HY and EN pages of an event are fetched in parallel,
+#   - an event listed under several EventTypes is fetched once.
+# Items come out in the sequential order (EventType order, then list order), so
+# the first type still "owns" an event and the rows come out the same. Event
+# pages are fetched SCRAPER_QUEUE_SIZE ahead of the parse stage, which runs in
+# the ParsePool (worker processes, backend/scraping/parse_pool.py).
+#
+# Known events (source_url already in news) are not fetched at all unless their
+# scraped_at is older than SCRAPER_REFRESH_HOURS. Stale ones are revalidated
+# against the on-disk HTTP cache (SCRAPER_CACHE_DIR): unchanged pages only bump
+# scraped_at, changed ones are re-parsed and the row is updated if the scraped
+# fields' content hash differs (upsert_scraped_news, logged to news_changes).
+# Event pages' cache entries are written only once their batch is saved.
+
+import asyncio
+import time
+from collections import Counter
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from backend.config.settings import settings
+from backend.database import get_news_scraped_at
+from backend.news_scraper import (
+    BASE_TOMSARKGH_URL,
+    TOMSARKGH_CATEGORIES,
+    event_url_en,
+    parse_event,
+    parse_event_links,
+    tomsarkgh_list_params,
+)
+from backend.scraping.fetch import Fetcher, FetchError
+from backend.scraping.ingest import default_cache, run_sources
+from backend.scraping.parse_pool import ParsePool, ordered_map
+from backend.scraping.runstats import RunStats
+from backend.scraping.sources import Item, Source
+from backend.utils.logger import logger
+
+EventPages = Tuple[str, Optional[str], bool, list]   # (html_hy, html_en or None, unchanged, PendingEntries)
+Work = Tuple[str, str, str]                     # (RunStats key, base category, url)
+
+
+async def fetch_event_links(fetcher: Fetcher, event_type: int, days_ahead: int = 7) -> List[str]:
+    params = tomsarkgh_list_params(event_type, days_ahead)
+    try:
+        html = await fetcher.get_text(f"{BASE_TOMSARKGH_URL}/list", params=params)
+    except FetchError as e:
+        logger.error(f"❌ Tomsarkgh list error (type={event_type}): {e}")
+        return []
+    links = parse_event_links(html)
+    logger.info(f"✅ Found {len(links)} events for type={event_type}")
+    return links
+
+
+async def fetch_event_pages(fetcher: Fetcher, url: str) -> Optional[EventPages]:
+    """HY + EN in parallel. None if the HY page failed; EN is optional."""
+    hy, en = await asyncio.gather(
+        fetcher.get(url, defer_cache=True),
+        fetcher.get(event_url_en(url), timeout=10, defer_cache=True),
+        return_exceptions=True,
+    )
+    if isinstance(hy, BaseException):
+        logger.error(f"❌ Event error: {url} — {hy}")
+        return None
+    if isinstance(en, BaseException):
+        logger.debug(f"EN version unavailable for {url}")
+        return hy.text, None, hy.unchanged, hy.pending
+    return hy.text, en.text, hy.unchanged and en.unchanged, hy.pending + en.pending
+
+
+class TomsarkghSource(Source):
+    name = "tomsarkgh"
+
+    def __init__(self, categories: Optional[Dict[int, str]] = None,
+                 refresh_hours: Optional[float] = None):
+        self.categories = categories or TOMSARKGH_CATEGORIES
+        self.refresh_hours = settings.SCRAPER_REFRESH_HOURS if refresh_hours is None else refresh_hours
+        self.base_url = BASE_TOMSARKGH_URL
+
+    async def items(self, fetcher: Fetcher, run: RunStats, parser: ParsePool) -> AsyncIterator[Item]:
+        """New + stale events through the fetch → parse stages, yielded in the sequential order."""
+        logger.info(f"▶️ Starting Tomsarkgh scraper (concurrent, {len(self.categories)} types)")
+        types = list(self.categories.items())
+        with run.stage("list_fetch"):
+            link_lists = await asyncio.gather(*(fetch_event_links(fetcher, t) for t, _ in types))
+
+        all_urls = list(dict.fromkeys(url for links in link_lists for url in links))
+        with run.stage("save"):
+            scraped_at = await asyncio.to_thread(get_news_scraped_at, all_urls)
+        stale_before = time.time() - self.refresh_hours * 3600
+
+        # one fetch per new/stale URL, even if several EventTypes list it
+        work: List[Work] = []
+        done: set = set()
+        for (event_type, base_category), links in zip(types, link_lists):
+            counts: Counter = run.type_counts(f"{event_type} {base_category}")
+            counts["found"] = len(links)
+            if not links:
+                logger.warning(f"⚠️ No events for type={event_type}")
+            for url in links:
+                if url in done or (url in scraped_at and scraped_at[url] > stale_before):
+                    # already handled under an earlier EventType, or fresh
+                    counts["skipped"] += 1
+                    continue
+                done.add(url)
+                work.append((f"{event_type} {base_category}", base_category, url))
+
+        async def fetch(w: Work) -> Optional[EventPages]:
+            return await fetch_event_pages(fetcher, w[2])
+
+        async def parse(got: Tuple[Work, Any]) -> Optional[Item]:
+            (key, base_category, url), fetched = got
+            if fetched is None or isinstance(fetched, BaseException):
+                return None
+            html_hy, html_en, same, pending = fetched
+            if url in scraped_at and same:
+                return Item(key, url, cache=pending)
+            row, seconds = await parser.run(parse_event, url, base_category, html_hy, html_en)
+            run.stages["parse"] += seconds
+            return Item(key, url, row, cache=pending)
+
+        async def fetched_pages() -> AsyncIterator[Tuple[Work, Any]]:
+            pages = ordered_map(fetch, work, settings.SCRAPER_QUEUE_SIZE)
+            try:
+                while True:
+                    with run.stage("detail_fetch"):
+                        got = await anext(pages, None)
+                    if got is None:
+                        break
+                    yield got
+            finally:
+                await pages.aclose()
+
+        parsed = ordered_map(parse, fetched_pages(), parser.depth)
+        try:
+            async for ((key, _, url), _), item in parsed:
+                if isinstance(item, BaseException):
+                    logger.error(f"❌ Event error: {url} — {item}")
+                    item = None
+                if item is None:
+                    run.type_counts(key)["failed"] += 1
+                    continue
+                yield item
+        finally:
+            await parsed.aclose()
+
+
+async def scrape_tomsarkgh_events_async(
+    categories: Optional[Dict[int, str]] = None,
+    fetcher: Optional[Fetcher] = None,
+    refresh_hours: Optional[float] = None,
+    run: Optional[RunStats] = None,
+) -> int:
+    """
+    The Tomsarkgh source alone through the ingest pipeline.
+    Returns the number of rows inserted or updated; stage timings and counts go to `run`.
+    """
+    source = TomsarkghSource(categories, refresh_hours)
+    run = run or RunStats(source.name)
+    await run_sources([source], fetcher=fetcher, runs={source.name: run})
+    if run.error:
+        raise RuntimeError(run.error)
+
+    totals = run.totals()
+    total_saved = totals["new"] + totals["updated"]
+    http = run.http
+    logger.info(
+        f"✅ === TOMSARKGH SCRAPER COMPLETE: {total_saved} items === "
+        f"({totals['new']} new, {totals['updated']} updated, {totals['unchanged']} unchanged, "
+        f"{totals['merged']} merged, {totals['skipped']} skipped; {http['requests']} requests, {http['retries']} retries, "
+        f"{http['bytes'] / 1024:.0f} KiB, {http['not_modified']} not modified, "
+        f"{http['bytes_saved'] / 1024:.0f} KiB saved)"
+    )
+    return total_saved
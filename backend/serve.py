@@ -0,0 +1,38 @@
+# backend/serve.py
+#
+# Web entry point:  python -m backend.serve
+#
+# Runs uvicorn with WEB_CONCURRENCY worker processes. Per-worker caches
+# (hero pool, like buffer state) stay coherent through backend/invalidation.py.
+
+import os
+
+import uvicorn
+
+from backend.assets import STATIC_DIR, refresh_manifest
+from backend.config.settings import settings
+from backend.utils.logger import logger
+
+
+def main() -> None:
+    workers = max(1, settings.WEB_CONCURRENCY)
+    if settings.ASSET_FINGERPRINTS:
+        # once here, so the workers just read the file
+        refresh_manifest(STATIC_DIR)
+    if workers > 1 and settings.RATE_LIMIT_STORE == "memory":
+        logger.warning("⚠️ RATE_LIMIT_STORE=memory with several workers — each worker keeps its own buckets")
+
+    uvicorn.run(
+        "backend.web_app:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        workers=workers,
+        proxy_headers=True,
+        # not "*": uvicorn would take the client-supplied first X-Forwarded-For hop
+        forwarded_allow_ips=settings.FORWARDED_ALLOW_IPS,
+        log_level=os.getenv("LOG_LEVEL", "info").lower(),
+    )
+
+
+if __name__ == "__main__":
+    main()
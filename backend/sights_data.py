@@ -17,6 +17,8 @@ SIGHTS = [
     "location_hy": "Կոտայքի մարզ, Գառնի, 2215",
     "location_en": "Kotayk Province, Garni, 2215",
     "maps_url": "https://maps.app.goo.gl/Kz1TYsPcFTybEkzY8",
+    "lat": 40.1123,
+    "lon": 44.7303,
     "thumb": "static/img/sights/garni-new.jpg",
     "images": [
         "static/img/sights/garni-old.jpg",
@@ -51,6 +53,8 @@ SIGHTS = [
     "location_hy": "Գեղարքունիքի մարզ",
     "location_en": "Gegharkunik Province",
     "maps_url": "https://maps.app.goo.gl/kzYrTEPJPcHF6UDx5",
+    "lat": 40.5600,
+    "lon": 44.9600,
     "thumb": "static/img/sights/Lake_Sevan.jpg",
     "images": [
         "static/img/sights/Lake_Sevan.jpg",
@@ -88,6 +92,8 @@ SIGHTS = [
     "location_hy": "Տավուշի մարզ, Դիլիջան ազգային պարկ",
     "location_en": "Tavush Province, Dilijan National Park",
     "maps_url": "https://maps.app.goo.gl/vb7AK3yCqG6NkmYj6",
+    "lat": 40.7506,
+    "lon": 44.9656,
     "thumb": "static/img/sights/parz-lake-mirror.jpg",
     "images": [
         "static/img/sights/parz-lake-mirror.jpg",
@@ -125,6 +131,8 @@ SIGHTS = [
     "location_hy": "Կոտայքի մարզ, Գառնի, 2215",
     "location_en": "Kotayk Province, Garni, 2215",
     "maps_url": "https://maps.app.goo.gl/yD5cc6rufBt2qu298",
+    "lat": 40.1072,
+    "lon": 44.7350,
     "thumb": "static/img/sights/garni-gorge-columns.jpg",
     "images": [
         "static/img/sights/garni-gorge-columns.jpg",
@@ -158,6 +166,8 @@ SIGHTS = [
     "location_hy": "Արագածոտնի մարզ, Արագած լեռ",
     "location_en": "Aragatsotn Province, Mount Aragats",
     "maps_url": "https://maps.app.goo.gl/vJ2ePCcn4KgNJ7dv6",
+    "lat": 40.4728,
+    "lon": 44.2164,
     "thumb": "static/img/sights/kari-lake-main.jpg",
     "images": [
         "static/img/sights/kari-lake-main.jpg",
@@ -197,6 +207,8 @@ SIGHTS = [
     "location_hy": "Տավուշի մարզ, Դիլիջան",
     "location_en": "Tavush Province, Dilijan",
     "maps_url": "https://maps.app.goo.gl/tkgAU2P3q9YJ4bN27",
+    "lat": 40.7410,
+    "lon": 44.8630,
     "thumb": "static/img/sights/dilijan-old-street.webp",
     "images": [
         "static/img/sights/dilijan-old-street.webp",
@@ -236,6 +248,8 @@ SIGHTS = [
     "location_hy": "Շիրակի մարզ, Գյումրի",
     "location_en": "Shirak Province, Gyumri",
     "maps_url": "https://maps.app.goo.gl/VysdV5so6QB8oNv59",
+    "lat": 40.7894,
+    "lon": 43.8420,
     "thumb": "static/img/sights/gyumri-old-street.jpg",
     "images": [
         "static/img/sights/gyumri-old-street.jpg",
@@ -275,6 +289,8 @@ SIGHTS = [
     "location_hy": "Սյունիքի մարզ, 3207",
     "location_en": "Syunik Province, 3207",
     "maps_url": "https://maps.app.goo.gl/Zv5CrsEWET2n88iQ8",
+    "lat": 39.5050,
+    "lon": 46.4350,
     "thumb": "static/img/sights/khndzoresk-bridge.jpg",
     "images": [
         "static/img/sights/khndzoresk-bridge.jpg",
@@ -314,6 +330,8 @@ SIGHTS = [
     "location_hy": "Սյունիքի մարզ, Սիսիան քաղաքի մոտ",
     "location_en": "Syunik Province, near Sisian town",
     "maps_url": "https://maps.app.goo.gl/L2qdmcdacpLixyYh7",
+    "lat": 39.5512,
+    "lon": 46.0285,
     "thumb": "static/img/sights/karahunj-circle-view.jpg",
     "images": [
         "static/img/sights/karahunj-circle-view.jpg",
@@ -351,6 +369,8 @@ SIGHTS = [
     "location_hy": "Արագածոտնի մարզ, Արագած լեռ, 2300 մ",
     "location_en": "Aragatsotn Province, Mount Aragats, 2,300 m",
     "maps_url": "https://maps.app.goo.gl/tcJNJUGVbU61UVRs9",
+    "lat": 40.3886,
+    "lon": 44.2258,
     "thumb": "static/img/sights/amberd-fortress-main.jpg",
     "images": [
         "static/img/sights/amberd-fortress-main.jpg",
@@ -390,6 +410,8 @@ SIGHTS = [
     "location_hy": "Սյունիքի մարզ, Շաքի գյուղ",
     "location_en": "Syunik Province, Shaki village",
     "maps_url": "https://maps.app.goo.gl/yf95w1TD2DrqKYEy6",
+    "lat": 39.5556,
+    "lon": 45.9944,
     "thumb": "static/img/sights/shaki-waterfall-main.webp",
     "images": [
         "static/img/sights/shaki-waterfall-main.webp",
@@ -427,6 +449,8 @@ SIGHTS = [
     "location_hy": "Վայոց Ձորի մարզ",
     "location_en": "Vayots Dzor Province",
     "maps_url": "https://maps.app.goo.gl/zbPBbZtMuabD2EEL9",
+    "lat": 39.4720,
+    "lon": 46.3070,
     "thumb": "static/img/sights/old-khot-village-view.jpg",
     "images": [
         "static/img/sights/old-khot-village-view.jpg",
@@ -465,6 +489,8 @@ SIGHTS = [
     "location_hy": "Սյունիքի մարզ, Գորիս–Կապան ճանապարհի մոտ",
     "location_en": "Syunik Province, near Goris–Kapan road",
     "maps_url": "https://maps.app.goo.gl/1QPA1MxSKvnZYi1f7",
+    "lat": 39.4500,
+    "lon": 46.3000,
     "thumb": "static/img/sights/vorotan-gorge-view.webp",
     "images": [
         "static/img/sights/vorotan-gorge-view.webp",
@@ -504,6 +530,8 @@ SIGHTS = [
     "location_hy": "Լոռու մարզ, Դսեղ գյուղ",
     "location_en": "Lori Province, Dsegh village",
     "maps_url": "https://maps.app.goo.gl/cqNNnuGhSJApqP8k7",
+    "lat": 40.9610,
+    "lon": 44.6500,
     "thumb": "static/img/sights/dsegh-village-view.jpg",
     "images": [
         "static/img/sights/dsegh-village-view.jpg",
@@ -543,6 +571,8 @@ SIGHTS = [
     "location_hy": "Շիրակի մարզ, Ամասիայի շրջան",
     "location_en": "Shirak Province, near Amasia",
     "maps_url": "https://maps.app.goo.gl/qeuM9rAqQFv7HLpk9",
+    "lat": 41.0500,
+    "lon": 43.6000,
     "thumb": "static/img/sights/arpi-lake-main.jpg",
     "images": [
         "static/img/sights/arpi-lake-main.jpg",
@@ -580,6 +610,8 @@ SIGHTS = [
     "location_hy": "Տավուշի մարզ, Գոշ գյուղի մոտ",
     "location_en": "Tavush Province, near Gosh village",
     "maps_url": "https://maps.app.goo.gl/2xDwD5Kktr1qAJry8",
+    "lat": 40.7290,
+    "lon": 44.9970,
     "thumb": "static/img/sights/gosh-lake-main.jpg",
     "images": [
         "static/img/sights/gosh-lake-main.jpg",
@@ -619,6 +651,8 @@ SIGHTS = [
     "location_hy": "Վայոց Ձորի մարզ, Ջերմուկ, 3701",
     "location_en": "Vayots Dzor Province, Jermuk, 3701",
     "maps_url": "https://maps.app.goo.gl/LLhjxpTJXzgkUfkg7",
+    "lat": 39.8420,
+    "lon": 45.6720,
     "thumb": "static/img/sights/jermuk-waterfall-main.webp",
     "images": [
         "static/img/sights/jermuk-waterfall-main.webp",
@@ -658,6 +692,8 @@ SIGHTS = [
     "location_hy": "Արագածոտնի մարզ, Բյուրական, 0213",
     "location_en": "Aragatsotn Province, Byurakan, 0213",
     "maps_url": "https://maps.app.goo.gl/hj55E82zk4A4vWdp6",
+    "lat": 40.3300,
+    "lon": 44.2730,
     "thumb": "static/img/sights/byurakan-observatory-main.webp",
     "images": [
         "static/img/sights/byurakan-observatory-main.webp",
@@ -697,6 +733,8 @@ SIGHTS = [
     "location_hy": "Արարատի մարզ, Գառնի–Խոսրով շրջան",
     "location_en": "Ararat Province, Garni–Khosrov area",
     "maps_url": "https://maps.app.goo.gl/kKcbo4zrSbHPkLgV7",
+    "lat": 39.9800,
+    "lon": 44.9200,
     "thumb": "static/img/sights/khosrovi_antar.jpg",
     "images": [
         "static/img/sights/khosrovi_antar.jpg",
@@ -736,6 +774,8 @@ SIGHTS = [
     "location_hy": "Վաղարշապատ, Արմավիրի մարզ",
     "location_en": "Armavir Province, near Vagharshapat",
     "maps_url": "https://maps.app.goo.gl/eiLm35KKrJJ4QEoG8",
+    "lat": 40.1603,
+    "lon": 44.3366,
     "thumb": "static/img/sights/zvartnots-new.jpg",
     "images": [
         "static/img/sights/zvartnots-old.png",
@@ -780,6 +820,8 @@ SIGHTS = [
     "location_hy": "Երևան, Կենտրոն, Մոսկովյան 10",
     "location_en": "Yerevan, Kentron, 10 Moskovyan Street",
     "maps_url": "https://maps.app.goo.gl/THTFRi4a4cW2qHKx9",
+    "lat": 40.1911,
+    "lon": 44.5153,
     "thumb": "static/img/sights/kaskad_amrane.jpg",
     "images": [
         "static/img/sights/kaskad_amrane.jpg",
@@ -819,6 +861,8 @@ SIGHTS = [
     "location_hy": "Երևան, Մեսրոպ Մաշտոցի պողոտա 53, 0009",
     "location_en": "Yerevan, 53 Mashtots Avenue, 0009",
     "maps_url": "https://maps.app.goo.gl/of4VcLWJ4XnfWshv6",
+    "lat": 40.1923,
+    "lon": 44.5213,
     "thumb": "static/img/sights/bmatenadaran.jpg",
     "images": [
         "static/img/sights/bmatenadaran.jpg",
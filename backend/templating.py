@@ -0,0 +1,86 @@
+# backend/templating.py
+#
+# One Jinja2 environment for web_app and admin_routes.
+#
+# Compiled templates go to a FileSystemBytecodeCache, so a restarted worker
+# (or a second uvicorn worker) loads bytecode instead of re-parsing the HTML.
+# With TEMPLATES_PRECOMPILE=1 every template is compiled once at startup,
+# so the first visitor after a deploy doesn't pay for it.
+
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+import jinja2
+from fastapi.templating import Jinja2Templates
+
+from backend.assets import asset_url
+from backend.config.settings import settings
+from backend.utils import metrics
+from backend.utils.logger import logger
+
+TEMPLATES_DIR = "templates"
+
+
+class _TimedTemplate(jinja2.Template):
+    """Reports render time to the request's Server-Timing and /metrics."""
+
+    def render(self, *args, **kwargs) -> str:
+        started = time.perf_counter()
+        try:
+            return super().render(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            metrics.add_timing("render", elapsed)
+            metrics.RENDER_TIME.observe(elapsed, self.name or "<string>")
+
+
+class _CountingBytecodeCache(jinja2.FileSystemBytecodeCache):
+    def load_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        super().load_bytecode(bucket)
+        metrics.cache_hit("jinja_bytecode", bucket.code is not None)
+
+
+def _bytecode_cache() -> Optional[jinja2.BytecodeCache]:
+    cache_dir = settings.TEMPLATES_CACHE_DIR
+    if not cache_dir:
+        return None
+    try:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.warning(f"Template bytecode cache disabled ({cache_dir}): {e}")
+        return None
+    return _CountingBytecodeCache(cache_dir, "askyerevan-%s.cache")
+
+
+env = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(TEMPLATES_DIR),
+    autoescape=True,  # same default Jinja2Templates(directory=...) uses
+    bytecode_cache=_bytecode_cache(),
+    auto_reload=settings.TEMPLATES_AUTO_RELOAD,
+    cache_size=-1,    # keep every compiled template; there are only ~30
+)
+env.template_class = _TimedTemplate
+env.globals["asset_url"] = asset_url
+
+templates = Jinja2Templates(env=env)
+
+
+def precompile_templates() -> int:
+    """Compiles (or loads from bytecode) every template. Returns the count."""
+    started = time.perf_counter()
+    names = env.list_templates(extensions=["html"])
+    failed = 0
+    for name in names:
+        try:
+            env.get_template(name)
+        except jinja2.TemplateError as e:
+            failed += 1
+            logger.error(f"❌ Template {name} failed to compile: {e}")
+    logger.info(
+        f"🧩 Precompiled {len(names) - failed}/{len(names)} templates "
+        f"in {(time.perf_counter() - started) * 1000:.0f} ms "
+        f"(bytecode cache: {'on' if env.bytecode_cache else 'off'}, pid {os.getpid()})"
+    )
+    return len(names) - failed
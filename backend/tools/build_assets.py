@@ -0,0 +1,23 @@
+# backend/tools/build_assets.py
+#
+# Writes static/asset-manifest.json (content hashes for asset_url()).
+#
+#   python -m backend.tools.build_assets
+#
+# Run from the repo root after static files change. Optional: backend.serve and
+# the app's startup hook rebuild the file whenever it doesn't match the assets.
+
+import time
+
+from backend.assets import STATIC_DIR, build_manifest, tree_signature, write_manifest
+
+
+def main() -> None:
+    started = time.perf_counter()
+    manifest = build_manifest(STATIC_DIR)
+    path = write_manifest(manifest, STATIC_DIR, tree_signature(STATIC_DIR))
+    print(f"{len(manifest)} files hashed → {path} ({(time.perf_counter() - started) * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
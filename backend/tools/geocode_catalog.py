@@ -0,0 +1,157 @@
+# backend/tools/geocode_catalog.py
+#
+# One-off: writes "lat"/"lon" into churches_data.py / sights_data.py / places_data.py.
+#
+#   python -m backend.tools.geocode_catalog            # dry run, prints what it found
+#   python -m backend.tools.geocode_catalog --write    # rewrites the data files
+#   python -m backend.tools.geocode_catalog --write --all   # re-resolve existing coords too
+#
+# Sources, in order:
+#   1. coordinates already in maps_url (?query=lat,lon)
+#   2. maps.app.goo.gl short link → follow redirects → @lat,lon / !3dlat!4dlon in the final URL
+#   3. Google Geocoding API on location_en (needs GOOGLE_MAPS_API_KEY)
+#
+# Runs offline from the web app: results are committed as plain literals in the data files.
+
+import argparse
+import re
+from pathlib import Path
+from typing import Optional, Tuple
+
+import requests
+
+from backend.catalog.items import CATALOGS
+from backend.config.settings import settings
+
+DATA_DIR = Path(__file__).resolve().parent.parent
+DATA_FILES = {
+    "church": DATA_DIR / "churches_data.py",
+    "sight": DATA_DIR / "sights_data.py",
+    "place": DATA_DIR / "places_data.py",
+}
+
+_QUERY_RE = re.compile(r"[?&](?:query|q)=(-?\d+\.\d+),\s*(-?\d+\.\d+)")
+_AT_RE = re.compile(r"@(-?\d+\.\d+),(-?\d+\.\d+)")
+_PIN_RE = re.compile(r"!3d(-?\d+\.\d+)!4d(-?\d+\.\d+)")
+
+# Armenia bounding box — anything outside is a bad parse
+_LAT_RANGE = (38.8, 41.4)
+_LON_RANGE = (43.4, 46.7)
+
+LatLon = Tuple[float, float]
+
+
+def _in_armenia(ll: Optional[LatLon]) -> Optional[LatLon]:
+    if ll and _LAT_RANGE[0] <= ll[0] <= _LAT_RANGE[1] and _LON_RANGE[0] <= ll[1] <= _LON_RANGE[1]:
+        return ll
+    return None
+
+
+def parse_maps_url(url: str) -> Optional[LatLon]:
+    # the pin (!3d…!4d…) is more exact than the viewport centre (@…)
+    for rx in (_QUERY_RE, _PIN_RE, _AT_RE):
+        m = rx.search(url or "")
+        if m:
+            return _in_armenia((round(float(m.group(1)), 4), round(float(m.group(2)), 4)))
+    return None
+
+
+def expand_short_link(url: str) -> Optional[str]:
+    try:
+        resp = requests.get(url, allow_redirects=True, timeout=10)
+        return resp.url
+    except Exception as e:
+        print(f"   ⚠️ redirect failed: {e}")
+        return None
+
+
+def geocode(address: str) -> Optional[LatLon]:
+    if not settings.GOOGLE_MAPS_API_KEY or not address:
+        return None
+    try:
+        resp = requests.get(
+            "https://maps.googleapis.com/maps/api/geocode/json",
+            params={"address": address, "region": "am", "key": settings.GOOGLE_MAPS_API_KEY},
+            timeout=10,
+        )
+        results = resp.json().get("results") or []
+    except Exception as e:
+        print(f"   ⚠️ geocode failed: {e}")
+        return None
+    if not results:
+        return None
+    loc = results[0]["geometry"]["location"]
+    return _in_armenia((round(loc["lat"], 4), round(loc["lng"], 4)))
+
+
+def resolve(item: dict) -> Tuple[Optional[LatLon], str]:
+    url = item.get("maps_url", "")
+    ll = parse_maps_url(url)
+    if ll:
+        return ll, "maps_url"
+    if "goo.gl" in url:
+        final = expand_short_link(url)
+        ll = parse_maps_url(final or "")
+        if ll:
+            return ll, "short link"
+    ll = geocode(item.get("address_en") or item.get("location_en", ""))
+    return ll, "geocode" if ll else "-"
+
+
+def write_coords(path: Path, coords: dict) -> int:
+    """
+    Inserts/replaces `"lat": …, "lon": …,` right after each entry's maps_url line.
+    coords: {item_id: (lat, lon)}. Returns the number of entries touched.
+    """
+    lines = path.read_text(encoding="utf-8").split("\n")
+    out, current_id, touched = [], None, 0
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        m = re.match(r'\s*"id":\s*"([^"]+)"', line)
+        if m:
+            current_id = m.group(1)
+        out.append(line)
+        if current_id in coords and re.match(r'\s*"maps_url":', line):
+            indent = line[: len(line) - len(line.lstrip())]
+            lat, lon = coords[current_id]
+            out.append(f'{indent}"lat": {lat:.4f},')
+            out.append(f'{indent}"lon": {lon:.4f},')
+            # drop previously written coordinates
+            while i + 1 < len(lines) and re.match(r'\s*"(lat|lon)":', lines[i + 1]):
+                i += 1
+            touched += 1
+            current_id = None
+        i += 1
+    path.write_text("\n".join(out), encoding="utf-8")
+    return touched
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Add lat/lon to catalog data files")
+    ap.add_argument("--write", action="store_true", help="rewrite the data files")
+    ap.add_argument("--all", action="store_true", help="also re-resolve entries that have lat/lon")
+    args = ap.parse_args()
+
+    missing = 0
+    for kind, (items, _) in CATALOGS.items():
+        found = {}
+        for item in items:
+            if "lat" in item and not args.all:
+                continue
+            ll, source = resolve(item)
+            print(f"{kind:<6} {item['id']:<32} {source:<10} {ll}")
+            if ll:
+                found[item["id"]] = ll
+            else:
+                missing += 1
+        if args.write and found:
+            n = write_coords(DATA_FILES[kind], found)
+            print(f"✅ {DATA_FILES[kind].name}: {n} entries updated")
+
+    if missing:
+        print(f"⚠️ {missing} entries unresolved — add lat/lon by hand")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# backend/tools/merge_duplicate_events.py
+#
+# One-off merge of duplicate events already in the news table — the same show
+# scraped under several EventTypes / sources / languages before ingest-time
+# dedupe (backend/scraping/dedupe.py) existed. New duplicates are merged by
+# bulk_upsert_scraped_news(), so this only needs to run once per database.
+#
+#   python -m backend.tools.merge_duplicate_events --dry-run     # list the groups only
+#   python -m backend.tools.merge_duplicate_events               # merge
+#   python -m backend.tools.merge_duplicate_events --threshold 0.9
+#
+# Uses DATABASE_URL / SQLITE_PATH like the app. Take a backup first: merged
+# rows are deleted (their URLs stay as news_aliases of the row that was kept).
+
+import argparse
+
+from backend.database import init_db, merge_duplicate_news
+from backend.scraping.dedupe import TITLE_MATCH
+
+
+def _label(row: dict) -> str:
+    when = f"{row['eventdate']} {row['eventtime'] or ''}".strip()
+    return f"#{row['id']} {row['title_hy'][:50]} | {when} | {(row['venue_hy'] or '—')[:30]} | {row['source_url'] or 'admin'}"
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Merge duplicate events in the news table")
+    ap.add_argument("--dry-run", action="store_true", help="show what would be merged, change nothing")
+    ap.add_argument("--threshold", type=float, default=TITLE_MATCH, help="title similarity (0..1)")
+    args = ap.parse_args()
+
+    init_db()   # dedupe_key column / news_aliases on databases that predate them
+    groups = merge_duplicate_news(dry_run=args.dry_run, threshold=args.threshold)
+    for group in groups:
+        print(f"keep   {_label(group['keep'])}")
+        for row in group["merged"]:
+            print(f"  merge {_label(row)}")
+    removed = sum(len(g["merged"]) for g in groups)
+    verb = "would be merged" if args.dry_run else "merged"
+    print(f"{removed} duplicate rows in {len(groups)} events {verb}")
+
+
+if __name__ == "__main__":
+    main()
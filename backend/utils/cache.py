@@ -0,0 +1,53 @@
+# backend/utils/cache.py
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from backend.utils import metrics
+
+
+class TTLCache:
+    """
+    Small per-process cache. Entries expire after `ttl` seconds or when
+    invalidate() is called (backend/invalidation.py does that for every worker).
+    """
+
+    def __init__(self, name: str, ttl: float, maxsize: int = 256):
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        # bumped on invalidate, so a load that started before it isn't stored
+        self._generation = 0
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            generation = self._generation
+        if entry is not None and entry[0] > now:
+            metrics.cache_hit(self.name, True)
+            return entry[1]
+
+        metrics.cache_hit(self.name, False)
+        value = loader()
+        with self._lock:
+            if generation == self._generation:
+                if len(self._data) >= self.maxsize and key not in self._data:
+                    self._data.pop(next(iter(self._data)))
+                self._data[key] = (now + self.ttl, value)
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """key=None → everything"""
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,3 +1,4 @@
+import html
 import json
 import re
 from datetime import datetime
@@ -37,6 +38,30 @@ def shorter(text: str, limit: int = 250) -> str:
     return text[:limit] + "..."
 
 
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def plain_text(content: str) -> str:
+    """HTML news content → one line of plain text."""
+    if not content:
+        return ""
+    return clean_text(html.unescape(_TAG_RE.sub(" ", content)))
+
+
+def make_excerpt(content: str, limit: int = 180) -> str:
+    """Plain-text excerpt cut on a word boundary (list cards, og:description)."""
+    text = plain_text(content)
+    if len(text) <= limit:
+        return text
+    cut = text[:limit].rsplit(" ", 1)[0] or text[:limit]
+    return cut.rstrip(" ,.;:—-") + "…"
+
+
+def reading_time_minutes(content: str, words_per_minute: int = 200) -> int:
+    words = len(plain_text(content).split())
+    return max(1, round(words / words_per_minute))
+
+
 # -----------------------------
 # JSON helpers
 # -----------------------------
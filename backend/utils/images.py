@@ -0,0 +1,40 @@
+# backend/utils/images.py
+#
+# Resized JPEG variants for uploaded news images (Pillow).
+
+from pathlib import Path
+from typing import Dict
+
+from PIL import Image, ImageOps
+
+VARIANT_WIDTHS = (480, 960, 1600)
+JPEG_QUALITY = 82
+
+
+def make_variants(src: Path, widths=VARIANT_WIDTHS) -> Dict[int, Path]:
+    """
+    src → {width: path} next to it (<stem>-<width>.jpg), never upscaled.
+    EXIF orientation is applied and metadata dropped. Animated GIFs → {}
+    (kept as uploaded).
+    """
+    with Image.open(src) as im:
+        if getattr(im, "is_animated", False):
+            return {}
+        im = ImageOps.exif_transpose(im)
+        if im.mode in ("RGBA", "LA", "P"):
+            im = im.convert("RGBA")
+            background = Image.new("RGB", im.size, (255, 255, 255))
+            background.paste(im, mask=im.getchannel("A"))
+            im = background
+        elif im.mode != "RGB":
+            im = im.convert("RGB")
+
+        targets = sorted({min(w, im.width) for w in widths})
+        out: Dict[int, Path] = {}
+        for width in targets:
+            height = max(1, round(im.height * width / im.width))
+            resized = im if width == im.width else im.resize((width, height), Image.LANCZOS)
+            path = src.with_name(f"{src.stem}-{width}.jpg")
+            resized.save(path, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+            out[width] = path
+        return out
@@ -0,0 +1,306 @@
+# backend/utils/metrics.py
+#
+# Tiny in-process metrics registry + ASGI middleware, exposed as Prometheus text.
+#
+# Per request a contextvar collects DB and template render time; the middleware
+# turns it into histograms and a Server-Timing header (db / render / app).
+
+import asyncio
+import contextvars
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from backend.utils.logger import logger
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+PREFIX = "askyerevan_"
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt(v: float) -> str:
+    return repr(float(v)) if v != int(v) else str(int(v))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Iterable[str] = ()):
+        self.name = PREFIX + name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.name += "_total"
+        self._values: Dict[tuple, float] = {}
+
+    def inc(self, *labelvalues, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def value(self, *labelvalues) -> float:
+        return self._values.get(labelvalues, 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_labels(self.labelnames, k)} {_fmt(v)}" for k, v in items
+        ]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[tuple, float] = {}
+
+    def set(self, value: float, *labelvalues) -> None:
+        with self._lock:
+            self._values[labelvalues] = value
+
+    def inc(self, *labelvalues, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def dec(self, *labelvalues, amount: float = 1.0) -> None:
+        self.inc(*labelvalues, amount=-amount)
+
+    def value(self, *labelvalues) -> float:
+        return self._values.get(labelvalues, 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_labels(self.labelnames, k)} {_fmt(v)}" for k, v in items
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: Iterable[str] = (),
+                 buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labelvalues → [per-bucket counts..., +Inf count], sum
+        self._counts: Dict[tuple, List[int]] = {}
+        self._sums: Dict[tuple, float] = {}
+
+    def observe(self, value: float, *labelvalues) -> None:
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(labelvalues)
+            if counts is None:
+                counts = self._counts[labelvalues] = [0] * (len(self.buckets) + 1)
+                self._sums[labelvalues] = 0.0
+            counts[i] += 1
+            self._sums[labelvalues] += value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, list(c), self._sums[k]) for k, c in self._counts.items())
+        lines = self._header()
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets, counts):
+                cumulative += n
+                le = 'le="%s"' % _fmt(bound)
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            cumulative += counts[-1]
+            le = 'le="+Inf"'
+            lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_fmt(round(total, 6))}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], List[str]]] = []
+
+    def counter(self, *args, **kwargs) -> Counter:
+        return self._add(Counter(*args, **kwargs))
+
+    def gauge(self, *args, **kwargs) -> Gauge:
+        return self._add(Gauge(*args, **kwargs))
+
+    def histogram(self, *args, **kwargs) -> Histogram:
+        return self._add(Histogram(*args, **kwargs))
+
+    def _add(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, fn: Callable[[], List[str]]) -> None:
+        """fn() → ready-made exposition lines, called on every scrape."""
+        self._collectors.append(fn)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines += metric.render()
+        for fn in self._collectors:
+            try:
+                lines += fn()
+            except Exception as e:
+                logger.warning(f"Metrics collector failed: {e}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+HTTP_REQUESTS = registry.counter(
+    "http_requests", "HTTP requests by route template, method and status.", ("route", "method", "status")
+)
+HTTP_LATENCY = registry.histogram(
+    "http_request_duration_seconds", "Time until the response body is sent.", ("route", "method")
+)
+HTTP_RESPONSE_SIZE = registry.histogram(
+    "http_response_size_bytes", "Response body size.", ("route", "method"), buckets=SIZE_BUCKETS
+)
+HTTP_IN_FLIGHT = registry.gauge("http_requests_in_flight", "Requests currently being served.")
+DB_TIME = registry.histogram("db_time_seconds", "DB time spent per request.", ("route",))
+RENDER_TIME = registry.histogram("template_render_seconds", "Jinja2 render time.", ("template",))
+DB_CONNECTIONS_OPEN = registry.gauge("db_connections_open", "DB connections currently open.")
+DB_CONNECTIONS = registry.counter("db_connections_opened", "DB connections opened (no pool: one per call).")
+DB_QUERIES = registry.counter("db_queries", "SQL statements executed.")
+LOOP_LAG = registry.histogram("event_loop_lag_seconds", "Event loop scheduling delay.", buckets=LAG_BUCKETS)
+LOOP_LAG_LAST = registry.gauge("event_loop_lag_last_seconds", "Most recent event loop lag sample.")
+CACHE_LOOKUPS = registry.counter("cache_lookups", "Cache lookups by cache and result.", ("cache", "result"))
+
+
+# ── per-request timings ──────────────────────────────────────────────────────
+
+_timings: contextvars.ContextVar[Optional[Dict[str, float]]] = contextvars.ContextVar(
+    "request_timings", default=None
+)
+
+
+def add_timing(kind: str, seconds: float) -> None:
+    """Adds to the current request's "db" / "render" bucket (no-op outside a request)."""
+    timings = _timings.get()
+    if timings is not None:
+        timings[kind] = timings.get(kind, 0.0) + seconds
+
+
+def cache_hit(cache: str, hit: bool) -> None:
+    CACHE_LOOKUPS.inc(cache, "hit" if hit else "miss")
+
+
+def lru_cache_collector(caches: Dict[str, Callable]) -> Callable[[], List[str]]:
+    """Collector for functools.lru_cache-wrapped functions: {label: fn}."""
+    name = PREFIX + "lru_cache_lookups_total"
+
+    def collect() -> List[str]:
+        lines = [
+            f"# HELP {name} functools.lru_cache lookups by cache and result.",
+            f"# TYPE {name} counter",
+        ]
+        for label, fn in sorted(caches.items()):
+            info = fn.cache_info()
+            lines.append(f'{name}{{cache="{label}",result="hit"}} {info.hits}')
+            lines.append(f'{name}{{cache="{label}",result="miss"}} {info.misses}')
+        return lines
+
+    return collect
+
+
+def _route_label(scope: dict) -> str:
+    route = scope.get("route")
+    if route is not None and getattr(route, "path", None):
+        return route.path
+    path = scope.get("path", "")
+    if path.startswith("/static/"):
+        return "/static"
+    return "unmatched"   # 404s — keep arbitrary paths out of the label set
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware (doesn't buffer bodies like BaseHTTPMiddleware)."""
+
+    def __init__(self, app, skip_paths: Tuple[str, ...] = ("/metrics",)):
+        self.app = app
+        self.skip_paths = skip_paths
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("path") in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        timings: Dict[str, float] = {}
+        token = _timings.set(timings)
+        started = time.perf_counter()
+        status = 500
+        size = 0
+        HTTP_IN_FLIGHT.inc()
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                app_ms = (time.perf_counter() - started) * 1000
+                header = (
+                    f"db;dur={timings.get('db', 0.0) * 1000:.1f}, "
+                    f"render;dur={timings.get('render', 0.0) * 1000:.1f}, "
+                    f"app;dur={app_ms:.1f}"
+                )
+                message = dict(message)
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", header.encode("latin-1"))
+                ]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            route = _route_label(scope)
+            method = scope.get("method", "GET")
+            HTTP_IN_FLIGHT.dec()
+            HTTP_REQUESTS.inc(route, method, str(status))
+            HTTP_LATENCY.observe(elapsed, route, method)
+            HTTP_RESPONSE_SIZE.observe(size, route, method)
+            DB_TIME.observe(timings.get("db", 0.0), route)
+            _timings.reset(token)
+
+
+# ── event loop lag ───────────────────────────────────────────────────────────
+
+async def monitor_event_loop_lag(interval: float = 0.5) -> None:
+    """Sleeps `interval` and records how late the wake-up was."""
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lag = max(0.0, loop.time() - expected)
+        LOOP_LAG.observe(lag)
+        LOOP_LAG_LAST.set(lag)
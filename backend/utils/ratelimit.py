@@ -0,0 +1,182 @@
+# backend/utils/ratelimit.py
+
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from backend.config.settings import settings
+from backend.utils.logger import logger
+
+
+@dataclass(frozen=True)
+class Budget:
+    """Token bucket: `burst` requests at once, refilled at `per_minute`."""
+    burst: int
+    per_minute: float
+
+    @property
+    def refill_per_sec(self) -> float:
+        return self.per_minute / 60.0
+
+
+# Per-endpoint budgets for the public place APIs.
+# "session" → place_session cookie, "ip" → client address (looser, NAT-friendly).
+PLACE_WRITE_BUDGETS: Dict[str, Dict[str, Budget]] = {
+    "like":    {"session": Budget(burst=20, per_minute=30), "ip": Budget(burst=60, per_minute=120)},
+    "rating":  {"session": Budget(burst=10, per_minute=10), "ip": Budget(burst=30, per_minute=60)},
+    "comment": {"session": Budget(burst=3,  per_minute=3),  "ip": Budget(burst=10, per_minute=20)},
+}
+
+
+class MemoryBucketStore:
+    """In-process buckets (single worker / local dev)."""
+
+    def __init__(self):
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def take(self, key: str, budget: Budget, now: float) -> Tuple[bool, float]:
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (float(budget.burst), now))
+            tokens = min(budget.burst, tokens + max(0.0, now - updated_at) * budget.refill_per_sec)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+            return allowed, tokens
+
+    def refund(self, key: str, budget: Budget) -> None:
+        with self._lock:
+            if key in self._buckets:
+                tokens, updated_at = self._buckets[key]
+                self._buckets[key] = (min(float(budget.burst), tokens + 1), updated_at)
+
+    def cleanup(self, older_than: float) -> int:
+        with self._lock:
+            stale = [k for k, (_, ts) in self._buckets.items() if ts < older_than]
+            for k in stale:
+                del self._buckets[k]
+            return len(stale)
+
+
+class DatabaseBucketStore:
+    """Buckets in the rate_limit_buckets table — shared by every uvicorn worker."""
+
+    def take(self, key: str, budget: Budget, now: float) -> Tuple[bool, float]:
+        from backend.database import take_rate_limit_token
+        return take_rate_limit_token(key, budget.burst, budget.refill_per_sec, now)
+
+    def refund(self, key: str, budget: Budget) -> None:
+        from backend.database import refund_rate_limit_token
+        refund_rate_limit_token(key, budget.burst)
+
+    def cleanup(self, older_than: float) -> int:
+        from backend.database import cleanup_rate_limit_buckets
+        return cleanup_rate_limit_buckets(older_than)
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter keyed by session and client IP.
+    check() returns 0 when the request may proceed, otherwise the number
+    of seconds the client should wait (for the Retry-After header). A
+    rejected request costs nothing: tokens taken from the other buckets are
+    given back.
+    """
+
+    CLEANUP_EVERY = 600      # seconds between stale-bucket sweeps
+    BUCKET_TTL = 24 * 3600   # buckets idle this long are dropped
+
+    def __init__(self, store, budgets: Dict[str, Dict[str, Budget]], enabled: bool = True):
+        self.store = store
+        self.budgets = budgets
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._allowed: Dict[str, int] = defaultdict(int)
+        self._rejected: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._last_cleanup = time.time()
+
+    def check(self, endpoint: str, client_ip: str, session_id: Optional[str]) -> float:
+        if not self.enabled or endpoint not in self.budgets:
+            return 0.0
+
+        now = time.time()
+        keys = [("ip", f"{endpoint}:ip:{client_ip}")]
+        if session_id:
+            keys.append(("session", f"{endpoint}:sid:{session_id}"))
+
+        taken = []
+        for scope, key in keys:
+            budget = self.budgets[endpoint][scope]
+            try:
+                allowed, tokens = self.store.take(key, budget, now)
+                if not allowed:
+                    for taken_key, taken_budget in taken:
+                        self.store.refund(taken_key, taken_budget)
+            except Exception as e:
+                # Limiter-ի սխալը չպետք է կոտրի like/comment-ը → fail open
+                logger.error(f"❌ Rate limiter store error ({endpoint}): {e}")
+                return 0.0
+            if not allowed:
+                with self._lock:
+                    self._rejected[(endpoint, scope)] += 1
+                return max(1.0, (1 - tokens) / budget.refill_per_sec)
+            taken.append((key, budget))
+
+        with self._lock:
+            self._allowed[endpoint] += 1
+        self._maybe_cleanup(now)
+        return 0.0
+
+    def _maybe_cleanup(self, now: float) -> None:
+        if now - self._last_cleanup < self.CLEANUP_EVERY:
+            return
+        self._last_cleanup = now
+        try:
+            self.store.cleanup(now - self.BUCKET_TTL)
+        except Exception as e:
+            logger.warning(f"Rate limiter cleanup failed: {e}")
+
+    def stats(self) -> dict:
+        """Counters since process start: {"allowed": {...}, "rejected": {...}}"""
+        with self._lock:
+            return {
+                "allowed": dict(self._allowed),
+                "rejected": {f"{e}:{s}": n for (e, s), n in self._rejected.items()},
+            }
+
+    def prometheus_lines(self) -> list:
+        """Counters in Prometheus text exposition format."""
+        lines = [
+            "# HELP askyerevan_ratelimit_allowed_total Place API writes let through by the limiter.",
+            "# TYPE askyerevan_ratelimit_allowed_total counter",
+        ]
+        with self._lock:
+            for endpoint, n in sorted(self._allowed.items()):
+                lines.append(f'askyerevan_ratelimit_allowed_total{{endpoint="{endpoint}"}} {n}')
+            lines += [
+                "# HELP askyerevan_ratelimit_rejected_total Place API writes answered with 429.",
+                "# TYPE askyerevan_ratelimit_rejected_total counter",
+            ]
+            for (endpoint, scope), n in sorted(self._rejected.items()):
+                lines.append(
+                    f'askyerevan_ratelimit_rejected_total{{endpoint="{endpoint}",key="{scope}"}} {n}'
+                )
+        return lines
+
+
+def client_ip(request, trusted_hops: Optional[int] = None) -> str:
+    """
+    Client address for the IP buckets. Each proxy in front of us appends the
+    address it got the request from to X-Forwarded-For, so with TRUSTED_PROXY_HOPS
+    proxies the client is the hop that many places from the right. Hops left of
+    it are whatever the client sent and are ignored (a spoofed header must not
+    buy a fresh bucket). 0 → the socket peer.
+    """
+    trusted_hops = settings.TRUSTED_PROXY_HOPS if trusted_hops is None else trusted_hops
+    hops = [h.strip() for h in request.headers.get("x-forwarded-for", "").split(",") if h.strip()]
+    if trusted_hops > 0 and hops:
+        return hops[-min(trusted_hops, len(hops))]
+    return request.client.host if request.client else "unknown"
@@ -0,0 +1,142 @@
+# backend/utils/uploads.py
+#
+# Admin image uploads: size-limited, streamed to disk in chunks off the event
+# loop, type checked by magic bytes (not by filename / client content-type).
+
+import asyncio
+import os
+import uuid
+from pathlib import Path
+from typing import Optional, Tuple
+
+from fastapi import UploadFile
+
+CHUNK_SIZE = 256 * 1024
+
+# magic prefix → (extension, mime)
+_IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", ("jpg", "image/jpeg")),
+    (b"\x89PNG\r\n\x1a\n", ("png", "image/png")),
+    (b"GIF87a", ("gif", "image/gif")),
+    (b"GIF89a", ("gif", "image/gif")),
+)
+
+
+class UploadRejected(ValueError):
+    """Upload is too large or not an allowed image. str(e) is shown to the admin."""
+
+
+def sniff_image_type(head: bytes) -> Optional[Tuple[str, str]]:
+    """First bytes of a file → (ext, mime) or None."""
+    for magic, kind in _IMAGE_SIGNATURES:
+        if head.startswith(magic):
+            return kind
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp", "image/webp"
+    return None
+
+
+async def save_image_upload(upload: UploadFile, dest_dir: str, stem: str, max_bytes: int) -> Path:
+    """
+    Writes `upload` to dest_dir/<stem>-<token>.<sniffed ext> and returns the path.
+    Raises UploadRejected (nothing is left on disk) if it is too large or not an image.
+    """
+    if upload.content_type and not upload.content_type.startswith("image/"):
+        raise UploadRejected(f"Թույլատրված են միայն նկարներ ({upload.content_type})")
+
+    os.makedirs(dest_dir, exist_ok=True)
+    tmp_path = Path(dest_dir) / f".upload-{uuid.uuid4().hex}.part"
+    written = 0
+    kind = None
+    f = await asyncio.to_thread(open, tmp_path, "wb")
+    try:
+        while True:
+            chunk = await upload.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            if kind is None:
+                kind = sniff_image_type(chunk)
+                if kind is None:
+                    raise UploadRejected("Ֆայլը JPEG/PNG/WebP/GIF նկար չէ")
+            written += len(chunk)
+            if written > max_bytes:
+                raise UploadRejected(f"Նկարը մեծ է {max_bytes // (1024 * 1024)} MB-ից")
+            await asyncio.to_thread(f.write, chunk)
+        if kind is None:
+            raise UploadRejected("Ֆայլը դատարկ է")
+    except BaseException:
+        await asyncio.to_thread(f.close)
+        tmp_path.unlink(missing_ok=True)
+        raise
+    await asyncio.to_thread(f.close)
+
+    final_path = Path(dest_dir) / f"{stem}-{uuid.uuid4().hex[:8]}.{kind[0]}"
+    os.replace(tmp_path, final_path)
+    return final_path
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Rejects oversized request bodies under `path_prefix` with 413 before the
+    multipart parser spools them (Content-Length check + running byte count).
+    """
+
+    def __init__(self, app, max_body_bytes: int, path_prefix: str = "/admin/"):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope.get("method") != "POST"
+            or not scope.get("path", "").startswith(self.path_prefix)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope.get("headers", []):
+            if name == b"content-length":
+                if value.isdigit() and int(value) > self.max_body_bytes:
+                    await self._reject(send)
+                    return
+                break
+
+        received = 0
+        response_started = False
+
+        class _TooLarge(Exception):
+            pass
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    raise _TooLarge()
+            return message
+
+        async def tracking_send(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracking_send)
+        except _TooLarge:
+            if not response_started:
+                await self._reject(send)
+
+    async def _reject(self, send) -> None:
+        body = "Request body too large".encode()
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -4,17 +4,43 @@ from backend.admin_routes import router as admin_router
 from backend.churches_data import CHURCHES
 from backend.sights_data import SIGHTS
 from backend.places_data import PLACES
-from fastapi.templating import Jinja2Templates
-from fastapi.staticfiles import StaticFiles
 from datetime import date
 from pathlib import Path
+import os
 import uuid
+import random
+import asyncio
+
+from backend.config.settings import settings
+from backend.templating import templates, precompile_templates
+from backend.assets import FingerprintedStaticFiles, manifest as asset_manifest
+from backend.utils.metrics import (
+    registry as metrics_registry,
+    MetricsMiddleware,
+    monitor_event_loop_lag,
+    lru_cache_collector,
+)
+from backend.utils.ratelimit import (
+    RateLimiter,
+    MemoryBucketStore,
+    DatabaseBucketStore,
+    PLACE_WRITE_BUDGETS,
+    client_ip,
+)
+from backend.like_buffer import LikeBuffer
+from backend.media_worker import media_worker
+from backend.utils.uploads import UploadSizeLimitMiddleware
+from backend.invalidation import InvalidationListener, on_invalidate
+from backend.utils.cache import TTLCache
+from backend.catalog.items import card
+from backend.catalog.search import get_index as get_catalog_index, canonical
+from backend.catalog.geo import get_geo_index
 
 from backend.database import (
     init_db,
-    get_all_news,
+    get_news_cards,
     get_news_by_id,
-    get_random_news_with_image,
+    get_news_image_pool,
     toggle_place_like,
     get_place_likes,
     set_place_rating,
@@ -22,6 +48,7 @@ from backend.database import (
     add_place_comment,
     get_place_comments,
     get_place_comment_count,
+    get_place_summary,
 )
 
 import logging
@@ -39,6 +66,85 @@ except Exception as e:
 
 app = FastAPI(title="AskYerevan Web")
 app.include_router(admin_router)
+# admin forms: one image (UPLOAD_MAX_MB) + text fields
+app.add_middleware(UploadSizeLimitMiddleware, max_body_bytes=(settings.UPLOAD_MAX_MB + 1) * 1024 * 1024)
+app.add_middleware(MetricsMiddleware)
+
+like_buffer = LikeBuffer(flush_interval=settings.PLACE_LIKES_FLUSH_MS / 1000)
+hero_pool = TTLCache("hero_pool", ttl=settings.HERO_POOL_TTL)
+news_items = TTLCache("news_item", ttl=settings.NEWS_ITEM_TTL, maxsize=1024)
+invalidation_listener = InvalidationListener(poll_interval=settings.INVALIDATION_POLL_MS / 1000)
+
+# Other workers' writes (and our own) arrive here — see backend/invalidation.py
+def _news_changed(key):
+    """key = news id for single-row edits, None for inserts / bulk deletes."""
+    hero_pool.invalidate()
+    news_items.invalidate(int(key) if key else None)
+
+
+on_invalidate("news", _news_changed)
+on_invalidate("place", like_buffer.invalidate)
+
+
+@app.on_event("startup")
+async def start_invalidation_listener():
+    invalidation_listener.start()
+
+
+@app.on_event("startup")
+async def start_like_buffer():
+    if settings.PLACE_LIKES_BUFFERED:
+        like_buffer.start()
+
+
+@app.on_event("startup")
+async def start_media_worker():
+    media_worker.start()
+
+
+@app.on_event("startup")
+async def start_loop_lag_monitor():
+    app.state.loop_lag_task = asyncio.create_task(monitor_event_loop_lag())
+
+
+@app.on_event("startup")
+async def warm_templates():
+    if settings.TEMPLATES_PRECOMPILE:
+        await asyncio.to_thread(precompile_templates)
+
+
+@app.on_event("startup")
+async def load_asset_manifest():
+    if settings.ASSET_FINGERPRINTS:
+        await asyncio.to_thread(asset_manifest.load)
+
+
+@app.on_event("startup")
+async def warm_catalog_index():
+    # built off the event loop so the first search doesn't pay for it
+    await asyncio.to_thread(get_catalog_index)
+
+
+@app.on_event("shutdown")
+async def flush_like_buffer():
+    if settings.PLACE_LIKES_BUFFERED:
+        await like_buffer.stop()
+
+
+@app.on_event("shutdown")
+async def stop_media_worker():
+    await media_worker.stop()
+
+
+@app.on_event("shutdown")
+async def stop_invalidation_listener():
+    await asyncio.to_thread(invalidation_listener.stop)
+
+
+def random_hero(category: str):
+    """Պատահական նկարով news — pool-ը cache-ում է, ORDER BY RANDOM() ամեն request-ի վրա չի արվում"""
+    pool = hero_pool.get_or_load(category, lambda: get_news_image_pool(category))
+    return random.choice(pool) if pool else None
 
 
 def is_winter_theme_enabled() -> bool:
@@ -56,8 +162,7 @@ def is_winter_theme_enabled() -> bool:
         return prev_start <= today <= prev_end
 
 
-templates = Jinja2Templates(directory="templates")
-app.mount("/static", StaticFiles(directory="static"), name="static")
+app.mount("/static", FingerprintedStaticFiles(directory="static"), name="static")
 
 # --- SITEMAP CONFIG -------------------------------------------------
 
@@ -83,9 +188,9 @@ async def root_redirect(request: Request):
 # Index
 @app.get("/hy", response_class=HTMLResponse)
 async def indexhy(request: Request):
-    hero_events = get_random_news_with_image("events")
-    hero_city = get_random_news_with_image("city")
-    hero_culture = get_random_news_with_image("culture")
+    hero_events = random_hero("events")
+    hero_city = random_hero("city")
+    hero_culture = random_hero("culture")
 
     return templates.TemplateResponse(
         "index_hy.html",
@@ -102,9 +207,9 @@ async def indexhy(request: Request):
 
 @app.get("/en", response_class=HTMLResponse)
 async def indexen(request: Request):
-    hero_events = get_random_news_with_image("events")
-    hero_city = get_random_news_with_image("city")
-    hero_culture = get_random_news_with_image("culture")
+    hero_events = random_hero("events")
+    hero_city = random_hero("city")
+    hero_culture = random_hero("culture")
 
     return templates.TemplateResponse(
         "index_en.html",
@@ -182,7 +287,7 @@ async def church_detail_en(request: Request, church_id: str):
 # News list
 @app.get("/hy/news", response_class=HTMLResponse)
 async def news_hy(request: Request, category: str = Query(None)):
-    news_list = get_all_news(limit=50, category=category)
+    news_list = get_news_cards(limit=50, category=category)
     return templates.TemplateResponse(
         "news_hy.html",
         {
@@ -197,7 +302,7 @@ async def news_hy(request: Request, category: str = Query(None)):
 
 @app.get("/en/news", response_class=HTMLResponse)
 async def news_en(request: Request, category: str = Query(None)):
-    news_list = get_all_news(limit=50, category=category)
+    news_list = get_news_cards(limit=50, category=category)
     return templates.TemplateResponse(
         "news_en.html",
         {
@@ -212,7 +317,7 @@ async def news_en(request: Request, category: str = Query(None)):
 # Single news HY
 @app.get("/hy/news/{news_id}", response_class=HTMLResponse)
 async def news_detail_hy(request: Request, news_id: int):
-    news_item = get_news_by_id(news_id)
+    news_item = news_items.get_or_load(news_id, lambda: get_news_by_id(news_id))
     if not news_item:
         return RedirectResponse(url="/hy/news")
 
@@ -239,7 +344,7 @@ async def news_detail_hy(request: Request, news_id: int):
 # Single news EN
 @app.get("/en/news/{news_id}", response_class=HTMLResponse)
 async def news_detail_en(request: Request, news_id: int):
-    news_item = get_news_by_id(news_id)
+    news_item = news_items.get_or_load(news_id, lambda: get_news_by_id(news_id))
     if not news_item:
         return RedirectResponse(url="/en/news")
 
@@ -357,12 +462,15 @@ async def place_detail_hy(request: Request, place_id: str):
     place = get_place_by_id(place_id)
     if not place:
         return RedirectResponse(url="/hy/places")
+    session_id = request.cookies.get("place_session") or ""
+    stats = place_summary(place_id, session_id)
     return templates.TemplateResponse(
         "places_detail_hy.html",
         {
             "request":         request,
             "lang":            "hy",
             "place":           place,
+            "stats":           stats,
             "backurl":         "/hy/places",
             "is_winter_theme": is_winter_theme_enabled(),
         },
@@ -373,12 +481,15 @@ async def place_detail_en(request: Request, place_id: str):
     place = get_place_by_id(place_id)
     if not place:
         return RedirectResponse(url="/en/places")
+    session_id = request.cookies.get("place_session") or ""
+    stats = place_summary(place_id, session_id)
     return templates.TemplateResponse(
         "places_detail_en.html",
         {
             "request":         request,
             "lang":            "en",
             "place":           place,
+            "stats":           stats,
             "backurl":         "/en/places",
             "is_winter_theme": is_winter_theme_enabled(),
         },
@@ -388,6 +499,39 @@ async def place_detail_en(request: Request, place_id: str):
 # Places API (likes / ratings / comments)
 # ════════════════════════════════
 
+place_limiter = RateLimiter(
+    store=MemoryBucketStore() if settings.RATE_LIMIT_STORE == "memory" else DatabaseBucketStore(),
+    budgets=PLACE_WRITE_BUDGETS,
+    enabled=settings.RATE_LIMIT_ENABLED,
+)
+
+
+def rate_limited(request: Request, endpoint: str):
+    """Returns a 429 response if the caller is over budget, else None."""
+    retry_after = place_limiter.check(
+        endpoint,
+        client_ip(request),
+        request.cookies.get("place_session"),
+    )
+    if not retry_after:
+        return None
+    return JSONResponse(
+        content={"error": "Too many requests"},
+        status_code=429,
+        headers={"Retry-After": str(int(retry_after + 0.999))},
+    )
+
+
+def place_summary(place_id: str, session_id: str) -> dict:
+    """get_place_summary() with not-yet-flushed like toggles applied."""
+    stats = get_place_summary(
+        place_id, session_id, comments_limit=settings.PLACE_COMMENTS_PAGE_SIZE
+    )
+    if settings.PLACE_LIKES_BUFFERED:
+        stats["likes"] = like_buffer.overlay(place_id, session_id, stats["likes"])
+    return stats
+
+
 def get_or_create_session(request: Request, response: JSONResponse) -> str:
     session_id = request.cookies.get("place_session")
     if not session_id:
@@ -404,9 +548,14 @@ def get_or_create_session(request: Request, response: JSONResponse) -> str:
 
 @app.post("/api/places/{place_id}/like")
 async def api_place_like(place_id: str, request: Request):
-    response = JSONResponse(content={})
+    limited = rate_limited(request, "like")
+    if limited:
+        return limited
     session_id = request.cookies.get("place_session") or str(uuid.uuid4())
-    result = toggle_place_like(place_id, session_id)
+    if settings.PLACE_LIKES_BUFFERED:
+        result = like_buffer.toggle(place_id, session_id)
+    else:
+        result = toggle_place_like(place_id, session_id)
     resp = JSONResponse(content=result)
     resp.set_cookie(
         key="place_session",
@@ -422,11 +571,16 @@ async def api_place_like(place_id: str, request: Request):
 async def api_place_likes(place_id: str, request: Request):
     session_id = request.cookies.get("place_session") or ""
     result = get_place_likes(place_id, session_id)
+    if settings.PLACE_LIKES_BUFFERED:
+        result = like_buffer.overlay(place_id, session_id, result)
     return JSONResponse(content=result)
 
 
 @app.post("/api/places/{place_id}/rating")
 async def api_place_rating_set(place_id: str, request: Request):
+    limited = rate_limited(request, "rating")
+    if limited:
+        return limited
     body = await request.json()
     rating = int(body.get("rating", 0))
     if not 1 <= rating <= 5:
@@ -453,6 +607,9 @@ async def api_place_rating_get(place_id: str, request: Request):
 
 @app.post("/api/places/{place_id}/comments")
 async def api_place_comment_add(place_id: str, request: Request):
+    limited = rate_limited(request, "comment")
+    if limited:
+        return limited
     body = await request.json()
     text = str(body.get("text", "")).strip()
     rating = int(body.get("rating", 0))
@@ -471,14 +628,79 @@ async def api_place_comment_add(place_id: str, request: Request):
     return resp
 
 
+@app.get("/api/places/{place_id}/summary")
+async def api_place_summary(place_id: str, request: Request):
+    session_id = request.cookies.get("place_session") or ""
+    result = place_summary(place_id, session_id)
+    return JSONResponse(content=result)
+
+
 @app.get("/api/places/{place_id}/comments")
-async def api_place_comments_get(place_id: str):
-    comments = get_place_comments(place_id)
-    for c in comments:
-        if hasattr(c.get("created_at"), "isoformat"):
-            c["created_at"] = c["created_at"].isoformat()
-    return JSONResponse(content=comments)
-    
+async def api_place_comments_get(
+    place_id: str,
+    cursor: str = Query(None),
+    limit: int = Query(None),
+):
+    page_size = min(max(limit or settings.PLACE_COMMENTS_PAGE_SIZE, 1), 50)
+    try:
+        page = get_place_comments(place_id, limit=page_size, cursor=cursor)
+    except ValueError:
+        return JSONResponse(content={"error": "Invalid cursor"}, status_code=400)
+    return JSONResponse(content=page)
+
+
+# ════════════════════════════════
+# Catalog search (churches / sights / places)
+# ════════════════════════════════
+
+@app.get("/api/catalog/search")
+async def api_catalog_search(
+    q: str = Query(""),
+    lang: str = Query("hy"),
+    limit: int = Query(10),
+):
+    lang = lang if lang in ("hy", "en") else "hy"
+    q = q[:100]
+    limit = min(max(limit, 1), 30)
+    hits = get_catalog_index().search(q, limit=limit)
+    return JSONResponse(content={
+        "query": q,
+        "results": [{**card(kind, item, lang), "score": score} for kind, item, score in hits],
+    })
+
+
+
+@app.get("/api/nearby")
+async def api_nearby(
+    lat: float = Query(...),
+    lon: float = Query(...),
+    radius_km: float = Query(None),
+    limit: int = Query(10),
+    kind: str = Query(None),
+    lang: str = Query("hy"),
+):
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        return JSONResponse(content={"error": "Invalid coordinates"}, status_code=400)
+    lang = lang if lang in ("hy", "en") else "hy"
+    limit = min(max(limit, 1), 50)
+    index = get_geo_index()
+
+    if radius_km is not None:
+        hits = index.within(lat, lon, min(max(radius_km, 0.0), 500.0))
+    else:
+        # without a kind filter k-nearest is enough; with one, over-fetch and filter
+        hits = index.nearest(lat, lon, k=limit if not kind else len(index))
+    if kind:
+        hits = [h for h in hits if h[1][0] == kind]
+
+    return JSONResponse(content={
+        "results": [
+            {**card(k, item, lang), "distance_km": km, "lat": item["lat"], "lon": item["lon"]}
+            for km, (k, item) in hits[:limit]
+        ],
+    })
+
+
 # About
 @app.get("/hy/about", response_class=HTMLResponse)
 async def about_hy(request: Request):
@@ -506,4 +728,14 @@ async def about_en(request: Request):
 # Healthcheck
 @app.get("/health")
 async def health():
-    return {"status": "ok"}
+    return {"status": "ok", "pid": os.getpid()}
+
+
+# Metrics (Prometheus text format)
+metrics_registry.register_collector(place_limiter.prometheus_lines)
+metrics_registry.register_collector(lru_cache_collector({"catalog_canonical": canonical}))
+
+
+@app.get("/metrics")
+async def metrics():
+    return Response(content=metrics_registry.render(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,11 @@
+# tests/conftest.py
+
+import os
+import tempfile
+
+# before backend.database is imported: never create / touch data/bot.db
+os.environ.setdefault("SQLITE_PATH", os.path.join(tempfile.mkdtemp(prefix="askyerevan-tests-"), "bot.db"))
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: starts server processes (deselect with -m 'not slow')")
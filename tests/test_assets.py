@@ -0,0 +1,53 @@
+# tests/test_assets.py
+
+import os
+
+import pytest
+
+from backend import assets
+from backend.assets import AssetManifest, build_manifest, read_manifest, refresh_manifest
+
+
+@pytest.fixture
+def static(tmp_path, monkeypatch):
+    for rel, body in {
+        "css/main.css": "body{}",
+        "js/app.js": "1",
+        "img/logo/logo.png": "png",
+        "img/important/upload.jpg": "admin upload",
+        "img/events/abc.jpg": "mirrored",
+        "robots.txt": "outside the asset dirs",
+    }.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(body)
+    monkeypatch.setattr(assets.settings, "IMAGE_MIRROR_DIR", str(tmp_path / "img" / "events"))
+    return tmp_path
+
+
+def test_only_bundled_assets_are_fingerprinted(static):
+    assert sorted(build_manifest(str(static))) == ["css/main.css", "img/logo/logo.png", "js/app.js"]
+
+
+def test_stale_manifest_file_is_rebuilt(static):
+    files, source = refresh_manifest(str(static))
+    assert source == "rebuilt"
+    assert refresh_manifest(str(static)) == (files, "file")
+
+    # a deploy that changes main.css but keeps the old manifest file
+    css = static / "css" / "main.css"
+    css.write_text("body{color:red}")
+    os.utime(css, ns=(1, 1))
+    fresh, source = refresh_manifest(str(static))
+    assert source == "rebuilt"
+    assert fresh["css/main.css"] != files["css/main.css"]
+    assert read_manifest(str(static))[1] == fresh
+
+
+def test_old_format_manifest_is_replaced(static):
+    (static / assets.MANIFEST_NAME).write_text('{"css/main.css": "css/main.0000000000.css"}')
+    manifest = AssetManifest(str(static))
+    hashed = manifest.hashed("css/main.css")
+    assert hashed != "css/main.0000000000.css"
+    assert manifest.original(hashed) == "css/main.css"
+    assert manifest.hashed("img/events/abc.jpg") is None
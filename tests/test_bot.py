@@ -0,0 +1,34 @@
+# tests/test_bot.py
+
+import pytest
+
+from backend.config.settings import settings
+
+settings.BOT_TOKEN = "123456:TEST-TOKEN"   # aiogram validates the format at import
+
+from backend.bot import is_near_me_question  # noqa: E402
+
+
+@pytest.mark.parametrize("text", [
+    "Ո՞ր սրճարաններն են մոտ",
+    "մոտակա թանգարան կա՞",
+    "Ինչ կա իմ շրջակայքում?",
+    "any good food nearby?",
+    "museums near me",
+    "Что интересного рядом?",
+    "kafe mot ka?",
+])
+def test_near_me_question(text):
+    assert is_near_me_question(text)
+
+
+@pytest.mark.parametrize("text", [
+    "Is remote work common in Yerevan?",
+    "Where can I fix my motor bike?",
+    "It costs nearly 5000 dram",
+    "Մոտավորապես որքա՞ն արժե տաքսին",
+    "Ինչ ժամի է բացվում Մատենադարանը",
+    "Где купить билеты в театр?",
+])
+def test_not_near_me_question(text):
+    assert not is_near_me_question(text)
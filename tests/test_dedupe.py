@@ -0,0 +1,50 @@
+# tests/test_dedupe.py
+
+import pytest
+
+from backend.scraping.dedupe import find_match, same_event
+
+
+def _row(title, time="", venue="", date="2026-11-05"):
+    return {"title_hy": title, "title_en": None, "eventdate": date, "eventtime": time, "venue_hy": venue}
+
+
+def test_strict_match_needs_time_or_venue_on_both_sides():
+    a, b = _row("Կարմեն օպերա", "19:00"), _row("Կարմեն օպերա")
+    assert same_event(a, b)
+    assert not same_event(a, b, strict=True)
+    assert find_match(_row("Կարմեն օպերա"), [_row("Կարմեն օպերա")], strict=True) is None
+    assert same_event(a, _row("Կարմեն օպերա", "19.00"), strict=True)
+    assert same_event(_row("Կարմեն", venue="Օպերայի թատրոն"), _row("Կարմեն", venue="Օպերայի"), strict=True)
+
+
+def test_merge_never_deletes_admin_rows(tmp_path, monkeypatch):
+    import backend.database as db
+
+    if db.DATABASE_URL:
+        pytest.skip("SQLite only")
+    monkeypatch.setattr(db, "DB_PATH", tmp_path / "news.db")
+    db.init_db()
+    conn = db.get_connection()
+    cur = conn.cursor()
+    rows = [
+        ("Կարմեն", "19:00", "Օպերա", None),                      # admin, kept
+        ("Կարմեն", "19:00", "Օպերա", None),                      # admin twin — still kept
+        ("Կարմեն", "19:00", "Օպերա", "https://a.example/1"),     # scraped → merged
+        ("Կարմեն", "", "", "https://a.example/2"),               # nothing to corroborate → kept
+    ]
+    for title, time, venue, url in rows:
+        cur.execute(
+            db._q("INSERT INTO news (title_hy, title_en, content_hy, content_en, eventdate, eventtime, venue_hy, source_url)"
+                  " VALUES (%s, '', '', '', %s, %s, %s, %s)"),
+            (title, "2026-11-05", time, venue, url),
+        )
+    conn.commit()
+    conn.close()
+
+    groups = db.merge_duplicate_news()
+    assert [[r["source_url"] for r in g["merged"]] for g in groups] == [["https://a.example/1"]]
+    conn = db.get_connection()
+    left = [tuple(r) for r in conn.execute("SELECT source_url FROM news ORDER BY id")]
+    conn.close()
+    assert left == [(None,), (None,), ("https://a.example/2",)]
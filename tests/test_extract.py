@@ -0,0 +1,110 @@
+# tests/test_extract.py
+
+import pytest
+
+from backend.scraping import extract
+from backend.scraping.standin import SyntheticTomsarkgh
+
+BASE_URL = "https://www.tomsarkgh.am"
+
+BACKENDS = [b for b in extract.BACKENDS if b != "selectolax" or extract.LexborHTMLParser is not None]
+BACKENDS = [b for b in BACKENDS if b != "bs4-lxml" or extract.HAS_LXML]
+
+# Pages without microdata: every field comes from the regex fallbacks / page text.
+FALLBACK_PAGE = """<html><head><title>x</title>
+<style>.a { content: "2020-01-01 10:00" }</style>
+<script>var d = "1999-09-09 09:09";</script>
+</head><body>
+<h1>  Ջազ   երեկո </h1>
+<div class="event_photo"><img src="/thumbnails/Event/7.jpg"></div>
+<p>Ամսաթիվ՝ 2026-11-05, ժամը 19․30</p>
+<p>Moscow Cinema, Աբովյան 18</p>
+<p>Տոմսեր՝ 3000–5000 դր.</p>
+<div class="description">
+  <p>Առաջին   տող</p>
+  <p>  </p>
+  <p>Երկրորդ &amp; <b>վերջին</b> տող</p>
+</div>
+</body></html>"""
+
+MICRODATA_PAGE = """<html><head>
+<meta property="og:image" content=" https://cdn.example.com/a.jpg ">
+<meta property="og:image" content="https://cdn.example.com/second.jpg">
+<meta itemprop="startDate" content="2026-12-30 14:00">
+</head><body>
+<h1 class="event-name">Կարմեն</h1><h1>Other</h1>
+<div class="occurrence_venue"><span itemprop="name"> Օպերայի և բալետի <i>ազգային</i> թատրոն </span></div>
+<span itemprop="offers"><meta itemprop="price" content="8000 AMD"></span>
+<div class="description"><span id="eventDesc"><p>Նկարագրություն</p><p>8000 դր.</p></span></div>
+</body></html>"""
+
+
+def _synthetic_pages(count=15):
+    site = SyntheticTomsarkgh(event_types=(16, 2), per_type=count)
+    ids = sorted(site.events)[:count]
+    return [site.event_page(i, "hy")[1] for i in ids], [site.event_page(i, "en")[1] for i in ids]
+
+
+def _all_backends(fn, *args):
+    results = {b: fn(*args, backend=b) for b in BACKENDS}
+    first = results[BACKENDS[0]]
+    for backend, result in results.items():
+        assert result == first, f"{backend} differs from {BACKENDS[0]}"
+    return first
+
+
+def test_backends_agree_on_synthetic_event_pages():
+    assert len(BACKENDS) >= 2
+    hy, en = _synthetic_pages()
+    for html in hy:
+        page = _all_backends(extract.extract_event, html, BASE_URL)
+        assert page.title and page.description and page.eventdate and page.venue and page.price
+    for html in en:
+        title, desc = _all_backends(extract.extract_event_en, html)
+        assert title.startswith("Event ") and desc
+
+
+def test_backends_agree_on_microdata_fields():
+    page = _all_backends(extract.extract_event, MICRODATA_PAGE, BASE_URL)
+    assert page == extract.EventPage(
+        title="Կարմեն",
+        description="Նկարագրություն\n8000 դր.",
+        eventdate="2026-12-30",
+        eventtime="14:00",
+        # get_text("", strip=True): each string stripped, joined without spaces
+        venue="Օպերայի և բալետիազգայինթատրոն",
+        price="8000",
+        image_url="https://cdn.example.com/a.jpg",
+    )
+
+
+def test_backends_agree_on_text_fallbacks_and_skip_script_style():
+    page = _all_backends(extract.extract_event, FALLBACK_PAGE, BASE_URL)
+    assert page.title == "Ջազ   երեկո"
+    assert page.eventdate == "2026-11-05"
+    assert page.eventtime == "19:30"
+    assert page.venue == "Cinema, Աբովյան 18"
+    assert page.price == "3000-5000"
+    assert page.image_url == BASE_URL + "/thumbnails/Event/7.jpg"
+    assert page.description == "Առաջին   տող\nԵրկրորդ &\nվերջին\nտող"
+
+
+def test_backends_agree_on_links():
+    html = """<div>
+      <a href="/hy/event/1">a</a> <a href="https://www.tomsarkgh.am/hy/event/2">b</a>
+      <a href="/hy/event/1">dup</a> <a href="/hy/venue/3">venue</a> <a href="">empty</a>
+      <a href="/hy/event/4">c</a>
+    </div>"""
+    links = _all_backends(extract.extract_links, html, BASE_URL, "/event/")
+    assert links == [f"{BASE_URL}/hy/event/1", f"{BASE_URL}/hy/event/2", f"{BASE_URL}/hy/event/4"]
+    assert _all_backends(extract.extract_links, html, BASE_URL, "/event/", 2) == links[:2]
+
+
+def test_backends_agree_on_html_to_text():
+    assert _all_backends(extract.html_to_text, "<p>Բարև <b>Երևան</b></p>\n<p> ! </p>") == "Բարև Երևան !"
+    assert extract.html_to_text("  plain text ") == "plain text"
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        extract.extract_event_en("<html></html>", backend="regex")
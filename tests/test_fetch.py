@@ -0,0 +1,149 @@
+# tests/test_fetch.py
+
+import asyncio
+import threading
+
+import pytest
+
+from backend.scraping.fetch import Fetcher, FetchError
+from backend.scraping.standin import StandinServer
+
+
+class _ConcurrencySite:
+    """Every page sleeps a bit; records the peak number of requests in flight."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    async def get(self, path, query):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return 200, f"<p>{path}</p>"
+
+
+class _FlakySite:
+    """Answers the first `failures` requests with `status`, then 200."""
+
+    def __init__(self, failures, status=503):
+        self.failures = failures
+        self.status = status
+        self.calls = 0
+
+    def get(self, path, query):
+        self.calls += 1
+        if self.calls <= self.failures:
+            return self.status, "busy"
+        return 200, "<p>ok</p>"
+
+
+def _fetch_all(fetcher_kwargs, urls):
+    async def run():
+        async with Fetcher(**fetcher_kwargs) as f:
+            texts = await asyncio.gather(*(f.get_text(u) for u in urls))
+            return f, texts
+    return asyncio.run(run())
+
+
+def test_per_host_limit_caps_requests_in_flight_per_host():
+    a, b = _ConcurrencySite(), _ConcurrencySite()
+    with StandinServer(a) as url_a, StandinServer(b) as url_b:
+        urls = [f"{url_a}/p/{i}" for i in range(8)] + [f"{url_b}/p/{i}" for i in range(8)]
+        f, texts = _fetch_all(dict(concurrency=10, per_host=2, crawl_delay=0), urls)
+
+    assert texts[0] == "<p>/p/0</p>" and len(texts) == 16
+    assert a.peak == 2 and b.peak == 2
+    assert f.stats.requests == 16
+
+
+def test_global_limit_applies_across_hosts():
+    sites = [_ConcurrencySite() for _ in range(3)]
+    peak = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    # share one counter across the three servers
+    for site in sites:
+        original = site.get
+
+        async def counted(path, query, _original=original):
+            with lock:
+                peak["now"] += 1
+                peak["max"] = max(peak["max"], peak["now"])
+            try:
+                return await _original(path, query)
+            finally:
+                with lock:
+                    peak["now"] -= 1
+        site.get = counted
+
+    with StandinServer(sites[0]) as u0, StandinServer(sites[1]) as u1, StandinServer(sites[2]) as u2:
+        urls = [f"{u}/p/{i}" for u in (u0, u1, u2) for i in range(4)]
+        _fetch_all(dict(concurrency=3, per_host=3, crawl_delay=0), urls)
+
+    assert peak["max"] == 3
+
+
+def test_transient_errors_are_retried_then_succeed():
+    site = _FlakySite(failures=2)
+    with StandinServer(site) as base:
+        f, texts = _fetch_all(dict(retries=3, backoff=0.01, crawl_delay=0), [f"{base}/x"])
+
+    assert texts == ["<p>ok</p>"]
+    assert site.calls == 3
+    assert f.stats.retries == 2 and f.stats.failures == 0
+    assert f.stats.statuses[503] == 2 and f.stats.statuses[200] == 1
+
+
+def test_gives_up_after_the_last_retry():
+    site = _FlakySite(failures=10)
+    with StandinServer(site) as base:
+        async def run():
+            async with Fetcher(retries=2, backoff=0.01, crawl_delay=0) as f:
+                with pytest.raises(FetchError) as exc:
+                    await f.get_text(f"{base}/x")
+                return f, exc.value
+
+        f, error = asyncio.run(run())
+
+    assert error.status == 503
+    assert site.calls == 3
+    assert f.stats.retries == 2 and f.stats.failures == 1
+
+
+def test_client_errors_are_not_retried():
+    site = _FlakySite(failures=10, status=404)
+    with StandinServer(site) as base:
+        async def run():
+            async with Fetcher(retries=3, backoff=0.01, crawl_delay=0) as f:
+                with pytest.raises(FetchError) as exc:
+                    await f.get_text(f"{base}/x")
+                return f, exc.value
+
+        f, error = asyncio.run(run())
+
+    assert error.status == 404
+    assert site.calls == 1 and f.stats.retries == 0
+
+
+def test_backoff_is_jittered_exponential_and_honours_retry_after():
+    f = Fetcher(backoff=0.5, crawl_delay=0)
+    for attempt in range(4):
+        step = 0.5 * 2 ** attempt
+        delays = [f._delay(attempt) for _ in range(50)]
+        assert all(0.5 * step <= d <= 1.5 * step for d in delays)
+        assert len(set(delays)) > 1
+    assert f._delay(0, "7") == 7.0
+    assert f._delay(0, "600") == 30.0
+    # HTTP-date Retry-After is not parsed — falls back to the exponential step
+    assert 0.25 <= f._delay(0, "Wed, 21 Oct 2026 07:28:00 GMT") <= 0.75
+
+
+def test_used_outside_context_manager():
+    with pytest.raises(RuntimeError):
+        asyncio.run(Fetcher().get_text("http://127.0.0.1:1/"))
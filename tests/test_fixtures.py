@@ -0,0 +1,89 @@
+# tests/test_fixtures.py
+
+import asyncio
+import json
+import subprocess
+import sys
+
+import pytest
+
+from backend.scraping.fetch import Fetcher, FetchError
+from backend.scraping.fixtures import FixtureStore, RecordingSite, fixture_key, record, scraper_env
+from backend.scraping.standin import StandinServer, SyntheticTomsarkgh
+
+
+def test_fixture_key_drops_date_range_and_sorts():
+    key = fixture_key("/list", {"startTo": "2026-10-26", "EventType[]": "16", "startFrom": "2026-10-19", "a": "1"})
+    assert key == "/list?EventType%5B%5D=16&a=1"
+    assert fixture_key("/hy/event/1", {}) == "/hy/event/1"
+
+
+def test_store_round_trip(tmp_path):
+    store = FixtureStore(str(tmp_path))
+    store.save("/hy/event/1", {}, 200, "<h1>Կարմեն</h1>")
+    store.save("/en/event/1", {}, 200, "<h1>Carmen</h1>")
+    store.save("/hy/event/2", {}, 404, "gone")
+    store.flush()
+
+    reloaded = FixtureStore(str(tmp_path))
+    assert len(reloaded) == 3
+    assert reloaded.get("/hy/event/1", {}) == (200, "<h1>Կարմեն</h1>")
+    assert reloaded.get("/hy/event/2", {}) == (404, "gone")
+    assert reloaded.get("/hy/event/3", {})[0] == 404
+    assert [key for key, _ in reloaded.pages("/hy/event/")] == ["/hy/event/1"]
+
+
+class _Upstream:
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, path, query):
+        self.calls += 1
+        if path == "/boom":
+            return 503, "busy"
+        return 200, '<a href="https://www.tomsarkgh.am/hy/event/5">x</a><a href="https://other.example/hy/event/6">y</a>'
+
+
+def test_recording_proxy_saves_pages_and_rewrites_event_links(tmp_path):
+    store = FixtureStore(str(tmp_path))
+    upstream = _Upstream()
+
+    async def fetch(base):
+        async with Fetcher(retries=0, crawl_delay=0) as f:
+            page = await f.get_text(f"{base}/list", params={"EventType[]": "16", "startFrom": "2026-10-19"})
+            with pytest.raises(FetchError) as exc:
+                await f.get_text(f"{base}/boom")
+            return page, exc.value.status
+
+    with StandinServer(upstream) as upstream_url, StandinServer(RecordingSite(upstream_url, store)) as proxy:
+        page, status = asyncio.run(fetch(proxy))
+
+    assert page == '<a href="/hy/event/5">x</a><a href="https://other.example/hy/event/6">y</a>'
+    assert status == 503
+    # 5xx answers are not recorded; the date range is not part of the key
+    assert list(store.index) == ["/list?EventType%5B%5D=16"]
+    assert store.get("/list", {"EventType[]": "16", "startFrom": "2030-01-01"}) == (200, page)
+
+
+def _scrape(base_url, db_path):
+    out = subprocess.run(
+        [sys.executable, "-m", "backend.scraping.fixtures", "_run-scrapers"],
+        env=scraper_env(base_url, str(db_path)), capture_output=True, text=True, check=True, timeout=120,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def test_recorded_site_replays_the_same_scrape(tmp_path):
+    directory = tmp_path / "fixtures"
+    with StandinServer(SyntheticTomsarkgh(per_type=2)) as upstream:
+        store = record(str(directory), upstream)
+        live = _scrape(upstream, tmp_path / "live.db")
+
+    replayed = FixtureStore(str(directory))
+    assert len(replayed) == len(store) > 0
+    server = StandinServer(replayed)
+    with server as base_url:
+        result = _scrape(base_url, tmp_path / "replay.db")
+
+    assert result == live and result["saved"] > 0
+    assert server.requests > 0
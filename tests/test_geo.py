@@ -0,0 +1,85 @@
+# tests/test_geo.py
+
+import random
+
+import pytest
+
+from backend.catalog.geo import GeoIndex, haversine_km
+
+
+def _points(n=400, seed=7):
+    rnd = random.Random(seed)
+    pts = [(40.18 + rnd.uniform(-0.15, 0.15), 44.51 + rnd.uniform(-0.2, 0.2), i) for i in range(n)]   # Yerevan
+    # around the world, incl. both sides of the antimeridian and near the poles
+    pts += [(rnd.uniform(-89, 89), rnd.uniform(-180, 180), n + i) for i in range(100)]
+    pts += [(10.0, 179.999, "east"), (10.0, -179.999, "west")]
+    return pts
+
+
+def _brute(pts, lat, lon):
+    return sorted((haversine_km(lat, lon, plat, plon), payload) for plat, plon, payload in pts)
+
+
+QUERIES = [(40.1811, 44.5136), (40.3, 44.3), (10.0, 180.0), (-33.9, 151.2), (89.5, 0.0)]
+
+
+@pytest.mark.parametrize("lat, lon", QUERIES)
+@pytest.mark.parametrize("k", [1, 5, 37])
+def test_nearest_matches_brute_force(lat, lon, k):
+    pts = _points()
+    got = GeoIndex(pts).nearest(lat, lon, k=k)
+    want = _brute(pts, lat, lon)[:k]
+    assert [km for km, _ in got] == pytest.approx([d for d, _ in want], abs=1e-3)
+    assert {p for _, p in got} == {p for _, p in want}
+
+
+@pytest.mark.parametrize("lat, lon", QUERIES)
+@pytest.mark.parametrize("radius", [0.5, 3, 25, 2500])
+def test_within_matches_brute_force(lat, lon, radius):
+    pts = _points()
+    got = GeoIndex(pts).within(lat, lon, radius)
+    want = [(d, p) for d, p in _brute(pts, lat, lon) if d <= radius]
+    assert [p for _, p in got] == [p for _, p in want]
+
+
+def test_radius_edges():
+    pts = _points()
+    index = GeoIndex(pts)
+    lat, lon = QUERIES[0]
+    d, payload = _brute(pts, lat, lon)[10]   # the 11th closest point sits right on the edge
+    inside = index.within(lat, lon, d + 1e-6)
+    outside = index.within(lat, lon, d - 1e-6)
+    assert payload in [p for _, p in inside] and payload not in [p for _, p in outside]
+    assert len(inside) == len(outside) + 1
+    assert payload in [p for _, p in index.nearest(lat, lon, k=50, max_km=d + 1e-6)]
+    assert payload not in [p for _, p in index.nearest(lat, lon, k=50, max_km=d - 1e-6)]
+
+
+def test_antimeridian_neighbours():
+    index = GeoIndex(_points())
+    (_, first), (_, second) = index.nearest(10.0, 180.0, k=2)
+    assert {first, second} == {"east", "west"}
+
+
+def test_empty_results():
+    assert GeoIndex([]).nearest(40.18, 44.51) == []
+    assert GeoIndex([]).within(40.18, 44.51, 100) == []
+    index = GeoIndex(_points())
+    assert index.nearest(40.18, 44.51, k=0) == []
+    assert index.within(0.0, -30.0, 1) == []                    # mid-Atlantic
+    assert index.nearest(0.0, -30.0, k=5, max_km=1) == []
+
+
+def test_nearby_api():
+    from fastapi.testclient import TestClient
+    from backend.web_app import app
+
+    client = TestClient(app)
+    assert client.get("/api/nearby", params={"lat": 91, "lon": 0}).status_code == 400
+    assert client.get("/api/nearby", params={"lat": 0, "lon": -30, "radius_km": 5}).json() == {"results": []}
+    results = client.get("/api/nearby", params={"lat": 40.1811, "lon": 44.5136, "limit": 5}).json()["results"]
+    assert len(results) == 5
+    distances = [r["distance_km"] for r in results]
+    assert distances == sorted(distances)
+    assert all(r["distance_km"] == pytest.approx(haversine_km(40.1811, 44.5136, r["lat"], r["lon"]), abs=1e-3)
+               for r in results)
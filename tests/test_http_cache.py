@@ -0,0 +1,149 @@
+# tests/test_http_cache.py
+
+import asyncio
+import json
+import os
+import time
+
+from backend.scraping.fetch import Fetcher
+from backend.scraping.http_cache import CacheEntry, HttpCache, body_hash, cache_key
+from backend.scraping.standin import StandinServer
+
+
+class _Site:
+    def __init__(self, body="<p>v1</p>"):
+        self.body = body
+
+    def get(self, path, query):
+        return 200, self.body
+
+
+def _entry(url="https://example.com/a", fetched_at=None):
+    return CacheEntry(url=url, etag='"e1"', last_modified="Mon, 19 Oct 2026 06:00:00 GMT",
+                      body_hash=body_hash("<a>"), size=3, fetched_at=fetched_at or time.time())
+
+
+def test_cache_key_ignores_param_order():
+    assert cache_key("https://x/list", {"a": 1, "b": 2}) == cache_key("https://x/list", {"b": 2, "a": 1})
+    assert cache_key("https://x/list", {"a": 1}) != cache_key("https://x/list", {"a": 2})
+
+
+def test_put_get_body_and_validators(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    key = cache_key("https://example.com/a")
+    assert cache.get(key) is None
+
+    cache.put(key, _entry(), "<a>")
+
+    entry = cache.get(key)
+    assert entry == _entry(fetched_at=entry.fetched_at)
+    assert cache.body(key) == "<a>"
+    assert entry.validators() == {"If-None-Match": '"e1"',
+                                  "If-Modified-Since": "Mon, 19 Oct 2026 06:00:00 GMT"}
+
+
+def test_entry_without_body_is_ignored(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    key = cache_key("https://example.com/a")
+    cache.put(key, _entry(), "<a>")
+    os.remove(tmp_path / key[:2] / f"{key}.html")
+    assert cache.get(key) is None
+
+
+def test_prune_drops_only_old_entries(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    old, fresh = cache_key("https://example.com/old"), cache_key("https://example.com/fresh")
+    cache.put(old, _entry(fetched_at=time.time() - 40 * 86400), "<old>")
+    cache.put(fresh, _entry(), "<fresh>")
+
+    assert cache.prune(max_age_days=30) == 1
+    assert cache.get(old) is None and cache.body(old) is None
+    assert cache.get(fresh) is not None
+
+
+def test_touch_keeps_an_entry_from_being_pruned(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    key = cache_key("https://example.com/a")
+    entry = _entry(fetched_at=time.time() - 40 * 86400)
+    cache.put(key, entry, "<a>")
+
+    cache.touch(key, entry)
+
+    assert cache.prune(max_age_days=30) == 0
+    meta = json.loads((tmp_path / key[:2] / f"{key}.json").read_text(encoding="utf-8"))
+    assert meta["fetched_at"] > time.time() - 60
+
+
+def _get(cache, url, defer_cache=False):
+    async def run():
+        async with Fetcher(cache=cache, crawl_delay=0, retries=0) as f:
+            return await f.get(url, defer_cache=defer_cache), f.stats
+    return asyncio.run(run())
+
+
+def test_second_fetch_is_revalidated_with_304(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    site = _Site()
+    with StandinServer(site) as base:
+        first, _ = _get(cache, f"{base}/e/1")
+        second, stats = _get(cache, f"{base}/e/1")
+
+    assert (first.status, first.unchanged) == (200, False)
+    assert (second.status, second.unchanged, second.text) == (304, True, "<p>v1</p>")
+    assert stats.not_modified == 1 and stats.bytes == 0
+    assert stats.bytes_saved == len("<p>v1</p>")
+
+
+def test_changed_page_is_refetched_and_replaces_the_entry(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    site = _Site()
+    with StandinServer(site) as base:
+        _get(cache, f"{base}/e/1")
+        site.body = "<p>v2</p>"
+        result, _ = _get(cache, f"{base}/e/1")
+        key = cache_key(f"{base}/e/1")
+
+    assert (result.status, result.unchanged, result.text) == (200, False, "<p>v2</p>")
+    assert cache.body(key) == "<p>v2</p>"
+
+
+def test_deferred_entry_is_written_only_on_commit(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    site = _Site()
+    with StandinServer(site) as base:
+        url = f"{base}/e/1"
+        key = cache_key(url)
+
+        result, _ = _get(cache, url, defer_cache=True)
+        assert [p.key for p in result.pending] == [key]
+        assert cache.get(key) is None
+
+        # not committed (the save failed) → the next run fetches the full page again
+        again, _ = _get(cache, url, defer_cache=True)
+        assert (again.status, again.unchanged) == (200, False)
+
+        cache.commit(again.pending)
+        assert cache.body(key) == "<p>v1</p>"
+        revalidated, _ = _get(cache, url, defer_cache=True)
+
+    assert (revalidated.status, revalidated.unchanged, revalidated.pending) == (304, True, [])
+
+
+def test_lost_body_file_falls_back_to_a_full_fetch(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    site = _Site()
+    with StandinServer(site) as base:
+        url = f"{base}/e/1"
+        key = cache_key(url)
+        _get(cache, url)
+        entry = cache.get(key)
+
+        # metadata survives, body disappears between get() and the 304
+        real_body = cache.body
+        cache.body = lambda k: None
+        result, stats = _get(cache, url)
+        cache.body = real_body
+
+    assert entry is not None
+    assert (result.status, result.text) == (200, "<p>v1</p>")
+    assert stats.statuses[304] == 1 and stats.statuses[200] == 1
@@ -0,0 +1,39 @@
+# tests/test_ingest.py
+
+import asyncio
+
+import pytest
+
+import backend.scraping.ingest as ingest
+from backend.scraping.http_cache import CacheEntry, HttpCache, PendingEntry, cache_key
+from backend.scraping.runstats import RunStats
+from backend.scraping.sources import Item
+
+URL = "https://www.tomsarkgh.am/hy/event/1"
+
+
+def _item():
+    key = cache_key(URL)
+    entry = CacheEntry(url=URL, etag='"v2"', last_modified=None, body_hash="h", size=4, fetched_at=0.0)
+    return Item("16 events", URL, {"title_hy": "Կարմեն", "source_url": URL}, cache=[PendingEntry(key, entry, "<v2>")])
+
+
+@pytest.mark.parametrize("save_fails", [True, False])
+def test_cache_entry_written_only_after_the_save(tmp_path, monkeypatch, save_fails):
+    def bulk_upsert(rows, scraped_at, unchanged_urls):
+        if save_fails:
+            raise RuntimeError("db down")
+        return [(1, "updated") for _ in rows]
+
+    monkeypatch.setattr(ingest, "bulk_upsert_scraped_news", bulk_upsert)
+    cache = HttpCache(str(tmp_path))
+    writer = ingest.BulkWriter({"tomsarkgh": RunStats("tomsarkgh")}, 0.0, 10, cache)
+
+    asyncio.run(writer.add("tomsarkgh", _item()))
+    asyncio.run(writer.flush())
+
+    entry = cache.get(cache_key(URL))
+    if save_fails:
+        assert entry is None        # next run: no validators → 200 → parsed and saved again
+    else:
+        assert entry.etag == '"v2"' and cache.body(cache_key(URL)) == "<v2>"
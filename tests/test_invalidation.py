@@ -0,0 +1,136 @@
+# tests/test_invalidation.py
+#
+# Cross-worker cache invalidation, end to end: `python -m backend.serve` with
+# several workers on a temporary SQLite DB (INVALIDATION_POLL_MS polling).
+#   news  — every worker's hero pool is warm (HERO_POOL_TTL is long), the test
+#           process calls update_news() and every worker must serve the new image;
+#   place — one session's like toggled with PLACE_LIKES_BUFFERED=1 over fresh
+#           connections (different workers) must alternate, not replay a stale state.
+# ~15 s; deselect with -m "not slow".
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Set
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+import backend.database as db  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+WORKERS = 3
+POLL_MS = 200
+SETTLE = 3 * POLL_MS / 1000 + 0.2
+IMAGE_A = "/static/img/check-a.jpg"
+IMAGE_B = "/static/img/check-b.jpg"
+PLACE_ID = "check-invalidation-place"
+
+pytestmark = pytest.mark.slow
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _get(base: str, path: str) -> "httpx.Response":
+    # new connection every time → the kernel spreads them over the workers
+    with httpx.Client(base_url=base, timeout=10) as client:
+        return client.get(path, headers={"Connection": "close"})
+
+
+def _pids(base: str, expected: int, tries: int = 200) -> Set[int]:
+    seen: Set[int] = set()
+    for _ in range(tries):
+        seen.add(_get(base, "/health").json()["pid"])
+        if len(seen) >= expected:
+            break
+    return seen
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    if db.DATABASE_URL:
+        pytest.skip("SQLite polling mode only")
+    db_path = tmp_path_factory.mktemp("invalidation") / "check.db"
+    saved_path = db.DB_PATH
+    db.DB_PATH = db_path
+    db.init_db()
+    news_id = db.save_news("Ստուգում", "Check", "…", "…", image_url=IMAGE_A, category="events")
+
+    port = _free_port()
+    env = dict(
+        os.environ,
+        SQLITE_PATH=str(db_path),
+        DATABASE_URL="",
+        PORT=str(port),
+        HOST="127.0.0.1",
+        WEB_CONCURRENCY=str(WORKERS),
+        LOG_LEVEL="warning",
+        HERO_POOL_TTL="3600",         # only an invalidation can refresh it
+        INVALIDATION_POLL_MS=str(POLL_MS),
+        PLACE_LIKES_BUFFERED="1",
+        PLACE_LIKES_FLUSH_MS="100",
+        RATE_LIMIT_ENABLED="0",
+        TEMPLATES_PRECOMPILE="0",
+    )
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "backend.serve"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    base = f"http://127.0.0.1:{port}"
+    try:
+        for _ in range(300):
+            assert proc.poll() is None, "server exited during startup"
+            try:
+                if _get(base, "/health").status_code == 200:
+                    break
+            except httpx.TransportError:
+                pass
+            time.sleep(0.1)
+        else:
+            pytest.fail("server did not come up")
+        yield base, news_id
+    finally:
+        proc.terminate()
+        proc.wait(timeout=15)
+        db.DB_PATH = saved_path
+
+
+def test_all_workers_answer(server):
+    base, _ = server
+    assert len(_pids(base, WORKERS)) == WORKERS
+
+
+def test_news_update_reaches_every_worker(server):
+    base, news_id = server
+    assert all(IMAGE_A in _get(base, "/hy").text for _ in range(30))
+
+    row = dict(db.get_news_by_id(news_id))
+    db.update_news(
+        news_id,
+        row["title_hy"], row["title_en"], row["content_hy"], row["content_en"],
+        IMAGE_B, row["category"],
+    )
+    time.sleep(SETTLE)
+
+    stale = sum(1 for _ in range(30) if IMAGE_B not in _get(base, "/hy").text)
+    assert stale == 0
+
+
+def test_buffered_like_toggles_stay_consistent_across_workers(server):
+    base, _ = server
+    cookies = {"place_session": "check-invalidation-session"}
+    expected = True
+    for _ in range(8):
+        with httpx.Client(base_url=base, timeout=10, cookies=cookies) as client:
+            data = client.post(f"/api/places/{PLACE_ID}/like", headers={"Connection": "close"}).json()
+        assert (data["liked"], data["count"]) == (expected, int(expected))
+        expected = not expected
+        time.sleep(SETTLE)   # flush + invalidation delivery
@@ -0,0 +1,121 @@
+# tests/test_media.py
+
+import sqlite3
+
+import pytest
+from PIL import Image
+
+import backend.database as db
+from backend.media_worker import MediaJob, MediaWorker
+from backend.utils.images import make_variants
+
+URL_PREFIX = "/static/img/important"
+
+
+def test_variants_have_requested_widths_and_keep_aspect(tmp_path):
+    src = tmp_path / "photo.png"
+    Image.new("RGB", (2000, 1000), (10, 120, 200)).save(src)
+
+    variants = make_variants(src)
+
+    assert sorted(variants) == [480, 960, 1600]
+    for width, path in variants.items():
+        assert path.name == f"photo-{width}.jpg"
+        with Image.open(path) as im:
+            assert im.format == "JPEG"
+            assert im.size == (width, width // 2)
+
+
+def test_small_images_are_not_upscaled(tmp_path):
+    src = tmp_path / "small.jpg"
+    Image.new("RGB", (600, 300)).save(src, "JPEG")
+
+    variants = make_variants(src)
+
+    # 960 and 1600 both collapse to the original width
+    assert sorted(variants) == [480, 600]
+    with Image.open(variants[600]) as im:
+        assert im.size == (600, 300)
+
+
+def test_transparent_png_is_flattened_on_white(tmp_path):
+    src = tmp_path / "logo.png"
+    Image.new("RGBA", (100, 100), (0, 0, 0, 0)).save(src)
+
+    variants = make_variants(src, widths=(100,))
+
+    with Image.open(variants[100]) as im:
+        assert im.mode == "RGB"
+        r, g, b = im.getpixel((50, 50))
+        assert min(r, g, b) > 240
+
+
+def test_animated_gif_gets_no_variants(tmp_path):
+    src = tmp_path / "anim.gif"
+    frames = [Image.new("RGB", (50, 50), color) for color in ((255, 0, 0), (0, 0, 255))]
+    frames[0].save(src, save_all=True, append_images=frames[1:], duration=100, loop=0)
+
+    assert make_variants(src) == {}
+    assert [p.name for p in tmp_path.iterdir()] == ["anim.gif"]
+
+
+@pytest.fixture
+def sqlite_db(tmp_path, monkeypatch):
+    if db.DATABASE_URL:
+        pytest.skip("SQLite only")
+    monkeypatch.setattr(db, "DB_PATH", tmp_path / "media.db")
+    db.init_db()
+    return tmp_path / "media.db"
+
+
+def _news(image_url, source_url=None):
+    return db.save_news(
+        title_hy="Վերնագիր", title_en="Title",
+        content_hy="Տեքստ", content_en="Text",
+        image_url=image_url, source_url=source_url,
+    )
+
+
+def test_save_news_returns_id_and_none_for_duplicate_source(sqlite_db):
+    first = _news(None, "https://example.com/a")
+    second = _news(None, "https://example.com/b")
+    assert isinstance(first, int) and second == first + 1
+    assert _news(None, "https://example.com/a") is None
+
+
+def _image_row(path, news_id):
+    conn = sqlite3.connect(path)
+    row = conn.execute("SELECT image_url, image_srcset FROM news WHERE id = ?", (news_id,)).fetchone()
+    conn.close()
+    return row
+
+
+def test_worker_swaps_in_variants_and_removes_original(sqlite_db, tmp_path):
+    upload_dir = tmp_path / "important"
+    upload_dir.mkdir()
+    original = upload_dir / "news-abc.png"
+    Image.new("RGB", (1000, 500)).save(original)
+    news_id = _news(f"{URL_PREFIX}/news-abc.png")
+
+    job = MediaJob(news_id=news_id, path=original, url=f"{URL_PREFIX}/news-abc.png", url_prefix=URL_PREFIX)
+    assert MediaWorker.process(job) is True
+
+    assert not original.exists()
+    assert _image_row(sqlite_db, news_id) == (
+        f"{URL_PREFIX}/news-abc-1000.jpg",
+        f"{URL_PREFIX}/news-abc-480.jpg 480w, {URL_PREFIX}/news-abc-960.jpg 960w, "
+        f"{URL_PREFIX}/news-abc-1000.jpg 1000w",
+    )
+
+
+def test_worker_drops_variants_if_image_was_replaced(sqlite_db, tmp_path):
+    original = tmp_path / "news-old.png"
+    Image.new("RGB", (800, 400)).save(original)
+    news_id = _news("https://cdn.example.com/replaced.jpg")
+
+    job = MediaJob(news_id=news_id, path=original, url=f"{URL_PREFIX}/news-old.png", url_prefix=URL_PREFIX)
+    assert MediaWorker.process(job) is False
+
+    assert original.exists()
+    assert not list(tmp_path.glob("news-old-*.jpg"))
+    assert _image_row(sqlite_db, news_id) == ("https://cdn.example.com/replaced.jpg", None)
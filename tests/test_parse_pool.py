@@ -0,0 +1,112 @@
+# tests/test_parse_pool.py
+
+import asyncio
+import os
+
+import pytest
+
+from backend.scraping import parse_pool
+from backend.scraping.parse_pool import ParsePool, ordered_map
+
+
+def _collect(fn, items, limit):
+    async def run():
+        return [got async for got in ordered_map(fn, items, limit)]
+    return asyncio.run(run())
+
+
+def test_results_come_back_in_input_order():
+    async def slow_first(n):
+        await asyncio.sleep(0.01 * (5 - n))
+        return n * 10
+
+    assert _collect(slow_first, range(5), 3) == [(n, n * 10) for n in range(5)]
+
+
+def test_at_most_limit_calls_in_flight():
+    state = {"now": 0, "peak": 0}
+
+    async def tracked(n):
+        state["now"] += 1
+        state["peak"] = max(state["peak"], state["now"])
+        await asyncio.sleep(0.005)
+        state["now"] -= 1
+        return n
+
+    assert [n for n, _ in _collect(tracked, range(20), 4)] == list(range(20))
+    assert state["peak"] == 4
+
+
+def test_exceptions_are_returned_in_place():
+    async def fail_on_two(n):
+        if n == 2:
+            raise ValueError("bad page")
+        return n
+
+    got = _collect(fail_on_two, range(4), 2)
+    assert [n for n, _ in got] == [0, 1, 2, 3]
+    assert isinstance(got[2][1], ValueError) and got[3][1] == 3
+
+
+def test_async_input_and_early_stop_cancels_pending():
+    started, cancelled = [], []
+
+    async def numbers():
+        for n in range(10):
+            yield n
+
+    async def work(n):
+        started.append(n)
+        try:
+            await asyncio.sleep(0 if n == 0 else 5)
+            return n
+        except asyncio.CancelledError:
+            cancelled.append(n)
+            raise
+
+    async def run():
+        results = ordered_map(work, numbers(), 3)
+        first = await anext(results)
+        await results.aclose()
+        await asyncio.sleep(0.01)
+        return first
+
+    assert asyncio.run(run()) == (0, 0)
+    # the window was refilled to 3 before the first result was handed out
+    assert started == [0, 1, 2]
+    assert cancelled == [1, 2]
+
+
+def _upper(text):
+    return text.upper(), os.getpid()
+
+
+def test_in_thread_pool_runs_in_this_process():
+    async def run():
+        with ParsePool(0) as pool:
+            return pool.depth, await pool.run(_upper, "abc")
+
+    depth, ((text, pid), seconds) = asyncio.run(run())
+    assert depth == 2 and text == "ABC" and pid == os.getpid() and seconds >= 0
+
+
+def test_worker_pool_runs_in_another_process():
+    async def run():
+        with ParsePool(1) as pool:
+            return await pool.run(_upper, "abc")
+
+    (text, pid), _ = asyncio.run(run())
+    assert text == "ABC" and pid != os.getpid()
+
+
+@pytest.mark.parametrize("backend,cores,expected", [
+    ("selectolax", 8, 0),
+    ("bs4-lxml", 8, 4),
+    ("bs4-lxml", 3, 2),
+    ("bs4", 1, 0),
+])
+def test_auto_worker_count(monkeypatch, backend, cores, expected):
+    monkeypatch.setattr(parse_pool, "DEFAULT_BACKEND", backend)
+    monkeypatch.setattr(parse_pool.os, "sched_getaffinity", lambda pid: set(range(cores)), raising=False)
+    assert parse_pool.parse_workers(-1) == expected
+    assert parse_pool.parse_workers(3) == 3
@@ -0,0 +1,79 @@
+# tests/test_place_comments.py
+
+import base64
+import json
+import sqlite3
+
+import pytest
+
+import backend.database as db
+
+
+@pytest.fixture
+def comments(tmp_path, monkeypatch):
+    """place p1: 7 comments, ids 1..7; 2..5 share one created_at (second-resolution ties)."""
+    if db.DATABASE_URL:
+        pytest.skip("SQLite only")
+    monkeypatch.setattr(db, "DB_PATH", tmp_path / "comments.db")
+    db.init_db()
+    stamps = ["2026-10-01 10:00:00"] + ["2026-10-02 12:00:00"] * 4 + ["2026-10-03 09:00:00"] * 2
+    conn = sqlite3.connect(db.DB_PATH)
+    conn.executemany(
+        "INSERT INTO place_comments (place_id, session_id, text, created_at) VALUES ('p1', 's', ?, ?)",
+        [(f"c{i}", ts) for i, ts in enumerate(stamps, start=1)],
+    )
+    conn.commit()
+    conn.close()
+    return [7, 6, 5, 4, 3, 2, 1]   # newest first, ties by id DESC
+
+
+def _all_pages(limit):
+    ids, pages, cursor = [], 0, None
+    while True:
+        page = db.get_place_comments("p1", limit=limit, cursor=cursor)
+        ids += [c["id"] for c in page["comments"]]
+        pages += 1
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return ids, pages
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 4, 7, 50])
+def test_pages_cover_every_comment_once_across_created_at_ties(comments, limit):
+    ids, pages = _all_pages(limit)
+    assert ids == comments
+    assert pages == max(1, -(-len(comments) // limit))   # no empty trailing page
+
+
+def test_last_page_has_no_cursor(comments):
+    first = db.get_place_comments("p1", limit=5)
+    assert [c["id"] for c in first["comments"]] == [7, 6, 5, 4, 3]
+    last = db.get_place_comments("p1", limit=5, cursor=first["next_cursor"])
+    assert [c["id"] for c in last["comments"]] == [2, 1]
+    assert last["next_cursor"] is None
+    assert db.get_place_comments("p1", limit=7)["next_cursor"] is None
+
+
+def _b64(value) -> str:
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).decode().rstrip("=")
+
+
+@pytest.mark.parametrize("cursor", [
+    "%%%not-base64",
+    "abc",
+    _b64("just a string"),
+    _b64(["2026-10-02 12:00:00"]),
+    _b64(["not a timestamp", 3]),
+    _b64([{"x": 1}, 3]),
+    _b64(["2026-10-02 12:00:00", "3; DROP TABLE"]),
+    _b64(["2026-10-02 12:00:00", 10 ** 20]),
+])
+def test_garbage_cursor_is_a_400(comments, cursor):
+    from fastapi.testclient import TestClient
+    from backend.web_app import app
+
+    with pytest.raises(ValueError):
+        db.get_place_comments("p1", cursor=cursor)
+    response = TestClient(app).get("/api/places/p1/comments", params={"cursor": cursor})
+    assert response.status_code == 400
+    assert response.json() == {"error": "Invalid cursor"}
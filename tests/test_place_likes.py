@@ -0,0 +1,88 @@
+# tests/test_place_likes.py
+
+import sqlite3
+
+import pytest
+
+import backend.database as db
+
+
+@pytest.fixture
+def sqlite_db(tmp_path, monkeypatch):
+    if db.DATABASE_URL:
+        pytest.skip("SQLite only")
+    path = tmp_path / "likes.db"
+    monkeypatch.setattr(db, "DB_PATH", path)
+    return path
+
+
+def test_old_duplicate_likes_are_removed_and_unique_enforced(sqlite_db):
+    conn = sqlite3.connect(sqlite_db)
+    conn.execute("CREATE TABLE place_likes (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                 "place_id TEXT NOT NULL, session_id TEXT NOT NULL, created_at TIMESTAMP)")
+    conn.execute("CREATE INDEX idx_place_likes_place ON place_likes (place_id, session_id)")
+    conn.executemany("INSERT INTO place_likes (place_id, session_id) VALUES (?, ?)",
+                     [("p1", "s1"), ("p1", "s1"), ("p1", "s2")])
+    conn.commit()
+    conn.close()
+
+    db.init_db()
+
+    conn = sqlite3.connect(sqlite_db)
+    assert conn.execute("SELECT id, session_id FROM place_likes ORDER BY id").fetchall() == [(1, "s1"), (3, "s2")]
+    with pytest.raises(sqlite3.IntegrityError):
+        conn.execute("INSERT INTO place_likes (place_id, session_id) VALUES ('p1', 's2')")
+    conn.close()
+
+
+def test_unindexed_table_with_duplicates_gets_the_unique_index(sqlite_db):
+    # place_likes as the old select-then-insert code left it: no index at all
+    conn = sqlite3.connect(sqlite_db)
+    conn.execute("CREATE TABLE place_likes (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                 "place_id TEXT NOT NULL, session_id TEXT NOT NULL, created_at TIMESTAMP)")
+    conn.executemany("INSERT INTO place_likes (place_id, session_id) VALUES (?, ?)",
+                     [("p1", "s1"), ("p2", "s1"), ("p1", "s1"), ("p1", "s1")])
+    conn.commit()
+    conn.close()
+
+    db.init_db()
+
+    conn = sqlite3.connect(sqlite_db)
+    assert conn.execute("SELECT id, place_id FROM place_likes ORDER BY id").fetchall() == [(1, "p1"), (2, "p2")]
+    indexes = [r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' "
+                                          "AND tbl_name = 'place_likes' AND sql IS NOT NULL")]
+    conn.close()
+    assert indexes == ["uq_place_likes_session"]
+    # ON CONFLICT (place_id, session_id) needs that index
+    assert db.apply_place_like_changes([("p1", "s1", True)]) == {"p1": 1}
+    assert db.toggle_place_like("p1", "s1") == {"liked": False, "count": 0}
+
+
+def test_like_toggle_and_buffered_adds_never_duplicate(sqlite_db):
+    db.init_db()
+    assert db.toggle_place_like("p1", "s1") == {"liked": True, "count": 1}
+    assert db.apply_place_like_changes([("p1", "s1", True), ("p1", "s2", True)]) == {"p1": 2}
+    assert db.toggle_place_like("p1", "s1") == {"liked": False, "count": 1}
+    assert db.get_place_likes("p1", "s2")["count"] == 1
+
+
+def test_like_counts_served_from_place_stats_backfilled_at_start(sqlite_db):
+    # likes written before place_stats existed
+    conn = sqlite3.connect(sqlite_db)
+    conn.execute("CREATE TABLE place_likes (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                 "place_id TEXT NOT NULL, session_id TEXT NOT NULL, created_at TIMESTAMP)")
+    conn.executemany("INSERT INTO place_likes (place_id, session_id) VALUES (?, ?)",
+                     [("p1", "s1"), ("p1", "s2"), ("p2", "s1")])
+    conn.commit()
+    conn.close()
+
+    db.init_db()
+    assert db.get_place_likes("p1", "s1") == {"liked": True, "count": 2}
+    assert db.get_place_summary("p2", "s9")["likes"] == {"liked": False, "count": 1}
+    assert db.get_place_likes("p3", "s1") == {"liked": False, "count": 0}
+
+    assert db.toggle_place_like("p1", "s3")["count"] == 3
+    assert db.toggle_place_like("p1", "s1")["count"] == 2
+    conn = sqlite3.connect(sqlite_db)
+    assert conn.execute("SELECT like_count FROM place_stats WHERE place_id = 'p1'").fetchone() == (2,)
+    conn.close()
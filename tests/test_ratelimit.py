@@ -0,0 +1,64 @@
+# tests/test_ratelimit.py
+
+import random
+
+import pytest
+from starlette.requests import Request
+
+from backend.utils.ratelimit import Budget, DatabaseBucketStore, MemoryBucketStore, RateLimiter, client_ip
+
+
+def _request(xff=None, peer="10.0.0.1"):
+    headers = [(b"x-forwarded-for", xff.encode())] if xff else []
+    return Request({"type": "http", "headers": headers, "client": (peer, 1234)})
+
+
+def test_client_ip_takes_the_hop_added_by_the_proxy():
+    assert client_ip(_request("6.6.6.6, 203.0.113.7"), trusted_hops=1) == "203.0.113.7"
+    assert client_ip(_request("203.0.113.7"), trusted_hops=1) == "203.0.113.7"
+    assert client_ip(_request("1.1.1.1, 6.6.6.6, 203.0.113.7, 10.1.1.1"), trusted_hops=2) == "203.0.113.7"
+
+
+def test_client_ip_without_trusted_proxy_ignores_the_header():
+    assert client_ip(_request("6.6.6.6"), trusted_hops=0) == "10.0.0.1"
+    assert client_ip(_request(), trusted_hops=1) == "10.0.0.1"
+
+
+def test_spoofed_forwarded_for_does_not_get_a_new_bucket():
+    limiter = RateLimiter(
+        MemoryBucketStore(),
+        {"comment": {"ip": Budget(burst=3, per_minute=0.001), "session": Budget(burst=3, per_minute=0.001)}},
+    )
+    results = []
+    for _ in range(10):
+        # cookieless script, fresh random X-Forwarded-For each time; the proxy appends the real peer
+        spoofed = ".".join(str(random.randint(1, 254)) for _ in range(4))
+        ip = client_ip(_request(f"{spoofed}, 203.0.113.7"), trusted_hops=1)
+        results.append(limiter.check("comment", ip, None))
+    assert results[:3] == [0.0, 0.0, 0.0]
+    assert all(wait > 0 for wait in results[3:])
+
+
+def _session_limited(store):
+    # one IP shared by many sessions (NAT); one of them runs out of its own budget
+    return RateLimiter(
+        store,
+        {"like": {"ip": Budget(burst=5, per_minute=0.001), "session": Budget(burst=2, per_minute=0.001)}},
+    )
+
+
+@pytest.mark.parametrize("store", ["memory", "db"])
+def test_session_rejection_does_not_burn_ip_tokens(store, tmp_path, monkeypatch):
+    if store == "db":
+        import backend.database as db
+        if db.DATABASE_URL:
+            pytest.skip("SQLite only")
+        monkeypatch.setattr(db, "DB_PATH", tmp_path / "buckets.db")
+        db.init_db()
+    limiter = _session_limited(MemoryBucketStore() if store == "memory" else DatabaseBucketStore())
+
+    assert [limiter.check("like", "203.0.113.7", "greedy") for _ in range(2)] == [0.0, 0.0]
+    assert all(limiter.check("like", "203.0.113.7", "greedy") > 0 for _ in range(10))
+    # 2 of the IP's 5 tokens were used; the 10 rejected requests cost nothing
+    assert [limiter.check("like", "203.0.113.7", f"other-{i}") for i in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.check("like", "203.0.113.7", "other-9") > 0
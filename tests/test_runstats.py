@@ -0,0 +1,93 @@
+# tests/test_runstats.py
+
+from collections import Counter
+
+import pytest
+
+from backend.scraping.fetch import FetchStats
+from backend.scraping.runstats import COUNTS, STAGES, RunStats, compare_runs
+
+
+def _run(source="tomsarkgh", started_at=1000.0, **types):
+    stats = RunStats(source, started_at=started_at)
+    for key, counts in types.items():
+        stats.type_counts(key.replace("_", " ")).update(counts)
+    return stats.finish()
+
+
+def test_totals_sum_every_type():
+    stats = _run(**{"16_events": {"found": 10, "new": 3, "unchanged": 6, "failed": 1},
+                    "2_events": {"found": 5, "new": 1, "updated": 2, "merged": 2}})
+    assert stats.totals() == Counter(found=15, new=4, updated=2, unchanged=6, merged=2, failed=1)
+
+    row = stats.to_row()
+    assert {c: row[c] for c in COUNTS} == {
+        "found": 15, "new": 4, "updated": 2, "unchanged": 6, "merged": 2, "skipped": 0, "failed": 1,
+    }
+    # every count present per type, zeros included
+    assert row["types"]["2 events"] == {"found": 5, "new": 1, "updated": 2, "unchanged": 0,
+                                        "merged": 2, "skipped": 0, "failed": 0}
+
+
+def test_empty_run_has_zero_totals_and_all_stages():
+    row = RunStats("feeds", started_at=1000.0).finish().to_row()
+    assert all(row[c] == 0 for c in COUNTS)
+    assert row["stages"] == {name: 0.0 for name in STAGES}
+    assert row["types"] == {} and row["error"] is None
+
+
+def test_stage_time_accumulates_across_blocks(monkeypatch):
+    clock = iter([1.0, 1.5, 10.0, 10.25])
+    monkeypatch.setattr("backend.scraping.runstats.time.perf_counter", lambda: next(clock))
+    stats = RunStats("tomsarkgh")
+    with stats.stage("parse"):
+        pass
+    with pytest.raises(RuntimeError):
+        with stats.stage("parse"):
+            raise RuntimeError("parse failed")   # time still counted
+    assert stats.to_row()["stages"]["parse"] == 0.75
+
+
+def test_fetch_counters_are_copied():
+    fetch = FetchStats(requests=12, retries=2, failures=1, bytes=4096, not_modified=5,
+                       bytes_saved=900, crawl_wait=0.12345)
+    fetch.statuses.update({200: 6, 304: 5, 503: 2})
+    stats = RunStats("tomsarkgh")
+    stats.absorb_fetch(fetch)
+    assert stats.to_row()["http"] == {
+        "requests": 12, "retries": 2, "failures": 1, "bytes": 4096, "not_modified": 5,
+        "bytes_saved": 900, "crawl_wait": 0.123, "statuses": {"200": 6, "304": 5, "503": 2},
+    }
+
+
+def test_error_and_duration():
+    stats = RunStats("tomsarkgh", started_at=1000.0)
+    stats.finish("list fetch failed")
+    stats.finished_at = 1012.5
+    row = stats.to_row()
+    assert row["error"] == "list fetch failed" and row["duration"] == 12.5
+
+
+def test_saved_runs_are_compared_per_source(tmp_path, monkeypatch):
+    import backend.database as db
+
+    if db.DATABASE_URL:
+        pytest.skip("SQLite only")
+    monkeypatch.setattr(db, "DB_PATH", tmp_path / "runs.db")
+    db.init_db()
+
+    db.save_scrape_run(_run(started_at=1000.0, **{"16_events": {"found": 20, "new": 4},
+                                                  "2_events": {"found": 6}}).to_row())
+    db.save_scrape_run(_run("feeds", started_at=1500.0, feed={"found": 3, "new": 3}).to_row())
+    db.save_scrape_run(_run(started_at=2000.0, **{"16_events": {"found": 8, "new": 1, "failed": 4}}).to_row())
+
+    runs = compare_runs(db.get_scrape_runs())
+
+    assert [(r["source"], r["found"]) for r in runs] == [("tomsarkgh", 8), ("feeds", 3), ("tomsarkgh", 26)]
+    latest = runs[0]
+    assert latest["delta"] == {"found": -18, "new": -3, "updated": 0, "failed": 4}
+    assert "found dropped 26 → 8" in latest["flags"]
+    assert "2 events: 0 found (was 6)" in latest["flags"]
+    assert "4/8 detail pages failed" in latest["flags"]
+    assert [t["key"] for t in latest["type_rows"]] == ["16 events", "2 events"]
+    assert runs[1]["delta"] is None and runs[2]["delta"] is None
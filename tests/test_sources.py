@@ -0,0 +1,168 @@
+# tests/test_sources.py
+
+import asyncio
+import time
+
+import pytest
+
+import backend.database as db
+from backend.scraping import ingest
+from backend.scraping.fetch import Fetcher
+from backend.scraping.sources import FeedParser, FeedSource, HtmlSource, Item, feed_sources
+from backend.scraping.standin import StandinServer
+
+RSS = """<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/"><channel><title>t</title>
+<item><title>Ջազ երեկո</title><link>/news/1</link>
+  <description>&lt;p&gt;Ամեն &lt;b&gt;ուրբաթ&lt;/b&gt;&lt;/p&gt;</description>
+  <enclosure url="/img/1.jpg" type="image/jpeg"/></item>
+<item><title>Event 2</title><link>https://site.example/event/2</link>
+  <media:thumbnail url="https://cdn.example/2.jpg"/></item>
+<item><title></title><link>/news/3</link></item>
+</channel></rss>"""
+
+ATOM = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>t</title>
+<entry><title>A</title><link rel="enclosure" type="image/png" href="https://x/a.png"/>
+  <link href="https://x/a"/><id>tag:x,1</id><summary>S</summary><updated>2026-10-01</updated></entry>
+<entry><title>B</title><id>https://x/b</id><content>C</content></entry>
+</feed>"""
+
+
+def test_feed_parser_yields_entries_as_bytes_arrive():
+    parser = FeedParser()
+    data = ATOM.encode("utf-8")
+    cut = data.index(b"</entry>") + len(b"</entry>")
+
+    first = parser.feed(data[:cut])
+    rest = parser.feed(data[cut:]) + parser.close()
+
+    assert first == [{"title": "A", "link": "https://x/a", "summary": "S",
+                      "published": "2026-10-01", "image": "https://x/a.png"}]
+    assert [(e["title"], e["link"], e["summary"]) for e in rest] == [("B", "https://x/b", "C")]
+
+
+def test_feed_entry_rows():
+    source = FeedSource("news", "https://site.example/feed.xml", category="culture")
+    entries = FeedParser().feed(RSS.encode("utf-8"))
+
+    rows = [source.entry_row(e) for e in entries]
+
+    assert rows[0] == dict(
+        title_hy="Ջազ երեկո", title_en="Ջազ երեկո", content_hy="Ամեն ուրբաթ", content_en="Ամեն ուրբաթ",
+        image_url="https://site.example/img/1.jpg", category="culture",
+        source_url="https://site.example/news/1",
+    )
+    assert rows[1]["image_url"] == "https://cdn.example/2.jpg"
+    assert rows[2] is None   # no title
+
+
+def test_feed_sources_setting():
+    sources = feed_sources(" a=https://a.example/rss|culture, bad, b=ftp://b, c=http://c.example/feed ,")
+    assert [(s.name, s.url, s.category) for s in sources] == [
+        ("a", "https://a.example/rss", "culture"),
+        ("c", "http://c.example/feed", "general"),
+    ]
+
+
+def test_normalize_row():
+    row = ingest.normalize_row({
+        "title_hy": "  ", "title_en": " Title ", "content_en": "x" * 5000,
+        "image_url": "", "category": None, "source_url": "https://a/1", "unknown": 1,
+    })
+    assert row["title_hy"] == row["title_en"] == "Title"
+    assert row["content_hy"] == row["content_en"] == "x" * ingest.ROW_LIMITS["content_en"]
+    assert row["image_url"] is None and row["category"] == "general"
+    assert "unknown" not in row
+    assert ingest.normalize_row({"title_hy": "T"}) is None
+    assert ingest.normalize_row({"source_url": "https://a/1"}) is None
+
+
+def test_dedupe_first_source_wins():
+    dedupe = ingest.Dedupe()
+    assert dedupe.admit("feed", Item("feed", "https://a/1"))
+    assert not dedupe.admit("html", Item("html", "https://a/1"))
+    assert dedupe.seen == {"https://a/1": "feed"}
+
+
+class _Site:
+    def __init__(self, base_holder):
+        self.base = base_holder
+        self.starts = []
+
+    def get(self, path, query):
+        self.starts.append(time.monotonic())
+        if path == "/feed.xml":
+            items = "".join(
+                f"<item><title>Feed {i}</title><link>{self.base[0]}/event/{i}</link></item>" for i in (1, 2, 9)
+            )
+            return 200, f"<rss><channel>{items}</channel></rss>"
+        if path == "/list":
+            links = "".join(f'<a href="/event/{i}">{i}</a>' for i in (1, 2, 3, 4, 404))
+            return 200, f"<html><body>{links}</body></html>"
+        if path.startswith("/event/") and path != "/event/404":
+            n = path.rsplit("/", 1)[1]
+            return 200, f"<html><body><h1>Page {n}</h1></body></html>"
+        return 404, "missing"
+
+
+def parse_page(url, html):
+    # module level: ParsePool may pickle it for a worker process
+    if "<h1>Page 4</h1>" in html:
+        raise ValueError("broken page")
+    start = html.index("<h1>") + 4
+    return {"title_hy": html[start:html.index("</h1>")], "content_hy": "body"}
+
+
+@pytest.fixture
+def sqlite_db(tmp_path, monkeypatch):
+    if db.DATABASE_URL:
+        pytest.skip("SQLite only")
+    monkeypatch.setattr(db, "DB_PATH", tmp_path / "sources.db")
+    db.init_db()
+
+
+def _run(sources, **fetcher_kwargs):
+    async def run():
+        async with Fetcher(retries=0, **fetcher_kwargs) as fetcher:
+            return await ingest.run_sources(sources, fetcher=fetcher, batch_size=2, parse_workers=0)
+    return asyncio.run(run())
+
+
+def test_feed_and_html_sources_share_the_pipeline(sqlite_db):
+    base = [""]
+    site = _Site(base)
+    with StandinServer(site) as url:
+        base[0] = url
+        feed = FeedSource("feed", f"{url}/feed.xml")
+        html = HtmlSource("html", f"{url}/list", parse_page, marker="/event/")
+        runs = _run([feed, html], crawl_delay=0)
+
+    feed_counts = runs["feed"].types["feed"]
+    html_counts = runs["html"].types["html"]
+    # 1 and 2 are in both sources: whichever arrives second is skipped
+    assert feed_counts["found"] == 3 and html_counts["found"] == 5
+    assert feed_counts["new"] + html_counts["new"] == 4             # 1, 2, 3, 9
+    assert feed_counts["skipped"] + html_counts["skipped"] == 2
+    assert html_counts["failed"] == 2                               # 404 page + parse error
+    assert runs["html"].http["statuses"]["404"] == 1
+    assert runs["feed"].error is None and runs["html"].error is None
+
+    conn = db.get_connection()
+    urls = sorted(r[0] for r in conn.execute("SELECT source_url FROM news").fetchall())
+    conn.close()
+    assert urls == [f"{url}/event/{i}" for i in (1, 2, 3, 9)]
+
+
+def test_source_crawl_delay_spaces_requests_to_its_host(sqlite_db):
+    base = [""]
+    site = _Site(base)
+    with StandinServer(site) as url:
+        base[0] = url
+        html = HtmlSource("html", f"{url}/list", parse_page, marker="/event/", crawl_delay=0.05)
+        runs = _run([html], crawl_delay=0, per_host=4)
+
+    gaps = [b - a for a, b in zip(site.starts, site.starts[1:])]
+    assert len(site.starts) == 6
+    assert min(gaps) >= 0.045
+    assert runs["html"].http["crawl_wait"] > 0
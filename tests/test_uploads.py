@@ -0,0 +1,133 @@
+# tests/test_uploads.py
+
+import asyncio
+import io
+
+import pytest
+from fastapi import FastAPI, Request, UploadFile
+from fastapi.testclient import TestClient
+from PIL import Image
+from starlette.datastructures import Headers
+
+from backend.utils import uploads
+from backend.utils.uploads import UploadRejected, UploadSizeLimitMiddleware, save_image_upload, sniff_image_type
+
+
+def _png_bytes(size=(64, 48)) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", size, (200, 30, 30)).save(buf, "PNG")
+    return buf.getvalue()
+
+
+def _upload(data: bytes, content_type: str = "image/png") -> UploadFile:
+    return UploadFile(io.BytesIO(data), filename="x.png", headers=Headers({"content-type": content_type}))
+
+
+def _save(upload, dest, max_bytes=10 * 1024 * 1024):
+    return asyncio.run(save_image_upload(upload, str(dest), "news", max_bytes))
+
+
+@pytest.mark.parametrize("head,ext", [
+    (b"\xff\xd8\xff\xe0rest", "jpg"),
+    (b"\x89PNG\r\n\x1a\nrest", "png"),
+    (b"GIF87a...", "gif"),
+    (b"GIF89a...", "gif"),
+    (b"RIFF\x00\x00\x00\x00WEBPVP8 ", "webp"),
+])
+def test_sniff_known_images(head, ext):
+    assert sniff_image_type(head)[0] == ext
+
+
+@pytest.mark.parametrize("head", [b"", b"<svg xmlns=", b"%PDF-1.7", b"RIFF\x00\x00\x00\x00WAVEfmt "])
+def test_sniff_rejects_non_images(head):
+    assert sniff_image_type(head) is None
+
+
+def test_valid_png_is_saved_with_sniffed_extension(tmp_path):
+    data = _png_bytes()
+    # client claims JPEG; the extension comes from the bytes
+    path = _save(_upload(data, "image/jpeg"), tmp_path)
+    assert path.suffix == ".png"
+    assert path.read_bytes() == data
+    assert [p.name for p in tmp_path.iterdir()] == [path.name]
+
+
+def test_magic_bytes_are_checked_not_content_type(tmp_path):
+    with pytest.raises(UploadRejected):
+        _save(_upload(b"<html>not an image</html>", "image/png"), tmp_path)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_non_image_content_type_is_rejected(tmp_path):
+    with pytest.raises(UploadRejected):
+        _save(_upload(_png_bytes(), "application/pdf"), tmp_path)
+    assert not tmp_path.exists() or list(tmp_path.iterdir()) == []
+
+
+def test_empty_file_is_rejected(tmp_path):
+    with pytest.raises(UploadRejected):
+        _save(_upload(b""), tmp_path)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_size_cap_is_enforced_while_streaming(tmp_path, monkeypatch):
+    monkeypatch.setattr(uploads, "CHUNK_SIZE", 1024)
+    data = _png_bytes() + b"\x00" * 8 * 1024
+    upload = _upload(data)
+    reads = []
+    original_read = upload.read
+
+    async def counting_read(size=-1):
+        chunk = await original_read(size)
+        reads.append(len(chunk))
+        return chunk
+
+    upload.read = counting_read
+    with pytest.raises(UploadRejected):
+        _save(upload, tmp_path, max_bytes=3 * 1024)
+    # stopped on the first chunk past the cap, not after reading everything
+    assert sum(reads) == 4 * 1024 < len(data)
+    # the .part file is gone
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_file_exactly_at_the_cap_is_accepted(tmp_path):
+    data = _png_bytes()
+    path = _save(_upload(data), tmp_path, max_bytes=len(data))
+    assert path.stat().st_size == len(data)
+
+
+def _limited_app(max_body_bytes):
+    app = FastAPI()
+
+    @app.post("/admin/upload")
+    async def admin_upload(request: Request):
+        return {"size": len(await request.body())}
+
+    @app.post("/api/other")
+    async def other(request: Request):
+        return {"size": len(await request.body())}
+
+    app.add_middleware(UploadSizeLimitMiddleware, max_body_bytes=max_body_bytes)
+    return app
+
+
+def test_middleware_rejects_large_admin_bodies():
+    client = TestClient(_limited_app(100))
+    assert client.post("/admin/upload", content=b"x" * 100).json() == {"size": 100}
+    r = client.post("/admin/upload", content=b"x" * 101)
+    assert r.status_code == 413
+    # other paths are not limited
+    assert client.post("/api/other", content=b"x" * 1000).status_code == 200
+
+
+def test_middleware_counts_streamed_bodies_without_content_length():
+    client = TestClient(_limited_app(100))
+
+    def body():
+        for _ in range(5):
+            yield b"x" * 50
+
+    # a generator body is sent chunked, with no Content-Length
+    r = client.post("/admin/upload", content=body())
+    assert r.status_code == 413